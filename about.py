@@ -3,15 +3,15 @@ This file is part of QuickEDL.
 It provides the About dialog for the application.
 """
 
+import logging
+
 import ttkbootstrap as ttk
 from ttkbootstrap.constants import *  # noqa: F403
 from PIL import Image, ImageTk
-import io
 
 # internal imports
-from logo import bin_logo
 from constants import GITHUBURL
-from utils import open_in_browser
+from utils import open_in_browser, resource_path
 
 def show_about(app, version):
     aboutscreen = ttk.Toplevel()
@@ -25,13 +25,16 @@ def show_about(app, version):
     aboutscreen.bind("<Button-1>", leave_about)
     aboutscreen.bind("<Escape>", leave_about)
 
-    image_stream = io.BytesIO(bin_logo)
-    logo = Image.open(image_stream)
-    logo = logo.resize((150, 150))
-    photo = ImageTk.PhotoImage(logo)
-    logo_label = ttk.Label(aboutscreen, image=photo)
-    logo_label.image = photo  # Keep a reference to avoid garbage collection
-    logo_label.pack(pady=20)
+    try:
+        logo = Image.open(resource_path("resources/icon_unix.png"))
+        logo = logo.resize((150, 150))
+        photo = ImageTk.PhotoImage(logo)
+        logo_label = ttk.Label(aboutscreen, image=photo)
+        logo_label.image = photo  # Keep a reference to avoid garbage collection
+        logo_label.pack(pady=20)
+    except OSError as e:
+        # builds without the resources folder still show the dialog
+        logging.warning(f"About logo not found: {e}")
 
     label1 = ttk.Label(aboutscreen, text=f"QuickEDL {version}", font=("Courier New", 14))
     label1.pack(padx=10, pady=10)
@@ -0,0 +1,125 @@
+"""
+This file is part of QuickEDL.
+It provides the clock driver for the time display.
+"""
+
+import logging
+import math
+import time
+from collections import deque
+
+
+class ClockDriver:
+    """
+    Updates a label with the current time, aligned to the wall-clock boundaries.
+
+    Every tick is scheduled for the next full second (or frame, in timecode mode),
+    so the display neither drifts nor skips a second under load.
+    The scheduling error of each tick is measured against the monotonic clock.
+
+    Objects:
+        timecode: bool
+            If True, the time is shown as HH:MM:SS:FF
+        fps: int
+            Frame rate for the timecode display
+        is_active: callable
+            Returns True if the window is visible and focused.
+            Frames are only updated at full rate while active, otherwise once a second.
+    """
+
+    JITTER_SAMPLES = 600
+
+    def __init__(self, root, label, timecode=False, fps=25, is_active=None):
+        self.root = root
+        self.label = label
+        self.timecode = timecode
+        self.fps = fps
+        self.is_active = is_active or (lambda: True)
+
+        self._after_id = None
+        self._target = None  # monotonic time the next tick is scheduled for
+        self._last_text = None
+
+        # jitter instrumentation (milliseconds)
+        self.jitter = deque(maxlen=self.JITTER_SAMPLES)
+        self.jitter_max = 0.0
+        self.tick_count = 0
+
+    def start(self):
+        """Starts the clock."""
+        self.stop()
+        self._tick()
+
+    def stop(self):
+        """Stops the clock."""
+        if self._after_id is not None:
+            self.root.after_cancel(self._after_id)
+            self._after_id = None
+        self._target = None
+
+    def set_timecode(self, enabled, fps=None):
+        """
+        Switches the timecode display on or off.
+        Args:
+            enabled: Show HH:MM:SS:FF if True
+            fps: Frame rate, unchanged if None
+        """
+        self.timecode = bool(enabled)
+        if fps:
+            self.fps = int(fps)
+        self.start()
+
+    def format_time(self, now):
+        """Returns the display text for a wall-clock time in seconds since the epoch."""
+        text = time.strftime("%H:%M:%S", time.localtime(now))
+        if self.timecode:
+            frame = int((now % 1) * self.fps)
+            text = f"{text}:{min(frame, self.fps - 1):02d}"
+        return text
+
+    def _tick(self):
+        now = time.time()
+        monotonic_now = time.monotonic()
+
+        if self._target is not None:
+            self._record_jitter((monotonic_now - self._target) * 1000)
+
+        text = self.format_time(now)
+        if text != self._last_text:
+            self.label.config(text=text)
+            self._last_text = text
+
+        # Full frame rate only while the window is visible and focused
+        if self.timecode and self.fps > 0 and self.is_active():
+            period = 1 / self.fps
+        else:
+            period = 1.0
+
+        # Schedule for the next boundary, 1 ms late rather than early
+        next_boundary = (math.floor(now / period) + 1) * period
+        delay_ms = math.ceil((next_boundary - now) * 1000) + 1
+        self._target = monotonic_now + delay_ms / 1000
+        self._after_id = self.root.after(delay_ms, self._tick)
+
+    def _record_jitter(self, jitter_ms):
+        self.tick_count += 1
+        self.jitter.append(jitter_ms)
+        if jitter_ms > self.jitter_max:
+            self.jitter_max = jitter_ms
+        if jitter_ms > 500:
+            logging.warning("Clock tick %.0f ms late", jitter_ms)
+
+    def jitter_stats(self):
+        """
+        Returns the tick jitter statistics in milliseconds,
+        mean and p95 over the recent ticks, max since start.
+        """
+        samples = sorted(self.jitter)
+        if not samples:
+            return {'count': 0, 'mean': 0.0, 'p95': 0.0, 'max': 0.0}
+        return {
+            'count': self.tick_count,
+            'mean': sum(samples) / len(samples),
+            'p95': samples[min(len(samples) - 1, int(len(samples) * 0.95))],
+            'max': self.jitter_max,
+        }
@@ -0,0 +1,141 @@
+"""
+This file is part of QuickEDL.
+It suggests marker texts used before, independent of Tk.
+"""
+
+import logging
+import re
+import time
+
+from history import read_last_lines
+
+# "HH:MM:SS - text" lines of the EDL
+MARKER_LINE = re.compile(r"^\d{1,2}:\d{2}:\d{2} - (.+)$")
+
+
+class _Node:
+    __slots__ = ("children", "top", "bucket")
+
+    def __init__(self):
+        self.children = {}
+        self.top = []  # most frequent keys below this node, at most TOP_COUNT
+        self.bucket = None  # all keys below a node at MAX_DEPTH
+
+
+class LabelTrie:
+    """
+    Prefix trie of marker texts with use counts.
+
+    Every node keeps its TOP_COUNT most used texts, so a lookup walks the
+    prefix and returns that list: it does not depend on the number of texts.
+    The trie is MAX_DEPTH characters deep, nodes at that depth keep a bucket
+    of their texts, which is filtered for longer prefixes.
+    Matching ignores case, the most recently used spelling is suggested.
+
+    Functions:
+        add(text): counts a use of the text
+        add_marker(line): counts the text of an EDL line "HH:MM:SS - text"
+        load_edl(path): counts the texts of the last lines of an EDL file
+        complete(prefix, limit): returns the most used texts starting with prefix
+    """
+
+    TOP_COUNT = 8
+    MAX_DEPTH = 8
+    MAX_LENGTH = 200  # longer texts are not suggested
+    MAX_TEXTS = 5000  # distinct texts read from the EDL
+    EDL_LINES = 20000  # lines read from the end of the EDL
+
+    def __init__(self):
+        self.clear()
+
+    def __len__(self):
+        return len(self._counts)
+
+    def clear(self):
+        self._root = _Node()
+        self._counts = {}  # lowercase text -> uses
+        self._texts = {}  # lowercase text -> text as last used
+
+    def add(self, text, count=1):
+        """Counts count uses of the text."""
+        text = text.strip()
+        if not text or len(text) > self.MAX_LENGTH:
+            return
+        key = text.lower()
+        new = key not in self._counts
+        self._counts[key] = self._counts.get(key, 0) + count
+        self._texts[key] = text
+
+        node = self._root
+        self._update_top(node, key)
+        for char in key[:self.MAX_DEPTH]:
+            child = node.children.get(char)
+            if child is None:
+                child = node.children[char] = _Node()
+            node = child
+            self._update_top(node, key)
+        if new and len(key) >= self.MAX_DEPTH:
+            if node.bucket is None:
+                node.bucket = []
+            node.bucket.append(key)
+
+    def _update_top(self, node, key):
+        top = node.top
+        counts = self._counts
+        if key not in top:
+            if len(top) < self.TOP_COUNT:
+                top.append(key)
+            elif counts[key] > counts[top[-1]]:
+                top[-1] = key
+            else:
+                return
+        top.sort(key=counts.__getitem__, reverse=True)
+
+    def add_marker(self, line):
+        """Counts the text of an EDL line, other lines (e.g. separators) are ignored."""
+        match = MARKER_LINE.match(line.strip())
+        if match:
+            self.add(match.group(1))
+
+    def load_edl(self, path):
+        """
+        Rebuilds the trie from the last EDL_LINES lines of an EDL file.
+        Recent lines are counted first, so MAX_TEXTS keeps the recent texts.
+        """
+        start = time.perf_counter()
+        self.clear()
+        lines = read_last_lines(path, self.EDL_LINES)
+        # counted first, every text is inserted once with its count
+        counts = {}
+        texts = {}  # lowercase -> most recent spelling
+        for line in reversed(lines):
+            match = MARKER_LINE.match(line)
+            if not match:
+                continue
+            text = match.group(1).strip()
+            key = text.lower()
+            if key in counts:
+                counts[key] += 1
+            elif len(counts) < self.MAX_TEXTS:
+                counts[key] = 1
+                texts[key] = text
+        for key, count in counts.items():
+            self.add(texts[key], count)
+        logging.info(f"Marker texts for completion: {len(self)} from {len(lines)} lines "
+                     f"in {(time.perf_counter() - start) * 1000:.1f} ms")
+
+    def complete(self, prefix, limit=TOP_COUNT):
+        """Returns up to limit texts starting with prefix, most used first."""
+        key = prefix.lstrip().lower()
+        node = self._root
+        for char in key[:self.MAX_DEPTH]:
+            node = node.children.get(char)
+            if node is None:
+                return []
+        if len(key) <= self.MAX_DEPTH:
+            keys = node.top[:limit]
+        else:
+            matches = [k for k in node.bucket or () if k.startswith(key)]
+            matches.sort(key=self._counts.__getitem__, reverse=True)
+            keys = matches[:limit]
+        return [self._texts[k] for k in keys]
@@ -0,0 +1,83 @@
+"""
+This file is part of QuickEDL.
+It measures the marker text completion of the popup without a display:
+building the trie from the end of a large EDL, its memory and the
+lookup time while typing.
+
+Usage (from the repository root):
+    python devtools/completion_benchmark.py [--lines 200000] [--texts 3000]
+"""
+
+import argparse
+import random
+import sys
+import tempfile
+import time
+import tracemalloc
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from completion import LabelTrie  # noqa: E402
+
+WORDS = ("interview", "intro", "break", "weather", "news", "sports", "live", "guest",
+         "studio", "report", "traffic", "music", "applause", "outro", "teaser", "jingle")
+
+
+def create_edl(path, lines, texts):
+    random.seed(1)
+    labels = [" ".join(random.choice(WORDS) for _ in range(random.randint(1, 4))).capitalize() + f" {i}"
+              for i in range(texts)]
+    with path.open('w', encoding='utf-8') as file:
+        file.write("File created on 2024-01-01 10:00:00\n")
+        for i in range(lines - 1):
+            if i % 50 == 49:
+                file.write("-" * 20 + "\n")
+                continue
+            # a few texts are used much more often than the others
+            label = labels[min(int(random.expovariate(1 / 50)), texts - 1)]
+            file.write(f"{10 + i // 3600 % 14:02d}:{i // 60 % 60:02d}:{i % 60:02d} - {label}\n")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="QuickEDL completion benchmark")
+    parser.add_argument("--lines", type=int, default=200_000, help="lines of the generated EDL")
+    parser.add_argument("--texts", type=int, default=3000, help="distinct marker texts")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as folder:
+        path = Path(folder) / "benchmark_EDL.txt"
+        create_edl(path, args.lines, args.texts)
+        print(f"EDL: {args.lines} lines, {path.stat().st_size / 1e6:.1f} MB")
+
+        trie = LabelTrie()
+        tracemalloc.start()
+        trie.load_edl(path)
+        memory = tracemalloc.get_traced_memory()[0]
+        tracemalloc.stop()
+        trie = LabelTrie()
+        start = time.perf_counter()
+        trie.load_edl(path)
+        print(f"Load ({trie.EDL_LINES} lines):         {(time.perf_counter() - start) * 1000:8.1f} ms, "
+              f"{len(trie)} texts, {memory / 1e6:.1f} MB")
+
+        # typing "interview guest" character by character
+        query = "interview guest"
+        for length in (0, 1, 3, 8, 9, len(query)):
+            prefix = query[:length]
+            runs = 10000
+            start = time.perf_counter()
+            for _ in range(runs):
+                results = trie.complete(prefix, 5)
+            elapsed = (time.perf_counter() - start) / runs
+            print(f"complete({prefix!r:<18}) {elapsed * 1e6:8.2f} µs  ({len(results)} results)")
+
+        start = time.perf_counter()
+        for i in range(10000):
+            trie.add_marker(f"12:00:00 - Interview guest {i % 100}")
+        print(f"add_marker:                  {(time.perf_counter() - start) / 10000 * 1e6:8.2f} µs")
+        assert trie.complete("interview guest")[0].startswith("Interview guest")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,83 @@
+"""
+This file is part of QuickEDL.
+It measures the history of a large EDL file without a display:
+loading the last markers, starting the line index (what the history
+window does when it opens), indexing the whole file and reading a page
+of rows at random positions.
+
+Usage (from the repository root):
+    python devtools/history_benchmark.py [--lines 500000] [--page 30]
+"""
+
+import argparse
+import random
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from history import LineIndex, read_last_lines  # noqa: E402
+
+
+def create_edl(path, lines):
+    with path.open('w', encoding='utf-8') as file:
+        file.write("File created on 2024-01-01 10:00:00\n")
+        for i in range(lines - 1):
+            file.write(f"{10 + i // 3600 % 14:02d}:{i // 60 % 60:02d}:{i % 60:02d} Marker number {i}\n")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="QuickEDL history benchmark")
+    parser.add_argument("--lines", type=int, default=500_000, help="lines of the generated EDL")
+    parser.add_argument("--page", type=int, default=30, help="rows per page")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as folder:
+        path = Path(folder) / "benchmark_EDL.txt"
+        create_edl(path, args.lines)
+        print(f"EDL: {args.lines} lines, {path.stat().st_size / 1e6:.1f} MB")
+
+        start = time.perf_counter()
+        with path.open('r', encoding='utf-8') as file:
+            lines = [line.strip() for line in file.readlines() if line.strip()][-5:]
+        print(f"Last 5 markers, readlines:       {(time.perf_counter() - start) * 1000:8.2f} ms")
+
+        start = time.perf_counter()
+        assert read_last_lines(path, 5) == lines
+        print(f"Last 5 markers, read_last_lines: {(time.perf_counter() - start) * 1000:8.2f} ms")
+
+        index = LineIndex(path)
+        start = time.perf_counter()
+        index.update()
+        first_page = index.lines(0, args.page)
+        print(f"Open (start index, first page):  {(time.perf_counter() - start) * 1000:8.2f} ms")
+
+        while index.running:
+            time.sleep(0.001)
+        print(f"Full index:                      {(time.perf_counter() - start) * 1000:8.2f} ms")
+        assert index.count == args.lines, index.count
+        assert first_page[0].startswith("File created")
+
+        timings = []
+        for _ in range(200):
+            first = random.randrange(max(1, index.count - args.page))
+            start = time.perf_counter()
+            rows = index.lines(first, args.page)
+            timings.append(time.perf_counter() - start)
+            assert rows[0].endswith(f"number {first - 1}") or first == 0
+        timings.sort()
+        print(f"Page of {args.page} rows, p50/max:       {timings[len(timings) // 2] * 1000:.3f} / {timings[-1] * 1000:.3f} ms")
+
+        with path.open('a', encoding='utf-8') as file:
+            file.write("23:59:59 Appended\n")
+        index.update()
+        while index.running:
+            time.sleep(0.001)
+        assert index.lines(index.count - 1, 1) == ["23:59:59 Appended"]
+        print(f"Appended line indexed, {index.count} lines")
+
+
+if __name__ == "__main__":
+    main()
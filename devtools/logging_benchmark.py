@@ -0,0 +1,91 @@
+"""
+This file is part of QuickEDL.
+It measures the logging overhead of a keypress on the Tk thread:
+the former synchronous FileHandler/StreamHandler setup at DEBUG with
+f-string messages against the queue-based setup (logsetup) with lazy
+messages, at the default level INFO and at DEBUG.
+Per keypress two debug messages and one info message are logged.
+
+Usage (from the repository root):
+    python devtools/logging_benchmark.py [--presses 20000]
+"""
+
+import argparse
+import logging
+import os
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from logsetup import LOG_FORMAT, setup_logging, stop_logging  # noqa: E402
+
+STATE = {"marker": "12:00:00 - Interview", "playhead": 42, "markers": list(range(5))}
+
+
+def press_eager(i):
+    logging.debug(f"Hotkey {i}: state {STATE}")
+    logging.debug(f"Playhead {STATE['playhead']}, markers {STATE['markers']}")
+    logging.info(f"Marker written: {STATE['marker']} ({i})")
+
+
+def press_lazy(i):
+    logging.debug("Hotkey %d: state %s", i, STATE)
+    logging.debug("Playhead %d, markers %s", STATE['playhead'], STATE['markers'])
+    logging.info("Marker written: %s (%d)", STATE['marker'], i)
+
+
+def run(press, presses):
+    timings = []
+    for i in range(presses):
+        start = time.perf_counter()
+        press(i)
+        timings.append(time.perf_counter() - start)
+    timings.sort()
+    return timings[len(timings) // 2] * 1e6, timings[int(len(timings) * 0.99)] * 1e6, sum(timings)
+
+
+def report(name, result):
+    p50, p99, total = result
+    print(f"{name:<34} p50 {p50:7.1f} µs  p99 {p99:7.1f} µs  total {total * 1000:7.1f} ms")
+
+
+def reset():
+    root = logging.getLogger()
+    for handler in root.handlers[:]:
+        root.removeHandler(handler)
+        handler.close()
+
+
+def main():
+    parser = argparse.ArgumentParser(description="QuickEDL logging benchmark")
+    parser.add_argument("--presses", type=int, default=20000, help="simulated keypresses")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as folder, open(os.devnull, 'w') as console:
+        log_file = Path(folder) / "quickedl.log"
+
+        # before: synchronous handlers, DEBUG, f-strings
+        logging.basicConfig(level=logging.DEBUG, format=LOG_FORMAT, force=True, handlers=[
+            logging.FileHandler(log_file, mode='w'),
+            logging.StreamHandler(console),
+        ])
+        report("sync handlers, DEBUG, f-strings", run(press_eager, args.presses))
+        report("sync handlers, INFO, f-strings", (logging.getLogger().setLevel(logging.INFO), run(press_eager, args.presses))[1])
+        reset()
+
+        # after: queue handler, lazy messages
+        setup_logging(log_file, logging.INFO, stream=console)
+        report("queue, INFO, lazy", run(press_lazy, args.presses))
+        logging.getLogger().setLevel(logging.DEBUG)
+        report("queue, DEBUG, lazy", run(press_lazy, args.presses))
+        start = time.perf_counter()
+        stop_logging()
+        print(f"Queue drained on stop in {(time.perf_counter() - start) * 1000:.1f} ms")
+        reset()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,141 @@
+"""
+This file is part of QuickEDL.
+It measures the playlist model without a display:
+loading a large rundown, the cost of playhead operations, merging an
+externally edited playlist file and the type-ahead search of the jump box.
+With --editor (needs a display) it also measures filling the editor
+line by line compared to the bulk insert, and syncing an edited line.
+
+Usage (from the repository root):
+    python devtools/playlist_benchmark.py [--items 100000] [--ops 1000000] [--editor]
+"""
+
+import argparse
+import random
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from playlist_model import PlaylistModel  # noqa: E402
+from playlist_search import PlaylistSearch  # noqa: E402
+
+WORDS = ["Intro", "Song", "Ballad", "Interview", "Opening", "Closing", "Break", "Applause",
+         "Band", "Guest", "Live", "Remix", "Encore", "News", "Weather", "Award", "Speech"]
+QUERIES = ["640", "song", "so ba", "interv 99", "weather encore 5", "e", "view", "brk", "speech award 1"]
+
+
+def measure(name, ops, function):
+    start = time.perf_counter()
+    for _ in range(ops):
+        function()
+    elapsed = time.perf_counter() - start
+    print(f"{name:<28} {elapsed / ops * 1e9:8.0f} ns/op")
+
+
+def measure_editor(lines):
+    import ttkbootstrap as ttk
+    from playlist import Playlist
+
+    try:
+        root = ttk.Window()
+    except Exception as e:
+        print(f"Editor not measured, no display: {e}")
+        return
+
+    text = ttk.Text(root)
+    start = time.perf_counter()
+    for line in lines:
+        text.insert("end", line + "\n")
+    root.update()
+    print(f"Editor, insert per line:     {(time.perf_counter() - start) * 1000:8.1f} ms")
+    text.destroy()
+
+    playlist = Playlist()
+    playlist.model.set_items(lines)
+    start = time.perf_counter()
+    playlist.playlist_edit_window()
+    playlist.set_list_mode(False)
+    root.update()
+    print(f"Editor, bulk insert:         {(time.perf_counter() - start) * 1000:8.1f} ms")
+
+    playlist.text_area.insert("10.0", "edited ")
+    start = time.perf_counter()
+    playlist.update_list()
+    print(f"Sync of one edited line:     {(time.perf_counter() - start) * 1000:8.2f} ms")
+    assert playlist.model.items[9].startswith("edited ")
+
+    playlist.set_list_mode(True)
+    start = time.perf_counter()
+    root.update()
+    print(f"Editor, list view:           {(time.perf_counter() - start) * 1000:8.1f} ms")
+    root.destroy()
+
+
+def main():
+    parser = argparse.ArgumentParser(description="QuickEDL playlist model benchmark")
+    parser.add_argument("--items", type=int, default=100_000, help="items in the playlist")
+    parser.add_argument("--ops", type=int, default=1_000_000, help="operations per measurement")
+    parser.add_argument("--editor", action="store_true", help="also measure the editor (needs a display)")
+    args = parser.parse_args()
+
+    random.seed(1)
+    lines = [f"{random.choice(WORDS)} {random.choice(WORDS)} {i}" for i in range(args.items)]
+    start = time.perf_counter()
+    model = PlaylistModel(lines)
+    print(f"Load {args.items} items:          {(time.perf_counter() - start) * 1000:8.2f} ms")
+
+    # a listener like the Tk view, which only compares values
+    shown = [None]
+
+    def view(m):
+        values = (m.current, m.can_inc, m.can_dec)
+        if values != shown[0]:
+            shown[0] = values
+    model.subscribe(view)
+
+    half = args.items // 2
+    model.seek(half)
+    measure("inc + dec", args.ops // 2, lambda: (model.inc(), model.dec()))
+    measure("seek (moving)", args.ops, lambda: model.seek(half if model.playhead != half else half + 1))
+    measure("take", min(args.ops, args.items - 1 - half), model.take)
+    assert model.playhead == args.items - 1 or args.ops < args.items - 1 - half
+
+    # the playlist file edited elsewhere: a few lines inserted, removed and changed
+    model.seek(half)
+    current = model.current
+    edited = list(model.items)
+    edited.insert(10, "Inserted item")
+    del edited[half // 2]
+    edited[half + half // 2] = "Changed item"
+    start = time.perf_counter()
+    edits = model.merge(edited)
+    print(f"Merge of an edited file:     {(time.perf_counter() - start) * 1000:8.1f} ms  ({len(edits)} edits)")
+    assert model.current == current and model.items == edited
+
+    search = PlaylistSearch()
+    start = time.perf_counter()
+    search.update(model.items)
+    print(f"Search index build:          {(time.perf_counter() - start) * 1000:8.1f} ms")
+    model.set_item(10, "Brand new item")
+    start = time.perf_counter()
+    search.update(model.items)
+    print(f"Search index, one item:      {(time.perf_counter() - start) * 1000:8.1f} ms")
+    assert search.search("brand new")[0][0] == 10
+
+    for query in QUERIES:
+        timings = []
+        for _ in range(20):
+            start = time.perf_counter()
+            results = search.search(query)
+            timings.append(time.perf_counter() - start)
+        timings.sort()
+        print(f"Search {query!r:<20} {timings[len(timings) // 2] * 1000:6.3f} ms  ({len(results)} results)")
+
+    if args.editor:
+        measure_editor(lines)
+
+
+if __name__ == "__main__":
+    main()
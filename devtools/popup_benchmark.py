@@ -0,0 +1,98 @@
+"""
+This file is part of QuickEDL.
+It measures how long the marker popup takes to appear:
+building a new popup on every keypress (the former behaviour)
+compared to showing the pre-built MarkerPopup.
+
+Usage (from the repository root, needs a display):
+    python devtools/popup_benchmark.py [--runs 20]
+"""
+
+import argparse
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+import ttkbootstrap as ttk  # noqa: E402
+from ttkbootstrap.constants import LEFT, RIGHT  # noqa: E402
+
+from popup import MarkerPopup  # noqa: E402
+
+
+def wait_mapped(root, window):
+    """Processes events until the window is mapped, returns the elapsed ms."""
+    start = time.perf_counter()
+    while not window.winfo_ismapped():
+        root.update()
+    return (time.perf_counter() - start) * 1000
+
+
+def build_popup(root):
+    """Builds the popup like add_with_popup did before it was reused."""
+    popup = ttk.Toplevel(root)
+    popup.title("Text for 12:00:00")
+    popup.geometry("400x150")
+    popup.resizable(False, False)
+    input_var = ttk.StringVar()
+    input_entry = ttk.Entry(popup, textvariable=input_var, width=50)
+    input_entry.pack(pady=5)
+    buttonframe = ttk.Frame(popup)
+    buttonframe.pack(pady=10)
+    ttk.Button(buttonframe, bootstyle="danger", text="Cancel").pack(side=LEFT, padx=10, pady=10)
+    ttk.Button(buttonframe, bootstyle="success", text="Save").pack(side=RIGHT, padx=10, pady=10)
+    input_entry.focus()
+    popup.transient(root)
+    return popup
+
+
+def report(name, samples):
+    samples = sorted(samples)
+    print(f"{name:<22} p50 {samples[len(samples) // 2]:7.2f} ms   max {samples[-1]:7.2f} ms")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="QuickEDL popup benchmark")
+    parser.add_argument("--runs", type=int, default=20, help="number of popups shown")
+    args = parser.parse_args()
+
+    try:
+        root = ttk.Window()
+    except Exception as e:
+        print(f"No display available: {e}")
+        sys.exit(1)
+    root.geometry("400x700")
+    root.update()
+
+    rebuilt = []
+    for _ in range(args.runs):
+        start = time.perf_counter()
+        popup = build_popup(root)
+        wait_mapped(root, popup)
+        rebuilt.append((time.perf_counter() - start) * 1000)
+        popup.destroy()
+        root.update()
+
+    marker_popup = MarkerPopup(root)
+    start = time.perf_counter()
+    marker_popup.build()
+    print(f"MarkerPopup.build():   {(time.perf_counter() - start) * 1000:7.2f} ms (once, after startup)")
+    reused = []
+    for _ in range(args.runs):
+        start = time.perf_counter()
+        marker_popup.show("Text for 12:00:00", lambda text: None)
+        wait_mapped(root, marker_popup.window)
+        reused.append((time.perf_counter() - start) * 1000)
+        marker_popup.hide()
+        root.update()
+
+    report("Built per keypress:", rebuilt)
+    report("Pre-built, shown:", reused)
+    stats = marker_popup.show_stats()
+    print(f"Show to <Map> event:   p50 {stats['p50']:7.2f} ms   max {stats['max']:7.2f} ms")
+    root.destroy()
+
+
+if __name__ == "__main__":
+    main()
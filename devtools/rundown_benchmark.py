@@ -0,0 +1,76 @@
+"""
+This file is part of QuickEDL.
+It measures the rundown import without a display: a generated CSV is read
+with read_text().splitlines() (the old playlist import) and with the
+streaming RundownReader, reporting time and peak memory (tracemalloc) of both.
+Tracing slows Python code down, the times are higher than in the application.
+
+Usage (from the repository root):
+    python devtools/rundown_benchmark.py [--rows 1000000]
+"""
+
+import argparse
+import csv
+import random
+import sys
+import tempfile
+import time
+import tracemalloc
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from rundown import RundownReader, format_duration  # noqa: E402
+
+WORDS = ("news", "weather", "sports", "interview", "live", "report", "studio", "break",
+         "traffic", "culture", "politics", "market", "update", "preview", "teaser")
+
+
+def create_rundown(path, rows):
+    with path.open('w', encoding='utf-8', newline='') as file:
+        writer = csv.writer(file)
+        writer.writerow(["Item ID", "Title", "Planned Duration", "Notes"])
+        for i in range(rows):
+            title = " ".join(random.choice(WORDS) for _ in range(3)).title()
+            duration = random.randrange(10, 600)
+            writer.writerow([f"RD-{i:07d}", title, f"00:{duration // 60:02d}:{duration % 60:02d}", "see script, page 2"])
+
+
+def measure(label, function):
+    tracemalloc.start()
+    start = time.perf_counter()
+    result = function()
+    elapsed = time.perf_counter() - start
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    print(f"{label:<32} {elapsed:7.2f} s, peak {peak / 1e6:7.1f} MB")
+    return result
+
+
+def main():
+    parser = argparse.ArgumentParser(description="QuickEDL rundown import benchmark")
+    parser.add_argument("--rows", type=int, default=1_000_000, help="rows of the generated CSV")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as folder:
+        path = Path(folder) / "rundown.csv"
+        create_rundown(path, args.rows)
+        print(f"Rundown: {args.rows} rows, {path.stat().st_size / 1e6:.1f} MB")
+
+        lines = measure("read_text().splitlines()", lambda: path.read_text().splitlines())
+        assert len(lines) == args.rows + 1
+        del lines
+
+        reader = measure("Open (sniff, preview)", lambda: RundownReader(path))
+        print(f"Columns: {reader.columns()}, delimiter {reader.dialect.delimiter!r}")
+
+        count = measure("Stream rows (nothing kept)", lambda: sum(1 for _ in reader.rows()))
+        assert count == args.rows
+
+        rundown = measure("Import (typed columns)", lambda: reader.load(reader.guess_text_column()))
+        assert len(rundown) == args.rows and rundown.ids[0] == "RD-0000000"
+        print(f"Items: {len(rundown)}, planned {format_duration(rundown.total_duration())}")
+
+
+if __name__ == "__main__":
+    main()
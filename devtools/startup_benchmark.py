@@ -0,0 +1,141 @@
+"""
+This file is part of QuickEDL.
+It measures the startup of the application:
+the import cost per module (parsed from `python -X importtime`)
+and the time from process start to the first drawn frame.
+
+Usage (from the repository root):
+    python devtools/startup_benchmark.py [--budget 1.5] [--top 15]
+
+Exits with 1 if the first frame takes longer than the budget
+or a module meant to be imported lazily is loaded at startup.
+"""
+
+import argparse
+import subprocess
+import sys
+import time
+from pathlib import Path
+
+REPO_DIR = Path(__file__).resolve().parent.parent
+
+# Modules which must not be imported before the first frame
+LAZY_MODULES = [
+    "about",
+    "logo",
+    "confetti",
+    "export_jsx",
+    "projects.newproject",
+    "settings.settings_window",
+]
+
+FIRST_FRAME_SCRIPT = """
+import sys, time
+import ttkbootstrap as ttk
+import main
+root = ttk.Window()
+app = main.QuickEDLApp(root)
+root.update()
+print("FIRST_FRAME", time.time())
+print("LOADED", ",".join(m for m in {lazy!r} if m in sys.modules))
+root.destroy()
+"""
+
+
+def parse_importtime(stderr):
+    """
+    Parses the output of `-X importtime`.
+    Returns a list of (module, self_us, cumulative_us, depth),
+    depth 0 is the imported module itself, 1 its direct imports and so on.
+    """
+    entries = []
+    for line in stderr.splitlines():
+        # "import time:       123 |        456 |   module"
+        if not line.startswith("import time:") or "self [us]" in line:
+            continue
+        try:
+            self_us, cumulative_us, name = line[len("import time:"):].split("|", 2)
+            self_us, cumulative_us = int(self_us), int(cumulative_us)
+        except ValueError:
+            continue
+        name = name.rstrip()
+        depth = (len(name) - len(name.lstrip(" ")) - 1) // 2
+        entries.append((name.strip(), self_us, cumulative_us, depth))
+    return entries
+
+
+def measure_imports(top):
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", "import main"],
+        cwd=REPO_DIR, capture_output=True, text=True
+    )
+    entries = parse_importtime(result.stderr)
+    if result.returncode != 0:
+        print(result.stderr.splitlines()[-1] if result.stderr else "import main failed")
+        return None
+
+    # importtime lists children before their parent
+    direct_imports, children, total_us = [], [], 0
+    for entry in entries:
+        if entry[3] == 1:
+            children.append(entry)
+        elif entry[3] == 0:
+            if entry[0] == "main":
+                direct_imports, total_us = children, entry[2]
+            children = []
+    print(f"Import of main: {total_us / 1000:.1f} ms, {len(entries)} modules")
+    print(f"{'cumulative':>12} {'self':>10}  module")
+    for name, self_us, cumulative_us, _ in sorted(direct_imports, key=lambda e: e[2], reverse=True)[:top]:
+        print(f"{cumulative_us / 1000:>10.1f}ms {self_us / 1000:>8.1f}ms  {name}")
+    return entries
+
+
+def measure_first_frame():
+    start = time.time()
+    result = subprocess.run(
+        [sys.executable, "-c", FIRST_FRAME_SCRIPT.format(lazy=LAZY_MODULES)],
+        cwd=REPO_DIR, capture_output=True, text=True
+    )
+    first_frame = None
+    loaded = []
+    for line in result.stdout.splitlines():
+        if line.startswith("FIRST_FRAME"):
+            first_frame = float(line.split()[1]) - start
+        elif line.startswith("LOADED"):
+            loaded = [m for m in line[len("LOADED"):].strip().split(",") if m]
+    if first_frame is None:
+        error = result.stderr.strip().splitlines()
+        print(f"First frame not measured: {error[-1] if error else 'no output'}")
+    return first_frame, loaded
+
+
+def main():
+    parser = argparse.ArgumentParser(description="QuickEDL startup benchmark")
+    parser.add_argument("--budget", type=float, default=1.5, help="time-to-first-frame budget in seconds")
+    parser.add_argument("--top", type=int, default=15, help="number of modules to list")
+    args = parser.parse_args()
+
+    failed = False
+
+    entries = measure_imports(args.top)
+    if entries is not None:
+        eager = [name for name, _, _, _ in entries if name in LAZY_MODULES]
+        if eager:
+            print(f"FAIL: imported at startup: {', '.join(eager)}")
+            failed = True
+
+    first_frame, loaded = measure_first_frame()
+    if first_frame is not None:
+        print(f"Time to first frame: {first_frame:.3f} s (budget {args.budget:.3f} s)")
+        if first_frame > args.budget:
+            print("FAIL: startup budget exceeded")
+            failed = True
+        if loaded:
+            print(f"FAIL: loaded before first frame: {', '.join(loaded)}")
+            failed = True
+
+    sys.exit(1 if failed else 0)
+
+
+if __name__ == "__main__":
+    main()
@@ -4,7 +4,6 @@ It provides a workflow to export EDL markers to a JSX script for Adobe Premiere
 """
 
 import ttkbootstrap as ttk
-from ttkbootstrap.dialogs import Messagebox
 from ttkbootstrap.tooltip import ToolTip
 from ttkbootstrap.validation import add_regex_validation
 from pathlib import Path
@@ -12,6 +11,7 @@ import logging
 import re
 
 from utils import open_directory
+from notifications import notify
 from confetti import show_confetti_pil
 
 class JSXExportWindow:
@@ -28,7 +28,7 @@ class JSXExportWindow:
             self.create_window()
             logging.debug("JSXExportWindow init DONE.")
         else:
-            Messagebox.show_error("No EDL file has been loaded.")
+            notify("No EDL file has been loaded.", "error")
 
     def create_window(self):
         self.export_window = ttk.Toplevel(self)
@@ -125,7 +125,7 @@ if (sequence) {
     var newMarker = markers.createMarker({marker_seconds});
     newMarker.name = "{text}";
 """
-                    logging.debug(f"marker converted: {text} at {marker_seconds} seconds.")
+                    logging.debug("marker converted: %s at %s seconds.", text, marker_seconds)
                 jsx_content += """
 } else {
     alert("No active sequence found.");
@@ -0,0 +1,292 @@
+"""
+This file is part of QuickEDL.
+It provides the marker history of the main window
+and a window browsing the whole EDL file.
+"""
+
+import logging
+import os
+import threading
+from array import array
+from collections import deque
+from pathlib import Path
+
+NO_MARKERS_TEXT = "No markers yet."
+
+
+class MarkerHistory:
+    """
+    The last markers, oldest first, limited to `depth` entries.
+    """
+
+    def __init__(self, depth=5):
+        self._markers = deque(maxlen=max(1, int(depth)))
+
+    @property
+    def depth(self):
+        return self._markers.maxlen
+
+    def set_depth(self, depth):
+        """Changes the number of markers kept, the newest ones are kept."""
+        depth = max(1, int(depth))
+        if depth != self._markers.maxlen:
+            self._markers = deque(self._markers, maxlen=depth)
+
+    def append(self, marker):
+        """Adds a marker, empty markers are ignored."""
+        marker = marker.strip()
+        if marker:
+            self._markers.append(marker)
+
+    def pop(self):
+        return self._markers.pop()
+
+    def clear(self):
+        self._markers.clear()
+
+    def load(self, markers):
+        """Replaces the history with the last markers of an iterable."""
+        self._markers.clear()
+        for marker in markers:
+            self.append(marker)
+
+    def text(self):
+        """Returns the markers as text for the history label."""
+        return "\n".join(self._markers) if self._markers else NO_MARKERS_TEXT
+
+    def __len__(self):
+        return len(self._markers)
+
+    def __iter__(self):
+        return iter(self._markers)
+
+
+def read_last_lines(path, count, encoding='utf-8', block_size=8192):
+    """
+    Returns the last `count` non-empty lines of a file (stripped, oldest first).
+    The file is read backwards in blocks, so only its end is read.
+    """
+    lines = []
+    with Path(path).open('rb') as file:
+        position = file.seek(0, os.SEEK_END)
+        rest = b""
+        while position > 0 and len(lines) < count:
+            size = min(block_size, position)
+            position -= size
+            file.seek(position)
+            data = file.read(size) + rest
+            parts = data.split(b"\n")
+            # the first part may be incomplete unless the start of the file is reached
+            rest = parts.pop(0) if position > 0 else b""
+            for part in reversed(parts):
+                if part.strip():
+                    lines.append(part)
+                    if len(lines) == count:
+                        break
+    return [line.decode(encoding, errors='replace').strip() for line in reversed(lines)]
+
+
+class LineIndex:
+    """
+    Byte offsets of the line starts of a file, built on a background thread.
+
+    Lines can be read while the index is built. Appended lines are indexed by
+    update(), a file that shrank or changed before the indexed end is re-indexed.
+
+    Objects:
+        count: int
+            Number of lines indexed so far
+        done: bool
+            True if the file is indexed up to its end
+    """
+
+    CHUNK_SIZE = 1 << 20
+
+    def __init__(self, path, encoding='utf-8'):
+        self.path = Path(path)
+        self.encoding = encoding
+        self._lock = threading.Lock()
+        self._offsets = array('Q', [0])
+        self._indexed = 0  # bytes scanned
+        self._size = 0  # file size seen by the last scan
+        self._mtime = None
+        self._thread = None
+        self._generation = 0
+
+    @property
+    def count(self):
+        with self._lock:
+            lines = len(self._offsets) - 1
+            # a last line without newline counts once the end is reached
+            if not self.running and self._size > self._offsets[-1]:
+                lines += 1
+            return lines
+
+    @property
+    def running(self):
+        return self._thread is not None and self._thread.is_alive()
+
+    @property
+    def done(self):
+        return not self.running and self._indexed >= self._size
+
+    def update(self):
+        """
+        Checks the file and indexes new content in the background.
+        Returns True if the index was reset (the file was truncated or rewritten).
+        """
+        try:
+            stat = self.path.stat()
+        except OSError:
+            return False
+        if stat.st_mtime_ns == self._mtime and stat.st_size == self._size:
+            return False
+        if self.running:
+            return False  # checked again on the next update
+
+        reset = stat.st_size < self._indexed or not self._ends_with_newline()
+        if reset:
+            with self._lock:
+                self._offsets = array('Q', [0])
+                self._indexed = 0
+                self._generation += 1
+        self._mtime = stat.st_mtime_ns
+        self._size = stat.st_size
+        if stat.st_size > self._indexed:
+            self._thread = threading.Thread(target=self._scan, args=(self._generation,), daemon=True)
+            self._thread.start()
+        return reset
+
+    def _ends_with_newline(self):
+        """Checks that the indexed part still ends at a line end."""
+        if self._indexed == 0:
+            return True
+        try:
+            with self.path.open('rb') as file:
+                file.seek(self._indexed - 1)
+                return file.read(1) == b"\n"
+        except OSError:
+            return False
+
+    def _scan(self, generation):
+        try:
+            with self.path.open('rb') as file:
+                file.seek(self._indexed)
+                position = self._indexed
+                while True:
+                    chunk = file.read(self.CHUNK_SIZE)
+                    if not chunk:
+                        break
+                    # index complete lines only, a partial last line is scanned again
+                    end = chunk.rfind(b"\n")
+                    if end < 0:
+                        break
+                    offsets = array('Q')
+                    start = chunk.find(b"\n")
+                    while 0 <= start <= end:
+                        offsets.append(position + start + 1)
+                        start = chunk.find(b"\n", start + 1)
+                    with self._lock:
+                        if generation != self._generation:
+                            return
+                        self._offsets.extend(offsets)
+                        self._indexed = position + end + 1
+                    position += end + 1
+                    file.seek(position)
+        except OSError as e:
+            logging.error(f"Failed to index {self.path}: {e}")
+
+    def lines(self, first, count):
+        """Returns up to `count` lines starting with line `first`."""
+        with self._lock:
+            total = len(self._offsets)
+            if first >= total:
+                return []
+            start = self._offsets[first]
+            last = first + count
+            end = self._offsets[last] if last < total else None
+        try:
+            with self.path.open('rb') as file:
+                file.seek(start)
+                data = file.read(end - start) if end is not None else file.read(count * 256)
+        except OSError:
+            return []
+        parts = data.split(b"\n")
+        if end is None and not parts[-1]:
+            parts.pop()  # nothing after the last newline
+        return [line.rstrip(b"\r").decode(self.encoding, errors='replace') for line in parts[:count]]
+
+
+class HistoryWindow:
+    """
+    Window showing every line of an EDL file.
+
+    Only the visible rows are rendered, the lines are read through a LineIndex,
+    so opening takes the same time for any file size. While the last line is
+    visible, the window follows new markers.
+    """
+
+    POLL_MS = 100  # while indexing
+    IDLE_POLL_MS = 500
+
+    def __init__(self, root, edl_file):
+        self.root = root
+        self.edl_file = Path(edl_file)
+        self.window = None
+        self.index = None
+        self.follow = True
+        self._poll_after = None
+
+    def show(self):
+        import ttkbootstrap as ttk
+        from virtuallist import VirtualList
+
+        if self.window is not None and self.window.winfo_exists():
+            self.window.lift()
+            return
+
+        self.window = ttk.Toplevel(self.root)
+        self.window.title(f"QuickEDL: History of {self.edl_file.name}")
+        self.window.geometry("500x600")
+        self.window.bind("<Escape>", lambda e: self.close())
+        self.window.protocol("WM_DELETE_WINDOW", self.close)
+
+        self.index = LineIndex(self.edl_file)
+        self.list = VirtualList(
+            self.window, self.get_rows,
+            columns=("line", "marker"), headings=("Line", "Marker"), widths=(70, None)
+        )
+        self.list.pack(fill="both", expand=True, padx=10, pady=(10, 5))
+        self.status = ttk.Label(self.window, text="Indexing...")
+        self.status.pack(anchor="w", padx=10, pady=(0, 10))
+
+        self.poll()
+
+    def get_rows(self, first, count):
+        return [(first + i + 1, line) for i, line in enumerate(self.index.lines(first, count))]
+
+    def poll(self):
+        """Indexes new lines and updates the list."""
+        self._poll_after = None
+        if self.window is None or not self.window.winfo_exists():
+            return
+        follow = self.list.at_end()
+        reset = self.index.update()
+        count = self.index.count
+        if reset or count != self.list.row_count:
+            self.list.set_row_count(count)
+            if follow:
+                self.list.scroll_to(count)
+
+        state = "indexing..." if self.index.running else "indexed"
+        self.status.config(text=f"{count} lines, {state}")
+        delay = self.POLL_MS if self.index.running else self.IDLE_POLL_MS
+        self._poll_after = self.window.after(delay, self.poll)
+
+    def close(self):
+        if self.window is not None:
+            if self._poll_after is not None:
+                self.window.after_cancel(self._poll_after)
+                self._poll_after = None
+            self.window.destroy()
+            self.window = None
@@ -0,0 +1,263 @@
+"""
+This file is part of QuickEDL.
+It provides a table-driven dispatcher for the hotkeys.
+"""
+
+import logging
+import sys
+import time
+
+# Default keymap: key -> action
+# Keys are Tk keysyms or characters, optionally with modifiers ("Control-1").
+DEFAULT_KEYMAP = {
+    **{str(i): f"marker_{i}" for i in range(1, 10)},
+    "0": "separator",
+    "space": "popup",
+    "p": "playlist",
+    "P": "playlist",
+    "Left": "playlist_prev",
+    "Right": "playlist_next",
+    "j": "playlist_jump",
+    **{f"Control-{i}": f"bank_{i}" for i in range(1, 10)},
+    "Control-0": "bank_10",
+    "b": "bank_next",
+    "B": "bank_prev",
+    "c": "confetti",
+    "BackSpace": "delete_last",
+}
+
+# Tk event.state bits of the modifier keys
+if sys.platform == "darwin":
+    MODIFIERS = {"Shift": 0x1, "Control": 0x4, "Command": 0x8, "Alt": 0x10, "Option": 0x10}
+elif sys.platform == "win32":
+    MODIFIERS = {"Shift": 0x1, "Control": 0x4, "Alt": 0x20000}
+else:
+    MODIFIERS = {"Shift": 0x1, "Control": 0x4, "Alt": 0x8}
+
+MODIFIER_MASK = 0
+for _bit in MODIFIERS.values():
+    MODIFIER_MASK |= _bit
+SHIFT = MODIFIERS["Shift"]
+
+# Actions which keep firing while their key is held down
+DEFAULT_REPEAT_ACTIONS = ("playlist_prev", "playlist_next")
+# Actions whose rapid identical presses are treated as a burst
+BURST_ACTIONS = tuple(f"marker_{i}" for i in range(1, 10)) + ("separator",)
+BURST_MODES = ("off", "collapse", "batch")
+
+# A held key repeats every ~30-100 ms, a longer gap means a new press
+# even if the release event got lost (e.g. the window lost focus).
+REPEAT_GAP = 1.0
+
+
+def parse_key(spec):
+    """
+    Parses a key spec like "Control-Shift-s" to (modifier bits, key).
+    Raises ValueError on unknown modifiers.
+    """
+    spec = str(spec)
+    if spec == "-" or "-" not in spec.strip("-"):
+        return 0, spec
+    *modifiers, key = spec.split("-")
+    if not key:  # "Control--" binds the minus key
+        key = "-"
+        modifiers = modifiers[:-1]
+    bits = 0
+    for modifier in modifiers:
+        if modifier not in MODIFIERS:
+            raise ValueError(f"Unknown modifier '{modifier}' in key '{spec}'")
+        bits |= MODIFIERS[modifier]
+    return bits, key
+
+
+class ActionStats:
+    """Invocation count and handler latency of one action."""
+    __slots__ = ("count", "total", "max")
+
+    def __init__(self):
+        self.count = 0
+        self.total = 0.0
+        self.max = 0.0
+
+    def record(self, elapsed):
+        self.count += 1
+        self.total += elapsed
+        if elapsed > self.max:
+            self.max = elapsed
+
+    def as_dict(self):
+        mean = self.total / self.count if self.count else 0.0
+        return {'count': self.count, 'mean_ms': mean * 1000, 'max_ms': self.max * 1000}
+
+
+class HotkeyDispatcher:
+    """
+    Maps key events to actions with a single dict lookup.
+
+    The keymap is loaded from the settings. Every entry is either an action name
+    or a dict {action: name, enabled: bool}. A key mapped to None is unbound.
+
+    Autorepeat of held keys is ignored, except for the repeat actions.
+    Identical presses of a burst action within the burst window are a burst:
+    in "collapse" mode they are dropped, in "batch" mode the handler is called
+    with `burst` set to True, so it can batch the write.
+
+    Functions:
+        load_keymap(keymap): replaces the keymap (merged with the defaults)
+        dispatch(event): calls the handler of the key, returns True if handled
+        stats(): invocation counts and handler latency per action
+    """
+
+    def __init__(self, actions):
+        """
+        Args:
+            actions: dict of action name -> handler without arguments
+        """
+        self.actions = actions
+        self._bindings = {}
+        self._stats = {name: ActionStats() for name in actions}
+        self.load_keymap(None)
+
+        self.repeat_actions = set(DEFAULT_REPEAT_ACTIONS)
+        self.burst_mode = "off"
+        self.burst_window = 0.3  # seconds
+        self.burst = False  # True while the handler of a burst press runs
+        self.suppressed = 0  # autorepeat events ignored
+        self.collapsed = 0  # burst presses dropped
+
+        self._held = {}  # keysym -> monotonic time of the last press/repeat
+        self._released = {}  # keysym -> event.time of the last release
+        self._last_action = None
+        self._last_action_time = 0.0
+
+    def configure(self, burst_mode=None, burst_window_ms=None, repeat_actions=None):
+        """
+        Sets the autorepeat and burst behaviour.
+        Args:
+            burst_mode: "off", "collapse" or "batch"
+            burst_window_ms: window for identical presses in milliseconds
+            repeat_actions: actions which may autorepeat
+        """
+        if burst_mode is not None:
+            if burst_mode not in BURST_MODES:
+                logging.warning(f"Unknown burst mode '{burst_mode}', using 'off'")
+                burst_mode = "off"
+            self.burst_mode = burst_mode
+        if burst_window_ms is not None:
+            self.burst_window = max(0, burst_window_ms) / 1000
+        if repeat_actions is not None:
+            self.repeat_actions = set(repeat_actions)
+
+    def load_keymap(self, keymap):
+        """
+        Builds the lookup table from the default keymap and the configured one.
+        Args:
+            keymap: dict of key spec -> action name or {action, enabled}, may be None
+        """
+        merged = dict(DEFAULT_KEYMAP)
+        if isinstance(keymap, dict):
+            merged.update({str(key): value for key, value in keymap.items()})
+        elif keymap is not None:
+            logging.error(f"Invalid keymap in settings, using defaults: {keymap!r}")
+
+        bindings = {}
+        for spec, entry in merged.items():
+            if entry is None:
+                continue
+            if isinstance(entry, dict):
+                action = entry.get('action')
+                enabled = bool(entry.get('enabled', True))
+            else:
+                action, enabled = str(entry), True
+            if action not in self.actions:
+                logging.warning(f"Keymap: unknown action '{action}' for key '{spec}'")
+                continue
+            try:
+                bindings[parse_key(spec)] = (action, enabled)
+            except ValueError as e:
+                logging.warning(f"Keymap: {e}")
+        self._bindings = bindings
+        logging.info(f"Keymap loaded with {len(bindings)} keys")
+
+    def lookup(self, event):
+        """
+        Returns (action, enabled) for a key event or None.
+        Tries the keysym with all modifiers, the keysym without Shift
+        (Shift is part of keysyms like "P") and finally the typed character
+        (e.g. digits on the numeric keypad).
+        """
+        modifiers = event.state & MODIFIER_MASK
+        bindings = self._bindings
+        binding = bindings.get((modifiers, event.keysym))
+        if binding is None and modifiers & SHIFT:
+            binding = bindings.get((modifiers & ~SHIFT, event.keysym))
+        if binding is None and event.char:
+            binding = bindings.get((modifiers & ~SHIFT, event.char))
+        return binding
+
+    def key_released(self, event):
+        """Tracks key releases, must be bound to <KeyRelease>."""
+        self._held.pop(event.keysym, None)
+        self._released[event.keysym] = event.time
+
+    def reset_keys(self):
+        """Forgets held keys, e.g. when the window lost the focus."""
+        self._held.clear()
+        self._released.clear()
+
+    def is_autorepeat(self, event, now):
+        """
+        Returns True if the event is an autorepeat of a held key.
+        Windows and macOS repeat the press without releases, X11 sends
+        release/press pairs with the same event time.
+        """
+        keysym = event.keysym
+        last_seen = self._held.get(keysym)
+        self._held[keysym] = now
+        if self._released.get(keysym) == event.time:
+            return True
+        return last_seen is not None and now - last_seen < REPEAT_GAP
+
+    def dispatch(self, event):
+        """
+        Calls the handler bound to the key of the event.
+        Returns True if an enabled action was called.
+        """
+        now = time.monotonic()
+        repeated = self.is_autorepeat(event, now)
+
+        binding = self.lookup(event)
+        if binding is None:
+            return False
+        action, enabled = binding
+        if not enabled:
+            return False
+        if repeated and action not in self.repeat_actions:
+            self.suppressed += 1
+            return False
+
+        burst = (
+            self.burst_mode != "off"
+            and action in BURST_ACTIONS
+            and action == self._last_action
+            and now - self._last_action_time < self.burst_window
+        )
+        self._last_action = action
+        self._last_action_time = now
+        if burst and self.burst_mode == "collapse":
+            self.collapsed += 1
+            logging.debug("Hotkey burst collapsed: %s", action)
+            return False
+
+        self.burst = burst
+        start = time.perf_counter()
+        try:
+            self.actions[action]()
+        finally:
+            self.burst = False
+            self._stats[action].record(time.perf_counter() - start)
+        return True
+
+    def stats(self):
+        """Returns {action: {count, mean_ms, max_ms}} for all invoked actions."""
+        return {name: stats.as_dict() for name, stats in self._stats.items() if stats.count}
@@ -0,0 +1,281 @@
+"""
+This file is part of QuickEDL.
+It measures the latency from a keypress to a marker being durable on disk
+and provides a small window showing the statistics.
+"""
+
+import logging
+import math
+import time
+from collections import deque
+
+# Stages of a marker write, in order
+STAGES = ("queue", "format", "write", "fsync", "total")
+STAGE_DESCRIPTIONS = {
+    "queue": "Key event to handler start",
+    "format": "Handler start to marker formatted",
+    "write": "Marker formatted to write end",
+    "fsync": "Write end to fsync end",
+    "total": "Key event to fsync end",
+}
+
+
+class Histogram:
+    """
+    Histogram with logarithmic buckets (4 per octave, starting at 10 µs).
+    Percentiles are estimated as the upper bound of the bucket.
+    """
+    __slots__ = ("counts", "count", "max")
+
+    BASE_MS = 0.01
+    STEPS_PER_OCTAVE = 4
+    BUCKETS = 96  # up to ~ 10 minutes
+
+    def __init__(self):
+        self.counts = [0] * self.BUCKETS
+        self.count = 0
+        self.max = 0.0
+
+    @classmethod
+    def bucket(cls, value_ms):
+        if value_ms <= cls.BASE_MS:
+            return 0
+        index = int(math.log2(value_ms / cls.BASE_MS) * cls.STEPS_PER_OCTAVE) + 1
+        return min(index, cls.BUCKETS - 1)
+
+    @classmethod
+    def upper_bound(cls, index):
+        return cls.BASE_MS * 2 ** (index / cls.STEPS_PER_OCTAVE)
+
+    def add(self, value_ms):
+        self.counts[self.bucket(value_ms)] += 1
+        self.count += 1
+        if value_ms > self.max:
+            self.max = value_ms
+
+    def merge(self, other):
+        for i, value in enumerate(other.counts):
+            if value:
+                self.counts[i] += value
+        self.count += other.count
+        self.max = max(self.max, other.max)
+
+    def percentile(self, fraction):
+        if not self.count:
+            return 0.0
+        rank = fraction * self.count
+        seen = 0
+        for i, value in enumerate(self.counts):
+            seen += value
+            if seen >= rank:
+                return min(self.upper_bound(i), self.max)
+        return self.max
+
+
+class StageHistograms:
+    """
+    Ring buffer of histograms for one stage, one histogram per time slot.
+    Statistics cover the slots in the ring, the session histogram everything.
+    """
+
+    def __init__(self, slots=15, slot_seconds=60):
+        self.slot_seconds = slot_seconds
+        self.ring = deque(maxlen=slots)
+        self.session = Histogram()
+        self._slot_start = None
+
+    def add(self, value_ms, now):
+        if self._slot_start is None or now - self._slot_start >= self.slot_seconds:
+            self.ring.append(Histogram())
+            self._slot_start = now
+        self.ring[-1].add(value_ms)
+        self.session.add(value_ms)
+
+    def recent(self):
+        merged = Histogram()
+        for histogram in self.ring:
+            merged.merge(histogram)
+        return merged
+
+
+class MarkerTrace:
+    """
+    Timestamps of a single marker, from the key event to the fsync.
+    Stages which are not marked are not recorded.
+    """
+    __slots__ = ("recorder", "event_delay", "start", "last", "durations")
+
+    def __init__(self, recorder, event_delay=None):
+        self.recorder = recorder
+        self.event_delay = event_delay  # ms from key event to handler start
+        self.start = time.perf_counter()
+        self.last = self.start
+        self.durations = {}
+
+    def mark(self, stage):
+        """Records the time since the previous mark as the duration of the stage."""
+        now = time.perf_counter()
+        self.durations[stage] = (now - self.last) * 1000
+        self.last = now
+
+    def finish(self):
+        """Hands the trace to the recorder."""
+        self.recorder.record(self)
+
+
+class LatencyRecorder:
+    """
+    Collects key-to-disk latency of markers per stage.
+
+    The event time of Tk (event.time, ms) has an unknown offset to the
+    perf_counter clock. The offset is estimated as the smallest difference
+    seen so far, so the queue stage is the delay relative to the fastest
+    handled event.
+
+    Functions:
+        begin(event): starts a trace for a key event (or a click, if event is None)
+        record(trace): adds a finished trace to the histograms
+        stats(): p50/p95/p99/max per stage
+        summary(): one line per stage for the log
+    """
+
+    def __init__(self, slots=15, slot_seconds=60):
+        self.stages = {stage: StageHistograms(slots, slot_seconds) for stage in STAGES}
+        self.current = None  # trace of the event being handled
+        self._event_offset = None
+
+    def begin(self, event=None):
+        """Starts a trace and makes it the current one."""
+        event_delay = None
+        event_time = getattr(event, "time", None)
+        if isinstance(event_time, int) and event_time > 0:
+            difference = time.perf_counter() * 1000 - event_time
+            # the event clock wraps around and can jump, so re-base on a lower difference
+            if self._event_offset is None or difference < self._event_offset:
+                self._event_offset = difference
+            event_delay = difference - self._event_offset
+        self.current = MarkerTrace(self, event_delay)
+        return self.current
+
+    def trace(self):
+        """Returns the current trace or starts one, e.g. for a button click."""
+        return self.current or self.begin()
+
+    def end(self):
+        """Ends the current trace without recording it if it wasn't finished."""
+        self.current = None
+
+    def record(self, trace):
+        if self.current is trace:
+            self.current = None
+        now = time.monotonic()
+        total = sum(trace.durations.values())
+        if trace.event_delay is not None:
+            self.stages["queue"].add(trace.event_delay, now)
+            total += trace.event_delay
+        for stage, duration in trace.durations.items():
+            if stage in self.stages:
+                self.stages[stage].add(duration, now)
+        self.stages["total"].add(total, now)
+
+    def stats(self, session=False):
+        """
+        Returns {stage: {count, p50, p95, p99, max}} in milliseconds.
+        Args:
+            session: Use the whole session instead of the recent time slots
+        """
+        result = {}
+        for stage, histograms in self.stages.items():
+            histogram = histograms.session if session else histograms.recent()
+            result[stage] = {
+                'count': histogram.count,
+                'p50': histogram.percentile(0.50),
+                'p95': histogram.percentile(0.95),
+                'p99': histogram.percentile(0.99),
+                'max': histogram.max,
+            }
+        return result
+
+    def summary(self):
+        """Returns the session statistics as text."""
+        lines = []
+        for stage, values in self.stats(session=True).items():
+            lines.append(
+                f"{stage:>6}: n={values['count']} p50={values['p50']:.2f} p95={values['p95']:.2f} "
+                f"p99={values['p99']:.2f} max={values['max']:.2f} ms"
+            )
+        return "\n".join(lines)
+
+    def log_summary(self, title="Marker latency"):
+        """Writes the session statistics to the log and starts a new session."""
+        if not self.stages["total"].session.count:
+            return
+        logging.info(f"{title}:\n{self.summary()}")
+        for histograms in self.stages.values():
+            histograms.session = Histogram()
+            histograms.ring.clear()
+            histograms._slot_start = None
+
+
+class LatencyStatsWindow:
+    """
+    Small window showing p50/p95/p99/max per stage, refreshed every second.
+    """
+
+    REFRESH_MS = 1000
+
+    def __init__(self, root, recorder):
+        self.root = root
+        self.recorder = recorder
+        self.window = None
+        self.tree = None
+        self.extra_rows = {}  # label -> callable returning text, shown below the stages
+
+    def show(self):
+        import ttkbootstrap as ttk
+
+        if self.window is not None and self.window.winfo_exists():
+            self.window.lift()
+            return
+
+        self.window = ttk.Toplevel(self.root)
+        self.window.title("QuickEDL: Latency")
+        self.window.geometry("520x240")
+        self.window.bind("<Escape>", lambda e: self.close())
+        self.window.protocol("WM_DELETE_WINDOW", self.close)
+
+        columns = ("count", "p50", "p95", "p99", "max")
+        self.tree = ttk.Treeview(self.window, columns=columns, height=len(STAGES) + 2)
+        self.tree.heading("#0", text="Stage (ms)")
+        self.tree.column("#0", width=120)
+        for column in columns:
+            self.tree.heading(column, text=column)
+            self.tree.column(column, width=70, anchor="e")
+        for stage in STAGES:
+            self.tree.insert("", "end", iid=stage, text=stage)
+        self.tree.pack(fill="both", expand=True, padx=10, pady=10)
+
+        self.info_label = ttk.Label(self.window, text="", justify="left")
+        self.info_label.pack(anchor="w", padx=10, pady=(0, 10))
+
+        self.refresh()
+
+    def refresh(self):
+        if self.window is None or not self.window.winfo_exists():
+            return
+        for stage, values in self.recorder.stats().items():
+            self.tree.item(stage, values=(
+                values['count'],
+                f"{values['p50']:.2f}",
+                f"{values['p95']:.2f}",
+                f"{values['p99']:.2f}",
+                f"{values['max']:.2f}",
+            ))
+        info = [f"{label}: {get_text()}" for label, get_text in self.extra_rows.items()]
+        self.info_label.config(text="\n".join(info))
+        self.window.after(self.REFRESH_MS, self.refresh)
+
+    def close(self):
+        if self.window is not None:
+            self.window.destroy()
+            self.window = None
@@ -1 +0,0 @@
-bin_logo = b'\x89PNG\r\n\x1a\n\x00\x00\x00\rIHDR\x00\x00\x02\x00\x00\x00\x02\x00\x08\x06\x00\x00\x00\xf4x\xd4\xfa\x00\x00\x00\x04sBIT\x08\x08\x08\x08|\x08d\x88\x00\x00 \x00IDATx\x9c\xec\x9dwx\\W\x99\xb8\xdfs\xef\xf4>\xea\x96\xdc\xe2\x16w;v\x9c\xe2$N\x0f\xa9\xa4Ah\x0b\t\x84,? \x04vi\x0b\xa1\xb3\xb0K]XXX:a\t\xa4\x01I\x08\x10\x1c\xd2\x9b\x13\xa7\xdaq\x1c\xc7\xbd\xabK\xd3\xfb\xdc\xdf\x1f#\xc7\xd2\xdc;\xa3\x9143\x9a\x91\xcf\xfb<\xf3H\xbaS\xee\xd1\x9ds\xcf\xf7\x9d\xaf\x82D"\x91H$\x12\x89D"\x91H$\x12\x89D"\x91H$\x12\x89D"\x91H$\x12\x89D"\x91H$\x12\x89D"\x91H$\x92\xfa@L\xf6\x00$5\x85\x9c\x0f\x12\xc9\xb1\x816\xd9\x03\x90L>r\xc1\x9fZ\xc8\xefS"\x91T\x1a\xa9<L\x11\xa4\xc0\xa8/*\xf9}\xc9\xb9 \x91\x1c[TR\x90K%\xa1\x0e\x90\x8b~m2\x91\xef\xa5\\\xdf\xa9\x9c\x1b\x12\xc9\xd4\xa2\\By\xbc\x9f#\x95\x82\x1aC.\xf2\xb5\xc1X\xbe\x87R_;\xde\xefV\xce\t\x89d\xeaRi\xe1=\xd6\xcf\x97J\xc1$"\x17\xfb\xeaS\x0e\x01>\xde\xe7\xc6r\xfer\xbdO"\x91L\x0e\xe3\x11\xae\xa3\xbd\xa7\xd8\xf3\xe3}n<\xaf\x93\x94\x01\xb9\xa8W\x87\xf1\ne\xa3\xe3\xf9\xc7\xc6\xf2\xdeR\xc6R\xeak&\x8bZ\x1e\x9bD\x02\xb5+\xc4J\x19\xd7X\x85\xf8D\x8e\x8dv\xbeR\x9e\x97L\x00\xb9\x98V\x86\xf1\x08\xfc\xd1\x04\xbb0\xfa\xbd\xb9\xb9\xd9b\xb5Z-\xc9d\xd2l2\x99,\xaa\xaaZ\xd2\xe9\xb4EUU\xb3\x10\xc2\xa2(\x8a%\x93\xc9\x98\x15E1k\x9a\xa6\x8cc\xac\xa3\xa2i\x9a\x9cG\x12\xc9$ \x84\x98\xa8\x80\xd4\xbd_\x08\x91\xcdf\xb3iUU\x93\xd9l6\xa9iZ2\x93\xc9\xa4L&S2\x93\xc9$\xd3\xe9t\xd2b\xb1\xa4\x12\x89D\xb2\xa7\xa7\'Y\xe4\xb3\xc6\xfaw\xa1c\xa5<\'\x19\x07r\xe1./c1\xcd\x97$\xe0\x01\xd1\xda\xdajN&\x93&\x87\xc3aRU\xd5\xab(\xca\x02!\xc4|M\xd3\xe6\x08!:\x00;`\x1bz\xd85M\xb3\x03V\xc0&\x84\xb0\x0f=o\x01\xd4\xf1\xfcS\x12\x89\xe4\x98"\x03$\x81\x98\xa6i1 \x0e$\x84\x101\xe0\xc8\xdf\xf1\xa1\xe7\x0f\n!vi\x9a\xb6=\x9b\xcd\xbe\x9e\xc9d\x02\xd1h4m\xb1X\xd2]]]\xa9\xa1\xcf\x1b.\xb8K\xf9\xbd\xd8\xb1R\x9e\x93\x94\x88T\x00&N\xa9\xa6\xf6\x82\x02>\xff\xf7\x193f4\x01KM&\xd3\xecl6;OQ\x949\xc0,`:\xd0Z\xe4\x9c\x12\x89D2Yh@\x17p\x00\xd8\x9b\xcdfw+\x8a\xb2=\x9dN\xef\x01^\xd9\xbf\x7f\x7fo\xdek\x87\xff,\xf6\xbb\xd1\xdf\xa5>\')\x82\x14$\xe3c"B?\xff\xa7\xd2\xd1\xd11\xd3l6/\x12B,\xd74\xed\x1c!\xc4\t\xe4v\xf0&r\xbbv\xf9=I$\x92zC#gMH\x03\tM\xd3^\x14B<\xa4i\xda\xa6T*\xb5\xf5\xe0\xc1\x83\xfb\x80\xec\xb0\xd7\x0e\xffY\xea\xef\xf9\xe7\x93\x8c\x01)X\xc6F)\x82\x7f4\xa1\xaf677{-\x16K\x9b\xd9l>\x198\x07X:d\xca\xf7\x149\x87D"\x91\xd4;\x1a\x10\xd44\xed \xf0\n\xf0P*\x95z&\x99Lv\xf6\xf4\xf4\x04\xc9)\x0b\xc5\x94\x81\x89\xc6\x11H\x86!\x85Mi\x8c%h\xcf\xe8\xa7\xd2\xda\xda\xea\xb1\xdb\xedk\x81\x0b\x815B\x88\xa5\xe4\xfc\xf2\x12\x89Dr,\x93\xd44m\x0b\xf0,p\x7f4\x1a}\xba\xbb\xbb;H\xcez\x009\x81>V\x97A\xa1c\x92aH\x05\xa08\xa3\t\xfebB_\xf8\xfd~\x9b\xc7\xe3Y+\x84x\x0bp\xb9\x10\xa2\xb1B\xe3\x94H$\x92)\x81\xa6i}\xc0=\x9a\xa6\xdd\x15\x0c\x06\x9f\x1a\x18\x18\x883R\x01\x90\xca@\x99\x90\n\x801\xc5\x04\x7fQ\xa1\xef\xf3\xf9\xec.\x97\xeb\x14\x93\xc9t\xb9\x10\xe2M@;9\x7f\xbeD"\x91HJ\'\x01\x1c\xd24\xed\xef\xe9t\xfa\x9ep8\xbcapp0Fqe@*\x02c@*\x00#\x19\xaf\xe0Wg\xce\x9c9MQ\x94u\xc0\xdb\x85\x10\xab\x81\xa6\xca\rS"\x91H\x8e)z5M{\x1e\xb8-\x93\xc9<\xbe\x7f\xff\xfeC\x14w\x11HE\xa0\x04\xa4\x02\x90c\xac\x82\xff\xc8Cmooo2\x9b\xcd7(\x8ar-\xb94=yM%\x12\x89\xa42h\xc0\x81l6{K*\x95\xfa\xd9\xa1C\x87z\xc9)\x02\xf9J@)\x8a\xc01\xaf\x04\x1c\xeb\xc2j\xbc\x82_\xcc\x981c\x8d\xaa\xaa\xef\x17B\\\x06\xf8+;L\x89D"\x91\xe41\xa0i\xda\x9f3\x99\xcc\xcf\xf7\xef\xdf\xbf\x11c%@*\x02E8V\x15\x80R\x05\xbf\xce\xbf\xefv\xbbOVU\xf5CB\x88\xf3\xc9U\xde;V\xaf\xa1D"\x91L6\x1a\x10\xd74\xed\x81L&\xf3\xa3P(\xf4\xcc\xe0\xe0`\x9c\x91\xf5\x05\xa4"P\x80cQx\x8dV\xacG\xb7\xe3\xf7\xfb\xfd6\x97\xcb\xb5\xc2d2}\x04X\x07\xb4T~\x98\x12\x89D"\x19\x03\xdd\xc0c\xe9t\xfa\x07\xe1p\xf8\xe5a\xd9\x03\xa5\x06\rR\xe4\xd8\x94\xe4XR\x00J\xad\xd27\xfc\xa1ttt\xcc0\x9b\xcd\x9f\x11B\\\x038*?L\x89D"\x91L\x80\xa8\xa6iw$\x93\xc9\xff<t\xe8\xd0~F\xc6\x08\x18)\x03p\x8cZ\x03\x8e\x15\x05\xa0\x94\xa2=#\x1e\xed\xed\xed\xcd\x16\x8b\xe5\xc3\xc0\xfbe\xfe\xbeD"\x91\xd4\x17C\xf5\x04~\x91L&\xff\xe7\xd0\xa1C\xdd\x8cT\x02\xa4"\xc0\xd4W\x00\xc6,\xf8\xfd~\xbf\xd5\xeb\xf5^%\x84\xf8\x020\x130j\xa1+\x91H$\x92\xda\'\x0b\xec\xd34\xed+\x83\x83\x83\x7f\x1a\x8a\x0f\xc8W\x04Fs\x0bLY%`*\xb7\x87\x1d\xab\xf07M\x9f>}\xbe\xc3\xe1\xb8Y\x08\xf1Id\xd7=\x89D"\xa9w\x04\xe0\x13B\x9cc\xb3\xd9\xda\\.\xd7\xae`0\x18\xc8{~,\xad\xda\xa7\x14S\xf5\x1f+\xd6\x9cG\xf7\xf0z\xbdv\xbf\xdf\x7f\x83\x10\xe2F`F\xf5\x86)\x91H$\x92*r \x93\xc9\xfc \x10\x08\xfc,\x10\x08\x1c\xa9*x\xccZ\x03\xa6\x9a\x02Pl\xd7\x9f\xff\xbb\x02(3g\xce<AU\xd5\xef\x03\xab\xab3D\x89D"\x91L&\x9a\xa6\xbd\x90\xcdfo\xda\xb7o\xdfK\xe8\x83\x04\x8b\xa5\x0e\x1a\xfd]\xb7L%\x17\xc0h\xc2\xff\r\xa1\x0f(n\xb7\xdb\xd9\xde\xde\xfe1EQ\xbe\x0e,\xac\xde0%\x12\x89D2\x99\x08!\xa6)\x8ar\xbe\xcf\xe7\xb3e2\x99\x97\x93\xc9d\xba\xd0K\xf3~\xe6\xff^\xd7L\x15\x05\xc0H\xf8\x17z(---^\x9f\xcf\xf7E!\xc4\xc7\x80\x86\xaa\x8eT"\x91H$\xb5\x80W\x08q\x9a\xc3\xe1\xf0X,\x96g"\x91H\x92\xd2\x8a\xc4\xe5\xff^\xb7L\x05\x05\xa0\x90\x8f?\xffo\x85\\^\xff\n\x9b\xcd\xf6+!\xc4UL\x8d\xff_"\x91H$\xe3C\x05N2\x9b\xcd\xa79\x9d\xceM\xa1P\xa8{\xe8x\xbe,a\xd8q\xf2^S\xb7\xd4\xb3\x00\xcc\xbf\xf8\x86>\xfe#\x0f\x8f\xc7\xe3hkk\xfb7\x93\xc9\xf4_B\x88\x05\xd5\x1d\xaaD"\x91Hj\x15!\xc4\x0cEQ\xae\xf4z\xbd\x0eM\xd3\x9eK$\x12\x19\x8a[\x03F;V\x17\xd4\xab\x02P\x8a\xbf\xff\r%\xa0\xa5\xa5\xa5\xc3\xeb\xf5~_\x08\xf1>\xc0U\xbdaJ$\x12\x89\xa4\x1e\x10B\xd8\x85\x10\xa78\x1c\x8e\xf9C.\x81\xc8\x91\xa7\xf2_jp\xbc.\x95\x80zT\x00\xc6$\xfc\xdb\xda\xda\xe68\x1c\x8e\xff\x06.\xa3>\xff_\x89D"\x91T\x07\x15Xl\xb1X\x16\xd9l\xb6g\xc2\xe1p\x90\\\xd4\x7f\xb1\xd4r\xa3\xdf\xeb\x82z\x13\x88\xa3\xe6\xf43\xcc\xec?k\xd6\xac\xb3,\x16\xcb\xaf\x80\x93\xaa=P\x89D"\x91\xd4-s\xcdf\xf3y^\xafw[ \x10\xd8\x8b\xf1\xae\x1f\x83cu\xa5\x04\xd4\x93\x020Z\xf3\x9e\xe1>\x7fu\xe6\xcc\x99W\xab\xaa\xfaK\xa0\xbd\xaa\xa3\x94H\xaaH\x93+\xc5\x8a\xd9\x11\xa67$H\xa4\x04\xd1d=\xdd\xd2\x12IM\xd3(\x84\xb8\xd4\xe3\xf1\xec\r\x04\x02\xdb\x86\x8e\x15\x12\xf0u\xa9\x04\xd4\xcb@G\x13\xfeo(\x01\r\r\rf\xa7\xd3y\xb5\xc9d\xfao\xa4\xbf_2\x05\xb1\x984\x96\xce\x88\xf3\xd6\xb5\x01\xce^\x99\xc4i\xcb\xa0\x01\xd1\x84\xc2\x86-f\xbe\xff\x97F\xf6\xf6X\xc9N\x99r%\x12\xc9\xa4\x12N\xa7\xd37\x85\xc3\xe1?\x0e\x0c\x0c\xa4\xc8\xf5\x17\xc82z\xd1\xa0\x9a\xbf\x03\xeba\xbbP\xb2\xf0\xf7\xfb\xfd\x16\x8f\xc7\xf3VUU\xbf\x01\xf8\xaa;L\x89\xa4\xf2\xd8\xcdY>zi/\x9fz\xcb \'-J\xe1\xb4kX\xcc`1\x83\xd3\xa6q\xfc\xcc\x0c\xa7\xce\x8f\x11\x8d\xa7y\xfd\xb0\x1dM\xab\x17\x1d_"\xa9Y,\x8a\xa2\x9cf\xb1X\x0e\t!^\x8f\xc7\xe3\xd9"\xaf\xad+K@\xad+\x00%\x0b\x7f\xc0\xdc\xd6\xd6\xf6UEQn\x06\xbcU\x1d\xa5DR\x05\xe6\xb5F\xf8\xdf\x0f\xf4r\xe9\xa9q\x1c\xf6\xc2\xafk\xf4f9sY\x82h4\xc1\x8b\xbb\xa5\x11L")\x03\x0e!\xc4y6\x9b\xcd;88\xf8\x18Gw\xf7u\x1d\x13P\xcb\n@)\xc2_\x01\x14\x97\xcb\xe5noo\xff\xa1\x10\xe2\xbd\x80\xb5\xba\xc3\x94H*\xcf\xd9K\x06\xf8\xaf\xf7\xf7q\xfc\xacLIK\x8aI\x85\xb5\x8b\xd2\xf4\rf\xd8\xb2\xdfQ\xfb\xb6H\x89\xa4\xf61\x0b!N\xf4\xf9|\xc7\xa5\xd3\xe9\x87\x92\xc9d\x8a:\x8f\t\xa8U\x05`,\xc2\xdf\xd5\xd4\xd4\xf4\x15!\xc4\xb5\xd4\xee\xff#\x91\x8c\x9bu\x8b\x06\xf9\xc6u\x01\xda\x9b\xc7\xf6>E\x81UsR<\xf0\x92\x9d\x81\x88\xa92\x83\x93H\x8e-\x14!\xc4\x12\x87\xc3\xe1I\xa7\xd3O\r\xf5\x10\xc8O\x13<B\xcd+\x01\xb5(0K\x15\xfe\xc2\xe3\xf1\xd8\x1b\x1b\x1bo\x18\xaa\xe9o\xae\xee0%\x92\xca\xe3ud\xf8\xc1\r\xbd\xccl3v;j\x1a\xa43\xb9\x87\x10\xa0\xe4-36+xlI\x9e\xde\xe6 \x91V\xaa0b\x89d\xca#\x84\x10K\x1d\x0eG0\x93\xc9lJ&\x93\x99#\xc7\x8d^[\xe0\xf7\x9a\xa0\xd6\x14\x80\x92\x85?\xa0N\x9b6\xedKB\x88\x8f\x03E<\xa2\x12I}bR5\xfe\xfd\x9d\x9d\xac]\x9aB\x18,\x1d}\x83\x82_\xfc\xdd\xc3/\xd7;\xf8\xdd#v^\xd9mc\xd5\x9c8\xb6<\'\xd8\xfc\x8e\x0c\xb1X\x96\x8d;\x1c\xd5\x19\xb8D2\xf51\t!N\xb3\xdb\xed\xce\xc1\xc1\xc1G\x87\x1d\xaf+%\xa0\xd6\x15\x80BE~\xcc\xb3f\xcd\xbaIQ\x94O!}\xfe\x92)\xca\xe5k\x82\xdcty\x18\x91\xb7q\xcff\xe0\xff\x1ep\xf2\xb1_\xb4\xf0\xd0\x16\x17\xbb\xbam\x1c\x1e\xb4\xb1y\x9f\x9d\xc7^\xb1q\xe1\xaa\x08\x0e\xdb\xd1\xd7+\n,\x9a\x9e\xe6\xc9-6z\x82\xd2\x15 \x91\x94\t\xb3\x10\xe2D\xaf\xd7\x1b\x0b\x04\x02\xcf\x8f\xf2\xda\x9aT\x02jI\x01(\xb5\xca\x9fi\xfa\xf4\xe9\xa7\x9bL\xa6o\x03\xce\xaa\x8fR"\xa9\x02m\xbe$\x9f\xbc\xb2\x8f\x8e\xe6\xbc\xf0=\r\xee~\xd2\xc9\xb7\xeei\xa4/\xac\x17\xe6\xbd!3.s\x86U\xf3\x12\xa8\xc3\xeen\xabY#\x91\xd0x\xecUy\xcbH$eD\x11B\xact\xb9\\\x1b\x83\xc1\xe0\x01\x8a\xe7\xfe\xd7\x8c\xe0?B\xad8\x05\x8biG\xc3\x85\xbf:c\xc6\x8c\xb5&\x93\xe9\x87\x80\xbfZ\x83\x93H\xaa\xcd5\xa7\x069qAFw|\xfb\x01\xc1W\xeehd RXw\xff\xf5#n^\xda12$FQ\xe0\xea\xd3\xa3\xb4\xfb\xe2e\x1f\xabDr\x8c\xd3`2\x99~8}\xfa\xf4\xb5\xe46\xd5G,\xd5\xf9\x1b\xd8\xe1\xd4\x842P\x0b\x16\x80b~\x7fe\xd8Oe\xe6\xcc\x99kM&\xd3o\x84\x103\xaa<F\x89\xa4j\xcco\x8b\xf3\xef\xef\x19\xc0n\x1b\xb9\x99\x88\xc5\x04\x1f\xfcq+{{-E\xdf\x1fO\xa9\x1c\xec\xd3\xb8\xec\xa4X\x9e\x15\x00\xd0\xe0\xc9\xad\x0e\xb4\xdaX\x7f$\x92)\x81\x10\xc2\xaf\xaa\xea\xf9\x1e\x8fgc \x108X\xea\xdb*:\xa8\x12\x98l\x0b@\xc9\xe9~\xad\xad\xads\x86j\xfb\xb7Vw\x88\x12Iuy\xeb\xda >\xf7\xc8\xa8\x7fM\x83?<i\xe3\xe5=\xa5\xc5\xbbn\xda\xeb\xe2\xd9\xd7FZ\x01\x84\x807\x9f\x1c\xc6\xeb(V\xc8L"\x91\x8c\x93VUU\x7f\xd9\xda\xdaz\x1c#{\xd3\x18\xb9\xb3\x8f0\xa9J\xc0d+\x00\xf9\x186\xf7q\xbb\xddv\xbb\xdd~3\xd01\x99\x83\x93H*\x8d\xd5\x94\xe5\x925Q]\xd4\x7fW\xbf\xe0\xeeg\xdc%\x17\xf4\x89&T\x9e|U\xaf,4\xfb\xe0\xf4\x85\xc1\x89\x0fT"\x91\x18\xd1a\xb7\xdbov\xb9\\vJw\x01L\x9a\x120\x99\n@)A\x7f\x020\xf9|\xbe\xb7\n!\xdeJ\r\x98L$\x92Jr\xc1\x8aAZ\x1b\xf5b~\xfd\xf36^\xdcSz\x00\x9f\x06\xac\x7f\xc9\x81\x96\x1fF \xe0\xf2\x93#\xb8\xed\xa9\x89\rT"\x91\x18!\x84\x10o\xf5\xfb\xfdo!W\x9b\xa6X<\xc0\xa4\xcb\xb3\xc9R\x00\x8c\x84\xff\xf0\xdf\xdf\xd8\xfd\xcf\x9c9\xf3M\xaa\xaa~\x95\xda\xb3VH$e\xc5\xa4j\\\xb2&\x8e\x927\xd3\xa3Q\xf8\xcd#\rhc\xac\xe7\xbb\xbf\xcf\xc6\xf3\xdb\xf5\xb7\xcd\xa9\x8bS,\x9e\x9e\x9e\xc0H%\x12I\x11\x14UU\xbf:s\xe6\xcc\x0b\x18\xa9\x00\xe4+\x02\x18\xfc\xac*\x93!T\x0b\x99>t\x81\x7f\x1d\x1d\x1d\xcbTU\xfd\x8e\x10\xa2\xb1\x9a\x03\x94H&\x83\x06g\x86\xd3\x16\'t\xc7\x9f\xd8b\xe6\xd0\xc0\xd8\xe3u\xd3Y\xc1\xbd\xcfx\xc9\xe6\xb9\xfc\xed6\xb8\xe2\xa4\xbe\xf1\x0eS"\x91\x8c\x82\x10\xa2QU\xd5owtt,\xa5\xb4X\x00\x0c\xfe\xae8\xb5\xe0\x020\xcc\xf7w\xbb\xddV\x8b\xc5\xf2Y\xa4\xdf_r\x8c\xb0\xf6\xf8\x10N\x83b}\x8f\xbe\xe2$\x9e\x1a_\xc2\xce\xd3\xaf\xdb\x88\'\xf5\xeb\xca\xc9\x0b\xb38\xad\xfa4C\x89DR6\xa6[,\x96\xcf\xba\xddn+\xfa\xa0\xc0\xe1LZ<@\xb5\x15\x80B9\xfe\xf9\xc1\x7fjcc\xe3{\x80\x8b\r\xde#\x91L9,&\x8duK\xf5~\xf9L\n\xfe\xb1y\xfc-}wv\xd98\xd0\xa5\xbf\x85Z\xfd\x19\xd6\xcc\r\x8f\xfbs%\x12\xc9\xa8\x08\xe0\xe2\x86\x86\x86\xf7\x90K\xb9/\x14\xe7\x06\x93$\xe7\xaa\xa9\x00\x8c\x96\xf2\xf7\x86\x86\xd4\xd1\xd1\xb1\x06\x90~\x7f\xc91\xc3\xf4\xc6\x04+\xe7Dt\xc77\xefa\xc2\x9d\xfc\x9e\xda\xa6\xaf\x96m\xb7\xc1\x99K\xe3(B6\n\x96H*\x88\xa2(\xca\x97;::Ndd\x91 \xa3x\x80#TM\x19\x98\xcc\x18\x00C%\xa0\xa3\xa3c\x8e\xd9l\xfe\xb6\x10B\xd6,\x95\x1c3\xccmM3\xb3e\xe41M\x83\x876y\xc9d&\xb6\x1e<\xb7\xddIB\x1fZ\xc0\xba%#\x0b\x05I$\x92\x8a\xe02\x9b\xcd\xdfnnn\x9eC\xf1\x8c\x80\xaa\xbb\x02\xaa\xa5\x00\x8cf\xfa?\xa2\x11\x99\xccf\xf3{\x85\x10\xcb\xaa4\xae\x9a\xc4a\xcd\xd0\xe0J\xd3\xe2M\xd3\xeeO\xd3\xe8J\xcb\x9d\xda\x14g\xdd\xe2 J\x9e0Ng`\xcb^\xb5\xe4\xdc\xffB\xec\xebQ\xe8\x0b\xe9\xd7\x93iM\xd0\xea\x91\xe9\x80\x12I\xa5\x11B,s:\x9d\xd7\x01&\x8a\x97\t\xae\xaa+\xa0\x1a\xad\xc1FK\xf9{C\thoo_#\x84\xb8\x96\xda(Q\\5\x84\xc8\xf9\x80\xe7\xb6F8kq\x82\x93\x17\xc5\xe8hH\xe1u\x80\xcb\x0e\x87\xfb\xe1{\xf7\xfa\xf9\xf3s\xbe\t\x0b\x03I\xed!\x04\xac1\xa8\xfb\x9fH(\xbc0\x86\xdc\xffB\xec\xe8\xb2\xb3\xbf\xdbB{\xd3H3\x80\xc5\xacq\xca\x82\x10wm\x90I6\x12I\x85Q\x85\x10\xd7\xb6\xb7\xb7\xff\xf5\xd0\xa1C\x1b8\xda4(\xcbH\x199|\x89\x17\x14o.4a\xaa\xd9\x1b\xb4P\xca\x9f\x02(\x1e\x8f\xc7l\xb1X\xbe\x02\xf8\xaa8\xa6IE\x003\x1ac\\sZ\x88+O\x8d0\xad\tC\xfdov;|\xfc\xaa\x00\xdb\x0eZ\xd9v\xb8\xb4R\xb0\x92\xfaaNs\x94&\xbf^\x01\xd8\xd3\t\x81\xe8\xc4o\xd1xJ\xe1\x85\x1d\x82\x93\x17\x8f<\xae(\xb0z^\x96?=\xab\x91\xc9\xcaX[\x89\xa4\xc2\xf8,\x16\xcb\x97\xddn\xf7\xa5\xa1PH#\'\xdc\x8db\x00\xe0\xa8\xe0\xaf\xa8\x12Pi\x17@)Q\xff\x02P}>\xdf{\x84\x10k*<\x9e\x9a@U\xe0\xbce!~\xfc\x81\x83\xfc\xe5\x8b]|\xf0\xb2\x08\xd3\x9a)j\xfcitg\x99\xd1$\xd3\xb6\xa6"\xf3\xa6\xa5qZ\xf5\xf7\xf8s;\x8b7\xfd\x19\x0b\x0fn\xf6\xa1\x19\xb4\x00X=/\x82\xc7.\xe7\x95DR\r\x84\x10k|>\xdf\x91\xac\x80\xfc`\xc0\x11/\xad\xc6x\xaae\x01(V\xf6Wihhp+\x8a2\xe5M\xff\x02p\xda2\\wV?\xfftN\x84\x16\xbfV\xf2\xd7,\x04(r\x936%i\xf5i\x98\xf3\xee\xc4L\x06^;P\xbe8\xd8\x83\xfdf\x02!\xf0yG\x1eoo\xd0\xb0[`@\x9f\x80 \x91H\xca\x8f\xaa\xaa\xea{\x1a\x1a\x1a\xee\xea\xef\xef\x0fp\xd4\n\x00\x93\xe0\n\xa8\xa4\x05\xa0\xd4\x9c\x7f\x93\xcb\xe5z\x9f\x10be\x05\xc72\xe98,Y\xdez\xea w\x7ff?\xff\xfa\x960-\r\xa5\x0b\x7f\x80@\x04\xba\x02\x95\x1b\x9fd\xf2X6;\xa2+\xff;\x18\x86\xbd\xdd\xe5\xbb=\xc3q\xc1\xd6\x03z}\xdf\xe1\x80E\x1d\xa1\xb2\x9dG"\x91\x14G\x08\xb1\xd2\xe5r\xbd\x97\xa3\x01\x81\x93f\x05\xa8F\x16@\xa1\xdd\xff\x91\x9c\xff\xd3TU\xbd\xb1\n\xe3\x98\x14\x04p\xd2\xdc(w|j?_\x7f\xef\x00s:\xc6\xae\xc8E"\xf0\xcb\xbf\xfb\xd8\xb4o\xfc\x05a$\xb5\xcb\xb2YI\xdd\xb1\xde\xa0\xca\xbe\xde\xf2\x19\xe8\xa2I\x95\xad\xfb\r\xca\x0c\x02\xa7\x1c\x1f/\xdby$\x12\xc9\xe8\xa8\xaa\xfa\xe1\xf6\xf6\xf6\xd3\x98\xe42\xc1\x95r\x01\x94\x92\xf6\'\x1a\x1a\x1a<\x16\x8b\xe5\xdf\x80\xe6\n\x8dcR\xf1:2\xbcm\xed\x00\x1f\xbe,\x8c\xdbY\x9a\xe0\x0fE`\xc7!\x0b[\xf6(\x1c\xec\x87\x1d\x87\x1d\xbcz\xd0IO@\x1ds3\x18I\xedcV5f4\xe9\x8f\xf7\x0e\x98\xe9\n\xd8\xcaw"\r\xe2\x06\xb5\x00\x00\x8e\xef\x00U\x91\x81\x80\x12I\x15i\xb1Z\xad\x9fnhhx\xa9\xbf\xbf\x7f\x90\x9cL\x1c\xee\x0e\xa8J\x10`\xa5c\x00\n\x05\xfd\t@q8\x1co\x02VUx\x0cUG\x088~Z\x8c\x1b/\x19\xe4\xfc\xd5q\x9d\x7f7\x9fl\x16\xfa\x03\n\x0f\xbcdc\xfd\x8bN^\xdcm\'\x18\x9b\xd2\xe1\x10\x92!f6\xc60Y\xf4\xf7\xf7\xbe\x1e\xc8\x96\xf1\xb6wX3,\x9f\x133|\xae\xb51\xc54_\x9c\x03\xfd2\xc3DR\xff\x08\x91\x130\xe5\xbc\x7f*\xc4*\x87\xc3qA\x7f\x7f\xff]\xe4\x84\xfc\x11%\xc0H\x11\x80\n(\x03\x95P\x00\nm#F\x08\x7f\x97\xcbe5\x99L7\x02Sj\xd5\x11\x02\xaeZ3\xc8\xcd\xef\x18\xc4\xe7\x1e\xe5\xbb\xd2\xe0`7\xfcb\xbd\x8f{\x9fs\xd3?\xc1\x92\xaf\x92\xfacv\x8b\xbe\xfd/\xc0\xd6\x03\xe5\xf5\xce9\xad\x1a\xc7w\x18\x17\xfdi\xf1d\x98\xdd\x92\xe1@\x7fYO)\x91T\x9d\x05mQ\xae:5\x8a\xd3\x06\xbf~\xd0\xce\xce\xee\x9a.(k7\x99L\x1fv\xb9\\\x7f\x0e\x87\xc3qF*\x01G8\xa2\x0cTD\x9d\xa9\xa4\xc4)\xb8\xf3\x07\x14\x9f\xcfw\x81\x10bE\x05\xcf_u\x1a\\\x19\xfe\xf5\xb2\x1e\xde~VLW\xd5-\x9f\x1d\x07T~\xf7\x88\x8b\xbb6\xf8\x08\xc7e\xcb\x83c\x95\xf6\x06\x83\xec\x8e,<\xbf\xab\xbc\xe50\x8el+\x8cp;\xa0\xc5W\xfb\xdb%\x89\xa4\x18\xa7\xcc\x0f\xf3\xdd\x1bzi\xf5k\x08\x01\x0b\xa7\xc7\xb9\xf1\xa7\x16\xba\x02\xe6\xc9\x1eZA\x84\x10+}>\xdf\x05\xe1p\xf8>\x8cw\xff\xf9\xc2\xbf\xac\xca@\xb9\x15\x00\xa3\xdd\xbfN\thllt\xa9\xaaz]\x81\xd7\xd7%\xa7.\x08\xf1\xc9+\x02,\x9f\x972\xdc\xd1\x1d!\x1a\x87\xbb\x1e\xb3\xf1?\xf77\xd1\x172\xd7\x83\x99JRA\x9a\xbd9\xab\xd1p\x06\xc3\xd0\x1f.\xaf\x0b(\x12\x17l\xdec\xe2\xdc\x86\xb4\xee9E\x85\xe3Z\xe3\x80\xbb\xac\xe7\x94H\xaa\xc9\x87.\x1a\xa0mXj\xf5\x8a9)\xe6MK\xd7\xb4\x02\x00\x08UU\xafmhhx\xa4\xbf\xbf?\xc8\xd1M\xf2\xf0\n\x81\x15\xb3\x02Tj\xeb\x99\x1f\xc98b\xf7o\xb7\xdb\x97+\x8arZ\x85\xce]U\x84\x80\xb5\x0b"|\xf3\xbd}\xac\\PX\xf8k\x1a\xf4\r\x08\xfe\xf3\x0e7_\xbdk\x1a=A)\xfc\x8fu\xcc\xaaF\x8b_/\x90\xfbC\x90*sm\x9ehR\xe5\xd6G\xfcd\r\x8a\x01\x01\xcck\x8b\x96\xf7\x84\x12I\x15qX\xb2,\x99\x9d\x1d\xb1\xa54\x99a\xf1\xf4\xe0\xe4\r\xaaD\x14E9\xcd\xe1p,cdF\x00\x06?)\xf0\xf7\xf8\xcf]\xae\x0f\xa2\xf8`\xdfx\xd8\xedv\x97\xc9d\xfa(S\xc0\xf7o1i\\qb\x88\x9f\xdd\xd4MGs\x11i\xae\xc1}O[\xb9\xe6[\xed\xfc\xf6\xb1&2\x05\x16a\xc9\xb1\x85\xcd\x9caV\xb3\xbe\x02Ow@!\xa9\xd7\x0b&\xcc\xe3\xaf9y\xe0y\xe3\xcc\x82\x95\xb3\xcb\x7f>\x89\xa4Z\xac\x9c\x1d\xc4i\xd7/\xac~\x97>\xc5\xb6\x06\xb1\x9bL\xa6\x8f\xda\xedv\x17y\x99r\xe8\xd3\xe8\xcbJ%\xd3\x00\r}\xff\xcd\xcd\xcd\x17\x03\xa7W\xe8\xbcU\xa3\xd1\x95\xe4so\xe9\xe3\x92\x93\xe3\x98\x8aX\x98\x06\x82\xf0\xcd;\x1b\xf8\xe3\xb3\x1eR\x13l\xeb*\x99ZX\xcc\xd0f\xe0\xea?\xd0\xef \x9e,\x7f\x16H&+\xb8\xe7\x19;\xe7\xae\x8ac\xca\xfbx\x97[\xa3\xc5\x93\xa0;h-\xfby%\xb5\x85\xc3\x92\xa5\xa3!J\xbb?K\xb3\x17\x1cV0\x994\xdc\x8e,~g\n\xb7-\x81\xc5\x9c!\x12\xb7\xd0\x1f\xb6\xd1\x1fVI&\x05\xf1$\x84\xe3p\xa0OaW\x97\x9dp\xa2v2\x95Z\xbc\xb9\x12\xebu\xcc\xe9\xcd\xcd\xcd\x17\xed\xdb\xb7\xefNF\xc6\x02\x0cW\x02\xca\x1e\x0bP.\x05\xa0\x94\xc8\x7f\xe1r\xb9,\x8a\xa2\xbcO\x08Q\xd3\xa1\x99\xa3\xd1\xecI\xf1\xdd\xf7ur\xea\xe2LA\x93\x7f&\x03[v\x99\xf9\xea\x9d^^\xd8\xed\x969\xfc\x12\x1d&\x15\xbc\x06\xb5y\xfa\x06\x15\xd2\x15\xca\xc9\x7ff\xbb\x8bx2\x80+o\xb7d5k\x9c2?\xc6\xbd\xcfK\x05`\xaa`1i\xb4\xfb\x13\xb4\xfa4\x96\xce\x0c\xb1dF\x829\xad\xd0\xd4\x00vK\x06\xabY\xc3b\xca\tNaTz\x86\xc4\xd0\x03\xb4l.\xad.\x93\x81XJ\x10\x8d)\xec>$xa\xb7\x99\x97v\xbb9\xd8\xaf\xb2\xab\xcb:i\x9b\x1c\xbbE\x1fKSO\x08!\x9c\x8a\xa2\xbc\xcf\xe5r\xdd3\x94\x11\x90\xbf\x81\xaeH]\x80J\x04\x01\x16|\xb8\xdd\xeeU\xf5\\\xf2W\x00M\x9e4\xdf\xba\xb6\x9b\xb5K2\x05\'\\*\rw<j\xe7\'\x7fo\xe4@\x7fM\x07\xa0H&\x11U\xe4v_\xf9\xf4W\xb02\xef@\xc4D \x98k3=\x1c\x93\n\x0bgf\xf8\xf3\x0bHe\xb5N\xb1\x984lf\x8d\xe53\xc3,\x9b\x95`\xe1L\x8dE3"\xcch\x02\xeb\x04\xf5:\xa1\xe4\x1a\xb5\xa8*X,\x1a^g\x86iM\xb0vy\x1a-\x13\xa3s\x00\x1e\x7f\xc5\xc9\x1f7\xd8\xd8\xb2\xdfE,)\xc8j\xd5\x93\xc86s}+\x00\x90\xcb\x08p\xbb\xdd\'\x84\xc3\xe1g\xd0\xb7\t\xae\x88\x15\xa0\x1c\n@Iy\xff\x80\xc9j\xb5\xbe\x03(cy\xb3\xea\xb2fn\x94/\xbd\xa3\x9f\x85\xb3\x8d\xf3\xa9\x01\xc2\x11\xb8\xf9\x96F\xfe\xf2\xa2\xbb\xaa7\x80\xa4\xfe0\x9b4,\x06\x0bs\xe7`e\xcf\xbb\xed t\xb4\xea\x8f\xaf[\x1c\xe4\xbb\xf76\x90\x96\xae\xaa\xbab\xe5\xac0\'\xcdO\xb2vq\x94\x13\xe7\xa5p\x18W|\xae\x18B\x85iMp\xcdY\x11\xaeY\x17a\x7fw?\xeb_tr\xe7\x93N^\xef\xac\xd2`\xa6\xc6\x94\xb5\r\xc9\xc8\xe7\xc8)\x00\xf9\xed\x82\xcb\xae\x9a\x97\xd3\x02\x90\x1f\xf1?"\x98\xc1\xe7\xf3y\x84\x10o.\xe3\xf9\xaa\xca\xbb\xce\xe8\xe6SWGp\x17)\xc7\xbfm\x9f\xc2g~\xd3\xc2K{\xea>\xbeq\xca\xa0\x088ca\x84\x8f_\xd1\xc3`D\xe5\x17\x0fxxt\xabw\xf47V\x81i\xbe\x94\xe1\xc2\xd59XY\xdf\xea\x8b\xbb\xdd\x9c\xb3J\xdfYj~\x07XM\x9aT\x00j\x9cv\x7f\x82\x13\xe7\xc69q^\x94\xb3\x96%hk\xd4P\xd5\x1a\xd9\x01+0\xa3M\xe3\xfa\x0b\xc3\xbc\xeb\xec0\xbf}\xd8\xc6o\x1fid__\xf9Z[\x1b\x91H\xe5,W5q\r&\xc6\x9b\xbd^\xef\x97\x03\x81@?#+\x03\x0e\xaf\x0f\x00eR\x06*]\x07\xe0\r%\xc0\xedv\x9f\x05\xf8\xcb|\xbe\x8acV5\xae=\xab\x9f\x7f\xb9*\x82\xbd\x90\x19M\x83\x07\x9e7\xf3\x8d?5\xb2\xabK\n\xffZ\xe2\xb8\x96\x18\xffy]\x0f\xad\x8d\x1a\x90fN\xfb \xd7\x7f\xdf\xca\xb6\xc3\x93o\x88j\xf1\x18\xa7\xde\xf5\x87*;\x87\xf6\xf7\x98I\xa7\xd0\x05\xaf\x9a-\xb0\xb8#\xc4\xc6]\xb5\xa1 I\x8e\xe2w\xa6\x99\xd7\x96\xe4\x9a\xb5}\xac[\x9e\xc5\xeb\xcab\xa9e\xef\xa2\x00\x9b\r\xde\xf7\xa68\x17\xaf\xee\xe4G\x7fuq\xcfF/\x91\n\x05\x0e&S\x15,\x98_E\x84\x10~\x8f\xc7sV \x10\xb8\x9b\xd1\x03\x01a\x82n\x80\x89*\x00%\x15\xfeq\xb9\\\x16UU\xcf\x9e\xe0\xb9\xaa\x8e\xd5\xa4q\xc5I!>ve\xb0\xa0\xf0\xd74xf\x8b\x95/\xdf\xde\xc8\xa1\x81\xea\x07P)BC\x11C\xf5\xafE.\xa0\xa7\xc3\x9f\xa0\xd5\x1b\xc3m\xcfb\xb3\x80\xd5\x0c\x16\x13XMC\xbf\x9bs\xafK\xa6 \x9e\x84\xd8\xd0#\x9a\x80p\x02"q\x13\xe1\xb8\x85\xee\xa0\x85HB!;\x14\x00To.\rU\xd1x\xd7\xba\xc1!\xe1\x9f\xa3\xad!\xcb\xba%\xf1\x9aP\x00|.cWR_\xb8\xb2%\xa1\xc31A<\x05.\x03\x012oZ\x9a\x8d\xbb*zzI\x89(B\xc3a\xd5\xb8h\xe5 \xe7\x9d\x90\xe0\xe4\x05q<\xd5\xa8\xd5\xa4\r\xdbnN\xf0\x96W\x14ho\xc9\xf0\x85w\x06X\xd0\x91\xe0;\xf7\xb4\x12\xaa@\xe5\xd3dz\xea\xc4\xae\xa8\xaaz\x96\xd3\xe9\xfck$\x12\xc9\x0f\x06\xd4\x0c~N\x88rg\x01\x18\xb9\x01\x14\xa7\xd3\xd9"\x84\xb8\xa0L\xe7\xaa\n6s\x96\xcf\\\xd9\xc7;\xcf\t\xa3\x16\xb8J\x89$\xdc\xb7\xc1\xce\xe7~\xd7J"]y\xe1(\x04\xccl\x8c2\x7fZ\x92v?\xf8=\x1a3\x9bb\xb47$htC\xa3\x1b|\xee\x9cO\xae,h\xd0;\x00{{`g\xa7\x8dm\x07\xec\x1c\xec\x83==*{{\\U\xf9\x9f\'\xc2\x99\x8b\xc2\\}\xfa\xc8V\xb7\x8a\x02\xc7O\x0f\x01\xe5-\xb5;\x1e\x1a\r\xdcI\x99$\xc4\x92\x95\xcdg\x1a\x88@$\x0e.\x03\xf7\xec\x82\x8e\xdc<\x9b*\x8bi=b3k\x9c\xb10\xc4\xd9\xcb#\\rb\x1cw\x05\x84~2\x01=\x018\xd4\x0f\x03\x11\x0b\x91\xb8\x99@T%\x16\x17$S\x90\xce\xe46\r\x16+8m\x1a.[\x1a\xbf3\xc1\xac\x96\x0cm\xfe\xdc\xee~,X,\xf0\x9e\xf3\xe3,\x99q\x98/\xdd\xd6\xc8\x96\x03\xe5U\xc0\xe3)\xe39[\xdb+\x941B\x88\x0b\\.\xd7\xb7#\x91\xc8\x01\x8e\x06\x03\x1a)\x01\x13\xa6\x1a1\x00\xc2f\xb3]\x04\xb4\x95\xf1\\\x15\xc5n\xc9\xf2\x1f\xef\xea\xe1\x92S\xa2\xa8\x05\x84i\xcf\x00|\xedv/\x7f{\xd1_\xf6\xd4\x17\xabYcNK\x94V\xaf\xc6\xb4\xc6,+g\x07\x99?-\xc3\xf4Fp\xb84\xcc\xaa\x86\xa9\x1a>?\x91K\x19jj\x80\xd5\xc7\xc7\xd1\xb48\xe9LnqH%\xfby\xfd \xdc\xff\x82\x97M{\xccl\xd9o\'\x96\xaa\xadD\xdc\xb7\x9d1\x80;/\xe14\x9b\x85]\x9d\xb5\x91\x85\xea5\x18F8VySf_H!\x1cWhE_8e\xf1\xcc\x10N\xab\x97p\\6\xa6\xaa6\xed\xfe8o:!\xc6\xbb\xcf\x0e\xd2\xd1\x9c\x1d\xb5\x8bh)D\xa2\xb0\xbbKa\xd7a;\xbb\x0e\x0bvw\xc3\xd6\x83\x1e\xba\x03f\xd2\xd9\\Z_F\x13hC\x16>#!\x9a\xb30j(B\xc3\xac\x82\xd9\x04\xd3|I\x96\xcd\x0c\xb1r\xae\xc6\x8a91\xe6\xb5\x97\xe6\x92X\xbd0\xc9\xaf?\xda\xc5g\x7f\xe3\xe3\x81\xcd\xe5s5\xc5\x0b\xb8\x00,\xf59\x8d\xdbl6\xdb\x85\xc0/0\xce\xa8\xcbO\t\x1c\xb7B0\x91\xcbcT\xf9O\x17\x00h\xb7\xdb\x9dB\x88\x8b\'p\x9e\xaab5i\xdcx\xe1@Q\xe1?\x18T\xb8\xf97~\x1e\xde\xe2\x9ep\x0fu\x018m\x19\x9cV\x8dY\xcdI\xce^\x1a\xe0\x84\xb9\x1a\xedMI\xbc\x0e\r\x97=\x97\x82S\x0b\x08\x91\xbb\xf9\xcd&\xb0[\xb3\x9c\xb8\x10V-\x18\xa0/(\xd8q\xd0\xc2\xfa\x17,<\xb0\xc9K \xaaT\xcc\xd7W*M\xae4\'.\xd0\xdf\x13\x81\x88\xe0\xf1-\xb5\xe1<\xb5\x1a\xdc}\x91D\x15\x14\x80\xb0\x8dP\xcc\xcc\x91\x1c\xef\xe1L\xf3k\xd8\xcc\xb9\x82/\x92\xca\xa3*\x1a\xd3|i\xae>e\x80\x0bV\xc5\x99?=\x83i\x9c\xab\xb2\xa6\xe5,;\xfdA\x13;\x0f\xc2\xd3\xdb\xec<\xb7\xd3Ew@\xd0\x13\xb4\x8c{\xa3\x92\xd5\x00M\x90A\xe4JT\'!\x10\xb5\xf1\xda!\x1b\x7fzV\xa3\xcd\x97d\xde\xb44W\x9d\xd2\xcfiK\xb2x\xddY}\x83\xaba4\xfa\xb3|\xe1\xed\x01vt\xda\xd9\xd3c)\xcb|O\x14\xb0\x00Xk\xe3V\x1f3B\x88\x8b\xedv\xfbm\xb1X,\x04:M\xbdlY\x01\xe5t\x01\x18*\x02~\xbf\x7f\x95\x10bi\x99\xceSQ\x1c\x96,\xef={\x90\x0f\\\x124\xec\xe6\xa7\x01\x9d\xbd\n\xff\xfa\xf3\x16\x9e\xd91\xbe@-!\xc0\xa4hL\xf3%X9;\xca\xa2\x19\x1a+\xe7FX\xd0\x9e\xc1\xef\xa6r\xdd\x19*\x84\xa2@\xb3O\xa3\xd9\x97\xe0\xd4%\t\xfe%\x14b\xd3\x1e\x13\xeb_p\xf2\xa7g}D\x13\xca\xa4\x04\xe7\x9c\xb54\x8c\xc7\xa5\xdf\xe1>\xf2\x92\x89\xcd\xfbk\xa3\xe9\x8d\xd1\x0e/\x1c\xa3\xe2\x1a@$\xa1\x10\x0c\x19\xaf\xd0\x8dn\xe3qI\xca\x8bI\xd18\xbe=\xca\x15\xa7D\xb9\xe2\x940\x8d\xe3\xf4He\xb3\x90H\nv\x1e\x14<\xbc\xd9\xc5\xd3\xdb\xcc\xbc\xbc\xc7U5k\\:+8\xd0o\xe5@\xbf\x95G\xb68Y\xdc\x11\xe7\xea\xb5A\xae\\\x1b\xc5\xeb\xd2\nZ);Z3\xfc\xd7\xfb\xba\xf9\xd0O\xda848\xf1\t\x17K\x1a[/\xea\xd4\x02\x80\x10b\xa9\xdf\xef?!\x16\x8b=Na\x0b\xc0\x88\xb7\x148^\x94\xf1^\x9eRs\xff\x85\xd9l\xbe\x14h\x1a\xe7y\xaa\x86\xcb\x9a\xe1K\xd7\xf4r\xe5\xe9\xd1\x82>\xf4\xa7\xb7\x98\xf8\xdco[\xd8\xd33\xf6`\xbf&w\x92U\xc7EY3?\xcd\xb9+B\xccj\xab\x9d\x9d}9\xf1\xb8\xe1\xf4eiN_\x16\xe0\xa6\xcb\x02\xdc\xf2\xa0\x97{6\xba8\xd0_\xd94\xa0\xe1\x98\x14\x8d\xab\xd7\x06t\xa5A\x0f\xf7\xc2O\x1f\xa8\x9d\xa9h6\x98g\x85L\x99\xe5&\x1c3>nw@\xb3\'\xcd\xe1\x81:]9k\x1cEh\x9c\xbd$\xc0\x07.\x1cd\xe5<m|\xbb}\r\x0e\xf7\xc1\xf3;m<\xf9\x8a\x95\x07_q\xd3\x1b\xaa\x8d\xad\xee\xab\x07m\xbcz\xa7\x8d\x9f\xaeO\xf2\x91\x8b\xfbx\xdb\x99\xf1\x821T\xcb\xe7\xa7\xf8\xca\xbb\x0e\xf3\x89_\xb52\x18\x9d\xd8\xfa\x10M\x98\xd04\xbd\x0c\xb4\xd5\xc6e\x19\x0fMC\xb2\xf3\tFv\x07,ke\xc0rf\x01\xe8|\x15\x0e\x87\xc3.\x84\xb8t\x82\xe7\xa88.[\x86\xef^\xdb\xcd9\xab\xe3\x05\x85\xf2_\x9f1\xf3\xf9\xdf\xb51\x10)\xed\x92\xd9-Y\x16\xb6\xc7X6;\xcdE\'\x0c\xb2x\xb6\x86\xcd\xaaU~w\xa5A,\x9e[\xe0\xc3\x89\\\xa4\x7f2\r\xc9\xb4 \x996\x11O\x99\x88%\x15R\x19\x81\xdd\x92\xc5a\xc9`\xb7$\xb1\x9a5l\x96\xdc\rc\x19\xca\x16p;0\xb4\x84\x94JS\x03\xfc\xcb[\x02\xbc\xef\x82 \xb7>\xec\xe4\xd7\x8fx\xe8\x0fW>S\xa2\xd1\x9d\xe2\xc4\xf9\xfa\xdd\xff\x03\xcf;\xd9~\xb8vJ\xdd\xe6\xd7\xe3\x87\xf2w\x01,DDo\xfd\x7f\x83\xa53\x06\xd9\xb4\xb7nBv\xea\x02\x8f=\xc5i\xc7G\xb9\xee\xdcAV\xce\x1f\x87\x7f_\xcb\xf5\x15y\xe2U;\x7f|\xda\xc1\x0b\xbbr\xd5\xf6*U2z\xa2t\x05,|\xf1\xf66\x9e~-\xccG/\x1f`\xdet\xe3\x89}\xe6\xf24\x1f\xbd$\xc0\x97\xefl\x9e\xd0\xf9\x06#\xd6\xa1,\xa5\x91\xb2\xb0^]\x00\x00B\x88K\xecv\xfb\x97c\xb1X\x84\xa35\x01\xdexz\xe8gMT\x024T\x04\xbc^\xef<!\xc4\xe4\x87[\x17\xc1n\xc9\xf2\x89\xcb\xfa8gU\xdc\xb0\xae\xbf\xa6\xc1\x0b\xdb\x15\xberG\xeb\xa8\xc2\xdf\xa4h\xf8]\x19N_\x18\xe2\xcaSc\xcc\xefH\xd2\xec\xd3\n\xf6\x08S\xd6{\x00\x00 \x00IDAT\x0b\x18\x0fZ6\xb7K\x8c%\x05\xb1\x98J_\x00:\x07\xa0+\x00\xfbzll\xeft\x11\x8a\xe5\x1aw$R9\x81\x92\xce@&\x0b\xa9\x8cJ*\xa3\x90L+d\xb2\x02\x8b\x9a\xc5j\xceb1e0\xa9\xb9\xba\xe0f5\'\x98\xcc*\xf8\\\x1a\xab\xe6\x0c\xb2\xa8#\xcd\xccfh\xf0gqX\xb2X\xcd\x94\xbcsQ\x04\xf8\xbd\x1a\x1f\xbc,\xcc\x9a\x05q\xber{3\xaf\x1f\xb6N8v\xa2\x18\xa7\xcc\x8f\xa0\xe6\xdd\xf8\x9a\x06\x0fo\xb1\xd6T*\xa3\x91\x02\x90\xceP\x15\x13@\xbcH\x93\xb4\x19M2\x05\xa0\\X\xcdYV\xcc\ns\xe3\xc5AV\xceK\x19f^\x14#\x99\x82\xfd\xdd*\x7f\xddh\xe1\xa1\xcd^\xb6\x1d\xb2\x12\xaf\xb1`\xdbBd\xb2\x82\xbf\xbe\xe4f\x7f\xbf\x89\xef\xbc\xaf\x9b\xb9\x1dz\xa5\\U\xe1\x8a\xd3"\xfc\xeeq\x07\xdb\'\x10\x9c;\x18U\r[]\xd7\xb3;K\x08\xe1\xf7z\xbd\xf3b\xb1\xd8&*\xe4\x06(w\x16\xc0\x88\x87\xd9l^\x05T\xcf\xf6;F\x1a\x9ci\xae?w\x80\xf7\x9c\x1f1\xf4\xbdk\x1al\xda\xa5p\xd3\xcf\xda\xe8\x0e\x18\xab\x92\x82\\\xca\xe0YK\x069}q\x86uK\xc3t\xb4\x94ap\x1ad4\xc8f\x05\xc1\x10\xec\xe9\x86\x9d\x9dV^\xdd\xe7\xe0@\x9f`o\x8f\xc2\xfe>\'\xc9\t\xa4\xe2\xc5\xb2\xca\x90\xaf\xb0\xf04x\xec\xd5\\\xac\x83\x00Z\xbcI\xe6\xb6\xc6\xe9h\xd4Xy\\\x84sW$i\xf0iG\x9b\x89\x14AU\xe1\xe4\xc5i~yS\'\xff\xf3\x17\x17\xb7=\xd9X\x91\x8as&E\xe3\xe4\xe3\xf5\xbdt{\xfa\xe1\xb9\x9d\xb5\xe1\xfb?\x82\x91\x0b \x95\xae\x8e\x0b\xa0\x98\x05`Fc\x15\x060\xc51\xa9\x1a+g\x85x\xf7Y!\xdetb\x12\xcb\x18VAM\x83h\\\xf0\xcck*\x7fz\xca\xc3\xa3\xaf\xba\t\'\xeaC\xe8\xe7\xa3i\xb0i\xaf\x9d\x9b~\xda\xc2/n\xea\xa2\xadQ?\xbb=N\x8dw\x9f\x15\xe4K\xb7;\xc6\xad\xa0\xa7\xb3\x82d\x1c\xc8S\xb0\xea5\x06`\x08\xcb\x90\x0c\xdd\x8c\xbe \xd0\xa4\xd5\x01(T\xfc\xe7\xc8\xcf#\x0f\x93\xa2(k\xc9\xf5\x90\xa89|\x8e\x14?x\x7f\x17\xa7.I\x15\x0c\xbc\xfb\xdb\xb3&\xbezG\x0b]\x01c\xb3\xf1\x9c\x96\x04\xe7\xaf\x88p\xdd\xb9\x01Z\xcb\xe4Z\x1e\x0c\xc2\xe6=&^\xda\xe5\xe4\xf5\x83\x82\x97\xf6888\t\x05\x86\xf2\xd1\xc8\x99\xf5\xba\x02\xb9\x95\xec\xce\xa7\xbd|\xfe\xf7p\xd2\xbc\x00\xa7,Hs\xc6\xd20\xcb\x8f\xcb\x16\xf4\xf7\x1d\xa1\xb5Q\xe3K\xff\x14b\xdd\xe2\x147\xdf\xda@O\xa8\xbc\xff\x9b\xd7\x99\xe1\xb4Ea\xdd\xf1\x07^r\x12K\xd6\xce\xee\x1f\x8c-\x00\xc9*\xb9\x002\x06\xbb\xa5#\xb46\xe6\x1a\xcbLD\xb9<V\x11\xc0\xea9Q>\xf6\xe6>NZ\x98\x1e\xb3\x8f\xffp\x0f\xdc\xfe\x98\x87\xbb6x84P\xc7\xf6\xeb<\xb6\x1e\xb4\xf3\xf1\x9f\xb7\xf0\x8b\x8fvc\xb3\x8d\x94[B\xc05\xeb\xe2\xfc\xea\xc18\xbb{\xc6_\x053\x14\x83|\xdd\xd5(\xd3\xa6\x8ePUU=\x15\xb8\x95\xc2\xf5\x00\x8e0)i\x80\xf9\x1a\xc9p\xff\xbf\x19X;\x81\xcf\xaf\x18\x8d\xae\x14?\xbc\xa1\x93\x93\x16\xa7\x8d\xd5\x19\r~\xf7\x90\x99o\xdc\xddF(6\xf2\x12)B\xe3\x84\xe3b\\\x7f^?\xa7/M\xe3\xb0\x8d\xdf\xc4\x1f\x8f\xc3\x81^\xd8\xb2\xcf\xc9\x96\xbd\x82\x17w\xd9\xd9v\xd81\xe4\xb3\xaf}\x8d?\xab\xc1\x86\xed^\x9e\xd9\x0e?^\xef\xa7\xd5\x9b\xe6\x9dg\x04\xb8\xe8\xc4(3Z\x0bK\x18E\x81\xf3V\xc7io:\xcc\xa7\x7f\xdd\xc4\x96\x03E\x1a,\x8c\x91%\xd3cL\xcfkt\x93\xc9\xc2\xe3[L5e\xfe\x87\x02\n@\x95\x84n\xb1\x85\xd1\xefN\xd2\xee\x8f\xb1\xa7\xa7\xca]e\xea\x18E\xc0\x92\xe9Q\xae;\'\xc8\xc5\'\xc7\xb1ZJ_\x8f\xe3\t\xd8\xf8\xba\x85\xbf=g\xe5\xbe\xe7\x1b\x88$\x94)Y\x88i\xc3\x0e\x07?\xbc\xcf\xc9M\x97\x87u5\x03,\x16\xb8\xfa\xd4\x08\xdf\xfd\xb3=\x97v8\x0e\x82\x06\x95\xb5k\xba\\ri\xac\xb5\xdb\xed\x96X,\x96\xa247\xc0\x98(w\x1a\xe0\x1b\x0f\x8f\xc7\xd3!\x84h/\xd3\xe7\x97\r\xa75\xcb\xbf\\:\xc0\xc9\x05\x84\xbf\xa6\xc1#/)|\xe7\xdeV\x9d\xf0\xf7;\xd3\\\xbe&\xc8\x07/\t\xd1\xec/\xb2\x85*@&\x03\xe1\xb8\xe0P\x97\xca\x03/[\xd8\xb0\xddC\xe7\x80\xe0`\xff\xe4\xf5\xd1.\x07\x1a\x90H)\xec\xeb\xb5\xf0\x9d{\x9b\xb8\xe7\xd9\x04\xef>k\x90KO\x8e\xe3r\x14\x98\xa3\x02\x16\xcf\xd6\xf8\xca\xbb\xfa\xf8\xe2\xef\xe0\x95\xfd\xe5Q\x02\xceY\x1a\xd6\xb9#R)\xc1\xf3\xbbj\xcb\xfc_\x08\xadJJJ1\xd3\xa8\xcb\x96\xa5\xd1\x95eOOU\x86R\xf74\xb8\xd2\xbc\xff\xdc^.=9\xc1\xf4\xe6l\xc9\xe5\xe7b\txm\xaf\x89\xff\xbd\xdf\xcfs;\xad\x0cD\xea_Z\x15C\xd3\xe0\x0fO\xfb8\x7fE\x82\x15\xf3\xf5e\xb0O_\x12\xe5g\xff\xc8\x10\x88\x8e\xcfh\x1c2\xa8]Q\xe7.\x00\x84\x10\xed^\xaf\xb7=\x16\x8b\xed@?\xb3\x8c\x94\x801)\x06c\xbd<\xc5\xcc\xff\xc3\xff\x16f\xb3\xf9\xa4\x02\xaf\x9f4,&\x8d\x1b\xce\x1b\xe4\xedgG\x8c\x85\x7f\x16\x9e\xde\xa2\xf2\xc9[ZG\xdc\x8c\x028y^\x94O\\\xd5\xc3\t\xf3\xb2cJ\xdf\xcbd`0 x\xf253\x1b\xb7\xbb\xd8\xbcWe\xf3~\xd7\x94\xd4\xf0\x01R\x19\xc1\xd6\x836n\xfe]\x1b\x7f\xda\x10\xe1\x83\x17\rp\xca\xa2\x14\xb6\x02\x96\xfe\x13\xe6g\xf9\xce\xf5\xbd|\xf0G*\xbb\xba\'\xd6\x04\xc7c\xcf\xb0b\xae^1\xdb\xd7\t}\xe1\xda[\\\x8d\x82\x96\xac\xe6\xb1+\x96\xe3\xa1\xd8\xce\xc8e\x03\x7f\xf9\x8c2S\x16\xb7-\xc3YK"\xdcxi?\xf3\xa6\x17\xcey\xcf\'\x9d\x86G_\xb6p\xd7Sn\x1e\xde\xe2>\xa6\\-]\x013?\xf8\x8b\x87\x9f~\xa4O\x97a\xb4dV\x86\xf9\xd3\xe2<\xb7s|\xc1\x80\x01\x03\x0b@\xc1\x06n\xf5\x830\x9b\xcdk\x80\x9d\x18[\x00&T\rp\xa2u\x00\x0c\xcd\xffN\xa7\xd3<\xe4\xff\xaf)>\xfe\xe6^\xae;?l\x9c\xda\xa6\xc1\xed\x8f\xd8\xf8\xe6\xddM\x0cF\x87\t\x7f\x01\xe7-\x8d\xf0\xbd\x7f\xee\xc6^\xaa|\xd2`\xd7!x\xeaU\'\x0fo6\xf3\xe8V\xff\xb8\xcdZ\xf5\x8a\xa6\xc1\xc6\x9dN6\xfe\xd0\xc9\xaa\xd9A\xbe\xf4\x8e K\xe7\x1a7\xbf\x99?]\xe3\'\x1f\xea\xe4m\xdf\x9aA\x7f\x89i\x96F,\x9e\x1ecF\x8b>\xbc\xfd\xf1\xad\xb5\xd9\xa1\xd1\xc8\x0f_\xad\xb4\xa5b;#\xbb\x15\x1a\xdc\xc7\xd8\x84\x1d\x03\x02\xb8\xea\xa4A>ti\x80\xe3\xdaKW\xd8\xd2)xl\xb3\x95\x1f\xfd\xcd\xcb\x8b{\x9cSv\x130\x1a\xcf\xeep\xf2\xdc\xf6 \'-\x1c\xb9\x1e\xa8&\xb8hep\xdc\n@\x7fX%\xbfh\x9e\xd9\nv\xb3F,U\xbfJ\x96\xa2(k\x9dN\xe7\x1f"\x91H~\x1c\xc0\x84\x84?\x94\xb7\x14\xf0\x1b\x83\xb2\xdb\xed^!\xc4\xca\t|vY\x11\x02\xae?\xa7\x87k\xcf\x0fc6Z`\xb3\xf0\xe3\xfb\\\xfc\xcf\xfd\x8dD\x875b1\xab\x1a\x17\xad\x0c\xf3\x1f\xd7\xf5\x8d*\xfc\xb5,\x1c\xe8\x11<\xb2\xc9\xc1\xbd\xcf\xda\xd9z\xd0I<%j\xce\xef<\x19\xbc\xb0\xc7\xc3\xbb\xfe\xcb\xc5g\xae\xee\xe4\xadg$\x0c\x03\x05\xe7N\x87\xcf_\xd3\xcbgom\x19w3\x9c%3S\xba\x9dk"\t/\xee\x9c\xfc\xce\x7fF\x18*\x00\xa6\xea\x98\xcd\x8a\xc5\x00\x08\x05\xe6\xb7G\x80\xfap\x9bT\x0bE\xc0\xf1\xed1>y\xc5\x00\xa7/K\x94\x1c\xe0\x17\x8a\xc0_\x9fup\xdb\xe3\x1e^=h\xabkw_9\x08\xc7U\xfe\xfc\x8c]\xa7\x00\x00\xac\x98\x9b\xc5i\xcd\x8c\xab\x94xO\xd0\x01\x04F\x1c3\xabY\x1a\\\xc9\x9a\x08\xa4\x1e/B\x88\x95\x8a\xa2x\x81\x1e\xf4i\xf7\x13\xa2"1\x00\x8a\xa24\t!\xe6\x96\xe9\xb3\'\x84\x10p\xf2\xbc\x007\xbeY\x1fx\x02\xb9\x9d\xea\x03\xcf\x99\xf9\xf1\xfa\x86\x11\xc2_\x11\xf0\xe6\xd5!\xfe\xed\xad\x03\xd8\xed\x85\x95\xabt\x06\x0e\xf5\xaa\xfc\xfe\x11;\x0fmv\xb3\xab\xbb\xb29\xee\xf5J(\xae\xf0\xb5\xbbZH$\x07x\xc7Y\x11,V\xfd5\xbd\xe8\xa4\x18\x1b\xb7\xf7s\xfbS\x8d\xe3\xba\x86\'\xcd\x0f\xeb\xdc3\x91\xb8\xc2k\x07k3\x13\xd5H\x01\xb0\x98\xa8\x8a\x060\x9a\xa5aFc\x91<\xc1c\x10\xb7-\xcb5k{\xf9\xa7\xb3\xe3\xcc\x9aVZ\xaaF2\x05\xaf\xec6\xf1\xbd{\x1a\xd9\xb8\xcbN\xa2\x8ew\xa1\xe5\xe6\xa9mN4-\xa8s\x9b\xb45\xa48\xae%\xce+\xfb\xc7n\x05\xe83\xa8\x86\xa8\xaaY\\\xb6$P\xd7\n\xc0\\\xbb\xdd\xde\x18\n\x85z1\xb6\xba\x8f;\x0e\xa0\x1c\x95\x00u\x99\x00V\xabu%5r\xc5\xe7\xb4$\xf8\xfa\xbb\x03x\n\xcc\xa7\xd7\xf6\t>\x7f[3\xe1\xf8H\x8ds\xc5\xac\x18\x9f{\xfb\x00^Oa\x13\xdf\xde\xc3\nw<\xee\xe2\x8e\xa7\xdc\xf4\x85kS\xc8\xd4\x12\x91\x84\x89o\xdd\xd3H8\xa6\xf0\xc1\xcb\xf4\xfd\x16,f\xb8\xe9\xcd\x11^?\xe4\xe4\xb9]c3\xdb\xab\n,\x9f\xad\xff\xae:{\x15vO0\xb6\xa0R\x14R\x00*-&\x04\xe0\x1ae}mo\xa8\xf0 \xea\x88\x05\xd3\xa2|\xe1\x9aAN^\x92\xd0\x95\x97.\xc4\xce\x03\x82[\x1e\xf2p\xf73^\xc2\x93\xdc\x18\xab\x169\xd0o\xa5\xb3\x17\xa6\xe5\x15\x00\xf495\xda|\x1a\xaf\xec\x1f\xfbg\xc6\xe2\x82lfd\xf5R\x93\x02.[m\xf9Z,&\x8d\xe3\xa7\x05\x18\x88\xd89\xd0_\x92\x98\xb4\x0e\xc9\xd4\xd71\xb6\x00\x8c\xdb\x150\x16\x05 \xdf\xe4o\xf4\xfc\x11\x0b@M4\xffY\xdc\x91\xe0\xbb\xd7w3\xbb\xddXc\x7f\xf8E3_\xbb\xb3\x89\x9e\xe0\xc8/\xc1j\xd6\xf8\xd2;\xba\x0b\n\xffP\x04~q\xbf\x9b_=\xe2\'\x1cS\'\xa5\xd9M\xbd\x12M*\xfc\xf7\xdf\x1a\x18\x8c(\xdc\xfc\xceA\xddlji\xc8\xf2\xe9\xabzx\xc7wg\x8c\xa9\xcc\xe9\xf2\x99!|\x06\xdf\xd7\xa3[\xcc5\xfb\xfd\xa4\r\xa6e5\xd2\x96|\x8e4.Gq\xdfu\xa3\xb4\xfe3\xcd\x97\xe2]g\x0ep\xddy\x11\x1c%\xea\x90\x9d}\xf0\xf3\xfb=\xdc\xf6\xa4\x9fXrr\x1aa\xd5\x03\x99,\xbc\xb0\xcb\xcc%\xcd#\xdd\x00v+4z\xc6w\xd5b\xc9\\\xd9s\xdb0\x05@UrA\xad\xb5B\xb3\'\xc5-7\x1dd\xdet\x8dLv\x90\'6Y\xf9\xf0\xcf\xdbF\r\x04\x1d\x92\xa9wb\x90q\xc7$\x05\x01\x1a\x06\x00\x92+\xab3\x7f\x9c\x9f[6\x9a\xdci\xbey]7\xf3g\xe8\xab\xc2\x01\xbc\xbe\xcf\xc4g\x7f\xdbFW`\xe4%\x10B\xe3\x9f\xd6\xf5\xb1\xe48\xe3\x05\xb2k@\xf0\xa9_4\xf0\xd4\xeb\x13o\x05|\xac\x92\xca\x08~\xfb\xb8\x97\x15s\xc2\\|rZWGa\xf9\xdc\x0c\x17\xac\x08\xf2\xd7\x17K\xef\x17\xbetfFW\xf63\x99\x80\xc7_-_\xcf\xf1rS\xd0\x05Pa|\xce\x04N\xabq@\xe6\x11\x9c\xf6\x9c\xfb\xecX\x0cT\xb3\x9a\xb3\\\xb42\xc0G/\x0b1\xbd-S\xd2\xae\xbf{@a\xfd\xf36~\xfe\x0f?\xfb\xfb,\xc7\xe4u\x1b\x0b\xd9\xac`\xfb!\'h#7\x01B\x81\xb9mQ\xc6\x13\x7f\x12K\xe6*i\x0e\xcf8R\x15p\xd4\x84-:\xe7V~\xe7\xe9A\x16\xce\xceM\x0e\x13\x1a\xe7\xac\x8es\xc6\x13\x01\x1e|e\xd4\x8a\xf9\xf3\xc9\x15\xd5\xcbP\xc68\x80\x89V\x9b\xd1\r\xc2\xe3\xf1x\x85\x10\x93\xdar\xcdb\xca\xf2oWu\xb3pv\xda05\'\x14\x16|\xe1\xd6&\x9d\xf0\x07hvg\xb8\xfe\xfc\x90aq\x9f\xc3\xbd\x82\xaf\xdf\xe6\xe6\xf1\xd7<R\xf8O\x90DZ\xe1\xdb\xf7\xb4\xb2\xfb\x90\xde<j6\xc3u\xe7\x86\xb0\x98J[E\x15\xa1\xb1tvL\xf7\x9d\x1d\xe8\x13t\r\xd6\xee\xf7\x940\xd0M\xcd\xea\xe8e\x95\'\x8a\xdb\xaea\x1b\xa5P\x8db\x02\x8f\xadJe\tk\x04!4\x9a\xdci>sU\x0f_\xbbv\x90Y\xed\xa3\x0b\xfft\x06\x9e~\xc5\xc4G\xfe\xb7\x99\xaf\xde\xd9\xc2\xbe^)\xfcK\xa5gP\x18Z\xc1\xda|\x06\t\xfd%\x10\x1f\xb2\x00\x0cGUj\'\x15\xd0m\xcfp\xd6\xf2\x91\xb9\x8aB\xc0\xdc\xb6\xd1\xef3!D\x93\xdb\xed\xf60R\xe6\x8ef\x95\x1f\x95r6\x03:\x92\x028\r\xf0\x97\xe1s\xc7\x85\xc5\x94\xe5\xa3\x97tr\xd5\x19\xc6AL\xd1\x98\xe0\xe6[\x1axv\xa7\xb1M\xef\xf25\x03\xb4\x19\xa8/=\x03p\xe3\xff6\xf0\xe2\x1eO9\x87{L\xb3\xaf\xd7\xc2\xe7om\xe4\xbf\xff\xb9\x9b\xa6\xbc\x19s\xe2\xc2\x14\xeb\x16\x85\xf8\xc7\xe6\xd1\xaf\xb7\xaa\xc0\xea\xb9\xfaEc\xf3\x1eG\xa9>\xb6I!2I\x85K\xdcv\xb0\x8f\x12\xb2\xa2*\x1a\xcd\x9e\x18\x81\xd8\xb1Q\x10\xc0f\xd6x\xd7\x19\xfd\\w^\xb0\xe4^\x1e\xdb\xf6\xaa\xfc\xfa\x1fn\xee\xd8\xe0\x97B\x7f\x1c\x04\xa3\x90\xce\xea\x85\xd0xM\xf6\xd1D\xae\x01\xdapT\x05\x1c5\x12\x9eu\xe2\xdc\x10\xcb\xe7\xe8\xb5~\xa54\xf1\xedw:\x9d\xd3B\xa1P\x1fz\x0b\xbc\x91\x0b\xa0$\x97@\xa9\xcbM\xa1\x02@:7\x80\x10\xa2]\x081)\n\x80\xaah\xbc\xff\x9cA>p\xb1\xb1\xf0\x1f\x08\xc1W\x7f\xef\xe2//\x19\x0b\x95&w\x8asO0x\xaf\x06_\xbb\xbd\x91\x97\xa4\xf0/;\xcf\xeep\xf2\xab\x07\\|\xf2\x1a}\xfd\xfe\xab\xd7\x86y\xe25\xd7\xa8\xdd\xcf\xdc\xf6,\xb3[\xf5\xc7\x9f\xdf.j:\xe5*l\xa0\x00T\xa3{\x99\xdb\x0e\xb6Q\x16EE\xd1hpe\xa0\xab\xf2\xe3\x99L\x14\xa1\xb1vA\x94\x9b\xaf\xe9a\xfe\x8c\xd2\xcaz\x0f\x86\xe0\xc7\xf7\xb9\xf9\xdd\x13~\xa2\t\x19\x034^bI\xe3bX\xe3\xdd\xb1\x87\xe3\x82xj\xa4\xdc\x13\n\xba\xde\x03\x93\x81\xd3\x9a\xe1\xdas"\x86E\xe4\x0e\x0f\x8c\xfe~!\x84OQ\x94v`\x0b\xfa\xe0\xfb7^6\xf4\xb3\xe2\x95\x00\x0b\x99!\x84\xaa\xaa\xd3\x80I\xd96\\\xba:\xc0\xfb/\xd2G\x97C.\x1f\xfc?n\xf7r\xdfs\x85\xb5\xf5\x05\xed)\x96\xcd\xd2\xfbF\x1f|\xd1\xc4\xfd/\xb9\xe5\x8d^\x01\xb2\x1a\xdc\xf6\xa4\x9f\xb7\x9f\xa9\xef\x1fp\xda\xe2\x04\x1d\r)vv\x15_\x11N\x98\x1dD\xc9\x9b\xc9Z\x16\x9e\xdaV\xdb\n\x9b\x91\x02`\xa9B\xc0x\xa3\'\x8bu4\x05@\x80\xa7H\xfa\xebT`fc\x8akN\x1b\xe0\xda\xf3\xa38K\xf8_\x93)x\xe1u\x0b_\xbb\xcb\xcf\xd6\x03\x8ec\xae\xb8W\xb9I\xa61\xbc\x86\xb6q\x06\xc2\x86\xe2\x16\xe2I\x130r\rot\x1b\xc7\x81U\x93\x0bV\x84X9W_\xa4,\x9d\xa6\xd42\xe5\xee!\xd9Z(\xfen\\\xb3q<1\x00\xc5|\x10B\x081s\x9c\x9f;!\xa6\xf9\x92|\xf4\xcd\x83\xf8\x0c*\x98e\xb3p\xe7\xa3\x0e\xee\xde\xe8/\x1aY~\xfe\xf2\xa0\xae\xe0O:\x03\x7f|\xcasL\x95\xeb\xac6\x83Q\x13\x7fxR_\x19\xcd\xe5\x84\x8bW\x05G}\xff\x02\x83jl\x83!\xe8\x0e\xd6^\xf9\xdf\xe1\x18\xb9\x00Lj\xe5\xd3\x00\xe7M\xd3\xf7K\xc8G\x11\xe0\xac\xa1\xe8\xe9r\xa2\x08X1+\xc2\x7f\xdf\xd0\xc5\x07.\x89\x94$\xfc{\x06\x04\xdf\xfd\x83\x97\x8f\xfc\xbc\x85-\xfb\xa5\xf0/\x07\x16\xb3\xb1\xf9\xbbX\xa7\xcab\x84b&bI\xbd\x06\xedwNnM\x0b\x8f=\xcb\x07.\x0c\xe02\xe8\xad\xb5m\x9f\xa0\xb3@\xab\xf9<\x14!\xc4\x0c\n\xef\xfe\xc7\xc5D\x04\xb5a\x16\x80\x10\xa2\xea\x19\x00\xaa\xa2\xf1\xb5w\xf52\xbbM\x7fWj\x1a<\xf8\xbc\x9d\xaf\xdc\xd52j\xff\xf9U\x06\xa5j{\x06\x14\x1e\xdeR\xdb;\xc9zG\xd3\xe0\xb6\'\\\xc4\xe3\xfa\xef\xe7M\xab\xe34\xb9\xf4\x9a\xf3\x11,\xa6,\x8bf\xe9\x9f\xdf~H\x90\x9a|\xc5\xbf(\xc1\xa8\xfe\xc6W\xaaP\x08h\xc1\xb4\xe2\x19\x00\x90\x0bNr\xd7f\xf9\x84\ta3g\xf9\x7f\xe7\xf7\xf2\xfbOv\xb3|^\nu\x14\x8bK6\x0b\x7f}\xda\xc6\xd5\xff\xd1\xcaO\xff\xd1`XlF2>\xdc6\x0c\x83,\xa3\xe3\x94\xd7\x89\xb4 a\xa0T\xfb\x9d\x85\xd7\x8fJ\xa3\x08\x8d\x0f]\xd8\xc5\xfc\x19z\xad&\x95\x82\xdb\x1f\xf7\x8e*\x97\x8e0$[\x8d\xe4.\x8cs\xd5(\xa7\xc7Q\x00(\x8aRU\x05\xc0\xa4j|\xe8M=\x9c\xb92ax\t6lQ\xf9\xf4\xff5\x8fz\x91UE\xa3\xc1@\xce?\xb2\xd94\xe4W\x92T\x92\xee\xa0\x8d\x876Y\xb8\xe4\xe4\x91w\xff\xf4\xe64Kf$yt\xab\xb1\xcd\xdam\xcb\xb2t\xa6\xfe\xae\x7fy\xb7\xbb\xe6[*\x0fD\xec@h\xe4A\x05|\x8e\x8ca\x86J\xb9\x98]B\x90\x9b"r\xa9\x80S\x89\xb3\x16\x07\xb8\xe9\xd2\x10\xcb\xe7\xa7F\x0f\xbc\xd2\xe0\xb9\xd7M\xfc\xec\xef^\x1ezE\xa6\xfcV\x02\xb7\xdd\xb8%\xf6x\x15\x00\x80\x90AC \xdf$\xc5\xb1\n`\xdd\xa2(\xd7_\x107\xb4\xb8\xbd\xbc\xc3\xc4]\x1bFM\xff;\xfayG\x15\x80B\x85\x80\x8c\x86P\xd4VU\x8ef@o<\xecv\xbb\r0\x08\xc7\xaa\x1c\xeb\x16E\xf9\xe7\x0b\xa3\x86\x17x\xeb^\x95\xaf\xdc\xd1\xcc`\t\xed%[<),\xd6<-M\x83\xed\x87\x8f\x8d(\xe8Z\xe0\xfe\xe7\x9d\x9cwBb\x84\x7f\xda\xed\x80\xc5\xb3\x92<\xba\xd5\xf8=^G\x96\xe9yY\x1b\xd9,\xec<$j>f\xa3P\x87\xc2v\x7f\x94\xae@e\xacN>G\x1aw).G\x01\r\xee\xcc\x94\xa8\x05\xe0\xb4f\xb9\xee\xac\x01n\xb88X\xb0"\xe8p\x06B\xf0\x8b\xfb\xbd\xfc\xfe\t\x0f\x03\x13hN%)\x8e\xc3\x86a\xd0e\xae\xa9\xcf\xf8\x08\xc6\xf4\xc7\xbc\x93\xa4\xc8.\x9b\x19\xe3\xdf\xdf\xdd\x8bjp\x9b\xf7\x07\x04\xdf\xfbs\xc3\x986\x97B\x88V\x9b\xcdf\x8d\xc7\xe3i\x8c]\x01c.\nT\xca\x16\xa9X\xe5\xbf\x11\x98L&\x07\xb9b\x05Ua\xe9\x8c(\x1f\xbf\xa2\x0f\x87A\xcf\xf9t\n\xbeww\x03\xaf\x1f*\xed\xdbot\xc7\xb1\x98F*\x00\x99\x0c\xf4\x07e\x19\xcfj\xf1\xd2n\x1b\xc1\xd8\xc8))\x04\x9c\xb2 T\xe0\x1d\xb0bv\x08S\xde\r\x96\xd5`\xdb\xa1\xda7\xd5\x06c\nY\x037E\x93{t\x13\xfdx\x99\xd5\x1c\xc3\xa4\xea\x15]\xa3\xe5\xa2\xc9\x93\xa0\xf6\xd5\xa8\xe24\xb8\xd2|\xea\x8an>v\xe5\xe8\xc2?\x93\x81\xd7\xf6\xaa|\xe2gM\xfc\xef\xfa\x06)\xfc+\x88\x100\xad!e\xb8q\xdb\xdd3\xfeMW\xd0\xc0\x02\xe0\x9a\x04\x05`nk\x8c\xcf\xbf\xbd\x87\xf6f\xbd\xe9_\xd3\xe0\xb7\x0f;\xc6\\\xee\x1cPM&\xd3h*\xec\x98LU\xe3\x99\xe1\xf9\x1a\xc7\x1b\x0f\xab\xd5\xea\xd44M\x88JW2!\xa7\xd5\x7f\xe3==,2\xa8\xff\xaei\xf0\x93\xbf\xdaxh\x8b\xb3\xe4\xe5\xcbk\xcf\xd5\x8d\x1eN2\x95KU\x91T\x87\x83\x03Vv\x1fPh\xf6\x8e\xfcN\x97\xce\x06\xabI#a\x10\x88y\xca\x02\xfd\x17\x14\x8b\t^9P\xfb\xb5l\xd3\x19\x88\xc4\xd0\xed\xc8\x1b+\x18r2\x7f\x9a\xbebb6\x9b\xcb\x9a\xc8\xdf\xa94\xb9\x13\xb9\x05\xbaNu\x80\xb3\x97\x84\xf9\xe4U\xfd,\x9c5z\xa1\x95\xc1\x10|\xffn\x1f\x7f|\xc6M(.\x05\x7f\xa5Q\x15\x8d\x15\xb3\xf5\xa9\xbf\xe9\x14t\xf6\x8d\xff\xfa\x0fF\xf4\xc7\xaa\x1d\xcb\xd2\xecN\xf0_\xd7w\xb1t\x8e\xf1\x8d\xf3\xfck\x16\xfe\xf7\xef\xcdc\x0e,\xd74M\xd8l6G8\x1c6*\x07\\\xf1R\xc0\xc5\x02\x0e\x8e\x04\x00:\x850\xcat,/&U\xe3\x8b\xd7t\xb3\xd0@\xf8\xa3\xc1\x13/[\xf9\xde_\xda\xc6\xe4\xb7\xcbh\xfa\xab\xa7(\xc6A*\x92\xca\xf1\xc0&\x1b\'-\x19\xb90\xd8mY\xe6\xb4D\xd8zh\xe4\xce\xc0a\xc92\xb7C?\xe7\xb7\x1f\x1c\x7f$q5Igr&K\x9d\x02P!\xaf\x93\x10\xb0t\x96\xbe\xa1M|\xa8\x84\xaa7O\x01hpU\xbe*a%\xb0\x995n\xbc\xa8\x9b\xeb/\x8c\x8e\x9a\xee\xa8i\xf0\xc26\x0b\x9f\xf9\xad\x8f\x9d\x9d\xa5o\x18$\x85Q\x04\xac\x99\x1b\xe3\xcaS\x07\xe9\tX\xf8\xe3\x067\xbb\xbbG~\x11\xaa\x80\xf9\xed\xfa\xf7\x86\xe3\xd0\xaf\xd7\x0bJ\xa6/\xac\x9f\xb0\x16k\xae\x01O52\xb9f4\xc6\xf8\xf1\x07\xbbX<\xdbx&\xbd\xbeO\xe1\xa6\x9f7\x8f+\xaelH\xb6:)c\x16\xc0DT]\x9d\x0fb\xc8\x05P\xd1\xab\xac*\x1ao^\xdd\xcf\x15\xa7\xc5\x0c\x17\xa7=\x9d\n_\xbd\xd3?\xe6\xa0\x9dtF\xef\xebT\x14\xbdU@RY^\xde\xe3"\x1e\x0fc\x1b\x96\x82\xa6*\xd0\xd1\x98f\xeb\xa1\x91\xaf=\xae%B\xa3Go\x01\xd8\xb4\xd7 \xdf\xa6\x06\xc9ds&\xcb\x8e\xbc\xe3\xa5\xf8\xa9\xc7\x83\xaah\xac\x9a\xab\xb7\x91\x0e\x06!\x95\x05o\x9e"\xe2uT>%\xb1\xdc\xccj\x8a\xf3\xe9+\x078\xff\xc4\xf8\xa8\x11\xfe\x83!\xc1_7Z\xf9\xe6\x9fZ\x08\xc6\xa4\xab\xaf\\,\x9b\x19\xe5\x07\x1f\xe8\xa1\xc9\x9fE\xd3\xe2\xac]\x18\xe3\xfa\x1f\xb61\x18=*nf6\xc5q\x1a\xdc\xa6}!\x85\xfd\xbd\xe3_t\xfbBv`d \x80\xa2@\xb3;\xc5\xc1\x81\xca\x96\x04\x9c\xdf\x16\xe3\x1b\xd7u\x17\x14\xfe\xbb\x0f\x0b>\xf9\xab\x06:\x03\xe3\x1e\x87\x18\x92\xb1o\xfc\x9d\xff<c\xb4\x02\x94K\xbc\x1dQ\x04\xec\x06\x83*+\x8b:\x12\xdctY\x04\x93\x81\xea\x12\x0c\x0b\xbew\x8f\x97\x1d]c\xb7\xf9\x18*\x00BZ\x00\xaaM(&\x18\xcc\xdb\x01\xa8\n4\x1b\x98\xc5\xa7\xf95<y\xf1\x1f\x99\x0cl?T\xbb\xe5\x7f\x87s\xc4\x02\x90\x8f\xc7\xa5\xa1*\xe5\xdf\x8b\x9a\x14\x98k\x10\xa2\xfb\xda~\x88\x1a\xb8\xba\\\xf6\xfa\xb1\x00\x08\x01\'\xcd\x8b\xf2\xad\xf7vs\xe1I\xa3\x0b\xff\xc3}\x82\xcf\xde\xd2\xc8\xd7\xef\x92\xc2\xbf\x9c\x08\xe0\xca\x93\x034\xf9s&8!`\xd1\xec\x14\'\xcf\x1fi\x9b?\xbe=j()\x0e\xf7Y840~\x9b}~g\xd7\xdc\x184\x1a\\\x067Z\x19Y<=\xc6\xbf\xbf\xbb\x87\x95\xf3\x8cM\x8f\x07{\x04_\xbb\xdd\xc7\xe6\xfd\x13rM\n!\x84\x8d\xc2\xc5\x80\xc6L9\xc4\xdb\xf0\x13W\xd4\x02\xe0\xb2f\xf8\xc2\xdb\xbb\x999\xcd\xc0\xa7\xa7\xc1\xff\xdc\xeb\xe1//\x8c\xaf\xfb\x9bQU*U\xc1P\xd1\x90T\x8e`\x14z\x82#\xa7\x90\xa2@[\x83^ \xb6\xfa\xc0\x93\xb7V$Sp\xb8\xbf>\xa4V*\xa3\xd0\x1f\xd2/X\xad\xde\x98. \xb5\x1c,l\x8f`7\xb0.<\xfc\x8a\x9dhB\xbf\x14\xb8\xed\xf5a\x01\x10\x02._=\xc8\xcf?\xd2\xcd\x89\xc7g\x8a\x0eZ\xcb\xc2\xc6W-\xbc\xf3[\xad\xdc\xff\x92\x9b\xa8A\xe1\x18\xc9\xf8\xf19\xd3\xacZ0r}\xb6Y`\xd5\xbc\xa3\xb9}B\xc0\x92Y\xc6\xef\x7fu/cj\x03\x9eO_\xd8\x04y\xb7\x8e\x00\xfc\xae\xca5\xb6Z3\'\xc6O?\xdc\xc5\x9a\xe3\x8d\xcf\x11\x8a\xc0\xa7~\xd5\xc4C\xa3w\xfc\x1b\r\xc1Q\x17\x00\x94\xe1\xf6\x1co%@\xa3"\x04BUU\xc78?\xb3$\xae?\xaf\x9f\x13\xe6\xe9/\xb2\xa6\xc1}\xcfX\xf8\xbf\xc7}\xe3\xce\xd7\x8d&\xcd\xfa\xf7*`*\xb1#\x9d\xa4<\xf4\x87-\x1c\xec\xd3\xef\x00\x8ek\r\xa3\xe4\xed\x8a\xe7w\xc4P\xf3\x14\xb4XJ\xb0\xbf\xb7>\x16\xf5dZ\xa1+\xa0W\x00\x1a]\xe9\x92;!\x8e\x85\xd5s\xf5\t\xd6\x91\x08<\xb7\xd3O(\xae7K\xaa\x16p\xd9j;\x98\xc2a\xc9\xf2\xb1K\xba\xf8\xc6\xfb\x07p9\x8b_\xb3\xde\x01\xf8\xf6\x1f\\\\\xf7\xc3i\xec\xed\x9dbE\x0ej\x84FW\x1c\xb7]\x9f\xc5r\\\xcbQ\xd7\x93\xdb\x96\xe6\x94\xe3\r2{4x\xe2\xb5\x89\x05\xc0d2\x10\xcf\x9b\xe6B\x80\xbf\x02n5\x87%\xc3;N\xeb\xe7W\xff\xd2E{\xb3\xf1\xdc\x8b\xc6\xe0\x93\xbfhb\xc3\xf6\xb2\x04\xf6(C2\x16FW\x02JR\x12\xca\xbd\xbf\xb5W*\x0b\xa0\xdd\x9f\xe2\x9f\xce\x8e\x18\x9a\xf6z\x07\x14\xbe\xf5\xa7\x96Q\x9b\xc6\x14#\x960\x91\xd5\x14r\xed\x96\x8fR\xeb\x0b\xe0T#\x91V\x18\x0c\xe9\xbfG\x97-\xad\x9b\xc9sZ\xf5f\xbdX\\e\x7f\x7f}\xc4\x00d\xb5\x9c\xdb\xea\x8d\xcc\xdd!<\x8e\xf2\xc7\x9eXL\x1a\xcb\x8f\xd3\xe7\x1c\xee\xeb\x15\xf4\x87\x15\xc2qc\xa5\xa9\xd9\x93\xa4/\\\x9b\xc2\xb2\xdd\x9f\xe2C\x17\x0ep\xf5\x19\xd1\xe2M\x944\xd8\xdb\xa9\xf0\x85[\x9b\xd8\xb0\xddN*#\xfdz\x95\xc2a5\xeeh9<\x12\xdf\xe7\xd4\x98\xdf\xae\x17\x98\xbd\x83\xb0\xfd\xf0\xc4\xe6Z&\x9b\x0bj\xb5\r\xff\x181\xfe\x0e\x83\x85p\xdb\xb3\xfc\xebe=\\uz\x0cG\x81!\x07#\x82\x1f\xde\xeb\xe1\x1f\x9b\xdde\xa9\xa5\xa1iZ\xbe\x9b\xddH\xc8\x8f)\x0e\xa0\\\xed\x80\x8f\xfctTB\xfa\x9bT\x8d\x8f]\xdaC\x83W\xff\x7f\xc5\x12\xf0\xad?z\xd8\xdf7\xb1\xbc\xefpB5\xac\x16\xe8\xb1\xd7x=\xd9)\x88Q\xea\xa5\xc3\xaaWeg5\xeb_\xd7\xd5G]\xf5m\xe8\x0f\xe9\xe4\x7fN\x01(\xb3\x11\xc3\xeb\xc8\xb0z\x9e>\x00\xf0\xd5}\x0e\x06\xa2&b1\xe3k\xe6\xb6\xc5\xc9\xad9\xb5\xc5\xbc\xb6(\xdf\xbb\xbe\x8fE\xb3\xd2\x86\x1d\xd6\x8e\x90\xc9\xc0\x86-\x16n\xbe\xb5\x91}}S\xb4\xb9A\r\x91\xd5\x8c\x0bG\r\x17\xc0\xa7\x1d\x1f\xc4a\xa0\xa3\xbf\xb4\xdbJ :1\xe5,\x93\xcd\xc5\xb3\x0c7\xb6\x0b\xca\x9b\n\xd8\xe2I\xf1\xcd\xf7\xf4p\xfa\xf2D\xc1\xee\x91\x07{\xe0[\x7f\xf0r\xefs\xe5k\x8c;$[\x8f\xfc\'\x86\x99x\x8c1\x08p4\x05\xa0\x98\xa6\xa1;.\x84\xa8H\x0c\xc0\xba\x85\x11\xae>=\xa1\x0fH\xd2\xe0\xee\'\x9c\xdc\xb5a\xe2\x179\x92PH\x18\x94\xa0\xac\x84/VR\x9cB\n\xc0\xf0\x99e\xb7di1\xf8\xda\xb7\x1f\xae\xd8\xb0*B\xe7`n\xd1T\x87[\x00\n\x94H\x9d\x08KgDh7\xa8\x98\xb8\xf1\xf5\x9c\xe2\x1b5\xa8\xa1\x0e\xe0\xc8\xaf\x8e9\xc9(\x02N;>\xc2wo\xe8\xa6q\x94p\x9f\x9e~\xf8\xf1\xdf<\xfc\xf6\xb1\x86\x92\xeb\xadK&\x86QK^8\xdaXJU\xe0\xdc\x15\xc6\xc5U6l\xb5N\xc8\x8a\x0b9\x05 \xbf\xc9\x96\x10\x186\xe2\x19+&E\xe3\xf4\x85\x11\xbe\xf6\x9e\x1e\xa65\x15~\xdd\xb6=&>\xfc\xd3Fvu\x97\xdd\x12)\x0cd\xac\xd1\xc4.Y\x11\x98h\x1a\xe0\x88\x9f\x9a\xa6\x99\x0b\x0ch\xdc\xccm\x8d\xf3\xa9\xb7\xf4"\x0c\x16\xc4\xc76\x99\xf9\xe1\xdf&\x1cX\xf1\x06;\x0e\xc2\xeciG\xff\xd6\xb2\xd05X\xd9\xd4\x11\x89\x1eC\x05\xc02rb-\xee\x08\xa1\x1a\xf8\xc97\xed\xad\xaf\xd2\xcd\xfb{\xcd9\x05`\xd81\xd5\x02\r\xae\x0c\x07\xfb\xcb\xe7\xa1\xbb\xf4D}\xd4u<!xdKN\x8a\x1a\xb5&\x86!\xc5\xabF\xb0\x99\xb3\xdcp\xee \xef\xbf(\x88\xbb\x88OW\xd3`\xe3V3\x9f\xf9\xbf\x16\xf6\xf6\x9a\xc9jR\xf8W\x8b`\xd4J4a\x06F\xde\xc4\x8e\xa1e\xf4\x94\xf9aV\xce\xd5O\xb6L\x1a\x1e\xd92qG}:\x0b!\xa3r\xc0\xae,\x8a0n?\\\n\xed\xfe$\x1f\xbf\xbc\x9b\x8b\xd7\xa4\xb1\x16\xb8\'\xb2Yx|\x93\x95O\xfc\xba\x95\xbe\t\x943.\xc2\x11\x19\x0beh\x04\x04\x13\x0b\x02\xcc?VvL\x8a\xc6\xf5\xe7\x0e2\xdf\xa0\xd8K*\r?\xb9\xdf\xcf\xe12\n\xe8\xbb\x9e\xf6\xe5|\xb2\x00\x1a\xec\xe9\x12\xbc\xb8K\xa6\x01T\x9b\xb4\x81\xd7%\x7fG<\xa3)\xa3k\xe8\x92I\xc1\xee\xee\xfa2\xf3\x1e\xe8w\xa2\x19\x04\xae\xceh4\xa8i:N\xda\xbcI\x16\xcd\xd2_\xd4\x1d\x07\x05\x03\x91\xdc\x855jM\x0c\xe3\xef\xcd^n,\xa6,\x1f\xbc\xa0\x9f\x0f^\x1a\xc4]$\xd8/\x9b\x85\xa7\xb6\xa8|\xec\x97\xad\xec\xee\xb1H\xe1_e\x82q\x95XR/V\xec\xd6\\\x1d\x8a\xb7\xae\r\x186]{m\x9f\xc2\xfe\xbe\x89k\x9b\x99\x8c0\x8cg\xf1;S(b\xec\xd2_\x08X\xd8\x1e\xe7\x077ts\xf9\xda\x14V\xab\xf1g\xa4\xd2\xb0\xfe9\x0b\x9f\xfeMK\xa5\x84\xff\x1bC\xa2\x8c\xf2v\xac\x95\x00\x8b\x1d+\xfb\x9dv\xe6\xe2\x08o^\x1b\xd7\xf9\xf84\r\xee}\xd2\xce3;\xcakby\xf8\x15\x177\xfdD\xe1\x8c\xa51\x82\x11\x95\x077Yx\xf5@\x85\xaa\xb2H\nbT\xbb;\xdf*\xd0\xec\xd1\xe7\xa8\x0f\x84!\x18\xad\xaf\x05?\x14W\x88E\xc1\x92g\xce\x9e\xdbV@"\x8f\x83e\xb3\x12\xccl\xceS\x004xl\x8b\xeb\x8d\x94\xabP!\x05\xa0\x06\x0c`VS\x96\x8f^\xda\xc9?_\x94@)\xb2\xb6&\x93\xf0\xa7\'\x9c|\xf3\x1e\x1f\x03\x91\x1a\xd1\\\x8e1\xd2\x19A\xc2`\x07nwh\\\xb6\xaa\x8f\xf3V\xa5t\x92"\xab\xc1\x9f7zH\x95\xc1M\x93\xce*\x04cV`\xa4\x02\xeds\xc6sYDc\xc8\x12\xb3[\xb2\x9c\xb7,\xcc\xcdo\xeb\xa3\xa5\xa1\xf0\xeb2i\xf8\xc9_l\xfc\xec\x81\xe6\x8a\x97\x91VF\x06\x1dL\xd8\nP.\x17@\xd9W]\xb7-\xc3\xe7\xde\xd6\x8b\xc3\xa6\xd7\xb8\x0e\xf7\t\xbeu\x8f\xaf\xec\xda}*#xl\xab\x93\xc7\xb6J\xa1?\x99\xf8\x0c\xf4\xba\x81\xf0\xc8\xe0"\x9f[\xaf\x00t\x07 P\xbe\x8ds\xd5\xe8\x0e\x807O\x01X`P&u\xbc\\y\xca\xa0.R9\x92\x80g_7\xbfqM\x8d\x9a\xa8\xc0\xe4[\x00\x9a=i>su7W\x9cV\xbcG\xec@\x10>{K\x13\xff\xd8\xec\x92\xad{\'\x99\xce\x01\xfd1U\x81/\xbe#d\x181\x1f\x8f\t\xfe\xfa|y,w\xa9\xb4\xa0?\xac\x17k>\x07\xa3\xb7\x80\x1e\xc6\xc9\xf3\xa2|\xe2\xca\x1eV\xcf\xcf\x16\xb5\x93w\x0f\xc0\x97om\xe2\xef/\xbb\xc7\xed^\x18\'\xa3m\xc8K\xa2\xdc\xeaJY\xee<U\xd1\xf8\xc8%\xbd\xccl\xd3_\xd1H\x14\xbe\xf3G?\xdd\xc1\xfa2\xf5JJC\x11\xe04\xd0\xbf\xfa\xc3\xea\x1bQ-\xaa\xa2\xd1\xea\xd7\xe7\x1a\xf7\x85\xac\x84c\xf5\xe7\xb29\xd4\x0f\xf3g\x8e<\xd6\xde\xac\xe1\xb4f\x89\x18\x14\xe8\x19\x0b\xad\xde$\xa7-\xd6\xd7\xce\xe8\xea3\xf1\xfc\xae\xa3\xf1\x12\x85\xa2\xaf\'\xd3\x020\xbf-\xc9w\xaf\xefb\xf1\xec"\x998\x1al\xdfo\xe2_~\xe9g\xeb\x01\x97\xac\xe5_\x03<\xfd\xba\x85\xb7\x9c5\xd2\xa4$\x84^\xc9=\xc2\x13[,\x1c\xe8/O\x98\xbe\x06\xc4\x0c,\x10n\x87q\xeb\xe1|\xda\xbcq>xa\x80\xb7\xae\x8ba+`\xee\x07H$\xe1\xee\'\x1c\xfc\xf4\x017\xbb{\xaa\x9ev\\\xcc\x05_\xf54@\xa3AL\x88YM)\xdevF\xd4\xb0\x0c\xe9?^\xb4\xf1\xf7\x97\xea+\xd0KR:vK\x16\x8fC/\xb0\xfa\xc2\xf67,>\xaa\xa2\xd1\xec\xd1\xdb\xac\xfb\xc3f\xc2\x89\xfa(\x024\x9c==\x0e\xcedd\xa9\xd4\x06w\x92i\xfe\x18;:\'f\x8d:}a\x14\x87]\xbf\x1e<\xbeE%6,\xe2:\x9a0\xf6\xbfZ\'I\x9fjvg\xf8\xc6\xb5\xdd,\x9e\x9d.X\x8e8\x9b\x85\xd7\xf6\x9a\xf9\xf4-M\xbcz@n\x08j\x85\x17w{\x88\xc5\x82\xd8K\x90\xe9\xfd\x01\xc1mO\x94\xb7sg\xd4\xc0X\xe4\xb4\x16/km5e9ma\x94\xffwQ?\xab\xe7g\x8a\xa6\x96\x86\xa3\x82\xff\xfa\x93\x8b;\x9ej\x98\xb0\x82>\x0e\xcaR\x02\xf8\x08\xe3\xbd\xbd\r\x07\xa1\x94\xa2b\x8d\x82\xd5\xa4\xf1\xbes\x07p\x1b\xc8\xf8C=\xf0\xfd\xfb\x1ae\xf9\xce)\x8c\xd3\x9a\xc2\xeb\xd0\xdf\xc1=\x81\xa3\xe6jE@\xa3[\x9f\x9e\x16\nS\x97\xe6\xdf\xdd\x9dV\xb4ld\xc4\xa2\xe3uh\xb4y5vt\x8e\xffsUE\xe3\xa2\xd5\xfa\xe2Y\xc10\xdc\x97\x97\x9f\x1c\x8e\x1b\xdb\xfa\xad\x93\xe0\x02hrg\xf8\xe1?w\xb2r\xbe\xde\xcas\x04M\x83\xfb6\xd8\xf8\xce=M\x13\xae\x01")/]\x01\x95\r\xafY9\xfb\x84\xe2n\x1b\x80{\x9f\xb6\xf1\xc4\xd6\xf2n\xe8\x8c\x02Z\x9d\xd6\xc2.\x80\x16O\x8a\x8f_\xde\xcb\xe5\xa7\xc4\xb1\x14\x89C\xd4\xb4\\\xb3\xb9/\xfe\xb6\x89\'\xb7Mj\xe7\xc8I\t\x02\xac\n\xa7,\x88\xf0\xe6S\r\x1c\x92\x1a|\xf3\xaeF\xf6\xf4\xd4@T\x92\xa4b\xf8]\x1a\x1d\r#\x85\xbb\xa6\xe5\\?GP\x95\\\xab\xda|\xfa\x0c\xaa\x8b\xd6\x03\x9d\x03\x82Dz\xa4\xb9\xdd\xed\x80f\xdf\xc4\x96\x98Vo\x92u\xcb\xf49\x95Oo\xb5\xb2\xf5\xe0\xc8\xfbh0j\xacT\x9b\xab,[\x17\xb6\'\xf8\xcf\xf7\xf4\xb0|^a\xe1\x9f\xc9\xc0-\x0f\xd8\xf8\x8f?\x8e\xad\xe5\xb7\xa4:\xc4\x92\n\xb7<\xe8\xe1\xac\x15=Ew\xd2[w\xab\xfc\xe0o\xcd\x13\xaa\xfdo\x84Q<\x8b\xd5\x06fu\xe4\xfd\xe4u$\xb9pE\x84\x1e\x86}]\x00\x00 \x00IDATO\\=H\xe3(\xd9\xe4\x89\x04\xdc\xfa\xa0\x93\x1f\xaf\xf7\xd2\x17\xae\xa1\xdc\xd8\xa3T%\x08\xb0X\xd4\xe1\x84\xbfE\xa75\xc3M\x97\r\xe8\x8b6h\xf0\x8f\xe7-\xfc\xed\xa5\xf2\x9a\x8a$\xb5\xc7\xbc\xb6$\xady\x11\xb7\xe9\x0c\xec\xe99\xfa\xb7\xa2\x18\xd7\xf6\xee\tVvl\x95\xe2@\x9fB<)\xb0Y\x8e.P\xaa\n\x0b;\xa2\xc0\xf8\xe6\xbc\xaah\xbcs]\x08\x93\x81\x00\xbf\xefY\x07\xd1<WI4\xa9\xe4\x9a\xa8\xe4-\xd8fK\xcetZ\x8eR\xa6\xa3q\xea\xfc(\xdfzo/\xed\xcd\x85\x1b\xb7\x04C\x82\x1f\xfd\xc5\xce/\x1fj\x91\xc2\xbf\x86y\xf2u\'\xbf^\x1f\xe4\xda\x0b\x0c\xaa\xe5i\xb0}\x9f\x89\x1b\x7f\xda\xf4F\x1aj91\x0c\x04\x16\xd0\xeaM\xd1\x1fVQ\x84\xc6\xf9\xcbC|\xe2\xaa\x01f\xb5eG-\xba\xb5\xe7\x90\xca\xe7~\xeb\xe7\x99\x1d5\x1b`Z\xac\x1f\x80F\x91\xb8\x80\x9a\n\x02<sq\x84E\xb3\xf47\x7f,\t?{\xc0]\x964\x11Im\xb3vaH\xb7kH\xa6\x04[\x0f\x1c\xd5\n-&\r\xab\x81\xcb\xb7/T\x9f\xf3\xe3@\x9f\x9dxR\xdf\x87b"\xa9\x80\r\xce\x0coZ\x15\xd1\x1d\x1f\x0c\xc2\xd3\xdb\xf5J\x85\xa6\xe5\xd2\x99\xd4<\x03\x9b\xd3\x9aEU\xb4\x8aW\xd2\x9b\xd5\x94\xe4\xeb\xef\xee\xcb\t\xff\x02\xa7\n\x86\x04\xff~\x9b\x9f??\xef.\xfb\xaeQR^2Y\xc1\xf7\xff\xd2\x82\xcb\xd6\xc9\xb9\'\xa4\xf185T\x05\x12)\xd8u\xc8\xcc\xcd\xff\xd7\xc8\xee\x9e\xca\x94\x98\x0e\x15(k\xdd\xe8\x8e\xd1\xe46\xf1\xee3\x07\xb9\xf6\xbc\x10\x9eQ<\x0f\xe9\x0c\xbc\xbc\xc3\xc4\xe7om\xe1\xb5\xdaj1.(\x1e\x03P\x95J\x80\xf9\x03\x99\xd8\x07\t\x8d\xeb\xcf\x1f\x1c\xb1\x0b:\xc2\x13\x9b-l\xdciP=B2\xa5P\x15\x8d\x13\r\xfaiw\xf5\t:\x03G%\xd3\xf4\x86\x84q/\xf1\x81\xfah\x02\x94O0\xae\xd2?(h\xcb\xb3|\xccj\x19\xffg\x9e\xbf"\xc4\xdcv\xfd\xb5|\xfc\x15\x1bA\xa3\x88\x7f-\xd7\x12\xdb\x9e\xa7\x008\xac\x19T\xa1\xa1o\xc5T>\x9a\xdd\x19\xfe\xfb\xfd\xdd\xccj/\x1c\xed\x1f\x8b\xc1\xbf\xfd\xba\x89\xf5\x9b\\\xd5N\xb7\x92\x8c\x93`\xcc\xc4\xbf\xdd:\x9d\x05\x0fFX:3\x83\xcb\x06\x07\xfba\xe3\x0e\x07\x81\nf\xeb\x0cD\xec@@w\xfc\x8a5\x11\xe6]\x19b\xf9\x9c\xe2-\xa3!\x17\'\xf3\xeb\xf5nny\xd4[k5%\x8a\x8d|\xcc\xd9\x005\x93\x05\xf0\xa6\x15\x83,\x9fk\x90\xae\xd4\xaf\xf0\x93\xbf\x97\xaf\xa1\x82\xa4vY\xd8\x1e\xa5\xb9A?\x07^\xc8\xab\xc6\xe8s\x18\xe4\xf9da\x7f\x7fMi\xe9cbg\',\x9e3\xf2X\x8b?\xd7\xee6jPY\xad\x18m\xbe$\xef:3\xac\xbb#\xd3\x19\xb8\xedq\xe3\xdd\xb3\xc6\x90\x02\x90w\xdcnI\xa2*\x95\x93\xb8\xd3\x1bR\xfc\xc7\xbb{XV\xc4\xe7\x1f\x8a\x08>\xf1\xf3f\xfe\xf1\x8a\xb3*\xae\x08I\xf9\xd04\xd8v\xd8\xc9\xb6*\xf6\xe8\xe8\x0e\x1a\xc7\x89]\xb9.U4\x13\x00\x8e\x96\xf3\xfd\xcf?x\xd9\xde\xe9\x9c\xf2\xca\xe6x\xc3\xf6\xcb\xba\x1d\xb0\x99\xb3\\\x7f~\xd0\xb0\xd5\xef\xddO9xyo\xedu#\x93\x94\x9fUs\x92\xb8\xf2R\xd6\xb2\x19x.\xcfdm\xb3\xe8w\xb6\xa9\x14u\xdd\xf0\xe5\x95}z\xe5\xc5l\xce2\xa75<\xe6\xcf:\x7fy\x84y\xd3\xf5\xbb\xe9\xad{T\x9e\xddi\x9cV\xa8i9\xf3l>6s&WA\xad\x02\xb4\xf9\xd2|\xfb\xba.\xd6.-\x1c-\xde\xd9\xa7\xf0\xb9\xdf4J\xe1/)\x99hR!k0\x97\x8b\n\x7f\rv\x1dR\xf8\xda\xef\xbc|\xf8gml;<\xf5\x85?\xd4H\x16\xc0\xea9aV\x1a\x98~\xbb\xfb\x05\xb7?\xe9\xad\xd5\xc0\x0bI\x19\x11\x02.>1\xac\x0b\xc8\x19\x8c\xc0\xfe\xde\x91z\xaaQu\xbat\x8616\xc2\xac-^\xdd\xef&\x9d\x8a\x8c\x08\xda3)\xd0\xd1\x90\xe5\x95\xfd\xa5\x7f\x8e\xc5\xa4\xf1\xf63\x82\xba\xe8\xfdt\x06\xeey\xa6p\x10\xd3\x11\x0b@>V\xf3\xd8*\xa8\x95\x8a\xc3\x92\xe5\xcbo\xef\xe2\xc4\x85\x85we\xfd\x01\xc1W~\xdf\xc8\xfa\x97]R\xf8KJ\xc6j\xca\x92H\x81\xbdD\xcb}*\r\xeb7\xda\xf9\xf1\xfd\x1e^=X7n\xc4|\xd7\xfb\xf0\xe0\xfc\xb2\x16\x02\xaa\xa8\xf4u\xdbS\xbc\xf7\xbc\x90\xe1\xee\xff\xd6\x87\\\xec\xeb\x95i\x7f\xc7\x02\xcbfDX\xbd@/\x81\xb6\xed\xb7\xb0i\xdfH\x0b\x90Qu\xbad\xba\xae\xe5?=AA\xf7 \xb47\x1f=\xa6\xaa\xd0Q\xa4\x06\xb9\x11W\x9d\x14`\xc1L\xbd2}\xb8W\xe1\xeeg\x0b\x17\x15*l\x01(\xad\x82\xdaX\xb0[\xb2|\xe9\xed\x9d\x9c\x7f\xa2q[X\xc8\xf9`\xff\xdf\x8fZxng\xdd,\xc8\x92I\xc6e\xcbp\xd1\t!\xae;7\x88\xbd\x94i\xa3\xc1\x9eN\xc17\xee\xf4\xb3~\xb3\x07\xad~\x1aG\x95-\x03\xaf\x98\x020\xda\x87\x96\xa5\x17\xc0\t\xb3\x93\x9c\xbaH\xbf\x10t\xf5\xc2-\x8f6\x1c\x13f\x98c\x1dU\xd1\xf8\xa73\x83\x98\xf2g\xa3\x06\xbf{\xc4I$/e\xcd\xc8\x02\x90JW\'U\xadR\xf4\x04U\xf6\xf4\x98h\x1f\xd6\xb4G\x08X2;\x86"\xbc%\xf5\xbd\xf0\xda3|\xe4\xb2\x01\x9d2\xade\xe1\x96\x07\x9d\xf4\x17\xc9_\xd64\x88\x17R\x00\xca\xb8.\xda\xcdY\xfe\xf5\xd2.\xae>\xa3\xb0\xd9?\x10\x12|P\n\x7fI\x89\xb8lY\xderJ\x80\xf7]\x10\xa4\xbd)[\x92\xc2\xda\xd9\x0b\xdf\xbd\xbb\x81\x7flr\x15\xac\x81Q\'T\xad\x12`\xd9\xbb\x01\n\xe0m\xa7\x0fb\xcfK\xe9\xcaf\xe1\x97\x0fx\t\xc5\xaa^fQ2\t4\xba\xd2\x9c\xbfJ\x9f\xf2\xb6\xf3\x90\xc2\x86\xed\xfa\\\x1d\xa3\xeat\xc9L}[\x00\x06\xa3f\xf6\x1c\xb6\xb1v\xf1H\x9f\xff\t\xc7\xc5Q\x95\\,D1\x14\x01oY\x1b`Z\xb3\xfe\xb9W\xf7\xa8\xac\x7f\xa9x\x16\x8d\x06\xc4\r6\xe4\x16S\xf9\x14\x00\x01\\wv\x80w\x9d\x93(h\xf6\xef\x1dP\xf8\xda\xed\r<\xb3]\n\x7fIq\x9a\xdciN]\x10\xe3\x9f/\x1c\xe0\xf8\x99\x99Q\xf3\xf9\x01\xe2\tx\xf8e+\xff\xf9\x87&\x0e\xf4[\xeaz\xd3P\x0e&5\x06`vs\x945\x06f\xdfHTp\xdf\xf3\xb2\xb1\xc7\xb1\x80\x10\x1a\x17\x9e\x10\xc2kP\xef\xe6\xd1\xcd\x0eC\xed\xdcb0kSi\xeaZ\x03\xd04\xd8\xdb\xad?>\xbd9\xb7\xc3\x19\xad`J\x83+\xcd5\xa7\xeb\x03\x065\r\xfe\xf0\xa4\x83\x83\x03\xc5]i\x9a\x06\t\x83\x18\x00s\x19\x15\x80\x95\xc7E\xb8\xe1\xa2\x006\x83\x0e\x9f\x00\xb1\x98\xe0\xdb\x7f\xf4\xf3\x97\x17\xe4\xbd/)\x8c\xd5\x94\xe5\xa4y\x11>tQ\x90\x95\xf3\x92XKL\xfe\xe9\x1e\x10\xfc\xe8\xcf^\xfe\xf8\xac\x87p\xbc\xaew\xfde\xa3T\x05\xa0\xd4\x9d~\xc9K\x85\x00.[\x13\xa7\xc1\xab\xf7W>\xf0\xa2\x95\xc3\x83\xd2\xf7\x7f,\xb0tz\x9c\x0f\\\xa4\xcf\xd9%\x0bw=\xe54\x0cZ3\xb4\x00\xd4y\x0c\x00\xc0\xcb{l\xc0H!n2\xc3\x9a\xb9\x83\xac\xdf\xd4X\xf0}fU\xe3\xc6\x0b{\x98?Co&\xd8q\x00\xeex\xbaa\xd4\x9d\x8e\xa6A4a\x02Fj\x01\xd62\xc5\x00L\xf3%\xf9\xde\xfb\xbb\xf1\x15(l\x98\xcd\xc0\xe7\xff\xaf\x81\xbb7\xba\xcb\xde\xe6[25P\x04\\\xb0|\x90\xb7\xaf\x0b\xb3nYj\xcc9l[\xf7[\xf9\xd3\xd4\x11\xfee\xb9I&\xcd\x02`5k\xbc\xed\xf4\x80nq\xe9\x0f\xc2\x1f\x9e\x96\xdd\xfe\x8e\x05\xdc\xb6\x0c\x9f{[/\xd3\x9a\xf4\xcfm\xd8jfG\xa7q\xfa\xa7\xd9\xe0\xfeM\xd6y\x0c\x00\xc0\xd6CNb\xd1^]\x00\xd3\xf2\xd9\xb0~S\xe1\xf7]{V\x1f\xd7\x9c\xa5w\xa1d\xb2\xf0\xbd{\x1aK\xaa#\xa0i\x82X\xd2L\xbe\x02P\x0e\x17\x80\xcf\x99\xe1;\xd7\xf52\xa3\xd5\xf8\xf9t\x1a\xbe\xf6{\x0fwo\xf4\xc8\x98\x1f\x89\x0e\x93\xa2q\xee\xb2 \x1f\xbex\x90\x85\xb3G/\xdd[\x08\xb3\x9a\xc5\xa4N\x89\tV\xff\xcd\x80\xd6\x1eo\xec\xaf|q\xbb\x95\xe7wM\xac\x05\xaa\xa4\xf6\x11\x02\xdey\xc6 +\xe7\xe9\xed\xce\xc9$\xfcl\xbd\xb7`\xb9\xd7\x94\x81?|\xb4\x02\x1f\xf5@*\r;:\x05\xcb\xe6\x8c\\\xa4\x96\xcc\x8a\xe1\xb0d\x0c\xbb`\x1e?-\xc1\x87.\tc30\x83\xbe\xb2\xcb\xc4\x03\x9bK\xeb%\x90K\x03\xd4+\n\x16\xd3\xc4\xae\xad\xcb\x96\xe1\xd3W\xf4p\xd2b\xe3\xa0\xbf\xff\xcf\xde}\xc7\xb9U\x9d\xf9\xe3\xff\xdc\xab\xae\xd1\x14M\xf5\xb8\xdb\x18c\x1b06\xc6\xe0\x84bz\t\t\x04\x08\x844B\x96M\xd9\xd4]\x96%e\xd3\x7f\x9b\x90\x84\xf0%$\xbbIH\x02\xa4AB\xaf!\xf4\xd0llL\xc0\xbd\xe0n\x8f=\xbd\xa8\x97[\xce\xef\x0f\xcd\xd8\x1a\xe9J#i\xee\x8cFs?\xef\xd7KV\x9d\xab;c\xe9\x9e\xe7\x9e\xf3\x9c\xe7\xa8*\xf0\xd0kN\xdc\xf7\xba\x9f\x8d?e\x99\xdd\x94\xc4M\x97\xf5\xe1\xdce1\xc3\xd9?FB\x91\xd41\xa2>#\xed\xc5n\xd3`\x93\xb3{\x9c+\x89\x18>Ua\xd4G\xbd\xb2d\xd99l\x02\xe7/If\xed\xbe\xd0\x81G\xd7\xf8\x0c\x0fD4\xb94U\xab\xb8\xe1\x82 \x1c\x06!\xe8\xfa]6\xbc\xbe=w/\x90\xd1t5\x87\xad\xf2\x83\x80\xa4*a\xeb\x81\xec^\x8fy\xad\n\xbc\xae\xec\xd6\xd1\xe3\xd4\xf1\x1f\x97\xf5\xa0\xb6:\xfb\xb9D\x12\xb8\xf7\xe5\xea\x82\x8b#\t!\x19~\xef\xe4Q\xfc]%\x00\x1f;\xab\x17\x97\xbd7f<\x8c \x807\xb68q\xc7S\xcdP4~\xe7i\xb8\xa9\xfe\x04~\xf0\xd1n\xbcoEa\x8d\x7f"!a\xcd\x16;n\xbe\xab\x01\xab\xb6d\x8f\x13\xdam\x1ad\xa9\xb2\x03\x80\x11\x14\xfdM5\xab\x07\xa0\xa87\xf6Wi8oq\xf6B%\xdb\x0fHX\xbd\x83\xd9\xbf\x93\x9d\xcb\xa1\xe3\xa6\x0fv\xa1\xd1`\x8e{w\xbf\x84\x9f>\xd6\x90w\xe1\xa7\x98\xc1\xc9\xa4\xd3>\xc6\x05+\xc6\x81.$l\xde\xe7\xc0\xd5bx\xb7\xfb\xd4\xc6T\xd5\xbc\x9e\xd0\xd1\xaf\xabM\x16\xf8\xe4\xca>\\\xb8\xdcx.\xfd\xb3\xeb\\x|]m\xc1\xef-\x00$T\x83\xbf\xa0\x9cJB,\xc5\x893c\xf8\xd2\x07\xa2\xf0\xe4H\xd2\xda\xb4\xcb\x81\x9b\xff\xd8\x82\xce\xc0\x84\xa8GF\x13\xcc\xbf\x7f\xa0\x0f\xef1X\xce:\x93\xd0\x81W7:\xf1\x7fO\xd7a\xfd>/t!a\xe5\xe28\x80\xe1g\n\x0e[j)q:\xaa\x94\xe5\x80\x0by,\xaf\xe5\xf3\xc2h28\xf8?\xba\xba\x1a\x03Q\x1e\x0c&3\x97]\xe0\xcb\x97\xf4\xe0\xca3\x0cZq\x01\xdc\xf5l\r\xfe\xb97\xff\x10P\xd4\xe0\x98\xe0\xb0\xa3\xf2#\x00\x00\xebv\xb9\xa0i\x80\x9c\xf65\x90d\xe0\xbc\x13\x07\xb0\xf9\xe0\x94#\x8f]z\xf2\x00>\xff\x81\x90\xe16^\xdf\xe8\xc0\x0f\x1fn*j\xf5\xccT! \xe3\xd7\xd7yU\x00\xc5%\xe5\xfa\\:n\xb9\xae\x13^\x8fq\xbf\xfe\xc1.\t_\xf8m\x03\x1b\x7f\xca\xe9\xd4cs\xd7\x8a\x00\x00U\x01Vmu\xe1w\xcf\xd5b\xcdN\xef\x91\x84aI\x82\xe1p\x99\x9d\x01@\x163\xd7\x02(\xe8h#K\xc0\x05\'e/\xe6\xa2\xeb\xc0\x0b\x9b\x98\xfc7\xd9]\xb7r\x00\xd7_\x185\xec\x12\xde\xb8\xdb\x86\x87\xd6\xd4\x8c\x98\xcc\x173\n\x00l\x93\xa2\xfd\xc7\xae\xce*\x04\r\x965^<G\x1cY\x94g^K\x027_\x19\x84\xcf\xa0\xb3,\x10\x02~\xf8P\x13\xba\x82\xc5\xaf`&r\xd4\x1ap\xda\x8b\x1b\x9c\xb7\xc9\x02\x9f<\xa7\x0f\x0bg\x19\xff\\\x7fP\xc2w\xeem@[\x1f\xd7\xf8\xa0\xdc\x06\xb2;\x89\x87\xb1\xd9\x81V\xbf\x82\xe9\r\t4U\xa7\xadW)\x80h"\xfb\x00c\x93\xcd\xafj9\x01\x8c\xea\xb07\xee\x7f\x8e)uq,\x98\x99=\x88\xdb\xd9\x8b\x11\xe7*\x93y$)5\x86\\\xe5\x1a\xbf\xcc\xd8%\xb3#\xf8\xec\xa5\x01x\x0c\xe6\x81k\x1ap\xf7\x0b>\xf4\x87G>#4*X3\x19r\x00\x00@\x17\xc0\xae\xf6\xec_dz\xb3\x82\xd6\xba\x04l\xb2\xc0\x17/\xedEkSv\xb7|\xaa\x80V\x15\xdem/\xed{\xa4\xe7\xe8\xe9\xb7\x17\x9985\xb3Q\xc1u\xe7\x86\x0c\x0fMJ\x12\xb8\xeb\x99Z\xbc\xb2\xb5\xb0\xe4D\xb2\xaeW6W\xe5-\x80%I\xc0\xfc\x99:~\xf0\xc9\x00~\xf9o\x1d\xb8\xee\xec\x1e\xb4\xd6%a\xb3\t\xc4\x93\xd9\x1f>\xbb\r\xb0M\x82c\x84\x81\x92\xab\xf1\x8e\xa6\xff\xad\xa47<n\xaa\x8a\xa9\r\xd9\xff\xab\xafouC\x1b\xa1\xda\x19\x99\xc3.\x0b|\xf0\xd4\x00n\xb8\xa0\x1f\xb5U\xc0\xaamN\xdc\xf1d#\xda\xc6p9\xdd\xd6\xba$\xee\xf8tWVf.\x90\xea~\xbe\xef%\x0f\x9e\xfa\xa7\xbf\xa0\xb9\xfc\x99\xa5\x81\x01\xc0\xeb\x9a\x1c\x01\x00\x00\xbc\xb1\xbd\x06\xa7-\x1c\x18\xf6\rk\xad\xd3pl\xab\x82\xf7\xce\x8f\xe3\xfd+\x8c+\xe9\xad\xdd\xea\xc4/\x9fi*y\x1e\xbd6\xb4\xa0R\xc6\x8f\xdbl\x85\x07\x00\x1e\xa7\x8e\x9b.\xef1\x1c\xe2\x03\x80\x87W\xb9\xf0\xfb\x97G\xee\xe5!\xfa\xcd\xf3\r\x98?5\x81\x8b\x96+y[\x1b\xd9\x06,\x99\xa7b\xc9\xbc\x10n\xba2\x84\x977\xba\r_n\x9f\x9c=\x00\xa32\xda\x01\xb8\xa2\x8f4\xc7NU\xe0\xcb\xe8\xf9\xd3t`\xddN\x0f\x0b\x80\x8c\x93\x15\xc7F\xf0\xf5k\xfa\xe1\x1fl\x8c\xaf<#\t]\xef\xc3W\xff\xd4:&\xef7\xd5\xaf\xe0\xd6\xebr\xcf\x03_\xff\xae\x03\xb7>\xde\\\xf0\xff\x7f8\x9e\x1d\xa88]@\x95K\x9f\x14\xe5\xa37\xef\xb7!\x96\xc4\xb0\xe49\x9f\x178wq\x0c\x17-3\x1e>i\xeb\x92\xf1\xbd\xfb\xfd\xa3Z9S\xd5\x0c\xdb\x7f8\x8a\x08\x00\xde\xbf,\x80\x95\'\x19\x8f\xdd\xb6uI\xf8\xd9\x93\xcd\x86\xe3\xb3D\x99"\t\x19\xdf\xb8\xb7\x05\xbb\xda\x03\xb8\xe1\xe2\x90\xe1T\xd7LU^\xe0\xd2\x15q\xc3\xde\xacI:\x040*\xe3\xfe\xe7X:\'\x9cu\x84Q\x14\t[\x0e\x14?fI\xa5\x99\xdb\xaa\xc3\x9f\xd6\x03+I\xc0\x8a\xe3\x92cr\x06=\xb3!\x89\xef_\xdb\x83\x159\xd6|?\xd8%\xe1\xd6\xc7j\x11\x8e\x17\xfeQ\x0c\xc5\r>+\x120\xbd>\xbb\x18N%\xda\xd2\xe6F0\xb3\x04\xb2\x04\\yF\x04\x8du\xd9\xa7\xce\xf18\xf0\xab\xbf\xd5\xe1\xdd\xf6\xd1\xcd\xa0Qs\xb4\xf3\x85\xce\x9dv\xdau|\xf2\xdc\x10\xbc\xee\xec\xe74\r\xf8\xcd\xdf\xab\xd1\x1db\xd2\x1f\x15\xae?\xe2\xc0\xff\xfe\xbd\x01\xb7<P\x83\xbe\x80\\p\xcf\x91QCo\x9b\xbcC\x00%\x1b\xf7\x00`\xe1\x8c\xec\x83I\xcf\x80\x84\xed\xed,\xfe3^\xdcN=+\x08k\xf0\x0b\xccl\x88\x9a\xfa>\xadu\t\xfc\xec\x86N\x9c{r\xdc0\xb8\x88\xc5\x81\x1f=P\x8f5;\x8b\x1b\x0f\xee\t\xd9\xa1\x1b\xd4\xado\xf5g\'\x97V\xa2\xce\x80\x13\xbb\xdb\xb2\xff`\xb9\xa6\xd3\xfd\xe5\x157\x1e[7\xfa\x04Z5\xc7\x10\x9cM.lln\xe5\xc2\x90a9b\x00\xf8\xe7\x0e;\xfe\xbaz\xe4\x92\xc4D\x99\x12\xaa\x84?\xbd\xd2\x80\x8f\xdd\xd6\x82G^\xf3 \x14)\xad\xeag\x9d\x0f\xb8\xf6\x8c f4\xc4 K\x15\xffA4%\x94\x19\xd7\x00\xc0\xe7\xd2Q_\x97\xfd\xf8\x9b\xef\xdax`\x18G\x87z\xecP2\x12\xe9\\\x0e\x81\xe5\xc7\x8c<\xe7\xb6P3\x1ab\xb8\xe7\xcb\x87\xb1d\xbej\xf8Q\xd5u\xe0\xc7\x0f\xd4\xe0\xb9\x8d\xc5\'\x83)j\xaadt\xa6)\x06\x9f\xadJ\xf5\xf7\xb7=\x05-n\xb0i\x97\x03\xb7=\xde\x82\x98\t\xdd\xeaF\x15\x16\x81T\x01\x95\x91\xd8e\x81\x7f\xb9\xd0\xb8\xb0Sw\xbf\x8c\xef\xfc\xa5\xa9\xe0\xa2DDFv\x1cv\xe3\xbf\xfe8\x05\x97\xffO3~\xf3t5:zR5\x00\n\xe5v\x01\xd7]\x18\xc1\xb3\xdf\xeb\xc0\xb7\xae\xee\xc0\x9c\xa6h\xa5\xce\x1c2m\xb7\xc75\x00\x98\xdb\x1c\x86=s<Q\x00\x1b\xf7\xe7_\xaa\x94\xcc\xd55\x00\x042N\xf6m2p\xc5{\x03\xb0\xcb\xa3\x8f\xc4\x16\xcf\x0c\xe3\xb7_\xec\xc4\xfc\x99\xc6\xcf\'\x15\xe0\x97O\xbaq\xef\xeb\xf5%\x8dYk:\xd0i\xb0~Ps\xe1uo&\xbc\xf5\xfb|\xe85\xf8\x1d\xd3u\xf7K\xf8\xea\x1f\xfd\x05\xd5\xfa/\x84\x9acIe{\x01\x9b_:;\x8a\xe5\xc7ew\xcb\xe8\x1ap\xe7\xdf\xbd\xd8\xd1n0.@T\x82}\xddU\xf8\xc9c\x8d\xb8\xf0\xbb\xb3p\xfd\xff\xf3\xe3\xa1W\xbd\xe8\x1b\xe1\xbb\x92\xce\xed\x06\xae\xbb \x8eG\xff\xbb\x0bw}\xe1\x00\xde;?4\x19z\x04J2\xae\x01@s\x9d\x9eU\x88!\xa9\x00=\x01ff\x8c\xa7\x1d\xedn\xec\xef\xcc\x9e*v\xca|\x1ds[\xf2\x17\xdf\xc8\xc7&\x0b\x9cwB\x18?\xbe\xbe\x17\xf3g\x18\x7f\xa1\x92\np\xff+N\xdc\xf9\\S\xc9\tk\x9a\x0et\x0ed\x9fj\xb64\xe8E\xcfY\x9f\xa8:\x07l\xd8\xdd\x91;/&\x91\x00\xeez\xb6\x16\xdb\x0f\x9b7t\xa6\x0e\xcd\x02\xc80R\xf1\x14I\x02\xce>\xc1\xb8\xdc\xef\x9ev\t/mb\x80O\xe6\x12\x02\x08\xc7e\xbc\xb6\xbd\x0e\xdf\xba\xaf\x19\x9f\xba\xa3\x15\x7fz\xde\x81\x03\x9d6(\x06\xa5\xc23I\x12P\xe3\x138{\xa9\x86\x9f\x7f\xae\x077]\xd6\x83\xe6\x1ae\xd2\xcc$*\xd4\xb8\xb6\xbcu\xde\xec\xe4\x8cH\x1c\xe8\x1f\xa1\xe0\x03\x99+\x18\xb3\xe3\xd9\xb7\xb3\x1b\x17\x87\x03\xf8\xc8\x99\xc1\x92\xea\x02\xd8m\x02\x9f8\xb3\x17?\xfbL\x0f\x8e\x9bi\xdc/\xa7\xeb\xc0\xef\x9eq\xe3\'\x8f\xb6 \x92(=\x19L\xd5e\x1c\xe8\xc9Nx\x9b\xdd\x1cCc\xb5y\xc3\x18\xe5\xd4\x1bv`\xd7!\xe3A\x7f!\x80\xa7\xd6\xbap\xefk\xe66\xac\xb9s\x00\xf2\xff\\\xadG\xc5Y\'\x1a\x7f\x89\x9fZ\xeb\xc3\xfe\x9e\xb1\x9b^J\x94P%l:\xe0\xc6w\xee\x9f\x8e+\x7f8\x15_\xbb\xbb\x1e\x9b\xf7H\x05\xaf\x0f^_\x03|\xee\x03a\xdc\xf3\xe5v|\xe8\xb4\xbe\xc9\xb2b`A\xcc\n\x00\n\x8a\x9b\xdc\xce\xec\x17&\x14 Z\xfaI\'\x95\xe8\xc9\xb7\xea\xd1;\x90\xfd\xf8\x87\xcf\x8a\xe0\x94\xb9\xc6%fs\xa9\xf7i\xb8\xe5c\x1d\xf8\xf6\'B\xa8\xf2\x1a\x7fyt\x1d\xf8\xf5S.\xdc\xfe\xe4\x94Q5\xfe@\xaa\x01l\xeb\x92\xb2\xf2F\xa6\xd5\x0b\xd4\xfb&\xc7\x97\xf7\x83\xcb\xfb\xf0\xbeS\xc3\x86\xcfm\xdc\xed\xc0\xff<\xd4bX\x0fa4r\xe7\x00\xe4\xff\xb9c[\xe3X4+;\xe8\x1b\x08\x02\xf7\xbd\xeeg~\x0f\x8d\x9b\xbe\x88\x1d\x8f\xae\xab\xc5C\xaf\xd7\x15\xda\xfe\x1f\xb1p\xb6\x86\x1f\xdd\x10\xc0\x1f\xbet\x18\x0b\xa7\xc5*5?\xa0(\xe3\xda\x03\xe0rd\x17kQ4\xe3\xcan4\xb6zC6<\xf6\x86/\xeb\xe0\xecv\x03_\xbb*\x88\xd6\xba\x02\xfa\xd1\x00\x9c\x7fb\x00\xf7\xddx\x18W\x9e\x99{\n\x9e\xa2\x00\xbf}\xda\x8d\xdb\x9fj\x1d\xd5<\xf5t[\x0f\xda\xa0e\xb49u\xd5\xc0\xf4\xc6\xc2\xf6{"\xfb\xe0\xf2\x1e|\xe7c\x01\xd4\xe5\xc8\x8fL\xaa"\xebw7C\xae\x1c\x80\x91z\x00\xce9!\x0c)\xe35B\x00\x8f\xac\xf6\xa1/\xcc9\xff4\xfe\\\x8e\xec\x93M\xa1c\xc4^\x01I\x02\xdesB\x12\xf7\xdd\xd4\x89\x7f9\xa7\x1f>\xb7\xc1t\xa3\x89cB,\x07,e\\\xe7~3)\xfbE\x9a\x8e19\x98Q~\xaa.\xe1\x81U5\x88\xc5\xb2\xff\xdb\x16\xceVp\xcd\xe9\xf9\xb3j<N\r\x1f~\xcf\x00~p]?\xe6\xcfTs\x8e\x9dE\xa3\x12\xeey\xce\x8d\xff{\xa6\xf41\x7f#[\xda|P3V\xaf\x93d\xe0\x8c\x05\xc5\xf5^L4\x8b\xa6E\xf1\xb5\x0f\x85Q\x93gh\xff\x84Y*\x9aj\xcc?0\xe5:S\xcf\x17\x00\xc8\x12\xb0`z\xf6\x0f\xea\x02X\xb5\xcd\x01\x9dg\xffT\x066\x83\xc5\xc1\x0ev\x01\xbf}\xda\x85\x03\x1dr\xce\xb2\xd7Cj\xab\x05n\xbcj\x00\xdf\xbc\xba\x0b5\x9e\xc9\xdb@\x99\xda\x03 D\xfeRn\xf1$\xb2\x0e\x08N;\nZ\xeb\x99\xcc\xb7\xbb\xcb\x89\xa7\xd7eO7s\xd8\x81O\x9c\x1b\xc6\xac\xc6\xecy\xf5\x92$0\x7fJ\x02\xff\xf3\xd1v\xfc\xe0\xfa~4\xf9s\x1f\xe1\x07B\xc0W\xefi\xc4mOLA8nn\x01\x98P\xdc\x86\x8e\xde\xec\xc7O\x99\xa7\x1dY4\xa7\xd2L\xf5+\xf8\xd9\r\xbdhn\xc8\xbf\xff\x1eOj5@\xb3\xe5j\xac\xf3\x05\x00\xaduqLm\xca\xeeuI$$\xac\xdb\xcd\xe4?*\x0f\x8f+\xfb\xc3\xdc\x1f\x01\xeey\xa9\x1e\x1f\xbe\xb5\x05\xbf~\xca\x8b@({\x18q\xd86\xdc\xc0\xd5g%\xf0\xeb\xcfu`F\xc3\xe4\x1c\xa7\x1e\xd7!\x80p"\xfb,\xc3\xe5\x00\xaa\x98#T\x16\xba.\xe1w/\xd4\xa2?\x98\xfd1\xa8\xaf\x15\xb8\xf9\x83\x03\xc3\x1aS\x8fC\xc7\xbf_\xda\x85G\xbeq\x18W\x9c\xa1@\xce\xd3\xbb\xbb\xfb\x10\xf0\xd1[\xa7\xe0o\xef\xf8\x8aZ\x96\xb6\x18\x9b\xf6g\'2\xb64jX4\xad\xf2\xb2J\xe76\'\xf1\x7f\x9f\xe9\xc2\xbc\x99\x85\x9d\xd9_xr\x12\xf5>s\xc7\xceJ\t\x00\xea}*|\xee\xec\xe4\x81\x8e^\x14U\xdd\x91\xc8,\x92\x04\xd4y\xb3?\x93\xe1\xb8\x13q\xc5\x8e\xce\x80\x1b?}\xa2\x05\x17\x7f\xb7\x15\xb7\xde_\x83\x80q\xaa\xcd\x91m\xad8>\x81\xfbo>\x8cK\x96\x04\'\xddr\xc2\xa5\xfc:%\x1f\xcd\xc3\xb1\xec\x83\x8c\xc7\t\xd4\x8c\xae\x82)\x8d\xc2\xcev7~\xf7\x9c\x17\xaaA\xbbs\xd1\xa9q\xac\\\x18\x86\xdd&p\xea\xbc(\x1e\xbc\xf9 \xbepY\x14\xde<\xff_\x8a\n<\xbd\xc6\x83O\xdc>\r\xdb\x0f\x8f\xedr\xafk\xb6\xfb\x90\xcch\x03}n\x81e\xf3&\xf4\xb8]\x96\x93g\xc7\xf1\xbb/v`\xf1\xbc\xc2\x1b\xf4\xb9SU\x9c:\xcf\xdc\xb3\x92R\x86\x00\xaa\xdc\xc6=x}y\x0e\xaaDcI\x82\x80\xcf\x93\xfd]\n\xc5\xec\x88)G\xcfZ:\x03.\xdc\xf9b\x03\xae\xfaa+^x\xcbex\x0c\x1c2\xa5\x01\xb8\xed\xd3\xbd\xf8\xc9\xc7;Q_5y\x92\xd6\xc65\x9e\tD\xe5\xec\x00\xc0\r\xccn\xa9\xfc\xc4\xadJ%\x00<\xb2\xa6\x0e\xef\xec\xca>\x9b\x96e\xe0_/\x1a\xc0W/\xef\xc0\xcf?\xd3\x8dEs\xf4\xbc\x8bi$\x15\xe0\xaeg\xaa\xf0\xed\xbf4\xa1c`\xec\xc7u\xb6\xb6\xc9\xe8\x1c\x18\x1e\x8f\xdal\xc0\xca\xe3+#\x0f@\x92Rg\xfe?\xbe\xbe\x1b\xb3Z5\xc3<\nE\x056\xbc\x9b=f\xe9u\x03g\x9f`P\x0eq\x14J\xe9\x01\xb0\xc9\xa9<\x80L\x85\x14\x0f"\x1a\x0b\x92\x04T\xb9\xb2\x1b\xe9hBFR\x19\xfea\x15\x02\xd8\xd3\xe5\xc6\xcd\x7fl\xc6O\x1f\xaa\xc5\xe1n9g\xa2\xa0\xdb\x05\\~F\x14?\xfed\'\x9ak\xd4I1K`\\\xbf\xa6\xdb\x0fW!\x99Q\xb5L\x92\x80\x15\xf3\xcd=\x90Qq:\x03\x0e\xfc\xfcI?4\x83\x08x\xc5"\x157\xbc/\x8e\xe6\xfa\xfc\x890}\x01\t\xdf\xfdS\x1dn{\xa2\t}\x91\xf1\xc9\xfc\xder\xd0\x87\x9dm\xd9\xe3G\xcb\xe6k\x86]\x80\x13\x89$\x01\'\xce\x88\xe2\xce\xcfu\xe2\x98\xe9\xc6I\x94\xaa\x06\xdc\xf3\xac\x17\xdf\xba\xaf\t\xc1h\xf6\x0b\xce]\xa2\xa2\xdeg^oG)=\x00\xd1Dj*o\xa6\x06\x0e\xffS\x99H\x12\xd0\\\x9b\xfdaN\xc4sO\x02\x18\x88\xda\xf1\x9b\x17\xea\xf1\xc9\x9f5c\xd5&W\xce$AY\x06\xce;Y\xc5]_\xe8\xc0\xd29\x95_Ap\xb4\x01@QAP0f\xc3\xde\xf6\xec\xc7O\x9a+\xe0\xafb/@9\xad\xdd\xe9\xc5\xc3\xaf\xbb\x8a\x9e\xb3\xad(\xc0\xdf\xd7xp\xc5\x0f\xa7\xe0\xaf\xabG\xb7\x1cm\xb1T]\xc2s\xefd\xf74x=\x02\x97\x9e\\Dm\xd02\xf8\xc0\xc9\xbd\xb8\xebK]8&\xc7\x98\x7fR\x01\xfe\xfcB\x15~\xf4h\x0b6\xb7y\xf1\xce\xbb\xd9AU}\x8d\x8e\x0f\x9df^\xf0\\J\x0f@ *!\x9a\xc8\xfe?\xaf/~\x89\x07"S\xc8\x120\xbd!\xfb\xf1B\n\xce\xed\xee\xf4\xe0\x93\xbf\x98\x8a\x9f?\xe6E,\xcf\xdab\xc7\x1f\xa3\xe0\xf77\xf6\xe0\xe6\x0fvUt^@\xa9\xbb.\xa1\xc4\\\x80\xf5{\xb3\xb3\xc1k}\x02\x17-\xa9\xbc\xc4\xad\xc9D\x92\x80\xd5\xdb\xbc#N\x8fI\xd7\xdem\xc3\xd7\x7f_\x87\x9b\xff\xd4\x8c\x83\xbd\xe5\xa9\xf5\xbe\xfa\xdd\x1a\x842\xc6\x9be\t\xb8\xec\xb4\x10\\\xf6\x897}G\x96\x80\xf7/\xeb\xc3w?\x1eDC\x8e\x19\x14\xaa\n\xfc\xe9\x05\x1fn{\xa2\xf1\xc8c\x0f\xbfQ\x975F)\xcb\xc0%\xcbCp;\xcc\xf9=\x85@\xd1\xa5\x80\x07".D\x12\x06U%]@s\xcd\xe4\x19+\xa5\xca\xe1\xb4\x0b\xd4\x1b\xf4@\xed\xef*\xec\xe7u\x01\xfc\xea\xd9&|\xe5\xce&l\xd9\x9b\xbb7\xd3\xe7\x01>uQ\x14\xdf\xbc\xaa\x1b>\xd7\xc4;\xd6\x14b\xdcc\x97\r{k\xb2j5\xdbl\xc0\xe5\xa7\x85-U\x82q\xa2p\xd8\x04\x16N\x8b\xe3\xbf\xaf\xea\xc6w>\xda\x0f[\x01\xbd\xf7\x9a\x06\xbc\xb3\xd3\x86\xcf\xff\xba\x19\x8f\xbe\xe9G$Q\xbe\x10\xb87d\xc3\x9b\xeff\x0f\x03,\x997\xbau\r\xc6\x82\xd3.p\xd9)A\xfc\x7f\x9f\xc8]\xe4G\x08\xe0\xe9\xb5\x1e\xfc\xfco\r\xc3\xfe\xae\x9b\x0f:\xb0\xa7=;\xe6>~\x96\x8e9\xcd\xe6\xfc\x9e\xb9z\x00\xf2\xe5}\x04bvD\r\xb2\xfdm\xb2\xc0\xf2c\x98\tH\xe3o\x9a?\x0e\xd9`\xd6\xf1\xae\x8e\xc2\x93\x92\x15M\xc6\x0b\x9b}\xf8\xf7\xdf5a\xcdfg\xce\x13#\x87\x1d\xf8\xc4\xf9a|\xe5\xd2\x1e\xd4\xfb*\xaf\x17{\xdc\x8f\xdco\xedvb\x7fW\xf6\xff\xcei\x0b\x14,\x9ei\xeez\xf4\x94\x9bM\x16Xql\x18\xbf\xfcL;\x1e\xfff;\xae\xbb0\x02\x7f\x01\xab\xe9\x05\xc3\xc0w\xff\xec\xc7u?\x9b\x86\r\xfb\xdde/\xf3\x1aK\xcaxbmv\x00\xe0p\x00\xd7\x9d\x13\x9c0\xbd\x00\r\xd5\t|\xeb\xaa.\xdczC/j}\xc6\xaf\x11\x02xn\x9d\x1b_\xffs\x0bB\x19\x8d\xea\xc1\x1e7^x;\xbb:\x90\xdd\x01|\xe4\xcc\x10\x1c&\x04\xcf\xa5\xe4\x00h:p\xa0\xd3\xf8g.^\x167euI\xa2b\x1c3%\xbb\xef>\x99\x00vw\x16?\xddlw\xa7\x07\x9f\xfa\xdf\xa9\xf8\xcbK\xc63\xa5\x00@\xb6\x017\\\x12\xc1\xaf>w\x18\xb3\x9brWD\x9d\x88\xc6u-\x00\x008\xd8\xeb\xc2\xcb\x1b\x0c\xc23\x19\xf8\xe6\xd5\x03h\xac\x9e\xd8\xc9[\x95\xae\xca\xa5\xe3\xda\xd3\x07\xf0\xd7\xffl\xc3\x1f\xff\xb3\x1b\xe7-K\xc0\x9e{\xd1\xb9,>\x0f0\xab1\x91\xbd\xacs\x19=\xbf\xd1\x8f\xae\x9e\xec\xc7\xdf\x7fZ\x14g\x1f_\xfe\x04\xd3E\xd3\xe3\xb8\xf7\xc6\x0e|\xf4\xfch\xaaB\x99\x81D\x12\xb8\xf7E/\xber\xf7\x14\xc4\x94\xec\xaf\x93\x00p\xdf\xebu\x88\x18\xc4\xc8\x97\x9e\x1a\xc1\x92\xd9y\x06,\x0b\xa4\x8b\xd2J\x01?\xb9\xcek\xf8\x83+OL\xa0\xb6j\xe2|N\xc8\x1af7e?v\xa0;\xf7Z\x17#I\xa8\x12\xbes\x7f3\xbe\xf1\xfb\x1at\xf4\xe4h\xea$`\xf9\x02\x1d\x7f\xbe\xb1\x03\'\xcf\xa9\x9cu\x04\xcc\xec\x01(\xf8w\xbe\x7fU=\x02\x063\xb5N:6\x89\xaf_\xd9\x8dj\x83\xc2"T:Y\x02\xa6\xd5\'q\xc5\xa9\x03x\xe0\xbf\xda\xf0\xbdO\xf4c\xd9q*\xec%\x14\xe7\x93m\xc0\xf5\x17E\xf1\xa3Ot\xa0\xaejb\xcc\xb7O\xa82\x1e][\x9du\x06[\xe5\x01\xbexi\x10\xd5\x9e\xf2\xec\xa7\xd3.p\xc9\x92 \xee\xf9r\'\xe6\xcf\xd0s\x96K\x0e\xc7\x80\xdb\x1e\xf6\xe1\x87\x0f7!\xa9\xe6\xfe\x1au\x05\xedxiCv\xae\x85\xbf\x06\xf8\x97\xf3\xfaG]\x011W7\xe7H\x01\xc0\xf6\xc3U8l\x10\x80\xf9\xaa\x80+N\x1d\xfd~\x11\x15\xa3:\xe3D_\x08\xe0\xe5\x8d\xd5H(\xa57w\xba\x90\xf0\xc8\x9b\xf5\xf8\xec\xffM\xc1\xae\xb6\xdc\x07\xce\xa9M\x02\xbf\xfe|\x17V.\x8aT\xc4\x90v\xbe\x11\xdf\xf4\x1a\xff\xe9\x17\xd9\xe0b\x03`\xab\xad\xad].\xcb\xf2{Gz\xd3HB\xc6\xec\xc6$\x16\xcd\x1e~`\x96$`N\xab\n5\x99\xc4[\xbb}E\xaf\xe6D\xc39l\x02\xb3\x9a\x12\xf8\xcc\x05\xfd\xf8\xfc\xfb\x06\xf0\x91\xb3\xa3h\xae\x17\x05e\xad\n\x01\xc4\xe2\x12\xec\xf6\xec\x05\x9cd\x19\x98\xdb\xaac\x9a?\x817vxG\xf5\xc52KoP\xc6\x15\xef\x89\xc0\x99\xd1\x9b\xe1\xf7\t\xf4\rHX\xbfol\x8b\x12e\x9aR\xab\xe0\xb3\x17\xf6\xe3\xc6+\x07\xe07\x98\x924DQ\x80\xdb\x1e\xf6\xe2\x8f\xaf4"\xa9\xe6\xff;\xeaB\x82\xae\xa9\xb8\xe4\x94x\xd6\xb8|S\xad\x8e\xd5[\\\xe8\x0c\x14\xd1\x9d\x93a\x9a?\x86+OOdm{\xdb~;\x9e\xdf\x98;\xad_\xd3\x81\xa5s\x12\x987-;\xd0\x9a\xd5\xa4a\xcdv7zB\xe6\x96\x82&\xcae^K\x1cg\x9ft4/F\xd5\x80[\x1e\xf0\xa3}\xc0\xf8\xbb!\x01p;t\xd4V\xe98~z\x04+\x17\x05\xb1`j\x14\x90$\x0cD\xec\xd0\x07+\xdc\x0b!\xa1+h\xc7\xbaw\xddXvL\x04\r5\xc20\xa8\xf7z\x04V\xcc\x8f\xa1?\xa8b\xc7a\x0fF\xa8\x90_\x14]\xd7W\x07\x83\xc1u\x00\xf4\x8c\x8b\xc8\xb8\x14\xa4,\x01\x80\xa6K\xd8\xd3i\xc35\xa7\x87\xb3\xceB\xed\xb6T=\xf7PX\xc1\xc6\x03^\x88\x8a\xe9L\x998j\xbd\n\xde\xb74\x84\x1b/\xef\xc37>\x1c\xc0\xa9\x0b\x93h\xf6\x8b\xbc\xc9\\\xe9\xbaz\x81?\xbeP\x85o\xfc\xa9\x01\xc7\xb5(\x98\xd1\xace\xf5\xefH\x12p\xdc\x0c\r\'\xcf\x8ab\xddN\x0f\x02\xd1\xf2\xae\xfa\xd6\x13\xb2c\xba?\x81\x13g+\xc3\xf6\xd5f\x03\x96\xceM\xe0\xc5\xf5n\xf4\x85Ko\x1c\x0b%I\xc0\x85\x8bC\xf8\xf9g;q\xde\xc9\t\xb8\xf2\xd4C\n\x86$|\xeb\x8f~\xfcuuc\xc1\xd3\'\xf7vyp\xd9\xb2\x00\xfc\x19Y\xcen\'\xe0\xb5kxf}\xe9\xf3\xef\xa6\xfac\xb8\xea\x8c\xec\x00`\xc7\x01;\x9e\xdb\x90/\x00\x90\xe0s%q\xfe\xd2\xecd\xc4Z\x9f\xc0\xb1-q<\xfd\xcf\xea1+\tM\x94n\x7f\xb7\x13\xe7,\n\xa0\xa1.u"\xf3\xd2\xdbn\xfc\xee\xc5\xfa\xac\xd7U\xb9t,\x9b\x1b\xc6\xb5gDp\xd3\x15\x9d\xf8\xdaU\x01|\xf8\xec(\xce[\x9a\xc4\x05\xcb\x92\xf8\xd0\xe9\x11,jM\xe0\xf9\rU\xc3\xbe\x9f=!;\x9e\x7f\xc7\x83\xb9\xcdQ\xccm\x11\x86}\xdf>\xaf\xc0\xca\x13\x93\xa8r$\xb0z\x87y\'\xb3\x93"\x00\x00\x80\x81\xa8\x03\xaa\xa2\xe3\xb4\x05\x89\xac3R\x9b\r8\xf3\xc4$\xa6\xd4&\xf0\xce\x1e\x0fb\xc9\xf2\x9faNtn\x87\x8e\x15\xc7\x06\xf1\xf9K\x06\xf0?\x1f\xef\xc7\xfbW\xc40w\xaaVPV?\x90\xfa\xa2\xec\xef\x00~\xf6h\r\xbeqo\x0b^\xd9Z\x8d@\xd4\x8eU\xdb\x9d8yN\x04\xad9\x16\xa8\x99\xd6\xa4\xe3\xf4\xe3"X\xbd\xcd\x8d\xfeHy\xcf\xf2\xf6w\xd9q\xe6\x82\x18\xfc5\xc3\xf7\xd5\xe5\x04\x16\xcfL\xe0\xd9\xb7\xab\x10\x1f\xc3\xde\x8ac\x9a\xa3\xf8\xda\x95=\xf8\xcf\x0f\x05sf\xf9\x0fy\xe9\x1d\x07n\xbc\xab\x05\xab\x8a<8\x08\x00\x89\x04\xb0\xf2\xc4x\xd6\xff\xed\xdcV\x15\xef\xect\xe2`oiU\x18[\xebb\xf8\x90A\x00\xf0\xeeA;\x9e\x1d!\xb0\xd8\xdd\xe1\xc6\xc5K\x02\x86\xd3\xaf\xa6\xd4\xebp\xdbT\xbc\xb6-\xcf\x12\x87D&\x89+2\x1eYS\x8bU\x9b%<\xf6\x86\x1b\xf7\xfc\xa3\x01\xaa&\xc1.\x0b\xcco\x8d\xe2\xc2\x93b\xf8\x8f\xcb\xba\xf0\xad\x0f\x0f\xe0\x9a\x95Q\x9c\xb6 \x81\xe6zd\xadmb\xb3\x01\xb3[Ut\xf6I\xd8t`\xf8\xd0[$a\xc7?6\xf9\xd0\x1f\x90\xf0\x9e\x05q\xc3uQl6`\xe9<\x15\xf3\x9a\x13X\xbd\xc3cJO\xe9D\x0c\x00lC\xd7\xc5\x04\x00\x00\xb0\xb5\xcd\x8d\xe3\xa7&0\xbb5\xbb\x12\x9a$\x01\x8bf\xaa8eN\x0c\xfb:e\x1c\xee\xe7\x92\x81\xe9d\th\xacN\xe2\xc4\x99I\xfc\xdbE\x9d\xb8\xf9\xcaT\xf4\xbat\x9e\n\xb7+\xbb\xdb>\x17]\x07v\x1f\x92\xf1\xe7\x17\xdd\xf8\xd6_Z\xb1f\xa7oXWt$a\xc7\xa6}.,\x9d\x13CS\x9d\xf1\xe7\xaa\xbeF`\xc9\xec(\x1e_[\ru\x1c\x0b\x01e\x1a\x88\xda\xa1k\n\xce<!\x99\xd5\x88\xb5\xf8u4V\xa9X\xb7\xcbmz\x10\xd0Z\xa7\xe0\x8b\x97\xf4\xe1\xeb\xd7\x0c`\xf9\x025\x7f\xb9\xe4$p\xef\x0b\x1e|\xf7\xfef\x1c*\xf13\xbd\xaf\xdb\x89s\x8f\x0fg\xad\xc4h\xb3\x01\xb3\x9bb\xf8\xdb[5%\x9dm\xb7\xd6\xc5\xf0\xa13\xb3\x03\x80]mv\xfc\xfd\x9d\xfc\x01\x80\xaaK\x88\xc6$\x9c\xbb${xB\x96\x81\xe3g+H\xc4ul\xd8on\x97(\x91\x11E\x93\xd0\xd6\xe7A(n\xc7\xdc\x94\x85\xb3\x81\x00\x00 \x00IDATf\x15\xd7\xbc\xb7\x1f\xff}u\x1f>ua\x18\x17-\x8ba\xeeT\x01\x97sp\x8ak\x9e\x8f\xa3,\x01\xc1\x88\xc0\xf3\x1b|Y\xbd\xd1IU\xc6\xc6\x03n\xf4\x05d\x9c:?\x965\xfc\x08\xa4\x8e\xc3\xc7NSq\xdc\x94\x04\xb6\x1d\xb4\x8f\xba\x17rR\x05\x00\xaa&a\xfb!\'\x96\xce\x8a\x19\x96\x9a\x95$`j\xa3\x86\xf7,\x88\x01\xba\x82\x9d\xedn\xa8\x9au{\x03d\t\xf0\xb8t,\x99\x1d\xc1u+\x03\xb8\xe1\xc2\x00>}q\x10\'\xcf\xd7\xe1\xaf\x11p\x16q\x02\xaej@g\x9f\x8c\xdf?\xef\xc1m\x8f\xd5\xe3\x99\xf5\xfe\x9c=-=!\x07\xf6\xb6;p\xde\xe2(\xdc\x06+7J\x12\xd0T\'\xb0q\xb7\x1d{\xbb\xca\xbb\xb4\xe3\x9eN7\x96\xcc\x8ccf\xcb\xf0D\xd2\xd4\x17Q\x81\xcb\xa6b\xcdN/\xf4Q\x06*\x92\x04T\xbbu\xac\\\x14\xc2\xf7?\xda\x87KN\x8d\xa3\xda\x9b?\xf0\nG\x81\xdf\xfc\xbd\x1a?{\xaa\t\xd1d\xe9C&\x8a&AUu\x9c}b\xf6\x99\xc7\x14\xbf\xc0\xf6\x836\xec\xec(\xbe0S\xbdO\xc1\xb5+cY\r\xf8\xf6\x03\xf6\x82\x86\x16\x0e\xf6:p\xc9\xd2PV\x0f\x0c\x90\x1a\xda[:/\x81}\x1d2\xf6t\xba\x18\x04\xd0\x98\x90e\x01\x8fS`\xc1\xb4\x08\xae;+\x80O\x9d\x1f\xc4g.\n\xe0\x9c\xa5I4\xfbu\xb8\x87\x1a\xfd"\xf4\x065<\xfef\x9d\xe1gV\x17\x126\x1fpCI\xea8aV\x12\x9e\x1c\xc7\xc79ST\x1c?#\x8a\xf5{\x9c\xe8\x1dE\x100\xa9\x02\x00\x00\xe8\r\xdb\xf1\xe6N;\xce?)\x92\x95\xbd9\xa4\xa6\nX\xb98\x89\x8b\x97\x04 t\x81\xfd\xddv$\x94\xf2\x8e9\x8f\xa7)\xb5q\x9cwb\x08\x1f9+\x8co]\xd3\x8d\x1b.\x8ab\xd9\xfc$\xa66\xeap\x14\xd9\xeb\xae*\xc0\xf3o;\xf1\xcb\'k\xf1\xfd\x07\x1a\xf1\xda\xb6j\xf4GF\xfe@\xb6\xf59\xf0\xce.\x17.\\\x1a1\x1c\xd7\x96%\xa0/\xe8\xc0\xab[\xcb\xbb\xb4cR\x95\xb0a\x9f\x1dW\xac\x08g\xed\xa7\xcd\x06\x9c4W\xc1\xec\x86\x04^\xdeRUroEsM\x02\x9f:7\x80o\x7f\xb8\x07\x9f<?\x8a\x96\x86\xdc\x19\xfeC6\xedr\xe0\xeb\x7f\xa8\xc3Ck\xeaM)\x97\xdc\xd6\xe7\xc0\xc2iq\xcci\xcd\x0et\x16\xcfJ\xe0\x9d\xdd.t\xe4Hz\xca%\x9et\xe0\xd3\x17\x05\xb3\x86\x16^\xddd\xc7\xeb\xdbG\x0e\x00\x92\xaa\x8c@D\xc2\x19\x8b\x8c\xcf\x86\x9c\x0e`\xe5\t18$\r\x1b\xf6\xbb\xa12\'\x80L \x01\x98\xd7\x12\xc5%KC\xf8\xc8\x99a|\xf5\xcan|\xee\xd2(\x96/Hbf\xb3fx\xd2R\x8cW6V\xe1\x1f\x9bs\x14\xef@\xaa\xb5}{\x8f\x17\x9b\xf6\xcaX1?\x86\x1a\xa3\x91.\thm\x108wq\x04o\xeep\xa1+XZ\x100\xe9\x02\x00\x00\xe8\x8f8\xf1\xeaf\x17N?.\x92\x95\xdc\x94\xce_\x93\x9a[|\xc5i!x\x9d\x1aBQ \x10=\x9a\xa59\x19\xd8e\x81\xc53\xc3Xy|\x1c\xd7\x9e\xd1\x8fo|\xa8\x17_\xf9`\x18\x97,\x8fc\xc91I\xd4\xf8P|\x11f\x1d\xd8\xdf!\xe1\xaf\xafT\xe3\xab\x7f\xa8\xc7_W\xf9\xb1\xfd\xb0\x1bJ\x91\xbd)\x87\xfa\x1dxg\x97\x13\xcb\xe6\xc6\xe0\xaf\xce\xf8\x8c\t\xe0\xe5\rn\xac\xdd9\xbe\xd9\xf6F\x06"\x0e\x0c\x04\x05V\x9e\x98\xdd\x9d-\xcb\xc0\xfc\x19*N\x9d\x13\xc3\xd6\x836\xf4E\x1c\x05\x153j\xadK\xe0\xecE\x11\xfc\xdb\xc5}\xf8\xde\xc7\x028kq\x02\r\xb5\xc6\t@\xe9\x02!\xe0\x17\x8fU\xe3\xbf\xff\xd2\x8c\xbd\xdd\xe6\xfdm\x12\x8a\x8c]\x87e\\vZ4\xab\xb1\xad\xa9\x128u^\x0c\xaflr#\x10-<BL\xaa\x12\x16\xcf\x88bn\xeb\xd1\xa4\xcf`\x18\xf8\xe1\x83M\xe8.0\x8b\x7fg\xbb\x1b\x03!\tg,\xca\xceQ\x00RA\xc0\xf2\xe3\x92X\xb90\x88-\xfb]\xe8\x0e\x8d}b&M.\xd5n\r\xa7\x1e\x13\xc6\xc5\'\xc7\xf0\xa9\xf3z\xf0\x8d\x0f\xf5\xe1\xd3\xef\x0b\xe3\xdc\xa5\t\x9c8GI\xe5\xdf\x98\xd4$$\x15\t?\x7f\xa2\x0e\xfb\xbbG\x1e\xaek\xebu\xe1\xe5\x8d.\xac\x98\x97@c\x9d\xf1\x9c\xdaj/p\xd1\xc9\x11l?\x90\xca\xd5)69\xd0\xec\x00 \xdf\x9f\xc9(\x008\x92\xf07x\xb1\x03p\x0c]\xcf\x981\xe3\xf3v\xbb\xfd\xa6b~\xa1t\x0b\xa7Ep\xcb\xc7\xfbq\xc21\xca\x88\xdd4BO-D\xb2\xbf\xdd\x86\'\xde\xf4\xe2\xb5mU\xd8\xd7\xe5*\xeb\x18t\xb1l\xb2@\x83OAc\x8d\x8e\xd9\xcdI\x9c\xb1 \x80\xe5\xf3\x81&\xbf\n\xaf;\xd5mZ2\x01\x04#\xc0\xd6\x03.\xfc\xe5\x15\x0f\xd6\xec\xacFo\xc86\xea`IBj\x9c\xf9\xf3\x17\xf7\xe3\xfd\xef9\x9a\xe5>\x10\x06>~k#\xb6\x1e\x9a\x18\xab\xc08l:\xbe}M;\xaeY\x994\xee%\x11@\x7fH\xc2\xc6\xddv\xdc\xfdR=z\x822"\x89\xd4\xf2\xbbn\'\xe0u\x02\x1e\x97\xc0\xc2i\x11\\\xb8$\x86\xf93u\xd4x\xf5\xbcY\xfd\xe9\x12I`\xddv\'n{\xbc\x16\x9b\x0e\xf8r\x96\xd9\x1d\r\x9b,\xf0\xef\xef\xeb\xc5\xbf]\x16\xca\xfa\xbe\x08\x01\xbc\xba\xd1\x86/\xfdv*\xc2\xf1\xec?\x80,\x0b\x9cy\\\x18\x9f\xbd(\x80HB\xe0O/W\xe3\xd5muh\xa9U\xf1\x85\x8b{q\xdcL\x1d\x89$\xf0\xfb\x17=xyKmQ\x9f\x1b\xa7]\xe0?.\xed\xc3g\xdf\x1f\xcc{\x84\xe9\x0f\xc8\xb8\xf3\x197\x1e~\xa3\x01\xbdaN\x13\xa4l6Y\xa0\xb1ZA\xab_\xc7\xf2ya\x9c\xb105~_W\xad\xc1[D\xaeS)T\r\xf8\xdb\x1a\'n\xfa\xc3\xd4\xa2z\xedf\xd4+\xb8\xe3_\xbb\xb0x^v.\xd2\x90\xde\x80\x84\xdb\x1f\xf5\xe3\xc17\x8a\xcb\xd7QU\xf5\xa7\x07\x0f\x1e\xfc%\x00\x05\x80\x9av\xad\xa5]2\x03\x02 GP0\xa1\x02\x00\x00\x98\xdd\x94\xc4\x17\xdf\xd7\x87\xcb\xde\x1b+\xb8\x01\x14\x02h\xeb\x02\xde\xd8Z\x85-\x07d\xbc\xb9\xdb\x8b\xb6^7\x92*\xa0jr\xd9\xeb\t\xc8\x92\x80\xc3&`\xb3\x01\x1e\xa7\xc0\xd2YA\x1c?S\xc5\xf4&`\xf6\x94\x18f5jh\xa8\x05$\x13\xd2\x1b\x92\n\xd0\xde-\xe3\x95-n\xbc\xb4\xb1\n\xff\xdc\xe3\x1d\x93Z\xfd^\xa7\x8e\xf3N\x8c`\xe5\t\x03p;\x04\x9e[_\x8b\'\xde*\xa0\x96\xf08j\xf0)\xf8\xdeG\xbap\xc9\xa9\xc9\xbc\x07\n%\x99\n`\xfa#\xa9\xa5m}n\xa0\xc6\x9b\xbav\xb9P\xd4\xd9\x84\x10@\x7fP\xc2/\xffV\x83G\xd7\xd6\x8c\xf9\xcc\x88\xa6\x9a$\x1e\xfbz;Z\x9b\xb2\xcf8t\x1d\xf8\xf3\x8bN\xfc\xf8\xd1)\x88e\xe4\x1c4\xd5\xa8x\xf0\xbf\xda0\xb35\xf5\xed8\xd8)\xe1\xea\x1fO;\xd25\xe9\xb4\t\xa8\xbaTr\xe0R\xe7U\xf1\xdb/\xb4a\xd9q\xf97\x90T\x80\x7f\xeep\xe1\xcegk\xb0vg\x15\x12y\n!\xd1\xe4f\x93S\xc7I\xbb\r\x98^\x9f\xc0\xf2y\x11\x9c8K\xc7\xbciq\xcck\xd5\xe0\x1b\xc7I$\x9a\x06<\xb9\xc6\x89[\x1fkF{\x7f\xf1\xbdTs\x9b\x93\xf8\xe65\xdd8kq\xee  \x14\x91p\xfb#u\xf8\xf3k\xb5\x05\x9f\xb8N\xfa\x00\x00H}\x10\xae:m\x00\xff\xf1\xc1\x01\xb4\x18,\xeb8"\x01\xf4\xf4\x03[\x0e\xda\xb1\xed\x80\x17;\x0eI\xd8\xdbi\xc7\xee.\xdf\xb8,\\\xd3R\xa3\xe0\xd8\xd60Z\xfd\x02S\xea\x80\xa9M\x1a\xe6\xb6D0\xb5^`J=r\x96\x83-\x99\x00\xda{\x80\xe7\xdf\xf1\xe2\xb9\xf5\x1e\xac\xddU=\xae\xcb\xf2Nd\xd5n\x1d\xb7]\xdf\x81\xf3O\x19\xfb\x85\x81\xa2Q\xe0\xa1\xd7\xbd\xf8\xed\x0b\xb58\xd47~\xab#^v\xca\x00\xbe\xff\x89~\xe3\xb1G\x00O\xbe\xe1\xc4-\x0f7\x0f\xcb\t\xf8\xc0\xb2^\xdc\xf1oG\xcb$\x0b\x01\xfc\xea\xa9j\xdc\xf6D\xa3i\xeb;\xb4\xfa\x13\xf8\xc5\xbf\xb6\xe3\xe4\xf9#\x0f\x95@\x00olq\xe2\x0f/U\xe3\x95\xad\xd5\x0c\x04,\xa2\xce\xabb\xd1\xf40\x16N\xd71\x7f\x86\x82\x85\xd3b\x98\xd1(P\x9bg(x\xac\xf5\x05\x80\x9f=V\x8b\x07\xde\xa8\x1b\xb18W>^\xa7\x8e\x9b\xaf\xe8\xc4u\x17\xe4Y\x1f@\x07n\x7f\xd4\x8b;\x9fo*\xe8\xbd,\x11\x00\x0c\xf1Wi\xf8\xf0\xe9\x03\xb8\xfa\x8c0\xe6L-\xbd\xa6\xb8\xae\xa7\xea\x9c\xeb\x9a\x84X\x0c\xe8\x0e\x02\xed\xfd\xc0\x81n\x0f\xda\x03.\xc4\xe22T5U+Z\xd5\x80\xa4\x9a\xba(jj\xcc\xd8aK]\xec\xb6TYT\x87\rp\xbb\x05\x9ajU4V\xc7\xd0T\xa3\xa2\xde\x07\xd4x\x80\xda*\xc0\xed\x05lR\xaaJ\xd4\xd0\xc5l\xe1\x08\xf0\xee!\tkwT\xe3\x85\rNl;\xe4CB\x05\xb3\xab\r\xb8\x1d\x02\xdf\xbe\xa6\x03\xd7\xac\xcc\x9e\xa2f\x86\xee>\xe0\xcf/U\xe3\xa155\xe8\x0c8\xc6=\'E\x92\x80\x8f\x9e\xd1\x8f\xef|l\xc0\xb0\xbc\xb3\x10\xc0@P\xc2\x9f\xfe\xe1\xc5\x1f\xfe\xe1G\x7f\xc4\x81\xcf]\xd0\x8e\x9b?<\xfc\xc0t\xa8\x138\xf7\xdb\xb3M-\xd8S\xeb\xd5\xf0\xe9\xf3\x06p\xc3%\xc1\x82\x86O4\r\xd8\xdf!\xe3\xa1U5xa\xa3\x1b{:=c2|B\xe3\xcbi\x178\xae5\x8c\xb9-\x02\xd3\x9b4,\x9e\x1d\xc2\xa2\xe9:\x1a\xfd\x80\xcd\x96\xaaN:\x16\xc7I!\x80\xbe\x01\xa0\xa1\x0e\xf9[;\x1d\xd8\xd3.\xe1\x85\xf5U\xb8\xeb\x85:\xf4\x84\x1c\xa6\xf4\x1c\xdbm\x02\x9f=\xbf\x13_\xf9`,\xe7\x9a+\xba\x0e<\xf2\xba\x03\xb7>\xd6\x82\xee\x11\x92\x03-\x15\x00\x00\xa9?\xe0\xbc)\t|\xe5\xd2n\x9cu\x92j8\xcdb\xd4\x04\xa0k\x80&ReM5m\xf0ZO}(mr*\x10\xb0I\xa9kYB\xea@;\x8e\xc7yU\x03"q\xe0p\x97\x1d\xcf\xafw\xe1\xf5\xed\xd5h\xef\x93\xd0>\xe0\xe6\x01\xb2\x00\xb5^\x15\xdf\xffH;.>E\x85\xc3\x84\xbc3U\x05z\x022\xd6\xef\xb2\xe1\xb7\xcf7`\xd3\x01wY\xf3O\xaa\xdd:~\xfa\xc9N\\\xb0<\xf7\xd9\x86\xa2\x00[\xf69\xf1\xf6.\x19\r\xd5I\\~\xc6\xf0\xa0Z\xd7\x81\xd3o\x9a\x81\xce\xa0\xb9]TU.\x1d\xffrn\x1f>\xff\x81P\xc19\x14\xaa\n\xec\xef\xb2a\xcdV\x07\x9e|\xab\x1a\xdb\x0fy\x10\x8cYg\xe6O%\x92%\xc0\xebR\xe1\xb2\x03.\x070\xa31\x81%\xb3B\x98\xdd,0k\n0\xb51\x81\x86j\x01\xaf{\xec\xc6\xee\x85\x00b\t\xa0/h\xc3\xfa]\x12^\xdbV\x8dw\x0f\xbb\xf0\xcdk\xba\xb0\xec\xb8\xe1\x9fw\xa1\x03q\x058\xd0a\xc7\xfd\xafy\xb0j\xbb\x0f\x07z\x9cH\x8c\xe2\xac\xdf\x88\xc7\xa9\xe1\xa6\x0f\xf4\xe1\xdas"\xf0\xb8\x8d\x0f\xd6I\x05\xb8\xffe\x17\xbe\xff`k\xde\xde[\xcb\x05\x00GvF\x02.Z\x1c\xc05g\x06p\xf2<\x1d>o\xe1\xa5m+\x91>\x18\x80\x04\x83\x12V\xedp\xe2\x8dmU\xd8\xd6&c\xf3\xc1j6\xf8%\xf2\xb9U|hE\x18\x9f}\xdf\x00\x9a\xfd\xc6u\xbc\xf3\xd1\xf5T\xed\x8a\xcd{\x80\x87W\xfb\xf1\xcaV\xcf\x84*P5\xd5\x1f\xc3]_\xea\xc4q3K\xff\x80\\{K=\xde\xdcm~.\x87,\t|\xe4\x8c^\xdc\xf8\xc10\xear\xd4P\xcfEW\x81M\xfbl\xf8\xc7\x86*\xac\xdbm\xc7\xe6\x03\xd5\x88%\xa5\x8aJ\xf8\x9d,$\xe9h\xef\xa6\xc3\x06\x1c\xd3\x12\xc1\xec\xa6\x04\xa67\x02\xd3\x9b\x04\xe6N\tcJ\x9d@K\x1d\xe0\x1e\x87\tAb\xf0\xa4-\x14\x96\xf0\xf6n\x1b\xfe\xb9\xd3\x87-\x07mxg\xaf\x0f\xe1\xb4\xe1\xde\xe3\xa6&\xf0\xd5+:0\xbbE\xa0+\x00\xecjwaW\xbb\x17\xfb\xbb$\xac\xde1\xf6CNN\xbb\xc0\xd5+\x82\xf8\xea\xd5}9s\x19\x12\t\t\x1f\xbb\xb5\to\xef\xcb\x9d\xec`\xd9\x00 ]\x8dG\xc3\xc5K\x02\xb8\xe4\x94\x18\x96\xceM\xa2fb$\x9e\x8f\x8e\x18\xec\xd6?\x0c\xbc\xbd\xbb\x06;\xda$l=\xe8\xc2\xb6\xc3,\x9fj\xb6\x06\x9f\x8a\x0f\x9f\x1e\xc4%\xa7\x041\xa3A\xa4\xa6V\xe6\x08&\x95$\xb0\xbb\x1dxkg56\xef\x97\xf1\xf6\x1e\x0fvu\x96\x7f\xaac.\xd3\xfcq\xfc\xf6K\x1dXPb\x10\xf0\x89[k\xb1jGv\xddt\xb3\xb4\xd6%\xf0/\xe7\x04q\xcd\xd9aT\x97\xf8\xd1\x8e\xc5\x80\r{\x81W6\xd7a\xe7!\x19o\xef\xad\xc2@\x11\xd3\x1d\xa90\x0e\x9b\xc0\x8c\x86\x18\xa6\xd4%Q\xef\x03\x9aj\x80\xd9\xadI\xcco\x8dbZC*\x9f\xa9\x98\xa5\xc4\xcd"Dj\xd8m\xdd.\'\xb6\xee\xf7\xe0\xed=6\xbc\xb5\xa7\x16\xda\x04_yZ\x02p\xda\xb1\x11\xfc\xe2s]h0\x88\xb1\x85\x00\xbe\xffg?\xfe\xf0J]\xcem0\x00H\xe3\xb0\x0b\xf8\\:\xce>>\x88\xd3\x17*X0#\xf5\xc1\xac-e\xae\xfc8\x8a\xc7\x81\xee\x00\xd0\x19\xb0a\x7f\xa7\x07[\xf6\x03\xff\xdc]\x85}=\xee\xc1\xfc\x03\xd9\xb4D,2&\x01p9t\xd8m\xa9\x1c\x81c\xa7\x841\xa31\x89j\x0f\x10\x88\x00\xddA\x1b:\x06\xaa\xd0\x15\xb4#\x96\x94\x90T\xe5\x8a\xe9y\x99\xdd\x14\xc3\x8d\x97\r\xe0\x92S\x8d\xe7\xe2\xe7\xa2\xa9\xc0\x99_\x9b^t\x01\xa1b\xc9\x92\xc0\xdc\x96\x04n\xba\xbc\x17g\x9f\x94\x84\xb3\xc4N\x14!RCc\x89\xa4\x8c\xc3\xdd\xc0\xb66\x19[\xda|8\xd8\xe5\xc0\xa1>`_\x97\x07\xe1\x04\x87\r\x8cT\xbb54\xd7\xc6\xd1\xe0\x13\xa8\xad\x02\xaa=\x023\x9a\x92\x98\xdb\x12\xc6T?\xd0X\x93\xaa\xbb\xe2p\x08\xd8\xe4To\xebX\x8d\xd3\xe7#t \x10\x06\xf6t\xda\xb1\xfd\x80\x1b[\x0e\x00\xeb\xf7U\xe1@\x8f\x1b\t\xa52{\x81\x8e\x9f\x1e\xc1\xcf>\xdd\x8dc\xa6\r?\xa0\xe8:\xf0\xad?\xf8\xf1\x97U\x0c\x00\x8af\x97\x05Z\xea\x12h\xa8\x06\x8emM\xe0\x9c\x13\x828a\x16P\xed\xd3\xe0r\xa4\xca\xe4\xdam\x18\x97\xc0@\xd7\x00UO\x1d\x9c\xe2\x8a\x84P\xc4\x86\x83\x9d\xc0\x9eN\t\x9b\x0eTco\xa7\x0b\xc1\x18\x10\x88\xc8\xe8\x8b8\x98\xb1O\xa6\xf3Wi\xf8\xec\x05}\xb8\xee\xc20\xdc\x056\xb0[\xf6\xc8\xb8\xe2\xc73\xc7\xadB_\x8dG\xc5\x05\x8b#\xf8\xd8\xca \x16\xccRG]\xb1\r\x00 \x80x\x02\xe8\x0b\x03]\x03N\xb4\xf7\xc8\xd8\xd5\x0e\xec\xe9t`G{\r\x82Q\x19\x8a\x96J\xf0M\xa8\xa9\xc0\xae\xd2\xbf\x7f6Y\xc0i\xd7a\xb7\x89a\xc9\xcaN\xbb\xc0\xf4\xfa$\xa67\x84\xd0X-\xd0X\x034V\x03u\xd5\x80\xafJG\xadW\x81\xcf#P\xe5J\x8d\xd9\x1b-h3\x9e\x84H\x8d\x85G\x13\x12\xba\xfbmx{\x17\xb0jG\x1d\x0et;\xd09 \xa3;\xe4\x9c4\'F\xcb\xe6\x86\xf0\x9dk\x028\xfe\x18\xe5HP\x15\x89\x01\x1f\xbb\xb5\x11\x1b\x0f\xe4\xee\xd2f\x00P\x04\x97]`Vc\x04S\xeat4\xd6\xa4\x16\xad\x99Z\x9f\xc0\x8c\xc6(\xa6\xd5\xa7\xa2\\\x97\x03p\xd8\x01ip\xdd\xfb\xd4/=|\x8c2\xf5\xa1\x93R\x7fA\x91\xba\xaf\xab\xa99\xe3\xe1\x18\xd0\x13J\x9d\xd1w\x05\xdd8\xd4\xe7F $#\x18\x05\x821\xe0p\xbf\x1d\xfb\xba=\x15\x7f\x90\xa1\xca#I\x02\x17-\x0e\xe2s\x97\x0c`\xe1,=o\xf2c"\t\xfc\xe7o\xfcxz}\xee\xb3\x8f\xb1\xe2\xb4\t\xac\\\x14\xc4GV\x86\xb0b\xa1\n\x97\xb3\xf8\xfc\x8c\x82\x88\xd4J\x8a\x03\x11\xa0\'\x08t\x06\x1c\xe8\x0e\xb8\xd13 \xa1?\x0c\x84\xe3\xa9D\xdb`\x0c\xe8\x8f\xb8\xd0\x17v!\x10\xb5A\xd5R\xdf\xfd\xcc\xc6Gd\xdc\xc9\xd76IG\xfeI\xbb\x9f\xf9\x1a\xe9\xe8s\x92\x0c\xf8\\:\xfcU\nj\xbdq\xf8\xdc\xa9\xc27U.\xa0\xca\rx\x9c\xa9\x8b\xdb\t\xd4V\xeb\xa8\xf7%\xe1\xafJ\xa2\xae\xeah\r\x0b\xb7\x0b9\x87\xb6\xcaM\x88\xd4\xcc,M\x93\x10\x8e\x00\xdb\xda\x80\xb5\xef\xd6b\xd7a\x1b\xf6t\xd8\xb1\xab\xd3[1=n\xa5\x9a\xe6Wp\xfd\xb9\xbd\xb8dY\x1c\xd1\x04\xf0\xd0j\x1f~\xf3|c\xde\x9fa\x000Fd)\x95I\xedui\xa8r\xa9\xf0:\x13p\xd8u(\x9a\x8cx\xd2\x81h\xd2\x81h\xc2\x86hRF\\acN\x95C\x96\x80\xe5\xc7\x84p\xfe\x92\x04\xce91\x849\xadiE\xa7\x04\xf0\xeeA\x19\xbf{\xd6\x87\x87\xd6\x96Rt\xc3\\s\x9b\x13\xf8\xc0)a\\\xf1\xde f\xb6\xa0\xfcCy\x02P\x12\xa9\xc0 \x928:UX\x1d\x9c-4\xd4\xd3\xa7\xa6\xddV\xd4T\xe3f\x97S\xebO\xa4\x9f\x95\xdb\xe5\xa3\xb7m\x06\xb7=N\xc0\xeb\x1a\x1c[\x9f\xa0\x8dwI\x040\x10\x04\xf6v\x01\xbb\xda\xbd\xd8\xd3\xee\xc0\xce\xc3\xc0\xd66\x1f:\x03\xc5\x97\xc4\xb5*\x06\x00DT\x12I\x02\xdc\x0e\x1d>\xb7\xc0\xac\xc6(\xea\xaa\x128\xd0\xe3C[\xaf\x131e\xe2\xe4\x9dH\x12\xe0q\xe88qf\x14\xe7.\x8ea\xe91q\x9c0K\x85{\xfcj+Q\x89t=\x95\xcc\xdc1\x00\xec\xe9\xf0bO\xbb\x8c=\x1d\x126\xee\xafFG\xc01\x18@I\xec\x11-\x91\xd9\x01\x00Sg\x89,B\x08 \x96\x94\x11K\x02\xdd\xc1j\x00\x13s\xfa\x8c\x10@4)c\xed.\x1f\xd6\xed\xf6\xa1\xc1\x97\xc4\xbcV\r\x97/\xef\xc5{\x17\xe9G\xea\xc0\x97{\xcc\xda\xaa\xb4\xc1^\x8e\xb8"!\x16\xb7\xa1/\x00\xec\xeb\x02\xb6\x1frb\xe3\xfe\x1a\x04\xa2\x12\x06"@g\xc0\x89\x842\x99\xba1&\x1f\x06\x00D4a\xe9\x02\xe8\x0e9\xd1\x1d\x02\xdexw:|n\x15\x0b\xa7Eql\xab\xc0\xc9\xf3"X0-\x89Y-\x80\xdb\x95\xcaT\x1f\xef,\xf5\xc9H\x88\xa3c\xf4\xba\x90\x90\x8c\x03]\x03\xc0\xben`{[\r\x0e\xf5\xd8\xd0\x13\x94p\xa8O\xc6\xben/\xa2I6\xf2\x95\x8a\x01\x00\x11U\x8cp\xdc\x8eu\xbbk\xb0n7p\xdf\xeb\xa9\xc9\xd4n\x87\x8ees\x038q\xa6\xc0\xfc\xe9\n\x16\xcd\x88bZ\x03P\xe5E\xf9s\x08&0\xa1\xa5V\x0c\xed\r\xa5.\x87\xfb\xbc8\xd4\xeb@\x7fp\xf0~?\xb0\xaf\xbb\x1a\xdd\xa1\xc2\x96\xcc\xa6\xca\xc3\x00\x80\x88*Z\\\x91\xb1j\x87\x1f\xabv\x0cM\x89K\xd5\x96\xf7Wi\x98\xdb\x1c\xc2\xacf\r3\x1a\x80)\x8d\x02-u14\xd5\xe8h\xac\x9ed\x01\x82\x00T%\x95\xa8\x18\x89\x03\xd1\x04\x10\x8aK\x18\x88\xb80\x10\xb6#\x1a\x03\x02Q\xa0?\x04\x1c\xee\x97\xd0\xd6\xe7E[\xaf\x0b\x8a&A\xd3\x07\xab\\\xea\x1c\x9b\xb7\x1a\x06\x00D4ih\xba\x84X2\xd5\x88\x85\xe32\x0e\xf6\xd6\x03\xdbR\xcf9m\x02\xb5\xde$j\xbc\x02\xd5\x1e\xa0\xca-P\xef\xd30\xd5\x1fAsm\xaa\xda]m\x15\xe0\xafJ];\xdd\xa9bc\x0e\x9bv\xa4\x08\x8e\x84\xa3\x0b|\xe5\xba\r\xa4\xee\xa7O\x1d\x14i\xd3\x04\x8f\xdc\x16G_3t\x9d*\x01.\x1d\xb9\xa8\x9a\x04-\t\xc4\x06/\xd1Dj\xbabtpVB\x7fX\xc6\xa1~\x1f:\x06\x9c\x88\xc6%$\x94T}\xfb\xa1\xebH"5{i\xb2O\xa9\xa3\xd20\x00 "KHj\x12\xbaC.t\x872\x9f\xf1\x19\xbe\xdei\x17\xf0{U\xf8}qx]"5\xadop\xba\x9e\xdd\x86#\xf7m\xe9\xb7\x07\xefK\x18\x9c\xe7\xae\xa7\xadF\xaa\x1f]pl\xe8\xb1\xa1E\xc7\xf4\xc1)\x84\xb1$\x10MJ\x88&\\\x88$l\x08\xc5m\x13\xbe\xc4-U.\x06\x00DD\x06\x92\xaa\x84\xce\xa0\x03\x9d#,\xd1JT\xa9\x98\xbeIDDdA\x0c\x00\x88\x88\x88,\x88\x01\x00\x11\x11\x91\x051\x00 ""\xb2 \x06\x00DDD\x16\xc4\x00\x80\x88\x88\xc8\x82\x18\x00\x10\x11\x11Y\xd0\xa4\xab\x03p\xf9\xe5\x97\xe3\x8c3\xce(\xf7n\xd0\x18\xd2u\x1d\x0f>\xf8 \xdez\xeb-\xd3\xb6YWW\x87/\x7f\xf9\xcb\xa8\xae\x9e\x98+\xe4U\x8a\xdbo\xbf\x1d\x87\x0f\x1f.\xf7n\x8c\xabSN9\x05W_}5dyb\x9eO\xf5\xf6\xf6\xe2\xee\xbb\xefFWWW\xb9w\x85&\x98I\x17\x00,]\xba\x14W]uU\xb9w\x83\xc6\x90\xa6ix\xf3\xcd7M\r\x00\xaa\xaa\xaa\xf0\xfe\xf7\xbf\x1f\x8d\x8d\x8d\xa6m\xd3\x8a\xee\xb9\xe7\x1e\xcb\x05\x00\xb3f\xcd\xc2\x95W^\t\x9bmb\xaeO|\xf0\xe0A<\xf4\xd0C\x0c\x00(\xcb\xc4\x0cY\x89\x88\x88hL1\x00 ""\xb2 \x06\x00DDD\x16\xc4\x00\x80\x88\x88\xc8\x82\x18\x00\x10\x11\x11Y\x10\x03\x00"""\x0bb\x00@DDdA\x0c\x00\x88\x88\x88,\x88\x01\x00\x11\x11\x91\x051\x00 ""\xb2 \x06\x00DDD\x16\xc4\x00\x80\x88\x88\xc8\x82\x18\x00\x10\x11\x11Y\x10\x03\x00"""\x0bb\x00@DDdA\x0c\x00\x88\x88\x88,\x88\x01\x00\x11\x11\x91\x051\x00 ""\xb2 {\xb9w\xc0jzzzp\xef\xbd\xf7\x96{7*\x9a\x10\x02[\xb7n-\xf7n\x8c\xbbU\xabV\xe1\xad\xb7\xde2m{6\x9b\r\xd7_\x7f=|>\x9fi\xdb\\\xb4h\x11\xaa\xaa\xaaL\xdb\xde\xa1C\x87p\xf8\xf0a\xd3\xb6GDG1\x00\x18g\xbd\xbd\xbd\xb8\xe3\x8e;\xca\xbd\x1bT\x81V\xaf^\x8d_\xfd\xeaW\xa6m\xcf\xe9t\xe2\xea\xab\xaf65\x00\xf8\xfa\xd7\xbf\x0eM\xd3L\xdb\xde\xaf\x7f\xfdk\xdc}\xf7\xdd\xa6m\x8f\x88\x8eb\x00@D\xa6\xf1\xfb\xfd\xa6n\xcf\xeb\xf5\x9a\xba=":\x8a9\x00DDD\x16\xc4\x00\x80\x88\x88\xc8\x82\x18\x00\x10\x11\x11Y\x10\x03\x00"""\x0bb\x00@DDdA\x0c\x00\x88\x88\x88,\x88\x01\x00\x11\x11\x91\x051\x00 ""\xb2 \x06\x00DDD\x16\xc4\x00\x80\x88\x88\xc8\x82\x18\x00\x10\x11\x11Y\x10\x03\x00"""\x0bb\x00@DDdA\x0c\x00\x88\x88\x88,\x88\x01\x00\x11\x11\x91\x051\x00 ""\xb2 \x06\x00DDD\x16d/\xf7\x0e\x10Qy\x08!\xb0q\xe3F\xd4\xd7\xd7\x9b\xb6\xcd\x96\x96\x16L\x9f>\xdd\xb4\xed\x11\xd1\xd8a\x00@dQ\x8a\xa2\xe0K_\xfa\x92\xa9\xdb\xfc\xccg>\x83\x1bo\xbc\xd1\xb4\xed\xad\\\xb9\x12\xb5\xb5\xb5\xa6m/\x12\x89\xe0\x9e{\xeeA \x100m\x9bD\x95\x8a\x01\x00\x91\x85%\x93IS\xb7\xa7i\x9a\xa9\xdb[\xb6l\x19\x96-[f\xda\xf6zzz\xf0\xe0\x83\x0f2\x00 \x02s\x00\x88\x88\x88,\x89\x01\x00\x11\x11\x91\x051\x00 ""\xb2 \x06\x00DDD\x16\xc4\x00\x80\x88\x88\xc8\x82\x18\x00\x10\x11\x11Y\x10\x03\x00"""\x0bb\x00@DDdA\x0c\x00\x88\x88\x88,\x88\x01\x00\x11\x11\x91\x051\x00 ""\xb2 \x06\x00DDD\x16\xc4\x00\x80\x88\x88\xc8\x82\x18\x00\x10\x11\x11Y\x10\x03\x00"""\x0bb\x00@DDdA\x0c\x00\x88\x88\x88,\x88\x01\x00\x11\x11\x91\x051\x00 ""\xb2 \x06\x00DDD\x16\xc4\x00\x80\x88\x88\xc8\x82\x18\x00\x10\x11\x11Y\x10\x03\x00"""\x0bb\x00@DDdA\x0c\x00\x88\x88\x88,\x88\x01\x00\x11\x11\x91\x051\x00 ""\xb2 \x06\x00DDD\x16\xc4\x00\x80\x88\x88\xc8\x82\x18\x00\x10\x11\x11Y\x10\x03\x00"""\x0bb\x00@DDdA\x0c\x00\x88\x88\x88,\x88\x01\x00\x11\x11\x91\x051\x00 ""\xb2 \x06\x00DDD\x16\xc4\x00\x80\x88\x88\xc8\x82\x18\x00\x10\x11\x11Y\x10\x03\x00"""\x0b\xb2\x97{\x07\xacf\xce\x9c9x\xf1\xc5\x17\xcb\xbd\x1b\xe3\xaa\xb3\xb3\x13\xd7]w\x1dTU-\xf7\xae\x10\x11\xd1 \x06\x00\xe3\xcc\xe9tb\xce\x9c9\xe5\xde\x8dq\xe5r\xb9\xca\xbd\x0bDD\x94\x81C\x00DDD\x16\xc4\x00\x80\x88\x88\xc8\x82\x18\x00\x10\x11\x11Y\x10\x03\x00"""\x0bb\x00@DDdA\x0c\x00\x88\x88\x88,\xc8\x8c\x00@\x98\xb0\r"""\x1aG\xec\x01 ""\xb2 \x06\x00DDD\x16\xc4\x00\x80\x88\x88\xc8\x82\x18\x00\x10\x11\x11Y\x10\x03\x00"""\x0bb\x00@DDdA\x0c\x00\x88\x88\x88,\xc8\xcc\x00\x80\xf5\x00\x88\x88\x88*\x04{\x00\x88\x88\x88,\x88\x01\x00\x11\x11\x91\x05\xd9\xcb\xbd\x03V\xa3i\x1a\xc2\xe1p\xb9wc\\\x05\x83\xc1r\xef\x02\x11\x11e0+\x00\xe0\xf8\x7f\x81\xf6\xed\xdb\x87\x8f\x7f\xfc\xe3\xe5\xde\x8dq\xa5\xeb:TU-\xf7n\x10\x11Q\x1a\xf6\x00\x8c3UU\xd1\xd9\xd9Y\xee\xdd ""\x8bc\x0e\x00\x11\x11\x91\x051\x00 ""\xb2 \x06\x00DDD\x16\xc4\x00\x80\x88\x88\xc8\x82\x18\x00\x10\x11\x11Y\x10\x03\x00"""\x0bb\x00@DDdA\x0c\x00\x88\x88\x88,\x88\x01\x00\x11\x11\x91\x051\x00 ""\xb2 \x06\x00DDD\x16Tj\x00 \xc0\x05\x80\x88\x88\x88*\x16{\x00\x88\x88\x88,\x88\x01\x00\x11\x11\x91\x05\x8d6\x00\xe00\x00\x11\x11Q\x05b\x0f\x00\x11\x11\x91\x051\x00 ""\xb2 \x06\x00DDD\x16\xc4\x00\x80\x88\x88\xc8\x82\x18\x00\x10\x11\x11Y\x10\x03\x00"""\x0bb\x00@DDdA\x0c\x00\x88\x88\x88,\x88\x01\x00\x11\x11\x91\x051\x00 ""\xb2 \x06\x00DDD\x16TJ\x00\xc0\xfa\xffDDD\x15\x8e=\x00DDD\x16\xc4\x00\x80\x88\x88\xc8\x82\x18\x00\x10\x11\x11Y\x10\x03\x00"""\x0bb\x00@DDdA\x0c\x00\x88\x88\x88,\x88\x01\x00\x11\x11\x91\x051\x00 ""\xb2 S\x03\x00I\x92X$\x88\x88\x88\xa8\x02\x98\x11\x00\xb0\xd1\'""\xaa0\x1c\x02 ""\xb2 \x06\x00DDD\x16df\x00\xc0\xa1\x00""\xa2\n\xc1\x1e\x00"""\x0bb\x00@DDdA\x0c\x00\x88\x88\x88,\x88\x01\x00\x11\x11\x91\x051\x00 ""\xb2 \x06\x00DDD\x16\xc4\x00\x80\x88\x88\xc8\x82\xcc\n\x00X\x03\x80\x88\x88\xa8\x82\xb0\x07\x80\x88\x88\xc8\x82\x18\x00\x10\x11\x11Y\x10\x03\x00"""\x0bb\x00@DDdA\x0c\x00\x88\x88\x88,\x88\x01\x00\x11\x11\x91\x051\x00 ""\xb2 \x06\x00DDD\x16\xc4\x00\x80\x88\x88\xc8\x82\x18\x00\x10\x11\x11U\x9eQW\xe0e\x00@DDdA\xf6r\xef\x00\x11\x95\x87\xddn\xc7\xed\xb7\xdf\x0e\xbf\xdfo\xda6\xa7N\x9dj\xda\xb6\x00\xe0\xe9\xa7\x9f\xc6K/\xbdd\xda\xf6\xe2\xf18\xfa\xfb\xfbM\xdb\x1eQ%c\x00@dQ\xb2,\xe3\x94SNAKKK\xb9w%\xa7\xed\xdb\xb7\xe3\x91G\x1e)\xf7n\x10MJ\x1c\x02 ""\xb2 \x06\x00DDD\x16\xc4\x00\x80\x88\x88\xa8r\x8c:\xfb\x7f\x08\x03\x00""\xa2\xcabJ\x100\xda\x00\xc0\xb4H\x84\x88\x88\x88\xc6\x0f{\x00\x88\x88\x88,h4\x01\x00\xcf\xfe\x89\x88\x88*\x14{\x00\x88\x88\x88*\x97@\x89\'\xe4\xa5\x06\x00Fo\xc6\x1e\x01""\xa2\xf13\xaav\xb7\xd8\x00\x80\r?\x11\x11\xd1$`\xd6\x10\x00\x83\x00""\xa2\n\xc2\x1c\x00""\xa2\xcaW\xf4\x898\x03\x00""\xa2\n IRz#?\xea\x9ew\x06\x00DDD\x95c\xdcK\x01\x17\x1au0\x17\x80\x88\x88hlM\x88R\xc0DDDT\x81\x8a\t\x00F\x9a\x02\xc8\xb3\x7f""\xa2\n\x91/\x00(\xb4A/\xb9\n\x11\x11\x11\x11\x95lTm\xaf\xbd\xc07\x90\xcc~c+\x93$\xa3?\'\x15C\x08k~\xfc\xcc\xfc\xec\x8c\xc5\xe7p\xd3\xa6M\x88\xc5b\xa6m\xef\xd0\xa1C\xa6m\xcb\xca$I\xe2qg\x94&\xd01\'sGJ\xde\xb1B\x02\x002\xd1\x8c\x193p\xdf}\xf7\x95{7*\x9a\xae\xeb\xb8\xf3\xce;\xf1\xea\xab\xaf\x96{W\xc6\xd5\xb5\xd7^\x8b\xb3\xce:\xcb\xb4\xedI\x92\x04\xbf\xdfo\xda\xf6\x00\xe0G?\xfa\x11\xde}\xf7]\xd3\xb6\x17\x8dFM\xdb\x96U577\xe3\xd6[o550\xb3\xa2g\x9f}\x16\xbf\xff\xfd\xef\xcb\xbd\x1bC2{\xdeE\xc6uAJ\r\x00\x0c\xdfD\xd7ua\xb3\xd9J\xdc\xa45x\xbd^\x9cv\xdai\xe5\xde\x8d\x8a\xa6i\x1a\x1ey\xe4\x91r\xef\xc6\xb8\x9b1c\x06f\xcc\x98Q\xee\xdd\xc8+\x10\x08\xa0\xb7\xb7\xb7\xdc\xbbAi\\.\x17\x16/^\\\xee\xdd\xa8x;v\xec(\xf7.@\xd7u\xdd\xcc\xed\x999\x0b@\x00\x88\x83C\x03DDDf\x1bjcM3\xda\x00@`xWD\x0c\x0c\x00\x88\x88\x88\xcc&\x90jc\xf3=ot;\'\xb3\xeb\x00\xc4\x00\x98\xdaEADDD\xd01\xbc\x97=\xd7\x0c\xbc\x82O\xc2G\xb3\x1cpV&\xa2\xae\xeb\xd1b\xde\x9c\x88\x88\x88\n"4M\x1b\xca\x8a-\xe4l\x7f\xc4\xc4\xc0Rz\x00\xf25\xf0\x0c\x00\x88\x88\x88\xcc\'\x90jcs=W\xb4R\x87\x002\xbb \x04\x00\xa8\xaa\xca\x1c\x00"""\xf3\r\xf5\x00\x8c\xfbb@\x85\x10B\x08\x06\x00DDD\xe6\x13B\x88\xa1Y\x00\x99\t\xf8%1;\t0*\x84`\x12 \x11\x11\x91\x89\x84\x10\xba\x10\xc2h\x08\xa0\xe4 `4\x01@V&b2\x99d\x0e\x00\x11\x11\x91\xf9DZ\x1b\x9b+\xfb\xbf\xa8\xf6\xd7\xd4\xd5\x005M\x8bJ\x92\xc4\x00\x80\x88\x88\xc8D\x92$\r\xcd\xb4\x1b\x92\xde\xe0\x8f[\x12`\xce@ \x1c\x0eG\x91;K\x91\x88\x88\x88J\x13\r\x87\xc3\xa6\xe6\xd9\x8dv\x16@\xfam\x01@\x17B\xec\x1d\xdd.\x11\x11\x11Q\xba\xc1\xb6U\x1b\xba\x9b\xfeT\xa9\xdb\x1c)\x00\xc8\xec^\xc8|\xd3\xacb@B\x88]\xa5\xee\x0c\x11\x11\x11e\xd3u}\x17\xb2\xbb\xfd\xc7\xb5\x12`.G\xa6$\xe8\xba\xbe\xcf\xa4m\x12\x11\x11\x11\x00!\xc4\xbe\xf4\xbb\x99O\x1b<6"3\x02\x80ao\xaaiZ;\x80\xa4\t\xdb%""" 1\xd8\xb6\x1a%\xfe\x8d\xeb4@\x91q\x19\xf6\x98\x10\xa2\x03\xc0@\xa9;DDDD\xc3\x04\x06\xdb\xd6!\xb9\x1a\xff\xa2\x82\x03\xd3{\x00\xe2\xf1x\x87\x10"`\xc2v\x89\x88\x88,O\x08\x11\x88\xc7\xe3\x9d0a\xea_:\xfbh70\xe8H\x0f@$\x12\xe9\xad\xa9\xa9\tJ\x92d\xd2\xa6\x8b\xa3(\nb\xb1|K&S\xa5\xd34\r\x9a\xa6\x8d\xfc\xc2"\x08!\x10\x8f\xc7\xf9\xd9\x19%]\xb7^!PM\xd3\x10\x8b\xc5`\xb3\xd9\xca\xbd+4\x86\x14E)\xdb{\x0b!\x82\x91H\xa47\xfd\xa1\xb4\xeb\x92K\x02\x17\xd2JKi\xd7C\x17y\xf0\xda6x\xb1\xa7]\x9c3g\xce\xbc\xc3f\xb3]^\xca\x0e\x8d\xd6\xb1\xc7\x1e\x8b\xe9\xd3\xa7\x97\xe3\xadi\x9c\x08!\xb0}\xfbvttt\x8c\xfc\xe2\x02\xb9\xddn,[\xb6\x0cN\xa7\xd3\xb4mZ\xd1\xbau\xeb\x10\x0e\x87\xcb\xbd\x1b\xe3j\xca\x94)X\xb0`\x01\xcau\xd2C\xe3\xa3\xad\xad\r;w\xee,\xcb{k\x9a\xf6\xf8\x81\x03\x07\xfe\x1d\x802xQ\x07/\xda\xe0E\x1f\xbc\x18\r\xcf\xe7Tl\x00\x00\x1cm\xfce\x1c\r\x00\x86\x82\x00\x07\x00\xc7\xf4\xe9\xd3?\xefp8\xbeZ\xd0oFDDD9)\x8a\xf2\x93\xb6\xb6\xb6_bx\x00\xa0a\x94\x01@)\xa5\x80\x8dj\x01\x0c\xbb(\x8a\xb2a\xa47&""\xa2\x11\xa5\xb7\xa9\x86\xc9\xf7\xa5n\xb8\x90\x00 \xd7\xc6s.F\xa0(\xca^\x00\xbd\x06\xcf\x13\x11\x11Q\xe1z\x07\xdb\xd4t#e\xff\x17d\xb4\xa5\x80\r\xa7\x04&\x93\xc9\xa0\x10bk\x89\xdb&"""\x00B\x88\xad\xc9d2\x88\x1c=\xee\xe9/\xcd\xb8\x1e\x91Y\x95\x00\x87\xdethQ\xa0\x88\xaa\xaa\xef\x98\xb8m"""\xcbQU\xf5\x9d\xc1\x85\xf6ru\xf9\x17\xd3K?\xcch\x02\x80\\\xbd\x00C\xc3\x00kF\xb1m"""\xcbS\x14e-\x86\'\xf8\x01\x06=\xef\xa5l{\xb4=\x00FU\x87\x04\x00\x11\x0e\x87\xb7\x03\x88\x8fr\xfbDDDV\x15\x0f\x85B\xdb\x91\xbf\xeb\xbfd\xc5\x06\x00#\x8d;\x1c\xb9\xa8\xaa\x1a\xd1u}\xcb\xe8w\x91\x88\x88\xc8zt]\xdf\xaciZd\xf0n\xce\x13\xeeR\xb7_h\x00\x903\xe3\xdf`G\x04\x00\x91H$\x14]\xd79\x0c@DDT\x02]\xd7\xd7&\x12\t\x15\xd9s\xfc\x8b\xc9\x05\xc8\xc9\xac\xb5\x00\x0c\x03\x01EQ\xfe\x89T\xd1\x02"""*\x9c\x92L&\xdfF\xfe\x02?E-\xfe\x93\xc9\xecY\x00C\xd7\x02\x80\x88F\xa3\xdb\x00$L|\x0f"""+H\x0c\xb6\xa1\xb9\xce\xfc\xf35\xfa\x05\x05\x02f\xd7\x01H\xbf\xe8\xc1`\xb0K\xd7\xf5\xed%\xbe\x07\x11\x11\x91%\xe9\xba\xbe=\x14\nua\xe4\xf9\xff%\x1bM)`\xa3\xf1\x87\xac @U\xd5G\xc1a\x00""\xa2B)\xaa\xaa>\x86\xfc\'\xd9\xa3\x0e\x04\xcc\x98\x06\x987\x190\x16\x8b\xad\x13B\xb4\x8d\xf2}\x88\x88\x88,A\x08\xd1\x16\x8b\xc5\xd6a\xf0D\x1a\xf9\x1b\xfc\x92\x03\x81\xb1\xa8\x048\xec\x12\x89D\xf6\x0b!\xd6\x9b\xf8>DDD\x93\x96\x10b}$\x12\xd9\x8f\xdc\xd9\xff#M\xc9/\xc8XU\x02<\xb2\xd3\x89DB\x8d\xbdBr\xd8\x00\x00\x12\xe2IDAT\xc7\xe3\x0f \xb5d!\x11\x11\x11\xe5 \x84\xd0\xe2\xf1\xf8\x83\x83\xd3\xff\xc6l\xfc\x1f0\'\t0\xf3:=\x08\xd0\x01\xe8\xa1Ph\x87\xae\xeb\xec\x05 ""\xcaC\x08\xb1>\x14\n\xed@\x8e\x93jd\x07\x02c^\x08\xe8\xc8\xbe\xe5y,g\x8f@4\x1a\r\xe9\xba\xfeJi\xbbHDDd\r\xba\xae\xbf\x12\x8dF\xc3H;\x89\xc6\xc8\xdd\xfde\xcd\x01\xc8;\x1d\x10\x80\x1e\x8b\xc5\xfe1x\x9b\x88\x88\x88\xb2\xe9\xb1X\xece\xa4\x86\xccG\x1a\xf7/y\xfe\xff\x10\xb3f\x01d\xde\xcf\xec\xb6\xd0\x83\xc1\xe0n!\xc4\xa6Q\xbe\x1f\x11\x11\xd1\xa4$\x84\xd8\x18\x0c\x06wc\xf80\xfa\x84\xa8\x03\x90)_\xc3?\xac\xf1\x07\xa0\'\x93IEU\xd5\xc7\xc1^\x00""\xa2L\xba\xaa\xaaO$\x93I\x05\xc3\x1b\xfe\\\xd3\x00G\x1d\x0c\x94\x12\x00\xe4z\xb3\xbc\xb3\x01\x00h\xc1`\xf0\xef\x00zKxO""\xa2\xc9\xac\'\x10\x08<\x83\xe1c\xff\x13\xb6\x07`H!\xc3\x00:\x00\x11\x0c\x06{5M{\x06&\xed<\x11\x11\xd1$ 4M{6\x14\n\xf5a\xe4F?\xdfIxQ\xcc\xc8\x01H\xbf=b2`4\x1a}@\x08qp\x94\xefKDD4)\x08!\x0eF\xa3\xd1\x07\x911t\x8e\xfcA\xc0\xa8O\xa4G[\x07 \xd7\xe3\xc3\xea\x00\xa4_zzzv\xaa\xaa\xfa@\x89\xefKDD4\xa9(\x8a\xf2`OO\xcfN\xe4h7\x91\xbb\xfb\x7fTA\x80\xd9\xd3\x00\xd3o\x1b\x16\x05\x02\xa0\x87\xc3\xe1\xa7\x84\x10\x07Lzo""\xa2\x8a$\x848\x10\x89D\x9eBa\xe3\xfe\xa6u\xff\x03\xe6\xe5\x00\xa4\xdf\xce\x97\x08(\x90\x1a\x06\xe8\xd6u\xfd9\x13\xde\x9b\x88\x88\xa8b\xa9\xaa\xfa\\4\x1a\xed\xc6\xc8g\xfeC&D\x12`!\xb3\x012\xc73\x8eL\t\x0c\x06\x83\xf7\t!\xa2\xa3x\x7f""\xa2\x8a%\x84\x88\x86B\xa1\xbf\xa4M\xfd\xcbl\xfc\x0b\xe9\xfe\x1f\xd7i\x80Fr%(\x18\xe5\x02h\x00\xf4\x81\x81\x81\x0e]\xd7\x1f\x06\xeb\x02\x10\x11\x91\xf5\xe8\xaa\xaa>\x1c\x08\x04:P\\\xe3o\xda,:3g\x01\x18=\x96\xaf8\x90\x16\x8dF\xff.\x84\x08\x8cr\x1f\x88\x88\x88*\x8a\x10"\x10\x8f\xc7\x9f\xc1\xe0I1\xf2\x17\xff\xc9l\xfc\xcb>\x04`\xa4\xe0D@\x00ZOO\xcfzM\xd3\x1e\x83\x89\x11\r\x11\x11\xd1\x04\'4M{\xac\xa7\xa7g\x03\n\xcb\xfa\xcf5\xee?\xaa\xb6\xd36\x9a\x1f\x1e$\xe5\xb9-\xa5=6t[N\x7fN\x08\xb1\xd3\xedv\x1f/I\xd2t\x13\xf6\x85\x88\x88hB\xd3u\xfd\xcd\xbe\xbe\xbe\x9f&\x93\xc9\x10R=\x00\x99\x97\xcc\xa1\x00\xc0\xc4\xe4\xbf!f\xcf\x02\xc8|<\xb3+cX\x1e\x00\x00=\x14\nuG"\x91\x9f\x03\x88\x9b\xb0/DDD\x13Y<\x12\x89\xfc"\x1c\x0ew#\xbb\xc1/d\xdc\x7f\xc2\xe4\x00d\x1a\xa9\x12\xa0\xe1\xcc\x80@ \xb0E\xd3\xb4\x97L\xde\x17""\xa2\tE\xd3\xb4\x97\x02\x81\xc0\x16\xe4.\xfa\x93o\n`\xba\xb2U\x02\xccTh/@f\x0f\x80\x06@W\x14%\x11\n\x85~\x05 l\xd2\xfe\x10\x11\x11M4\xa1P(\xf4kEQ\x12\xc8>\xf3/\xa4\x08\x90\xa9C\x00f\xe4\x00\x0c\x912\xae\x8d\x1e\x1b6\xfe\x9f~?\x1e\x8f\x07}>\x9fC\x96\xe5e\x92$\x99\xdd3ADDT6B\x08MU\xd5\xbb\xba\xba\xba^\xc0\xd1\xae\x7f\x15\xd9c\xff\x1aF\x9e\xfa7\xe1f\x01\xe4\x1a\xab\x18\xb1&\xc0\xd0\xed\xde\xde\xde\xfb\x00l6q\x9f\x88\x88\x88&\x82\xcd\x83m\x9cQ\x83o4\x15p\xcc\xe6\xff\x0f\x19\xcb3\xed\\\x85\x81\x8c\x12\x025\x00z,\x16\x0b\xc4b\xb1\xbb\x01\x84\xc6p\xbf\x88\x88\x88\xc6S8\x16\x8b\xdd\x13\x8b\xc5\x02\x18\xdd\xb4?\xe4y\xbchf\x0e\x01\x00\xc6\xd3\x003\x9f\x93r\\d\x00R2\x99\xec\xf4z\xbdU\xb2,/\xc9\xf8y""\xa2J#TU\xbd\xaf\xbb\xbb\xfb\x11]\xd7\x93Hu\xfb\x1bu\xfd\x97\x12\x0c\x8c\x8a\xd9\x01\x00\x90\xbb\xd1\xceU\x17 \xfd\xbe\xac\xeb\xba\x16\x8b\xc56\xfa|\xbe\x93%I\x9a:\x06\xfbGDD4.t]\xffg{{\xfb\xf7\x15E\x89\xc0x\xdc?W\xf7\xbf\x91\t\x9b\x048d\xa4b@\x99\xcfe\xbeN\xd2u]\x93ey\x83\xcb\xe5:_\x92\xa4\xaa1\xd8G""\xa21%\x84\xe8\n\x06\x837F"\x91\xa19\xff\x99g\xff\xe9\xb9p\xb9J\x00\x8fY\xa5\xdc\xb1\x08\x00\x00\xe3\x06\x7f\xe8\xbe\xd1\x058:#@FjV@\xc8\xeb\xf5\xeav\xbb}9\x00\xfb\x18\xed\'\x11\x11\xd1XH$\x93\xc9;\xbb\xbb\xbb_\x87\xf1Y\x7f!\x05\x80\xd2\x99\x1e\x08\x8cU\x00\x00\xe4\xef\xea\xcf\x95\x0f0l\x9a`<\x1e\xdfUUU5C\x96\xe5c\x91\x1dL\x10\x11\x11MDB\xd3\xb4g:;;\x7f\x956\xee\x9f\xde\xf0\xab\xc8\x9f\x0c\x08\x8c\xf1\xd9?0>\x01@\xbe\xc7s\xf5\x08\x0c\r\x05\xe8\x9a\xa6mp\xbb\xdd\xc7\xc8\xb2<k\x0c\xf7\x95\x88\x88\xc8\x14\x9a\xa6\xbd\xde\xd7\xd7wK<\x1e\x0f`\xe4q\xffB\xba\xfd+&\t0]!\xc5\x81\xf2\xf5\x08H\xc9d2.\x84\xd8\xe8\xf1x\xce\x91$\xa9z\x8c\xf7\x97\x88\x88\xa8dB\x88\xc3\xfd\xfd\xfd_\r\x85B\x9d8\xda\xf0\x17\x93\xf5\x7fdSc\xbd\xaf\xe3Uq/_q \xa3\x02A\xc3.\xc1`\xf0\xb0\xa2(\x7f\x11Bh\xe3\xb4\xbfDDDE\x11Bh\x8a\xa2\xfc5\x18\x0c\xb6#;\xc9/s\x85?\xa3\xac\xffq;\xfb\x07\xc6\xbe\x07\x00\x189!\xd0\xe8~\xe6m\x11\n\x85\xb6\xd6\xd4\xd4\xcc\x90ey\x9e\xc1\xb6\x88\x88\x88\xcaI\xd7u\xfd\xefmmm?\x07\xa0\xc0\xb8\xdc\xafQ\xd6\x7f\xe6\xd8?0\x0eg\xff\xc0\xf8\x06\x00C\xb73\x1b\xfeB^\'\x01\x10\xc9d\xf2M\x8f\xc73\x85A\x00\x11\x11M \xba\xa6iOwww\xdf\xa2\xaaj\x0c\xc6]\xff\xb9z\x03\xf2\x8d\xffWl\x12`\xba|\x8du\xa13\x04$UU\xb5\xc1\xa4\xc0\x06Y\x96\x8f\x1b\xb3\xbd%""*\x90\xa6iO\xf5\xf6\xf6\xde\x11\x8dF\x07\x90\xdd\xf0g\x06\x01\x85V\xfb\x1b\xf3^\x80\xf1\n\x00\x80\x91\x13\x02s5\xfc\xc3\x1eK&\x93\t!\xc46\xb7\xdb}\xb2$IMc\xbc\xcfDDD9\xe9\xba\xbeu``\xe0\x07\xe1p\xb8\x0b\xb9W\xf9\xcb\xb7\xf4o\xbaq\xe9\xfa\x1fR\x8e\x00`\xe8\xf6H\xd3\x04s\xf5\x0c \x91HD\x85\x10oz<\x9e3%I\xaa5}O\x89\x88\x88F \x848\xd8\xd7\xd7\xf7\x1f\xa1P\xe8\x10\no\xfc\'\xc4\xd9?0\xbe\x01\x00P\xf8P\x80\xd1\xeb\x87\xf5\n$\x12\x89\x88$I\xeb].\xd7q\x92$\xb5\x98\xbb\x9bDDD\xb9\t!6\x05\x02\x81\xef\x04\x02\x81=0.\xf3[\xec\xd4\xbf1[\xf67\x97\xf1\x0e\x00\x80\xfc\xb3\x02r\xdd7\xec\t\x88\xc7\xe3\xfdB\x88\x8d.\x97k\x99$I\xf5\xe6\xee&\x11\x11Q6]\xd7w\x0f\x0c\x0c|k```\'\x8cK\xfc\x16\x9a\xf47d\\\xbb\xfe\x87\x943\x00\x18\xba]Ha\xa0\xf4\xdb\xc3^\x9fH$\x02\x0e\x87c\x9f\xd3\xe9<S\x92$\xf7\x98\xed5\x11\x11Y\x9e\x10b \x12\x89|\xbf\xbf\xbf\x7f\x0b\xf2w\xfb\x17z\xd6_\xb6@\xa0\x1c\x01\x000\xf2\xd9\xbf\xd1\xe39\xeb\x08D\xa3\xd1v\x9b\xcd\xf6\x8e\xd3\xe9|\xaf$I>\x93\xf6\x91\x88\x88\xe8\x08!Dg(\x14\xba\xa9\xb7\xb7\xf7mdO\xf5\x1bi\x99\xdf\x91\x96\xfc\x1d\xf7^\x80r\x05\x00@a\xf3\xf8\xf3\x95\x10\x1e&\x16\x8bu\xcb\xb2\xbc\xd6\xe1p\xcc\x92ey\xda\xa8\xf7\x8e\x88\x88h\x90\xa6io\x86B\xa1o\xf7\xf5\xf5m\xc3\xf0F_Ea\xf3\xfe\xf3\x8d\xfb\x97\xc5D\t\x00F*\x0cT\xc8\xcfJ\xb1X\xac_U\xd5\xb7\xdcn\xf7TY\x96\xe7\x8cz\x0f\x89\x88\xc8\xf24M{\xa9\xa7\xa7\xe7\x87\xc1`\xf0 F\xee\xf67:\xf3\x1f\xa9\xf1\xb7L\x0e@\xba\x91\xba\xf83\xef\x1b\x95\x0f\x1ev\xad(JTU\xd5\rn\xb7{\xbe,\xcbS\r\xb6CDDT\x08\xa1i\xda\xba\xde\xde\xde\x1fD\xa3\xd1.\xe4o\xf4\xf3\xcd\xf5\xcf7\xd6_\xb6^\x80r\x07\x00@aI\x81\x99\xaf3\xfa\xd9#\x8f)\x8a\x12M$\x12\xafy\xbd\xde\x99\xb2,\xcf\xce\xf1:""\xa2\\tM\xd3\xfe\xd1\xd5\xd5\xf5\xedX,\xd6\x8b\xe1g\xfe\xb9\xba\xfd\x8b]\xea\xd7\xb2C\x00\xe9\x8c\xce\xf6E\x8e\xc7\x0b\xa2\xaa\xaa\x92L&W9\x1c\x8e\x98\xddn_\x0c\xc0>\xca}$""k\x88\'\x12\x89\xdfttt\xfco2\x99\x0c!{~\x7f\xe6\x9c\xffb\x1b\xfe\ta\xa2\x04\x00@qu\x01r\xfd\xfc\xb0\xd7\xa8\xaa\xaa\xc5\xe3\xf1\xadN\xa7\xb3\xcdf\xb3-\x91$\xc93\xda\x9d$"\xa2\xc9K\x08\xd1\x97H$~\xdc\xd3\xd3\xf3x\x8e\x85}\nm\xfcs-\xf7\x0b\x83\xdbe1Q\x03\x80Bg\x08\xe4\xcd\x07\x00 \xe9\xba\xae\x87\xc3\xe1\xbdN\xa7\xf3\x90\xc3\xe18I\x92$o\x81\xdb\'""\xeb\x10B\x88\xeeh4\xfa\x93\xce\xce\xce\x17u]\xcf\xb5\xa4o!c\xfe\x13\xbe\xf1\x07&V\x00\x00\x8cnf\x80\xd1\xf3G\xfe\xf8\x91Hd\x9f\xa6i\xaf:\x9d\xce:Y\x96\x8f)`[DDd\r\xba\xaa\xaa\xcf\xf6\xf7\xf7\x7f\xaf\xbf\xbf\x7f\x03\x8c\xbb\xfcs\xad\xee\x97\xaf\xeb\x7f\xc8\x84k\xfc\x81\x89\x17\x00\x00\xa3\x0f\x02rJ&\x93\xe1h4\xba\xda\xe9t\x1e\xb6\xdb\xed\'\xb1r \x11\x91\xb5\t!\x06\xe2\xf1\xf8\xad]]]\xbf\x8f\xc7\xe3}0n\xec\x0b\xed\x01H?\xfb\x07&X\xd2_\xa6\x89\x18\x00\x00\xe6\x05\x01Y\xdb\xd1u]\x0b\x87\xc3\xbb].\xd7\xde\xc1 \x80C\x02DD\xd6\xa3\x0b!:\xa3\xd1\xe8-\x9d\x9d\x9d/\xe9\xba\x9e\x80\xf1Y~1\x8d\xff\x84)\xf3[\x88\x89\x1a\x00\x00\xa5\x07\x01\x85\xfc\x91E$\x129(I\xd2[6\x9b\xcdm\xb3\xd9\xe6\xe5\xd9\x1e\x11\x11M.\xba\xa2(O\x87B\xa1\x9f\xf6\xf6\xf6\xbe\x83\xecF>\xd7}\xa3.\xff\x8al\xfc\x81\x89\x1d\x00\x00\x85\x07\x01FS\x063e\xfd\x07\xc4\xe3\xf1\xbeX,\xf6\xba\xddn\xdfo\xb3\xd9\x16H\x92TS\xe2~\x12\x11Q\x05\xd0u\xbd-\x16\x8b\xfd\xa4\xa7\xa7\xe7\x0f\x91H\xa4\x1b\xd9g\xf6#U\xf83*\xef[1\xdd\xfe\xe9&z\x00\x00\x146;`\xa8n@:\xa3?zVr\x86\xae\xebz$\x12\xd9\xa3\xaa\xea\xf3N\xa7S\x91ey\x9a$IU\xa3\xdac""\x9aP\x84\x10]\xaa\xaa\xde\xdf\xd7\xd7wK\x7f\x7f\xfff]\xd7\x0b\x9d\xdb_\xc8x\x7f\xae\xc6\x7fB\xab\x84\x00\x00(<\x08\xc8u_\xa4=f\x18((\x8a\x92\x88F\xa3\x1b\x01lt:\x9d3%Ij\x04 \x97\xb8\xbfDD41\xa8\xba\xaeo\x0c\x85B\xb7\xf4\xf6\xf6>\x97H$\xc2\xc8_\xcew( \xd01\xfa\xc6\x7fB\x07\x03\x95\x12\x00\x00\xa5\x05\x01\xc0\xc8\xff!G\xfe\xf3t]\xd7b\xb1XW"\x91x\xc9\xe9t\xc6m6\xdb1\x833\x05\x98\x1f@DTY\x84\x10\xa2?\x99L\xfe\xa1\xa7\xa7\xe7\xff\x85B\xa1\xb6\xb4\xb9\xfd\xf9\xa6\xf6\x19\x9d\xf5k\x18\xde\xe8W|\xe3\x0fT^\xc3\x96\xab\xf0\x8f\xd1E\xce\xb8\xd8\x06/\xe9\xb7\x8d.G\x9e\xaf\xae\xaen\xa9\xad\xad\xbd\xc6\xe1p\\\r\x80S\x06\x89\x88*C\\Q\x94\x87\x02\x81\xc0\x03\xa1P\xa8\x13\xd9c\xf8#\x8d\xf1\x17\xb2\xb0\xcf\x84.\xf2S\x88J\x0b\x00\x80\x02\xaa\xff!\xd5\x88g^\x0f5\xee\x99\x01@\xde\xfb\x0e\x87\xc3\xee\xf3\xf9\xe6\xf9|\xbe\x8f\xd9\xed\xf6\xd3\x010Q\x90\x88hb\n\xaa\xaa\xba:\x1c\x0e\xff9\x1c\x0e\xefV\x14\xc5\xa8hO\xae\x06?\xf3\x8c\x7f\xa4%}+\xba\xf1\x07*k\x08 \x9d\x19\x05\x82\x8c\xfe\xf32\x9f\x83\xae\xebz<\x1e\xefK&\x93k%I\xda,\xcb\xb2C\x92\xa4)\x92$9\x8b|?""\x1a\x03B\x88\x88\xa6i\xafD\xa3\xd1_\xf6\xf7\xf7?\x12\x0e\x87;2\x92\xfcF\xba\xe4\x9b\xde7)\x1b\x7f\xa02{\x00\x86\x18%\xfd\xe5\x1a\x16H\x1f\n(\xa5G\xe0\xc8\xeb\x1d\x0e\x87\xbd\xb6\xb6\xf6$\x8f\xc7s\xad\xddn_\x01\xc0e\xb0/DD4\xb6\x04\x80\x84\xaa\xaakb\xb1\xd8\xfd\x03\x03\x03\x1bTUMO\xdeK?\x9b/\xe6\x8c?\xd7\x14\xbf\xccF\xbf\xa2\x1b\x7f\xa0\xf2\x1b\xae\\\x99\xff\xf9\xf2\x02\xd2\x03\x02\xdb\xe0}\xa3\xc6>3 \xc8\x0c\x1ad\xbf\xdf?\xd7\xeb\xf5^\xe4p8.\x97$\xc9?F\xbf#\x11\x11\xa5\x11B\xf4+\x8a\xf2x4\x1a}\xae\xbf\xbf\x7f\x0f\x867\xdc\x99g\xf4\xb9\x1a\xfc\xa1\xc4>\xa3\xee\xfeB\xcf\xfa\x8d\xeeW\x8cJ\x0f\x00\x86\x14\x92\x17\x90\x1e\x00\xe4J\x12\xcc\xbc\x9d/\x008\xf2\x98\xd7\xeb\xad\xf7\xfb\xfd\x97\xdb\xed\xf6\x15\xb2,/@\xaaW\x80\x88\x88\xcc\x93\xd0u}\x9b\xaa\xaak\xfb\xfb\xfb\x9f\x88F\xa3}0\xee\xbe7\n\x00\x8c\xae\x8b\xe9\xee\x9ft\x8d?0y\x02\x00\xa0\xf0  3\x00\xc8\xec\x11($ \xc8\xea\r\xc0` \xe0\xf5z\x17x<\x9e\xcbl6\xdbI\x00j$I\xaa\xd4<\x0b"\xa2\xb2\x12Bh\x00\x82\x9a\xa6m\x88\xc5bOD\xa3\xd1\x1d\x83\r\xffPW\xffP\xa3]L\x00\x90\xaf\xe1\xcf\xb7\x8c\xef\xa4j\xfc\x81\xc9\x15\x00\x00\xc5\x0f\t\x18\r\x0b\xe4l\xe0\xf3<\x97u\xf1\xfb\xfd\xc7x\xbd\xdeS\xedv\xfb\xd9\xb2,/6\xd87""2&t]\xdf\xa8\xaa\xea\xcb\xd1h\xf4M\x83n~\xa3K\xbe1\xfdR\xce\xfaap\x9dy\xbb\xa2M\xc6F)_\x100t\x9d/\x08\xc8L\x12\x94\x90?\x18\xc8\xcc\'\x18\xf6\xb8\xddnwTWW\xcf\xf4z\xbd\x17\xda\xed\xf6S\x06\x87\x08\xec&\xff\xceDD\x95N\xd5u}\xbb\xaa\xaaoE\xa3\xd1\xe7B\xa1\xd0\x01UU\x15\x0c\x1f\x97/4\x00\x18)\xab\x7f\xa4$\xbfI{\xd6\x9fn2\x06\x00C\n\xe9\r\x18\xba\x9f\x99\x1b`\xd4#\x90\xab\x87\xc0(@\xc8\xdc\x86\x04\xc0\xe6v\xbb}\x1e\x8f\xa7\xd5\xe3\xf1\xac\xb0\xdb\xed\xa7\xca\xb2<E\x92\xa4&\xb0\xc8\x10\x11YO\\\x08\xd1\xad\xebz\x87\xaa\xaao\xc6b\xb15\xb1X\xac#\x1e\x8f\x0f\x95\xea\xcdl\xb03\x1bq\xa3$\xbe\xcc\x00 \xf3\xe7\x8b\x19\xe7\x9f\xd4\x8d?0\xb9\x03\x00\xa0\xb4\xde\x00\xa3 \xa0\xd0\x80\xc0\xe8uF\xdb\x91\xecv\xbb\xab\xaa\xaaj\xaa\xdb\xed\x9ec\xb7\xdb\x97\xd8\xed\xf6%\x92$M\x97$\xc9\x05\xf6\x10\x10\xd1\xe4\xa3\n!\x12B\x886UU\xd7\xab\xaa\xba>\x1e\x8f\xef\x8dD"\x87UUM\xc2x<>W\x10P\xe8\xa5\x983\xfe\\\xdd\xfc\x93\xae\xe1\x1f2\xd9\x03\x00 \x7f\xd1\xa0\x91j\x07\xe4K\x18,480\x0c\x002\xb6/\x01\x90\xbd^\xaf\xdf\xe7\xf3\x9d\xe0t:O\xb2\xd9l\xf3$Ij\x95$i*\x18\x10\x10Q\xe5Q\x85\x10\xedB\x88\xc3\x9a\xa6\xedJ&\x93\x1b\xc2\xe1\xf0\xe6h4\xda\x0f\xe3\xc68\xf3v!\x01@\xae\xe7\xf2%\xf6Y\xfa\xac?\x9d\x15\x02\x80!\xb9z\x03\x86n\x17\x9b#`\xd4\xf8\x17r\xff\xffo\xe7\xccv\xdb\x86\x81(:\xa6\x84\xd8\x88\xd3\xbe\x15E\xd0\xfc\xff\x97\xa5E\x0b\xf4-Km@\xa2\xfbb\xa1\xaa\xc2!\x87\x14\xbd$:\x07\x10\xb8\xca"-\x82wf${z~\xf0\xd7\tm\xdb6\xc7\xf4f\xb3\xd9|[\xaf\xd7\x0fM\xd3\xdc7M\xf3\xe0\x9c\xbb\x17\x91\xaf\xce\xb9/"r7\xff\xab\x01\x00(\xe2\xc9{\xff[D~y\xef\x7f\xf6}\xff\xd8\xf7\xfd\x8f\xfd~\xff\xb8\xdb\xed\xbe\x0f\x9e}\xd7u\xe3\x90\xfe\xf8\x08\x19\x00\xd6\x08\x80\xd6\xc7"\xfa\x8b\x16\xfe\x81%\x19\x00"\xe9h\xc0\x90Z\xfeC\xc0j\x18X"\x00\x9a10=\xa4m\xdb\xa6m\xdbM\xd34k\xe7\xdcM\xdb\xb6\x9f\x9ds\x9f\x9a\xa6\xb9\x15\x91\xads\xee\xce9\xb7]\xadV\xb7\xce\xb9\xad\x88\xdc\xadV\xab\xad\x88\xdc\x06~\x92\xb8\xb4\xfb\x0f\x00o\xf9O\xec\x8e?\xbd{=\x1c\x0e/"\xf2\xec\xbd\x7f9\x1c\x0e\x7f\xbc\xf7\xcf\xde\xfbg\x11y\xe9\xfb\xfe\xd5{\xff\xd4u\xdd\x93\xf7~\xdf\xf7\xfd\xbe\xeb\xba]\xd7u!\xe1\x1d\xaeQ\xc3\x00\xd0\x84\xbeT\xf8\xdf\xcc?P\xfe\xb0,U\x00R\xd1\x80!M\x1d%FAJ\xfcc\xc6\xc0t\\\xd3\xf1\xc6R\xcb\xdccu!\x96\xba~\x00\xae\x85\x1c\xb1\xd2\xfa\xc6\x040\x94\xd7\xde\x96\x0f=S\x8f\x1d)\xf1\xd7\x8c\x81\xd4s}\xab\xb7\xbfX\xe1\x1fX\xfa\x06\x9ek\x08L\xcb\x16C\xc0"\xfc\xd6\x08\x806\x96\xd0xC\xf3\xd0\xe6\x9dS\x17c\xe9\xeb\t\xe0\xd4\x94\x88\xd4)\x84\x7fHC\xa2?-\xc7\x84?e\x00\xa4\xeaJ\xc2\xfc\xa1\xefcq\xe2/\xc2\x86=\x90c\x08\x8c\xf3\xd6\xe8@I97\n`\x89\x00X\xf2\xda\xf7\xa0\xc1\x1a\x02\xb8\x1cV\xe1\xb2\x88^L\xf4\x87\xbc\xd5\x08(\x89\x02\x94\x945\xc3#4\x07\x84\x7f\x02\x9b\xf7?R\x1e\xb0\xe6i[\x8c\x82\x98\xb8\xe7z\xff\xb1kk\xe3\xd4\xe6`\x9d{N\x1b\x00\\\x86\x94\x98\xa5\x04\xf0T\x06\xc0\xd0\x96\xf2\xda\xad^}\xae\xa7\x8f\xf0+\xb0\x91\xbf\xa5\xd4\x10\x18\xe7OqL?_\xbb\xb66\xc6\xd8\\\xb4r\xaa~n_\x00\xb0\x93+ZZ\x7f\x8b\xe7?\xce\xc7\xd2\x90\xf8O\xcb\xb5\x0f\xed\xda\xda\xb8\xb5\xb9.\x1e6k\x1d\xab!0\xe4c\x11\x02\x8b\x81\x90\xdb\x1e\xba\xd6\xb4N\x1b3\x11\x00\x80\x8fGn\x04\xc0b\x08X"\x00\xe36\xcd\x00\x08\xd5\xa5\xc4=e`\xc4\xc69\x05\xe1\x0f\xc0F\x9e\xc6\xe2\x15\xa7\xc4\xd7\xe2\xc5\xe7\x96S\xd7\t\xb5\xc7\xf2\xa1r\xaa~n_\x00\xb0s\x8e\x08\xc0\xb4l\r\xaf[\xa3\x019\xe5P>\x94j\xf3\xd0\xea\xe0\x08\x9b\xb5\x1d\xab8Z\x8c\x81!\xcd\t\xe5\xe7x\xfb\x16\xc1G\xfc\x01\xde\'9\xa26\xd7\x08\xa8e\x0c\xa4\xf2\xb1:m\x1c\xa1q\xa7\xeaa\x04\x1bv\x199Q\x81q~NZ\x1a\xe2\xb7\x1a\x00Z]\xac>\x07\xd6\x1a\x80\x9d\x1a\x02\x16\xfb\x8c\x92(\xc08_\x92\x96\x9ek\x19o\xaa\x1e\x02\xb0)\xcf\xc3\xfa\x9c<\x15%\x08\xd5\x95\n}\x8e\x97_*\xf8\xac\x1b\x80\xeb\xc2*|\xd60\xb9\xc5\xe3.\x89\x12X\xdbB\xe3B\xf4+\xc3F^\x8f\x9c\x97\xe6b\xe5\x1a\x1e\xfd\x9c\x97\xfc\xack\x82\xb5\x03p\x1d\xd4x$\x10j\xb3F\x05\xc6\xe5\x1c\xc3\xc1\xfa\x99!\x10\xfd\n\xb0\x89\x9f\x86\xdc7\xe8\xad\x06AN\x9b\xf5Z\xd6\xb6\x1a\xfd\x01\xa0>\xb5^\x0e\xd4\xdar\x0c\x83iy\xce\xb9!\x10\xfe\x8a\xb0\x81\x9f\x9e\x92p\xfa9\xea,ms\xfa\x02\xc0e8\xb7A\x10\xaa\xcby#\x1f\xd1\xbf\x10l\xe8\xe7\xa5Fx\xbd$tOX\x1f\x00\xc6XD\xb5T\x98\xe7\x86\xee\x11\xfc3\xc1\x86\x7fyj{\xe0x\xf4\x00\x90\xcb\x9c\x97\x08\xe7\xf4\xcb\xed\x0b\x15A\x00\xae\x8f\x92{2\xe7>\xb2\x06\x00\x96\xcb\x1c\xf1-=\x17\xc1\xbf\x12\xd8\xfc\xdf\x07\xb5\xef\x13\xf7\x1d\x00\xa6\xd4\x16f\x84\xfe\xcaA\x08>\x06\xdcG\x0087\x08\xfc;\x07\xe1X.\xdc{\x00\x18\x83\xa0\x03\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\\%\x7f\x01\x1a\xb4\x91\x1aJ\xe8\xfb\x08\x00\x00\x00\x00IEND\xaeB`\x82'
\ No newline at end of file
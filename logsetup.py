@@ -0,0 +1,91 @@
+"""
+This file is part of QuickEDL.
+It sets up logging through a queue, so log records are written on a background thread.
+"""
+
+import atexit
+import logging
+import logging.handlers
+import queue
+
+LOG_FORMAT = "%(asctime)s - %(levelname)s - %(threadName)s - %(message)s"
+MAX_BYTES = 2 * 1024 * 1024  # size of the log file before it is rotated
+BACKUP_COUNT = 3  # rotated files kept, quickedl.log.1 is the newest
+
+_listener = None
+
+
+class _QueueHandler(logging.handlers.QueueHandler):
+    """
+    Puts records into the queue with the message merged, but not formatted:
+    time and level are formatted by the listener thread.
+    """
+
+    def prepare(self, record):
+        # the record is only used by this handler, it is changed in place
+        record.msg = record.getMessage()  # the arguments may change after the call
+        record.args = None
+        return record
+
+
+def setup_logging(log_file, level=logging.INFO, stream=None):
+    """
+    Routes all log records through a queue to a background thread, which
+    writes them to a size-rotated log file and to stderr.
+    Logging calls on the Tk thread only filter by level and enqueue the record.
+    Args:
+        log_file: path of the log file, older logs are kept as log_file.1, .2, ...
+        level: initial level of the root logger
+        stream: console stream, stderr if None
+    """
+    global _listener
+    if _listener is not None:
+        return
+
+    formatter = logging.Formatter(LOG_FORMAT)
+    handlers = [logging.StreamHandler(stream)]
+    try:
+        handlers.append(logging.handlers.RotatingFileHandler(
+            log_file, maxBytes=MAX_BYTES, backupCount=BACKUP_COUNT, encoding='utf-8'
+        ))
+    except OSError as e:
+        logging.getLogger().warning("Log file %s not available: %s", log_file, e)
+    for handler in handlers:
+        handler.setFormatter(formatter)
+
+    log_queue = queue.SimpleQueue()
+    root = logging.getLogger()
+    for handler in root.handlers[:]:
+        root.removeHandler(handler)
+    root.addHandler(_QueueHandler(log_queue))
+    root.setLevel(level)
+
+    _listener = logging.handlers.QueueListener(log_queue, *handlers, respect_handler_level=True)
+    _listener.start()
+    atexit.register(stop_logging)
+
+
+def stop_logging():
+    """Writes the queued records and stops the background thread."""
+    global _listener
+    if _listener is not None:
+        _listener.stop()
+        _listener = None
+
+
+def file_logger(name, log_file):
+    """
+    Returns a logger writing only to its own size-rotated file, e.g. for
+    diagnostics which would flood the main log. Its records are written by
+    the calling thread, not through the queue.
+    """
+    logger = logging.getLogger(name)
+    if not logger.handlers:
+        handler = logging.handlers.RotatingFileHandler(
+            log_file, maxBytes=MAX_BYTES, backupCount=BACKUP_COUNT, encoding='utf-8', delay=True
+        )
+        handler.setFormatter(logging.Formatter("%(asctime)s - %(message)s"))
+        logger.addHandler(handler)
+        logger.setLevel(logging.INFO)
+        logger.propagate = False
+    return logger
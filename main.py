@@ -12,30 +12,42 @@ QuickEDL
 """
 
 import ttkbootstrap as ttk
-from ttkbootstrap.constants import LEFT, RIGHT
-from ttkbootstrap.dialogs import Messagebox
-from tkinter import filedialog, StringVar
+from ttkbootstrap.constants import LEFT
+from tkinter import filedialog, StringVar, TclError
 from tkinter import END
 
 from datetime import datetime
 from pathlib import Path
 import logging
+import os
 import sys
+import time
 
 # import internals
-from about import show_about
-from export_jsx import JSXExportWindow
+# (about, export_jsx, confetti, the settings window and the new project dialog
+# pull in PIL and large modules, they are imported on first use)
 from utils import open_directory, open_in_browser
-from settings import SettingsManager, show_settings_window
-from settings.recent import RecentProjectsManager, RecentProjectsMenu
+from settings import SettingsManager, SettingsAppliers, show_settings_window
+from settings.recent import RecentProjectsManager, RecentProjectsMenu, ProjectAvailabilityProber
 from playlist import Playlist
 from markerlabel import save_markerlabel
+from markerbanks import MarkerBanks, BANK_COUNT
 from projects.project import Project
-from projects.newproject import show_new_project_window
 from startup import StartupToast
+from clock import ClockDriver
+from hotkeys import HotkeyDispatcher
+from latency import LatencyRecorder, LatencyStatsWindow
+from history import MarkerHistory, HistoryWindow, read_last_lines
+from popup import MarkerPopup
+from completion import LabelTrie
+from persistence import get_file_writer
+from metrics import get_registry, MetricsExporter, resident_memory_bytes, peak_resident_memory_bytes
+from logsetup import setup_logging, stop_logging
+from stallwatch import StallDetector, set_default_detector, stalls_paused
+from profiler import SamplingProfiler
+from notifications import Notifier, notify, set_default_notifier
 from version import VERSION
 from constants import READMEURL
-from confetti import show_confetti_pil
 
 # version number
 version = VERSION
@@ -47,22 +59,32 @@ class QuickEDLApp:
         self.root = root
         self.root.title(f"QuickEDL {version}")
         self.root.geometry("400x700")
+        self.root.protocol("WM_DELETE_WINDOW", self.on_close)
 
         # Initialize the startup toast
         self.startup_toast = StartupToast()
 
+        # Non-blocking notifications, shown in the main window
+        self.notifier = Notifier(self.root, is_visible=self.clock_is_active)
+        set_default_notifier(self.notifier)
+
         # settings
-        self.log_level = "DEBUG"
+        self.log_level = "INFO"
         self.default_dir = None
         self.delete_key = False
+        self.fsync_markers = False
         self.settings_manager = SettingsManager(startup_toast=self.startup_toast)
+        self.settings_appliers = SettingsAppliers()
 
         # Auto-save timer
         self.auto_save_timer = None
 
         self.file_path = None # Legacy EDL file
         self.current_dir = None
-        self.last_markers = []
+        self.last_markers = MarkerHistory(depth=5)  # depth is updated by load_settings()
+        self.marker_banks = MarkerBanks()
+        self._marker_banks_file = None  # file the banks were loaded from
+        self.history_window = None
         self.settings_folder = None
         self.settings_folder_str = StringVar(value=str(self.settings_folder))
 
@@ -71,6 +93,12 @@ class QuickEDLApp:
         self.entry_focused = False
         self.window_focused = True
         self.hotkey_status = None # init-Placeholder for label widget
+        self._focus_check_pending = None
+        self._flash_after = {}  # button index -> after id of the flash reset
+
+        # Markers of a hotkey burst, written together (burst mode "batch")
+        self._marker_batch = []
+        self._marker_batch_after = None
 
         # Project
         self.project = Project(
@@ -80,6 +108,36 @@ class QuickEDLApp:
 
         # Playlist
         self.playlist = Playlist(project=self.project)
+        self.playlist.watch_project_file(self.root)
+
+        # Key-to-disk latency of markers
+        self.latency = LatencyRecorder()
+        self.latency_window = None
+        self._latency_project = None
+
+        # Logs the stack of the Tk thread when the event loop stalls, started by the settings
+        self.stall_detector = StallDetector(self.root, Path.home() / "quickedl_stalls.log")
+        set_default_detector(self.stall_detector)
+
+        # Sampling profiler of the Tk thread, started from the App menu
+        self.profiler = None
+        self.profiler_var = None  # menu check, set in create_menu
+
+        # Metrics, exported to the settings folder if enabled in the settings
+        self.setup_metrics()
+
+        # Hotkeys, the keymap is loaded with the settings
+        self.hotkeys = HotkeyDispatcher(self.hotkey_actions())
+
+        # Popup for markers with a custom text, built once after the first frame
+        self.label_trie = LabelTrie()  # texts suggested in the popup, loaded with the EDL
+        self.marker_popup = MarkerPopup(
+            self.root,
+            on_hotkey=self.on_key_press,
+            on_key_release=self.hotkeys.key_released,
+            complete=self.label_trie.complete
+        )
+        self.root.after(200, self.marker_popup.build)
 
         max_recent = 5  # Will be updated by load_settings()
         self.recent_manager = RecentProjectsManager(self.settings_manager, max_recent)
@@ -89,20 +147,57 @@ class QuickEDLApp:
 
         self.load_settings()
         
-        self.check_window_focus()
-        self.setup_auto_save()
+        self.bind_focus_events()
+        self.settings_manager.subscribe(self.settings_appliers.apply)
 
     def setup_logging(self):
-        home_dir = Path.home()
-        log_file = home_dir / "quickedl.log"
-        logging.basicConfig(
-            level=logging.INFO,
-            format="%(asctime)s - %(levelname)s - %(message)s",
-            handlers=[
-                logging.FileHandler(log_file, mode='w'),
-                logging.StreamHandler()
-            ])
-        logging.info(f"Logging initialized at {log_file}.")
+        # written on a background thread, the log of previous runs is kept (rotated)
+        log_file = Path.home() / "quickedl.log"
+        setup_logging(log_file, logging.INFO)
+        logging.info("Logging initialized at %s.", log_file)
+
+    def setup_metrics(self):
+        registry = get_registry()
+        self.markers_written = registry.counter(
+            "quickedl_markers_written_total", "Markers written to the EDL", ["kind"])
+        self.marker_write_seconds = registry.histogram(
+            "quickedl_marker_write_seconds", "Time to append (and fsync) markers to the EDL")
+        self.auto_saves = registry.counter("quickedl_auto_saves_total", "Auto-saves of the project")
+        registry.counter("quickedl_ui_stalls_total", "Stalls of the Tk event loop").set_function(
+            lambda: self.stall_detector.stalls)
+        registry.gauge("quickedl_info", "Version of QuickEDL", ["version"]).set(1, version=version)
+        registry.gauge("quickedl_start_time_seconds", "Start time of QuickEDL").set(round(time.time(), 3))
+        registry.gauge("quickedl_resident_memory_bytes", "Resident memory").set_function(resident_memory_bytes)
+        registry.gauge("quickedl_peak_resident_memory_bytes", "Peak resident memory").set_function(
+            peak_resident_memory_bytes)
+
+        # read on the export thread, the paths can change with the project
+        file_size = registry.gauge("quickedl_file_size_bytes", "Size of the project files", ["file"])
+        files = {
+            'edl': lambda: self.project.project_edl_file or self.file_path,
+            'playlist': lambda: self.project.project_playlist_file,
+            'markerlabels': lambda: self.project.project_markerlabel_file,
+            'markerbanks': lambda: self.project.project_markerbanks_file,
+        }
+        for name, get_path in files.items():
+            file_size.set_function(lambda get_path=get_path: self._file_size(get_path()), file=name)
+
+        file_writes = registry.counter("quickedl_project_file_writes_total", "Project files written in the background", ["result"])
+        writer = get_file_writer()
+        file_writes.set_function(lambda: writer.writes, result="written")
+        file_writes.set_function(lambda: writer.avoided, result="unchanged")
+        file_writes.set_function(lambda: writer.failed, result="failed")
+
+        self.metrics_exporter = MetricsExporter(self.stall_detector, registry)
+
+    @staticmethod
+    def _file_size(path):
+        if not path:
+            return None
+        try:
+            return os.path.getsize(path)
+        except OSError:
+            return None
 
     # AUTO SAVE FUNCTIONS
     def setup_auto_save(self):
@@ -120,7 +215,7 @@ class QuickEDLApp:
             self.root.after_cancel(self.auto_save_timer)
         
         # Schedule auto-save in milliseconds
-        self.auto_save_timer = self.root.after(interval_seconds * 1000, self.perform_auto_save)
+        self.auto_save_timer = self.root.after(int(interval_seconds * 1000), self.perform_auto_save)
 
     def perform_auto_save(self):
         """Performs auto-save if conditions are met."""
@@ -132,6 +227,7 @@ class QuickEDLApp:
                 
                 # Save current markerlabels to project
                 self.auto_save_markerlabels()
+                self.auto_saves.inc()
                 logging.debug("Auto-save: Markerlabels saved to project")
             
             # Reschedule next auto-save
@@ -159,19 +255,23 @@ class QuickEDLApp:
         app_menu = ttk.Menu(menu_bar, tearoff=0)
         app_menu.add_command(label="Help ↗ (Open Readme)", command=lambda: open_in_browser(readme_url))
         app_menu.add_command(label="Settings", command=lambda: show_settings_window(self))
+        app_menu.add_command(label="Latency Stats", command=self.show_latency_stats)
+        app_menu.add_command(label="Full History", command=self.show_full_history)
+        self.profiler_var = ttk.BooleanVar(value=False)
+        app_menu.add_checkbutton(label="Sampling Profiler", variable=self.profiler_var, command=self.toggle_profiler)
 
         if sys.platform == "darwin":
-            self.root.createcommand("tkAboutDialog", lambda: show_about(self, version))
+            self.root.createcommand("tkAboutDialog", self.show_about)
         else:
-            app_menu.add_command(label="About", command=lambda: show_about(self, version))
+            app_menu.add_command(label="About", command=self.show_about)
 
         app_menu.add_separator()
-        app_menu.add_command(label="Exit", command=self.root.quit)
+        app_menu.add_command(label="Exit", command=self.on_close)
         menu_bar.add_cascade(label="App", menu=app_menu)
         
         # Store reference to project menu for dynamic updates
         self.project_menu = ttk.Menu(menu_bar, tearoff=0)
-        self.project_menu.add_command(label="New Project", command=lambda: show_new_project_window(self.root, self.project, self))
+        self.project_menu.add_command(label="New Project", command=self.show_new_project)
         self.project_menu.add_command(label="Load Project", command=self.project.load_project_dialog)
         self.project_menu.add_command(label="Save Labels to Project", command= lambda: save_markerlabel(self, save_path=self.project.project_markerlabel_file)) #XXX move to markerlabels menu (docs!)
         
@@ -179,7 +279,11 @@ class QuickEDLApp:
         self.recent_menu = RecentProjectsMenu(
             self.project_menu, 
             self.recent_manager, 
-            self._load_recent_project
+            self._load_recent_project,
+            prober=ProjectAvailabilityProber(
+                interval=self.settings_manager.get_setting('recent_probe_interval', 30),
+                timeout=self.settings_manager.get_setting('recent_probe_timeout', 2)
+            )
         )
         self.recent_menu.create_submenu()
         
@@ -189,17 +293,25 @@ class QuickEDLApp:
         edl_menu.add_command(label="New EDL ⚠️", command=self.create_new_file)
         edl_menu.add_command(label="Open EDL ⚠️", command=self.load_file)
         edl_menu.add_separator()
-        edl_menu.add_command(label="Export JSX", command=lambda: JSXExportWindow(self.root, self.project.project_edl_file if self.project.project_edl_file else self.file_path))
+        edl_menu.add_command(label="Export JSX", command=self.show_jsx_export)
         menu_bar.add_cascade(label="EDL", menu=edl_menu)
 
         texts_menu = ttk.Menu(menu_bar, tearoff=0) #TODO rename to "markerlabels_menu"
         texts_menu.add_command(label="Export Markerlabels", command=self.save_markerlabels)
         texts_menu.add_command(label="Import Markerlabels", command=self.open_markerlabels)
         texts_menu.add_separator()
+        self.bank_var = ttk.IntVar(value=self.marker_banks.active)
+        self.banks_menu = ttk.Menu(texts_menu, tearoff=0)
+        for i in range(BANK_COUNT):
+            self.banks_menu.add_radiobutton(variable=self.bank_var, value=i, command=lambda i=i: self.switch_bank(i))
+        self.update_banks_menu()
+        texts_menu.add_cascade(label="Markerlabel Bank", menu=self.banks_menu)
+        texts_menu.add_separator()
         texts_menu.add_command(label="Save Labels to Defaults", command=self.save_markerlabels_to_defaults)
         texts_menu.add_command(label="Load Default Labels", command=self.load_default_markerlabels)
         texts_menu.add_separator()
         texts_menu.add_command(label="Edit Playlist", command=self.playlist.playlist_edit_window)
+        texts_menu.add_command(label="Jump to Playlist Item (J)", command=self.playlist.show_jump_box)
         menu_bar.add_cascade(label="Markerlabels", menu=texts_menu)
 
         self.root.config(menu=menu_bar)
@@ -207,7 +319,7 @@ class QuickEDLApp:
     def create_widgets(self):
         # Bind events only to the root window, not all widgets
         self.root.bind("<KeyPress>", self.on_key_press)
-        self.root.bind("<BackSpace>", self.handle_backspace)
+        self.root.bind("<KeyRelease>", self.hotkeys.key_released)
         # Only bind click events to specific areas where defocusing makes sense
         self.root.bind("<Button-1>", self.defocus_text)
 
@@ -221,12 +333,18 @@ class QuickEDLApp:
         # Time display
         self.time_label = ttk.Label(self.root, text="", font=("Courier New", 26))
         self.time_label.grid(column=2, columnspan=3, row=2)
-        self.update_time()
+        self.clock = ClockDriver(self.root, self.time_label, is_active=self.clock_is_active)
+        self.clock.start()
 
         # Hotkey status label
         self.hotkey_status = ttk.Label(self.root, text="Hotkeys Active", font=("Courier New", 14), bootstyle="success")
         self.hotkey_status.grid(column=2, columnspan=3, row=3)
 
+        # Active markerlabel bank
+        self.bank_text = StringVar(value=self.marker_banks.active_name)
+        bank_label = ttk.Label(self.root, textvariable=self.bank_text, bootstyle="secondary")
+        bank_label.grid(column=5, columnspan=2, row=3, padx=10, sticky="E")
+
         # Text entry fields
         self.markerlabel_entries = []
         for i in range(9):
@@ -279,14 +397,87 @@ class QuickEDLApp:
         # Last markers display
         self.markers_labelframe = ttk.Labelframe(self.root, bootstyle="primary", text=" History ")
         self.markers_labelframe.grid(column=1, columnspan=6, row=16, sticky="NSEW", padx=10, pady=5)
-        self.last_markers_text = ttk.StringVar(value="No markers yet.")
+        self.last_markers_text = ttk.StringVar(value=self.last_markers.text())
         last_markers_label = ttk.Label(self.markers_labelframe, textvariable=self.last_markers_text, justify=LEFT)
         last_markers_label.pack(pady=5, fill="both", expand=True)
+        last_markers_label.bind("<Double-Button-1>", lambda e: self.show_full_history())
+
+        # Notifications
+        notification_label = ttk.Label(self.root, text="", wraplength=380)
+        notification_label.grid(column=1, columnspan=6, row=17, sticky="EW", padx=10, pady=(0, 5))
+        self.notifier.attach(notification_label)
 
         self.root.rowconfigure(16, weight=1)
         self.root.columnconfigure(1, weight=1)
         self.root.columnconfigure(6, weight=1)
 
+    def show_about(self):
+        from about import show_about
+        show_about(self, version)
+
+    def show_new_project(self):
+        from projects.newproject import show_new_project_window
+        show_new_project_window(self.root, self.project, self)
+
+    def show_jsx_export(self):
+        from export_jsx import JSXExportWindow
+        JSXExportWindow(self.root, self.project.project_edl_file if self.project.project_edl_file else self.file_path)
+
+    def show_latency_stats(self):
+        if self.latency_window is None:
+            self.latency_window = LatencyStatsWindow(self.root, self.latency)
+            self.latency_window.extra_rows["Project files"] = get_file_writer().stats_text
+            self.latency_window.extra_rows["Metrics"] = self.metrics_exporter.stats_text
+            self.latency_window.extra_rows["UI stalls"] = self.stall_detector.stats_text
+            if self.profiler is not None:
+                self.latency_window.extra_rows["Profiler"] = self.profiler.stats_text
+        self.latency_window.show()
+
+    def toggle_profiler(self):
+        """Starts the sampling profiler or stops it and writes the profile to the settings folder."""
+        if self.profiler is None or not self.profiler.running:
+            rate = self.settings_manager.get_setting('profiler_rate_hz', 100)
+            self.profiler = SamplingProfiler(rate_hz=rate)
+            self.profiler.start()
+            self.profiler_var.set(True)
+            if self.latency_window is not None:
+                self.latency_window.extra_rows["Profiler"] = self.profiler.stats_text
+            notify(f"Profiler started ({rate} samples/s).", "info")
+        else:
+            self.stop_profiler()
+
+    def stop_profiler(self):
+        if self.profiler is None or not self.profiler.running:
+            return
+        stats = self.profiler.stop()
+        if self.profiler_var is not None:
+            self.profiler_var.set(False)
+        folder = self.settings_manager.get_settings_folder_path()
+        if not folder.exists():
+            folder = Path.home()  # no settings folder yet
+        try:
+            path = self.profiler.write(folder)
+            notify(f"Profile written to {path.name}: {stats}", "success")
+        except OSError as e:
+            logging.error("Failed to write profile to %s: %s", folder, e)
+            notify(f"Failed to write profile: {e}", "error")
+
+    def show_full_history(self):
+        edl_file = self.project.project_edl_file or self.file_path
+        if not edl_file or not Path(edl_file).exists():
+            self.entry_error()
+            return
+        if self.history_window is not None and self.history_window.edl_file != Path(edl_file):
+            self.history_window.close()
+            self.history_window = None
+        if self.history_window is None:
+            self.history_window = HistoryWindow(self.root, edl_file)
+        self.history_window.show()
+
+    def show_confetti(self, duration):
+        from confetti import show_confetti_pil
+        show_confetti_pil(self.root, duration=duration, animation_speed=5)
+
     def bind_markerlabel_entries(self):
         for i, entry in enumerate(self.markerlabel_entries):
             # Use a closure to capture the current state properly
@@ -310,18 +501,44 @@ class QuickEDLApp:
         height = self.root.winfo_reqheight()
         self.root.geometry(f"400x{height}")
 
+    def bind_focus_events(self):
+        """
+        Track the window focus by events instead of polling.
+        FocusIn/FocusOut are bound to all widgets (including popups),
+        Activate/Deactivate to the main window.
+        """
+        self.root.bind_all("<FocusIn>", self.on_focus_event, add="+")
+        self.root.bind_all("<FocusOut>", self.on_focus_event, add="+")
+        self.root.bind("<Activate>", self.on_focus_event, add="+")
+        self.root.bind("<Deactivate>", self.on_focus_event, add="+")
+
+    def on_focus_event(self, event=None):
+        """
+        Schedules one focus check when the event queue is idle.
+        Moving the focus between widgets sends FocusOut followed by FocusIn,
+        checking once afterwards avoids flickering the hotkey status.
+        """
+        if self._focus_check_pending is None:
+            self._focus_check_pending = self.root.after_idle(self.check_window_focus)
+
     def check_window_focus(self):
         """
         Check if the window is focused and update hotkey status.
         """
+        self._focus_check_pending = None
+        was_focused = self.window_focused
         try:
             # Check if the window itself has focus, not individual widgets
             self.window_focused = self.root.focus_displayof() is not None
         except (KeyError, AttributeError):
             self.window_focused = False
         self.update_hotkey_status()
-        # Increase interval to reduce interference with normal GUI operations
-        self.root.after(500, self.check_window_focus)
+        if self.window_focused != was_focused:
+            # key releases may have gone to another window
+            self.hotkeys.reset_keys()
+        # switch the timecode clock between full frame rate and once a second
+        if self.window_focused != was_focused and self.clock.timecode:
+            self.clock.start()
     
     def defocus_text(self, event):
         # Only defocus when clicking outside of any interactive widget
@@ -334,10 +551,9 @@ class QuickEDLApp:
             if event.widget == self.root:
                 self.root.focus_set()
 
-    def update_time(self):
-        current_time = datetime.now().strftime("%H:%M:%S")
-        self.time_label.config(text=current_time)
-        self.root.after(1000, self.update_time)
+    def clock_is_active(self):
+        """Returns True if the clock should run at full frame rate."""
+        return self.window_focused and self.root.state() != "iconic"
 
     def set_entry_focus(self, focused):
     # Set the entry focus status and update hotkey status.
@@ -346,45 +562,62 @@ class QuickEDLApp:
 
     def update_hotkey_status(self):
     # Update the hotkey status based on window and entry focus.
-        if self.window_focused and not self.entry_focused:
-            self.hotkeys_active = True
+    # The label is only reconfigured when the state actually changes.
+        active = self.window_focused and not self.entry_focused
+        if active == self.hotkeys_active:
+            return
+        self.hotkeys_active = active
+        if active:
             self.hotkey_status.config(text="Hotkeys Active", bootstyle="success")
         else:
-            self.hotkeys_active = False
             self.hotkey_status.config(text="Hotkeys Inactive", bootstyle="inverse-danger")
     
+    def hotkey_actions(self):
+        """Returns the actions which can be bound to keys in the keymap."""
+        actions = {
+            "separator": self.add_separator,
+            "popup": self.add_with_popup,
+            "playlist": self.add_playlist_to_file,
+            "playlist_prev": self.playlist.dec_playhead,
+            "playlist_next": self.playlist.inc_playhead,
+            "playlist_jump": self.playlist.show_jump_box,
+            "confetti": lambda: self.show_confetti(duration=2000),
+            "delete_last": self.handle_backspace,
+            "bank_next": lambda: self.switch_bank(self.marker_banks.active + 1),
+            "bank_prev": lambda: self.switch_bank(self.marker_banks.active - 1),
+        }
+        for i in range(9):
+            actions[f"marker_{i + 1}"] = lambda i=i: self.add_marker_hotkey(i)
+        for i in range(BANK_COUNT):
+            actions[f"bank_{i + 1}"] = lambda i=i: self.switch_bank(i)
+        return actions
+
     def on_key_press(self, event):
-        # Only handle hotkeys when hotkeys are active and not in an entry field
+        # Only handle hotkeys when hotkeys are active (not in an entry field)
         if not self.hotkeys_active:
             return
-            
-        # Check if focus is on an entry field
-        current_focus = self.root.focus_get()
-        if current_focus in self.markerlabel_entries:
-            return
-            
-        key = event.char
-        if key.isdigit():
-            key_num = int(key)
-            if key_num == 0:
-                self.add_separator()  # Separator for key '0'
-            elif 1 <= key_num <= 9:
-                self.add_to_file(key_num - 1)  # Corresponding button for keys 1-9
-                self.flash_button(key_num - 1)
-        elif event.keysym == "space":
-            self.add_with_popup()  # Trigger the pop-up entry for spacebar
-        elif key == "p" or key == "P":
-            self.add_playlist_to_file()  # Add playlist entry for 'p' or 'P'
-        elif event.keysym == "Left":
-            self.playlist.dec_playhead()  # Decrease playlist playhead with left arrow
-        elif event.keysym == "Right":
-            self.playlist.inc_playhead()  # Increase playlist playhead with right arrow
-        elif event.keysym == "c":
-            show_confetti_pil(self.root, duration=2000, animation_speed=5)
+        self.latency.begin(event)
+        try:
+            self.hotkeys.dispatch(event)
+        finally:
+            self.latency.end()
+
+    def add_marker_hotkey(self, index):
+        self.add_to_file(index)
+        self.flash_button(index)
     
     def flash_button(self, index):
-        self.markerlabel_entries[index].config(bootstyle="danger")
-        self.root.after(500, lambda: self.markerlabel_entries[index].config(bootstyle="default"))
+        # only one pending reset per button, a new flash restarts it
+        pending = self._flash_after.get(index)
+        if pending:
+            self.root.after_cancel(pending)
+        else:
+            self.markerlabel_entries[index].config(bootstyle="danger")
+        self._flash_after[index] = self.root.after(500, lambda: self._unflash_button(index))
+
+    def _unflash_button(self, index):
+        self._flash_after.pop(index, None)
+        self.markerlabel_entries[index].config(bootstyle="default")
     
     def update_playlist_selector(self, lenght, *args):
         self.playlist_selector.configure(to=lenght)
@@ -394,37 +627,110 @@ class QuickEDLApp:
         if self.project.project_markerlabel_file:
             try:
                 markerlabel_data = "\n".join(entry.get() for entry in self.markerlabel_entries) + "\n"
-                Path(self.project.project_markerlabel_file).write_text(markerlabel_data, encoding='utf-8')
-                logging.debug(f"Auto-saved markerlabels to {self.project.project_markerlabel_file}")
+                # unchanged labels are not written again
+                get_file_writer().write(self.project.project_markerlabel_file, markerlabel_data)
+                logging.debug("Auto-saved markerlabels to %s", self.project.project_markerlabel_file)
             except Exception as e:
                 logging.error(f"Failed to auto-save markerlabels: {e}")
+        self.save_marker_banks()
+
+    # MARKERLABEL BANKS
+    def set_markerlabels(self, labels):
+        """
+        Shows the labels in the markerlabel entries.
+        Only entries whose text differs are changed, returns their number.
+        """
+        changed = 0
+        for entry, label in zip(self.markerlabel_entries, labels):
+            if entry.get() != label:
+                entry.delete(0, END)
+                entry.insert(0, label)
+                changed += 1
+        return changed
+
+    def switch_bank(self, index):
+        """
+        Shows another markerlabel bank. The banks are held in memory, the current
+        labels are kept in the active bank. The switch is logged as marker.
+        """
+        index %= BANK_COUNT
+        if index == self.marker_banks.active:
+            self.bank_var.set(index)
+            return
+        current = [entry.get() for entry in self.markerlabel_entries]
+        changed = self.set_markerlabels(self.marker_banks.switch(index, current))
+        name = self.marker_banks.active_name
+        self.bank_text.set(name)
+        self.bank_var.set(index)
+        logging.info("Switched to markerlabel bank '%s' (%d labels changed)", name, changed)
+
+        edl_file = self.project.project_edl_file or self.file_path
+        if edl_file:
+            marker = f"{datetime.now().strftime('%H:%M:%S')} - Bank: {name}"
+            self.write_marker(edl_file, marker, "bank")
+            self.update_last_markers(marker)
+
+    def update_banks_menu(self):
+        for i, name in enumerate(self.marker_banks.names):
+            self.banks_menu.entryconfig(i, label=f"{name} (Ctrl+{(i + 1) % 10})")
+
+    def load_marker_banks(self):
+        """Loads the banks of the project, the labels loaded from the project stay in the active bank."""
+        banks_file = self.project.project_markerbanks_file
+        current = [entry.get() for entry in self.markerlabel_entries]
+        try:
+            self.set_markerlabels(self.marker_banks.load(banks_file, current))
+        except (OSError, ValueError, AttributeError, TypeError) as e:
+            logging.error(f"Failed to load markerlabel banks from {banks_file}: {e}")
+            notify(f"Could not load markerlabel banks: {e}", "error")
+            self.marker_banks.clear()
+            self.marker_banks.store(current)
+        self._marker_banks_file = banks_file
+        self.bank_text.set(self.marker_banks.active_name)
+        self.bank_var.set(self.marker_banks.active)
+        self.update_banks_menu()
+
+    def save_marker_banks(self):
+        """Writes the banks (in the background, only if they changed)."""
+        if self._marker_banks_file is None:
+            return
+        self.marker_banks.store(entry.get() for entry in self.markerlabel_entries)
+        get_file_writer().write(self._marker_banks_file, self.marker_banks.to_json())
+
+    def on_close(self):
+        """
+        Closes the main window. The labels are taken from the entries while they still exist,
+        the queued files are written after the mainloop.
+        """
+        try:
+            self.save_marker_banks()
+        except Exception as e:
+            logging.error(f"Failed to save markerlabel banks: {e}")
+        self.stop_profiler()
+        self.root.destroy()
 
     def load_project_history(self):
         """
         Loads the history from the current project's EDL file.
         """
         if self.project.project_edl_file and Path(self.project.project_edl_file).exists():
-            # Clear existing history
-            self.last_markers.clear()
-            
             try:
-                with Path(self.project.project_edl_file).open('r', encoding='utf-8') as file:
-                    lines = file.readlines()
-                    # Get the last 5 lines that are not empty
-                    non_empty_lines = [line.strip() for line in lines if line.strip()]
-                    recent_lines = non_empty_lines[-5:] if len(non_empty_lines) >= 5 else non_empty_lines
-                    
-                    # Add them to history without using update_last_markers to avoid duplication
-                    self.last_markers.extend(recent_lines)
-                    self.last_markers_text.set("\n".join(self.last_markers))
-                    
+                # Only the end of the file is read, the EDL may be long
+                recent_lines = read_last_lines(self.project.project_edl_file, self.last_markers.depth)
+                self.last_markers.load(recent_lines)
+                self.last_markers_text.set(self.last_markers.text())
                 logging.info(f"Loaded {len(recent_lines)} markers from project EDL file: {self.project.project_edl_file}")
+                self.label_trie.load_edl(self.project.project_edl_file)
             except Exception as e:
+                self.last_markers.clear()
+                self.label_trie.clear()
                 logging.error(f"Error loading project history: {e}")
         else:
             # Clear history if no valid project file
             self.last_markers.clear()
-            self.last_markers_text.set("No markers yet.")
+            self.last_markers_text.set(self.last_markers.text())
+            # no suggestions from the previous project
+            self.label_trie.clear()
 
     def update_project_display(self):
         """
@@ -457,10 +763,7 @@ class QuickEDLApp:
             self.project.load_project(project_path)
         except Exception as e:
             logging.error(f"Error loading recent project: {e}")
-            Messagebox.show_error(
-                title="Error loading project",
-                message=f"Failed to load project:\n{str(e)}"
-            )
+            notify(f"Failed to load project: {e}", "error")
 
     def load_project_content(self):
         """
@@ -474,6 +777,8 @@ class QuickEDLApp:
                 from markerlabel import load_markerlabel
                 load_markerlabel(self, self.project.project_markerlabel_file)
                 logging.info(f"Loaded markerlabels from project: {self.project.project_markerlabel_file}")
+            if self.project.project_markerbanks_file:
+                self.load_marker_banks()
             
             # Load playlist if file exists
             if (self.project.project_playlist_file and 
@@ -481,7 +786,7 @@ class QuickEDLApp:
                 
                 self.playlist.load_from_project()
             
-            show_confetti_pil(self.root, duration=1500, animation_speed=5)
+            self.show_confetti(duration=1500)
                 
         except Exception as e:
             logging.error(f"Error loading project content: {e}")
@@ -491,24 +796,23 @@ class QuickEDLApp:
         Gets the default directory from settings if it exists and is valid.
         Returns None if not set or invalid.
         """
-        default_dir = self.settings_manager.get_setting('default_dir')
-        if default_dir and Path(default_dir).exists() and Path(default_dir).is_dir():
-            return default_dir
-        return None
+        return self.settings_manager.get_default_directory()
 
     def create_new_file(self):
         try:
-            file_path = filedialog.asksaveasfilename(
-                defaultextension=".txt",
-                initialfile=f"EDL_{datetime.now().strftime('%Y-%m-%d_%H-%M-%S')}.txt",
-                initialdir=self.get_default_directory(),
-                filetypes=[("Text files", "*.txt")])
+            with stalls_paused():
+                file_path = filedialog.asksaveasfilename(
+                    defaultextension=".txt",
+                    initialfile=f"EDL_{datetime.now().strftime('%Y-%m-%d_%H-%M-%S')}.txt",
+                    initialdir=self.get_default_directory(),
+                    filetypes=[("Text files", "*.txt")])
             if file_path:
                 self.file_path = Path(file_path)
                 self.current_dir = self.file_path.parent
                 with self.file_path.open('w') as file:
                     file.write("File created on " + datetime.now().strftime("%Y-%m-%d %H:%M:%S") + "\n")
                 # Note: This creates a standalone EDL file, not a project
+                self.label_trie.clear()
                 self.file_label.config(text=f"CREATED: {self.file_path}")
                 self.file_labelframe.config(bootstyle="success")
                 logging.info(f"New file created: {self.file_path}")
@@ -516,10 +820,11 @@ class QuickEDLApp:
             logging.error(f"An error occurred while creating a new file: {e}", exc_info=True)
 
     def load_file(self):
-        file_path = filedialog.askopenfilename(
-            filetypes=[("Text files", "*.txt")],
-            initialdir=self.get_default_directory()
-        )
+        with stalls_paused():
+            file_path = filedialog.askopenfilename(
+                filetypes=[("Text files", "*.txt")],
+                initialdir=self.get_default_directory()
+            )
         if file_path:
             self.file_path = Path(file_path)
             self.current_dir = self.file_path.parent
@@ -528,37 +833,33 @@ class QuickEDLApp:
             self.file_labelframe.config(bootstyle="success")
             
             # Load history from file
-            self.last_markers.clear()
-            with self.file_path.open('r') as file:
-                lines = file.readlines()
-                # Get the last 5 lines that are not empty
-                non_empty_lines = [line.strip() for line in lines if line.strip()]
-                recent_lines = non_empty_lines[-5:] if len(non_empty_lines) >= 5 else non_empty_lines
-                self.last_markers.extend(recent_lines)
-                self.last_markers_text.set("\n".join(self.last_markers))
+            self.last_markers.load(read_last_lines(self.file_path, self.last_markers.depth))
+            self.last_markers_text.set(self.last_markers.text())
+            self.label_trie.load_edl(self.file_path)
 
     def save_markerlabels(self): #TODO move all markerlabels functionality to markerlabel.py
         # Use current_dir if available, otherwise default directory from settings
         initial_dir = self.current_dir or self.get_default_directory()
         
-        save_path = filedialog.asksaveasfilename(
-            initialdir=initial_dir,
-            defaultextension=".txt",
-            initialfile=f"Markerlabels_{datetime.now().strftime('%Y-%m-%d_%H-%M-%S')}.txt",
-            filetypes=[("Text files", "*.txt")]
-        )
+        with stalls_paused():
+            save_path = filedialog.asksaveasfilename(
+                initialdir=initial_dir,
+                defaultextension=".txt",
+                initialfile=f"Markerlabels_{datetime.now().strftime('%Y-%m-%d_%H-%M-%S')}.txt",
+                filetypes=[("Text files", "*.txt")]
+            )
         if save_path:
-            save_path = Path(save_path)
-            save_path.write_text("\n".join(entry.get() for entry in self.markerlabel_entries) + "\n")
+            get_file_writer().write(save_path, "\n".join(entry.get() for entry in self.markerlabel_entries) + "\n")
 
     def open_markerlabels(self):    #TODO Renome to "...dialog"
         # Use current_dir if available, otherwise default directory from settings
         initial_dir = self.current_dir or self.get_default_directory()
         
-        load_path = filedialog.askopenfilename(
-            filetypes=[("Text files", "*.txt")],
-            initialdir=initial_dir
-        )
+        with stalls_paused():
+            load_path = filedialog.askopenfilename(
+                filetypes=[("Text files", "*.txt")],
+                initialdir=initial_dir
+            )
         self.import_markerlabels(load_path)
 
     def import_markerlabels(self, load_path):   #TODO Rename "import" to "load"
@@ -575,9 +876,7 @@ class QuickEDLApp:
         try:
             # Check if settings folder exists first
             if not self.settings_manager.settings_folder_exists():
-                Messagebox.show_error(
-                    "Settings folder not found!\n\n"
-                )
+                notify("Settings folder not found!", "error")
                 return
             
             current_markerlabels = [entry.get() for entry in self.markerlabel_entries]
@@ -587,48 +886,34 @@ class QuickEDLApp:
             
             success = self.settings_manager.save_current_markerlabels_to_default(current_markerlabels)
             if success:
-                Messagebox.show_info("Markerlabels successfully saved to defaults!")
+                notify("Markerlabels saved to defaults.", "success")
                 logging.info("Current markerlabels saved to defaults")
             else:
-                Messagebox.show_error("Failed to save markerlabels to defaults.")
+                notify("Failed to save markerlabels to defaults.", "error")
                 logging.error("Failed to save markerlabels to defaults")
         except Exception as e:
-            Messagebox.show_error(f"Error saving markerlabels to defaults: {e}")
+            notify(f"Error saving markerlabels to defaults: {e}", "error")
             logging.error(f"Failed to save current markerlabels to default: {e}")
     
     def load_settings(self):
+        """
+        Loads the settings at startup and applies all of them.
+        Later changes are applied by the registered appliers only.
+        """
         settings_data = self.settings_manager.load_settings()
 
-        # apply theme
-        theme = settings_data.get('theme', 'darkly')
-        try:
-            # Apply theme to the existing root window
-            self.root.style.theme_use(theme)
-            logging.info(f"Theme set to: {theme}")
-        except Exception as e:
-            logging.warning(f"Failed to set theme '{theme}', falling back to 'darkly': {e}")
-            try:
-                self.root.style.theme_use("darkly")
-            except Exception:
-                logging.error("Failed to set fallback theme")
-                pass
-
-        # Apply settings to instance variables
-        self.log_level = settings_data.get('log_level', self.log_level)
-        self.default_dir = settings_data.get('default_dir', self.default_dir)
-        self.delete_key = settings_data.get('delete_key', self.delete_key)
-        
-        # Update recent projects manager with max_recent setting
-        max_recent = settings_data.get('max_recent', 5)
-        if hasattr(self, 'recent_manager'):
-            self.recent_manager.update_max_recent(max_recent)
-            # Update recent menu if it exists
-            if hasattr(self, 'recent_menu') and self.recent_menu:
-                self.recent_menu.update_submenu()
-        
-        # Set log level
-        logging.getLogger().setLevel(self.log_level)
-        logging.info(f"Logging level set to {self.log_level}")
+        self.settings_appliers.register(['theme'], self.apply_theme)
+        self.settings_appliers.register(['log_level'], self.apply_log_level)
+        self.settings_appliers.register(['default_dir', 'delete_key', 'fsync_markers'], self.apply_simple_settings)
+        self.settings_appliers.register(['max_recent'], self.apply_max_recent)
+        self.settings_appliers.register(['history_depth'], self.apply_history_depth)
+        self.settings_appliers.register(['auto_save_interval'], self.apply_auto_save_interval)
+        self.settings_appliers.register(['clock_timecode', 'timecode_fps'], self.apply_clock_settings)
+        self.settings_appliers.register(['keymap'], self.apply_keymap)
+        self.settings_appliers.register(['hotkey_burst_mode', 'hotkey_burst_window_ms', 'hotkey_repeat_actions'], self.apply_hotkey_behaviour)
+        self.settings_appliers.register(['metrics_export', 'metrics_interval'], self.apply_metrics_export)
+        self.settings_appliers.register(['stall_detector', 'stall_threshold_ms'], self.apply_stall_detector)
+        self.settings_appliers.apply_all(settings_data)
         
         # Update settings folder reference
         self.settings_folder = self.settings_manager.get_settings_folder_path()
@@ -644,6 +929,83 @@ class QuickEDLApp:
                 return
         else:
             logging.info("No markerlabels loaded - settings folder does not exist yet.")
+
+    def apply_theme(self, changes):
+        theme = changes.new('theme') or 'darkly'
+        try:
+            # Apply theme to the existing root window
+            self.root.style.theme_use(theme)
+            logging.info(f"Theme set to: {theme}")
+        except Exception as e:
+            logging.warning(f"Failed to set theme '{theme}', falling back to 'darkly': {e}")
+            try:
+                self.root.style.theme_use("darkly")
+            except Exception:
+                logging.error("Failed to set fallback theme")
+
+    def apply_log_level(self, changes):
+        self.log_level = changes.new('log_level') or self.log_level
+        logging.getLogger().setLevel(self.log_level)
+        logging.info("Logging level set to %s", self.log_level)
+
+    def apply_simple_settings(self, changes):
+        if 'default_dir' in changes:
+            self.default_dir = changes.new('default_dir')
+        if 'delete_key' in changes:
+            self.delete_key = bool(changes.new('delete_key'))
+        if 'fsync_markers' in changes:
+            self.fsync_markers = bool(changes.new('fsync_markers'))
+
+    def apply_max_recent(self, changes):
+        max_recent = changes.new('max_recent') or 5
+        self.recent_manager.update_max_recent(max_recent)
+        if self.recent_menu:
+            self.recent_menu.update_submenu()
+
+    def apply_history_depth(self, changes):
+        depth = changes.new('history_depth') or 5
+        if depth > self.last_markers.depth:
+            self.last_markers.set_depth(depth)
+            self.load_project_history()
+        else:
+            self.last_markers.set_depth(depth)
+            self.last_markers_text.set(self.last_markers.text())
+
+    def apply_clock_settings(self, changes):
+        self.clock.set_timecode(
+            self.settings_manager.get_setting('clock_timecode', False),
+            self.settings_manager.get_setting('timecode_fps', 25)
+        )
+
+    def apply_keymap(self, changes):
+        self.hotkeys.load_keymap(changes.new('keymap'))
+
+    def apply_hotkey_behaviour(self, changes):
+        self.hotkeys.configure(
+            burst_mode=self.settings_manager.get_setting('hotkey_burst_mode', 'batch'),
+            burst_window_ms=self.settings_manager.get_setting('hotkey_burst_window_ms', 300),
+            repeat_actions=self.settings_manager.get_setting('hotkey_repeat_actions')
+        )
+
+    def apply_metrics_export(self, changes):
+        self.metrics_exporter.configure(
+            self.settings_manager.get_settings_folder_path(),
+            self.settings_manager.get_setting('metrics_export', 'off'),
+            self.settings_manager.get_setting('metrics_interval', 15)
+        )
+
+    def apply_stall_detector(self, changes):
+        self.stall_detector.threshold_ms = self.settings_manager.get_setting('stall_threshold_ms', 150)
+        if self.settings_manager.get_setting('stall_detector', True):
+            self.stall_detector.start()
+        else:
+            self.stall_detector.stop()
+
+    def apply_auto_save_interval(self, changes):
+        if self.auto_save_timer:
+            self.root.after_cancel(self.auto_save_timer)
+            self.auto_save_timer = None
+        self.setup_auto_save()
     
     def load_default_markerlabels(self):
         settings_folder = self.settings_manager.get_settings_folder_path()
@@ -653,18 +1015,18 @@ class QuickEDLApp:
                 self.import_markerlabels(load_path)
                 logging.info(f"Imported markerlabels and settings from {load_path}")
             else:
-                Messagebox.show_error(
-                    "Default markerlabel file doesn't exist.\n\n"
-                    "You can create one by saving your current markerlabels:\n"
-                    "Markerlabels → Save markerlabels to defaults"
+                notify(
+                    "Default markerlabel file doesn't exist. "
+                    "Create it with Markerlabels → Save Labels to Defaults.",
+                    "error"
                 )
                 logging.error("Default markerlabel file doesn't exist.")
                 return
         else:
-            Messagebox.show_error(
-                "Settings folder not found!\n\n"
-                "Please create the settings folder first:\n"
-                "App → Settings → Create Settings Folder"
+            notify(
+                "Settings folder not found! "
+                "Create it with App → Settings → Create Settings Folder.",
+                "error"
             )
             logging.error("Settings folder not found.")
 
@@ -673,6 +1035,16 @@ class QuickEDLApp:
         Callback function called when a project is updated/loaded.
         Updates the display and loads project content (markerlabels and playlist).
         """
+        # Markers of a burst still belong to the previous project's EDL
+        self.flush_marker_batch()
+        # the entries still show the labels of the previous project's bank
+        self.save_marker_banks()
+
+        # Log the latency of the previous project's markers
+        if self._latency_project and self._latency_project != self.project.project_path:
+            self.latency.log_summary(f"Marker latency of project '{Path(self._latency_project).name}'")
+        self._latency_project = self.project.project_path
+
         # Update the display first
         self.update_project_display()
         
@@ -706,9 +1078,8 @@ class QuickEDLApp:
             if not text:
                 text = f"Button {index +1}"
             marker = f"{datetime.now().strftime('%H:%M:%S')} - {text}"
-            with Path(edl_file).open('a') as file:
-                file.write(marker + "\n")
-            self.update_last_markers(marker)        
+            self.write_marker(edl_file, marker, "button")
+            self.update_last_markers(marker)
         else:
             self.entry_error()
 
@@ -723,8 +1094,7 @@ class QuickEDLApp:
                 playlist_text = self.playlist.playlist_entry()
                 if playlist_text:
                     marker = f"{datetime.now().strftime('%H:%M:%S')} - {playlist_text}"
-                    with Path(edl_file).open('a') as file:
-                        file.write(marker + "\n")
+                    self.write_marker(edl_file, marker, "playlist")
                     self.update_last_markers(marker)
                 else:
                     logging.warning("No playlist entry available")
@@ -738,53 +1108,29 @@ class QuickEDLApp:
         edl_file = self.project.project_edl_file if self.project.project_edl_file else self.file_path
         
         if self.hotkeys_active and edl_file:
+            # the timestamp is taken at the keypress, not when the text is entered
             timestamp = datetime.now().strftime("%H:%M:%S")
             marker = f"{timestamp} - "
 
-            def get_input(event=None):
-                text_input = input_var.get()
-                popup.destroy()
-                if text_input:
-                    marker_popup = marker + text_input
-                    with Path(edl_file).open('a') as file:
-                        file.write(marker_popup + "\n")
-                    self.update_last_markers(marker_popup)
-
-            def cancel_popup(event = None):
-                popup.destroy()
-            
-            popup = ttk.Toplevel(self.root)
-            popup.title(f"Text for {timestamp}")
-            popup.geometry("400x150")
-            popup.resizable(False, False)
-            popup.bind("<Escape>", cancel_popup)
-            popup.bind("<Return>", get_input)
-
-            input_var = ttk.StringVar()
-            input_entry = ttk.Entry(popup, textvariable=input_var, width=50)
-            input_entry.pack(pady=5)
-
-            buttonframe = ttk.Frame(popup)
-            buttonframe.pack(pady=10)
-            cancel_button = ttk.Button(buttonframe, bootstyle="danger", text="Cancel", command=cancel_popup)
-            cancel_button.pack(side=LEFT, padx=10, pady=10)
-            submit_button = ttk.Button(buttonframe, bootstyle="success", text="Save", command=get_input)
-            submit_button.pack(side=RIGHT, padx=10, pady=10)
-
-            input_entry.focus()
-            popup.transient(self.root)
-            self.root.wait_window(popup)
+            def get_input(text_input):
+                marker_popup = marker + text_input
+                # new trace, the typing time is not part of the latency
+                self.latency.begin()
+                self.write_marker(edl_file, marker_popup, "popup")
+                self.update_last_markers(marker_popup)
+
+            self.marker_popup.show(f"Text for {timestamp}", get_input)
         
         else:
             self.entry_error()
 
-    def handle_backspace(self, event):
-        # Only handle backspace for deletion when not in an entry field
-        current_focus = self.root.focus_get()
-        if current_focus not in self.markerlabel_entries and self.delete_key and self.hotkeys_active:
+    def handle_backspace(self, event=None):
+        # Deleting by hotkey must be enabled in the settings
+        if self.delete_key and self.hotkeys_active:
             self.delete_last_marker()
 
     def delete_last_marker(self, **kwargs):  
+        self.flush_marker_batch()
         if self.project.project_edl_file and self.last_markers:
             # Read all lines from the file
             with Path(self.project.project_edl_file).open('r') as file:
@@ -798,32 +1144,84 @@ class QuickEDLApp:
             # Update last_markers list and label
             if self.last_markers:  # Check if there are markers to remove
                 self.last_markers.pop()
-                self.last_markers_text.set("\n".join(self.last_markers))
+                self.last_markers_text.set(self.last_markers.text())
         else:
             self.entry_error()
 
     def add_separator(self):
         if self.hotkeys_active and self.project.project_edl_file:
             separator = "-" * 20
-            with open(self.project.project_edl_file, 'a') as file:
-                file.write(separator + "\n")
-            self.update_last_markers(separator)        
+            self.write_marker(self.project.project_edl_file, separator, "separator")
+            self.update_last_markers(separator)
         else:
             self.entry_error()
 
+    def write_marker(self, edl_file, marker, kind):
+        """
+        Appends a marker line to the EDL file and makes it durable on disk.
+        The stages are recorded by the latency recorder, kind is counted in the metrics.
+        """
+        trace = self.latency.trace()
+        trace.mark("format")
+
+        # Burst of identical hotkey presses: collect and write once the burst window ends
+        if self.hotkeys.burst and self.hotkeys.burst_mode == "batch":
+            self.latency.end()
+            self._marker_batch.append((edl_file, marker, trace, kind))
+            if self._marker_batch_after is None:
+                delay = int(self.hotkeys.burst_window * 1000)
+                self._marker_batch_after = self.root.after(delay, self.flush_marker_batch)
+            return
+
+        self.flush_marker_batch()
+        self._append_markers(edl_file, [marker], [trace], [kind])
+
+    def flush_marker_batch(self):
+        """Writes the collected burst markers with one write per EDL file."""
+        if self._marker_batch_after is not None:
+            try:
+                self.root.after_cancel(self._marker_batch_after)
+            except TclError:
+                pass  # window already destroyed on exit
+            self._marker_batch_after = None
+        batch, self._marker_batch = self._marker_batch, []
+        while batch:
+            edl_file = batch[0][0]
+            same_file = [entry for entry in batch if entry[0] == edl_file]
+            batch = [entry for entry in batch if entry[0] != edl_file]
+            try:
+                self._append_markers(edl_file, [entry[1] for entry in same_file], [entry[2] for entry in same_file],
+                                     [entry[3] for entry in same_file])
+            except Exception as e:
+                logging.error(f"Failed to write marker batch to {edl_file}: {e}")
+        
+    def _append_markers(self, edl_file, markers, traces, kinds):
+        start = time.perf_counter()
+        with Path(edl_file).open('a') as file:
+            file.write("".join(marker + "\n" for marker in markers))
+            file.flush()
+            for trace in traces:
+                trace.mark("write")
+            if self.fsync_markers:
+                os.fsync(file.fileno())
+        self.marker_write_seconds.observe(time.perf_counter() - start)
+        for trace, kind in zip(traces, kinds):
+            trace.mark("fsync")
+            trace.finish()
+            self.markers_written.inc(kind=kind)
+
     def update_last_markers(self, new_marker):
-        if new_marker.strip():  # Only add non-empty markers
-            self.last_markers.append(new_marker.strip())
-        if len(self.last_markers) > 5:
-            self.last_markers.pop(0)
-        self.last_markers_text.set("\n".join(self.last_markers))
+        self.last_markers.append(new_marker)
+        self.last_markers_text.set(self.last_markers.text())
+        self.label_trie.add_marker(new_marker)
 
 
     def entry_error(self):
+        # no modal dialog here, it would hold back the following hotkeys
         if not self.hotkeys_active:
-            Messagebox.show_error("Hotkeys are inactive. Please click outside text fields to enable.")
+            notify("Hotkeys are inactive. Please click outside text fields to enable.", "warning")
         else:
-            Messagebox.show_error("No project loaded. Please create or load a project first.")
+            notify("No project loaded. Please create or load a project first.", "error")
 
 # ███    ███  █████  ██ ███    ██ 
 # ████  ████ ██   ██ ██ ████   ██ 
@@ -833,6 +1231,7 @@ class QuickEDLApp:
 #                                 
 #                                 
 if __name__ == "__main__":
+    app = None
     try:
         root = ttk.Window()
         app = QuickEDLApp(root)
@@ -840,6 +1239,31 @@ if __name__ == "__main__":
         app.startup_toast.show()
         
         root.mainloop()
+        app.flush_marker_batch()
+        app.latency.log_summary()
+        logging.info(f"Clock jitter (ms): {app.clock.jitter_stats()}")
+        logging.info(f"Hotkey stats: {app.hotkeys.stats()}, autorepeat suppressed: {app.hotkeys.suppressed}, bursts collapsed: {app.hotkeys.collapsed}")
+        logging.info(f"Marker popup show latency (ms): {app.marker_popup.show_stats()}")
+        logging.info(f"Repeated notifications suppressed: {app.notifier.suppressed}")
     except Exception as e:
         logging.error(f"An error occurred: {e}", exc_info=True)
         raise
+    finally:
+        # write pending settings and project files before the interpreter shuts down,
+        # the widgets are gone here (the banks were stored by on_close)
+        set_default_notifier(None)  # notifications are only logged from now on
+        if app is not None:
+            try:
+                app.settings_manager.flush_settings()
+            except Exception as e:
+                logging.error(f"Failed to write settings: {e}")
+        file_writer = get_file_writer()
+        file_writer.flush()
+        logging.info(f"Project files: {file_writer.stats_text()}")
+        if app is not None:
+            app.stop_profiler()
+            # the stats read "detector off" once it is stopped
+            logging.info(f"UI stalls: {app.stall_detector.stats_text()}")
+            app.stall_detector.stop()
+            app.metrics_exporter.stop()
+        stop_logging()
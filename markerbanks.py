@@ -0,0 +1,90 @@
+"""
+This file is part of QuickEDL.
+It provides banks of markerlabels, which are switched without reading files.
+"""
+
+import json
+import logging
+from pathlib import Path
+
+BANK_COUNT = 10
+LABEL_COUNT = 9
+
+
+class MarkerBanks:
+    """
+    BANK_COUNT banks of LABEL_COUNT markerlabels, held in memory.
+
+    The banks are stored in the project as <name>_MARKERBANKS.json:
+    {"active": 0, "banks": [{"name": "Bank 1", "labels": ["...", ...]}, ...]}
+
+    Objects:
+        names: list of str
+        labels: list of lists of str
+        active: int
+            Index of the bank shown in the markerlabel entries
+
+    Functions:
+        switch(index, current): returns the labels of a bank, the current labels are kept in the active bank
+        load(path, current) / to_json(): reads and serializes the banks
+    """
+
+    def __init__(self):
+        self.clear()
+
+    def clear(self):
+        """Resets to empty banks with default names."""
+        self.names = [f"Bank {i + 1}" for i in range(BANK_COUNT)]
+        self.labels = [[""] * LABEL_COUNT for _ in range(BANK_COUNT)]
+        self.active = 0
+
+    @property
+    def active_name(self):
+        return self.names[self.active]
+
+    def store(self, labels):
+        """Keeps the labels (e.g. edited in the entries) in the active bank."""
+        labels = list(labels)[:LABEL_COUNT]
+        self.labels[self.active] = labels + [""] * (LABEL_COUNT - len(labels))
+
+    def switch(self, index, current):
+        """
+        Makes the bank at index active and returns its labels.
+        Args:
+            index: index of the bank, wraps around
+            current: labels shown now, stored in the previously active bank
+        """
+        self.store(current)
+        self.active = index % BANK_COUNT
+        return self.labels[self.active]
+
+    def load(self, path, current=None):
+        """
+        Loads the banks from a JSON file, without a file the banks are empty.
+        The current labels (loaded from the markerlabel file) are kept in the active bank.
+        Returns the labels of the active bank.
+        """
+        self.clear()
+        path = Path(path)
+        if not path.exists():
+            if current is not None:
+                self.store(current)
+            return self.labels[self.active]
+
+        data = json.loads(path.read_text(encoding='utf-8'))
+        for i, bank in enumerate(data.get('banks', [])[:BANK_COUNT]):
+            name = str(bank.get('name') or "").strip()
+            if name:
+                self.names[i] = name
+            labels = [str(label) for label in bank.get('labels', [])][:LABEL_COUNT]
+            self.labels[i] = labels + [""] * (LABEL_COUNT - len(labels))
+        active = data.get('active', 0)
+        self.active = active if isinstance(active, int) and 0 <= active < BANK_COUNT else 0
+        if current is not None:
+            self.store(current)
+        logging.info(f"Loaded {BANK_COUNT} markerlabel banks from {path}, active: {self.active_name}")
+        return self.labels[self.active]
+
+    def to_json(self):
+        banks = [{'name': name, 'labels': labels} for name, labels in zip(self.names, self.labels)]
+        return json.dumps({'active': self.active, 'banks': banks}, indent=2, ensure_ascii=False) + "\n"
@@ -7,15 +7,17 @@ import logging
 from pathlib import Path
 from tkinter import END
 
+from persistence import get_file_writer
+
 
 def save_markerlabel(self, save_path):
     """
     Saves the markerlabels to a file.
-    Takes path-object.
+    Takes path-object. The file is written in the background, and only if the labels changed.
     """
     if save_path:
         save_path = Path(save_path)
-        save_path.write_text("\n".join(entry.get() for entry in self.markerlabel_entries) + "\n")
+        get_file_writer().write(save_path, "\n".join(entry.get() for entry in self.markerlabel_entries) + "\n")
         logging.info("Saved markerlabels to project.")
     else:
         logging.error("No path to save markerlabels.")
@@ -27,7 +29,9 @@ def load_markerlabel(self, load_path, startup_toast=None):
     """
     if load_path:
         load_path = Path(load_path)
-        lines = load_path.read_text().splitlines()
+        text = load_path.read_text()
+        get_file_writer().remember(load_path, text)
+        lines = text.splitlines()
         for i, line in enumerate(lines[:9]):
             self.markerlabel_entries[i].delete(0, END)
             self.markerlabel_entries[i].insert(0, line.strip())
@@ -0,0 +1,384 @@
+"""
+This file is part of QuickEDL.
+It collects metrics of the app and writes them to a file in the settings folder,
+e.g. for the textfile collector of a local node_exporter.
+"""
+
+import bisect
+import json
+import logging
+import os
+import threading
+import time
+from pathlib import Path
+
+from utils import atomic_write_text
+
+try:
+    import resource
+except ImportError:  # Windows
+    resource = None
+
+try:
+    import psutil
+except ImportError:
+    psutil = None
+
+EXPORT_FORMATS = ('off', 'prometheus', 'jsonl')
+PROM_FILE = "quickedl.prom"
+JSONL_FILE = "quickedl_metrics.jsonl"
+JSONL_MAX_BYTES = 5 * 1024 * 1024  # size of the JSON lines file before it is rotated to .1
+# seconds, for write latencies and the Tk loop lag
+LATENCY_BUCKETS = (0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5)
+
+
+def _format_value(value):
+    if value == float('inf'):
+        return "+Inf"
+    if isinstance(value, float) and value.is_integer() and abs(value) < 1e15:
+        return str(int(value))
+    return repr(value)
+
+
+def _format_labels(labels):
+    if not labels:
+        return ""
+    escaped = (
+        (name, str(value).replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"'))
+        for name, value in labels
+    )
+    return "{" + ",".join(f'{name}="{value}"' for name, value in escaped) + "}"
+
+
+class Metric:
+    """
+    Base of the metric types: values per combination of label values.
+    Values can also be read by a function when the metrics are collected,
+    e.g. the size of a file or a counter kept by another object.
+    Updates and collection can happen on different threads.
+    """
+
+    kind = "untyped"
+
+    def __init__(self, name, help_text, labelnames=()):
+        self.name = name
+        self.help = help_text
+        self.labelnames = tuple(labelnames)
+        self._values = {}  # tuple of label values -> value
+        self._functions = {}  # tuple of label values -> function returning the value or None
+        self._lock = threading.Lock()
+
+    def _key(self, labels):
+        return tuple(str(labels[name]) for name in self.labelnames)
+
+    def set_function(self, function, **labels):
+        """Reads the value with function at collection, a value of None is not exported."""
+        with self._lock:
+            self._functions[self._key(labels)] = function
+
+    def samples(self):
+        """Returns a list of (name, ((label, value), ...), value)."""
+        with self._lock:
+            values = list(self._values.items())
+            functions = list(self._functions.items())
+        samples = [(self.name, tuple(zip(self.labelnames, key)), value) for key, value in values]
+        for key, function in functions:
+            try:
+                value = function()
+            except Exception as e:
+                logging.debug("Metric %s not collected: %s", self.name, e)
+                continue
+            if value is not None:
+                samples.append((self.name, tuple(zip(self.labelnames, key)), value))
+        return samples
+
+
+class Counter(Metric):
+    kind = "counter"
+
+    def inc(self, amount=1, **labels):
+        key = self._key(labels)
+        with self._lock:
+            self._values[key] = self._values.get(key, 0) + amount
+
+
+class Gauge(Metric):
+    kind = "gauge"
+
+    def set(self, value, **labels):
+        key = self._key(labels)
+        with self._lock:
+            self._values[key] = value
+
+
+class Histogram(Metric):
+    """Counts observations in fixed buckets, exported as cumulative _bucket, _sum and _count."""
+
+    kind = "histogram"
+
+    def __init__(self, name, help_text, buckets=LATENCY_BUCKETS, labelnames=()):
+        super().__init__(name, help_text, labelnames)
+        self.buckets = tuple(sorted(buckets))
+
+    def observe(self, value, **labels):
+        key = self._key(labels)
+        index = bisect.bisect_left(self.buckets, value)  # buckets are "less or equal"
+        with self._lock:
+            entry = self._values.get(key)
+            if entry is None:
+                entry = self._values[key] = [[0] * (len(self.buckets) + 1), 0.0, 0]
+            entry[0][index] += 1
+            entry[1] += value
+            entry[2] += 1
+
+    def samples(self):
+        with self._lock:
+            values = [(key, (list(counts), total, count)) for key, (counts, total, count) in self._values.items()]
+        samples = []
+        for key, (counts, total, count) in values:
+            labels = tuple(zip(self.labelnames, key))
+            cumulative = 0
+            for bound, bucket_count in zip(self.buckets + (float('inf'),), counts):
+                cumulative += bucket_count
+                samples.append((self.name + "_bucket", labels + (("le", _format_value(float(bound))),), cumulative))
+            samples.append((self.name + "_sum", labels, total))
+            samples.append((self.name + "_count", labels, count))
+        return samples
+
+
+class MetricsRegistry:
+    """
+    Holds the metrics of the app by name.
+
+    Functions:
+        counter(name, help_text, labelnames) / gauge(...) / histogram(...):
+            returns the metric with that name, created on first use
+        render_prometheus(): returns the metrics in the Prometheus text format
+        render_json(): returns the metrics as one JSON line
+    """
+
+    def __init__(self):
+        self._metrics = {}
+        self._lock = threading.Lock()
+
+    def _get(self, cls, name, *args, **kwargs):
+        with self._lock:
+            metric = self._metrics.get(name)
+            if metric is None:
+                metric = self._metrics[name] = cls(name, *args, **kwargs)
+            elif not isinstance(metric, cls):
+                raise ValueError(f"Metric {name} is a {metric.kind}")
+            return metric
+
+    def counter(self, name, help_text, labelnames=()):
+        return self._get(Counter, name, help_text, labelnames)
+
+    def gauge(self, name, help_text, labelnames=()):
+        return self._get(Gauge, name, help_text, labelnames)
+
+    def histogram(self, name, help_text, buckets=LATENCY_BUCKETS, labelnames=()):
+        return self._get(Histogram, name, help_text, buckets, labelnames)
+
+    def metrics(self):
+        with self._lock:
+            return list(self._metrics.values())
+
+    def render_prometheus(self):
+        lines = []
+        for metric in self.metrics():
+            samples = metric.samples()
+            if not samples:
+                continue
+            lines.append(f"# HELP {metric.name} {metric.help}")
+            lines.append(f"# TYPE {metric.name} {metric.kind}")
+            for name, labels, value in samples:
+                lines.append(f"{name}{_format_labels(labels)} {_format_value(value)}")
+        return "\n".join(lines) + "\n"
+
+    def render_json(self, timestamp=None):
+        """One object per export, the keys are the sample names with labels as in the text format."""
+        data = {'time': round(time.time() if timestamp is None else timestamp, 3)}
+        for metric in self.metrics():
+            for name, labels, value in metric.samples():
+                data[name + _format_labels(labels)] = value
+        return json.dumps(data, separators=(",", ":"))
+
+
+_registry = MetricsRegistry()
+
+
+def get_registry():
+    """Returns the registry shared by the whole app."""
+    return _registry
+
+
+def resident_memory_bytes():
+    """Returns the resident memory of the process, None if it can't be read on this system."""
+    try:
+        with open("/proc/self/statm", "rb") as file:
+            return int(file.read().split()[1]) * os.sysconf("SC_PAGE_SIZE")
+    except (OSError, ValueError, IndexError, AttributeError):
+        pass
+    if psutil is not None:
+        return psutil.Process().memory_info().rss
+    return None
+
+
+def peak_resident_memory_bytes():
+    """Returns the peak resident memory of the process, None on Windows."""
+    if resource is None:
+        return None
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return peak if os.uname().sysname == "Darwin" else peak * 1024  # kilobytes on Linux
+
+
+class MetricsExporter:
+    """
+    Writes the registry to the settings folder every interval seconds.
+
+    The files are written on a background thread, so functions of the
+    metrics (file sizes, memory) are read off the Tk thread.
+    prometheus: quickedl.prom, replaced atomically as the textfile collector requires
+    jsonl: quickedl_metrics.jsonl, one line appended per export
+
+    The lag of the Tk event loop is taken from the tick of the stall
+    detector, the delay of a tick is the time the loop was busy.
+
+    Objects:
+        exports / failed: int
+            Counters of written and failed exports
+    """
+
+    def __init__(self, heartbeat, registry=None):
+        """
+        Args:
+            heartbeat: StallDetector whose tick delays are observed as loop lag
+            registry: registry of the exported metrics, the process-wide one if None
+        """
+        self.heartbeat = heartbeat
+        self.registry = registry or get_registry()
+        self.folder = None
+        self.export_format = 'off'
+        self.interval = 15
+        self.exports = 0
+        self.failed = 0
+        self.last_export_ms = 0.0
+
+        self.loop_lag = self.registry.histogram(
+            "quickedl_tk_loop_lag_seconds", "Delay of a Tk timer tick, the time the event loop was busy")
+        self.last_export = self.registry.gauge(
+            "quickedl_metrics_export_timestamp_seconds", "Time of the last metrics export")
+
+        self._observing_lag = False
+        self._thread = None
+        self._stop = threading.Event()
+        self._wake = threading.Event()
+        self._warned_folder = False
+
+    @property
+    def enabled(self):
+        return self.export_format in ('prometheus', 'jsonl') and self.folder is not None
+
+    def configure(self, folder, export_format, interval):
+        """
+        Changes the export, starts or stops the background thread.
+        Args:
+            folder: settings folder the file is written to
+            export_format: 'off', 'prometheus' or 'jsonl'
+            interval: seconds between exports
+        """
+        export_format = export_format or 'off'  # YAML reads an unquoted off as False
+        if export_format not in EXPORT_FORMATS:
+            logging.warning("Unknown metrics export '%s', export is off", export_format)
+            export_format = 'off'
+        if self.export_format == 'prometheus' and export_format != 'prometheus':
+            self._remove_prom_file()  # a stale file would be scraped as current
+        self.folder = Path(folder) if folder else None
+        self.export_format = export_format
+        self.interval = max(1, int(interval or 15))
+        self._warned_folder = False
+
+        if self.enabled:
+            self._start()
+            self._wake.set()  # export now, then with the new interval
+            logging.info("Metrics export: %s every %d s to %s", self.export_format, self.interval, self.folder)
+        else:
+            self.stop(final_export=False)
+
+    def _start(self):
+        if not self._observing_lag:
+            self.heartbeat.add_lag_listener(self.loop_lag.observe)
+            self._observing_lag = True
+        if self._thread is None or not self._thread.is_alive():
+            self._stop.clear()
+            self._thread = threading.Thread(target=self._run, name="MetricsExporter", daemon=True)
+            self._thread.start()
+
+    def stop(self, final_export=True):
+        """Stops the export, by default the metrics are written a last time."""
+        if self._observing_lag:
+            self.heartbeat.remove_lag_listener(self.loop_lag.observe)
+            self._observing_lag = False
+        if self._thread is not None:
+            self._stop.set()
+            self._wake.set()
+            self._thread.join(timeout=2)
+            self._thread = None
+        if final_export and self.enabled:
+            self.export()
+
+    def _run(self):
+        while not self._stop.is_set():
+            self._wake.wait(self.interval)
+            self._wake.clear()
+            if self._stop.is_set():
+                break
+            self.export()
+
+    def export(self):
+        """Writes the metrics once, errors are logged and counted."""
+        folder = self.folder
+        if folder is None:
+            return
+        if not folder.exists():
+            if not self._warned_folder:
+                logging.warning("Metrics not exported, settings folder %s does not exist", folder)
+                self._warned_folder = True
+            return
+        start = time.perf_counter()
+        try:
+            self.last_export.set(round(time.time(), 3))
+            if self.export_format == 'prometheus':
+                atomic_write_text(folder / PROM_FILE, self.registry.render_prometheus())
+            elif self.export_format == 'jsonl':
+                self._append_json(folder / JSONL_FILE, self.registry.render_json())
+            self.exports += 1
+        except Exception as e:
+            self.failed += 1
+            logging.error("Metrics export to %s failed: %s", folder, e)
+        self.last_export_ms = (time.perf_counter() - start) * 1000
+
+    def _append_json(self, path, line):
+        try:
+            if path.stat().st_size > JSONL_MAX_BYTES:
+                os.replace(path, path.with_name(path.name + ".1"))
+        except FileNotFoundError:
+            pass
+        with path.open('a', encoding='utf-8') as file:
+            file.write(line + "\n")
+
+    def _remove_prom_file(self):
+        if self.folder is None:
+            return
+        try:
+            (self.folder / PROM_FILE).unlink()
+        except FileNotFoundError:
+            pass
+        except OSError as e:
+            logging.warning("Could not remove %s: %s", self.folder / PROM_FILE, e)
+
+    def stats_text(self):
+        if not self.enabled:
+            return "export off"
+        return (f"{self.export_format} every {self.interval} s, {self.exports} exports, "
+                f"{self.failed} failed, last {self.last_export_ms:.1f} ms")
@@ -0,0 +1,150 @@
+"""
+This file is part of QuickEDL.
+It shows short notifications in the main window without blocking the event loop.
+"""
+
+import logging
+import threading
+import time
+from collections import deque
+
+# level -> (bootstyle, log level, duration in ms)
+LEVELS = {
+    "info": ("info", logging.INFO, 3000),
+    "success": ("success", logging.INFO, 3000),
+    "warning": ("warning", logging.WARNING, 4000),
+    "error": ("danger", logging.ERROR, 6000),
+}
+
+
+class Notifier:
+    """
+    Queue of notifications shown one after another in a label of the main window.
+
+    Unlike a Messagebox, a notification never starts a nested event loop, so
+    hotkeys keep working while it is shown. Identical notifications within
+    REPEAT_WINDOW seconds are counted instead of queued again. Warnings and
+    errors are shown as toast while the main window is not visible.
+
+    Functions:
+        attach(label): sets the label showing the notifications
+        notify(message, level, duration): queues a notification
+    """
+
+    REPEAT_WINDOW = 10.0  # seconds
+    MAX_QUEUED = 10
+    MIN_DURATION = 1500  # ms, when more notifications are waiting
+
+    def __init__(self, root, is_visible=None):
+        """
+        Args:
+            root: main window
+            is_visible: callable returning True if the main window can be seen
+        """
+        self.root = root
+        self.is_visible = is_visible or (lambda: True)
+        self.label = None
+        self.suppressed = 0  # repeated notifications not shown again
+
+        self._queue = deque(maxlen=self.MAX_QUEUED)
+        self._recent = {}  # (level, message) -> [last time, repeats]
+        self._current = None
+        self._after = None
+        self._main_thread = threading.current_thread()
+
+    def attach(self, label):
+        self.label = label
+
+    def notify(self, message, level="info", duration=None):
+        """
+        Queues a notification. Can be called from any thread.
+        Args:
+            message: text of the notification
+            level: "info", "success", "warning" or "error"
+            duration: display time in ms, depends on the level if None
+        """
+        if threading.current_thread() is not self._main_thread:
+            self.root.after(0, self.notify, message, level, duration)
+            return
+        if level not in LEVELS:
+            level = "info"
+
+        key = (level, message)
+        now = time.monotonic()
+        recent = self._recent.get(key)
+        if recent is not None and now - recent[0] < self.REPEAT_WINDOW:
+            recent[0] = now
+            recent[1] += 1
+            self.suppressed += 1
+            if self._current is not None and self._current[:2] == key:
+                self._show_text(*self._current)
+            return
+        self._recent[key] = [now, 0]
+        if len(self._recent) > 100:
+            self._recent = {k: v for k, v in self._recent.items() if now - v[0] < self.REPEAT_WINDOW}
+
+        logging.debug("Notification (%s): %s", level, message)
+        self._queue.append((level, message, duration))
+        if self._current is None:
+            self._show_next()
+
+    def _show_next(self):
+        self._after = None
+        if not self._queue:
+            self._current = None
+            if self.label is not None:
+                self.label.config(text="")
+            return
+
+        level, message, duration = self._queue.popleft()
+        self._current = (level, message)
+        bootstyle, _, default_duration = LEVELS[level]
+        duration = duration or default_duration
+        if self._queue:
+            duration = min(duration, max(self.MIN_DURATION, duration // 2))
+
+        if self.label is None or (level in ("warning", "error") and not self.is_visible()):
+            self._toast(message, bootstyle, duration)
+        if self.label is not None:
+            self._show_text(level, message)
+        self._after = self.root.after(duration, self._show_next)
+
+    def _show_text(self, level, message):
+        if self.label is None:
+            return
+        repeats = self._recent.get((level, message), [0, 0])[1]
+        text = f"{message} (×{repeats + 1})" if repeats else message
+        self.label.config(text=text, bootstyle=LEVELS[level][0])
+
+    def _toast(self, message, bootstyle, duration):
+        try:
+            from ttkbootstrap.toast import ToastNotification
+            ToastNotification(
+                title="QuickEDL",
+                message=message,
+                bootstyle=bootstyle,
+                icon="",
+                duration=duration
+            ).show_toast()
+        except Exception as e:
+            logging.error(f"Failed to show toast: {e}")
+
+
+_default = None
+
+
+def set_default_notifier(notifier):
+    """Sets the notifier used by notify()."""
+    global _default
+    _default = notifier
+
+
+def notify(message, level="info", duration=None):
+    """
+    Shows a notification with the default notifier.
+    Without a notifier (e.g. before the main window exists) the message is only logged.
+    """
+    if _default is not None:
+        _default.notify(message, level, duration)
+    else:
+        logging.log(LEVELS.get(level, LEVELS["info"])[1], message)
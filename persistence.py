@@ -0,0 +1,153 @@
+"""
+This file is part of QuickEDL.
+It writes the project files (markerlabels, playlist) atomically and off the Tk thread,
+skipping writes which would not change the file.
+"""
+
+import atexit
+import hashlib
+import logging
+import threading
+from pathlib import Path
+
+from utils import atomic_write_text
+
+_shared_writer = None
+_shared_lock = threading.Lock()
+
+
+def get_file_writer():
+    """Returns the process-wide file writer, creating it on first use."""
+    global _shared_writer
+    if _shared_writer is None:
+        with _shared_lock:
+            if _shared_writer is None:
+                _shared_writer = FileWriter()
+                atexit.register(_shared_writer.flush)
+    return _shared_writer
+
+
+def content_hash(text):
+    return hashlib.blake2b(text.encode('utf-8'), digest_size=16).digest()
+
+
+def _file_state(path):
+    try:
+        stat = path.stat()
+    except OSError:
+        return None
+    return (stat.st_mtime_ns, stat.st_size)
+
+
+class FileWriter:
+    """
+    Writes text files on a background thread.
+
+    write() only queues the text, later texts for the same file replace
+    queued ones. Before writing, the hash of the text is compared with the
+    hash of the file as last written or loaded (or read from disk if the
+    file changed since), equal content is not written again.
+    Files are written with a temporary file and os.replace.
+
+    Objects:
+        writes / avoided / failed: int
+            Counters of written files, skipped no-op writes and errors
+
+    Functions:
+        write(path, text): queues writing text to path
+        remember(path, text): notes the content of a file just loaded
+        flush(): waits until the queued files are written
+    """
+
+    def __init__(self):
+        self.writes = 0
+        self.avoided = 0
+        self.failed = 0
+        self.last_error = None
+
+        self._pending = {}  # path -> text, in order of the first write() call
+        self._known = {}  # path -> (content hash, (mtime, size)) of the file as written or loaded
+        self._lock = threading.Lock()
+        self._wake = threading.Condition(self._lock)
+        self._busy = False
+        self._thread = threading.Thread(target=self._run, name="FileWriter", daemon=True)
+        self._thread.start()
+
+    def write(self, path, text):
+        """Queues writing text to path. Can be called from any thread."""
+        path = Path(path)
+        with self._lock:
+            self._pending[path] = text
+            self._wake.notify()
+
+    def remember(self, path, text):
+        """Notes the content of a file just loaded, so saving it unchanged is skipped."""
+        path = Path(path)
+        with self._lock:
+            self._known[path] = (content_hash(text), _file_state(path))
+
+    def flush(self, timeout=5.0):
+        """
+        Waits until all queued files are written.
+        Returns False if the timeout expired.
+        """
+        with self._lock:
+            return self._wake.wait_for(lambda: not self._pending and not self._busy, timeout)
+
+    def stats_text(self):
+        text = f"{self.writes} written, {self.avoided} unchanged skipped"
+        if self.failed:
+            text += f", {self.failed} failed"
+        return text
+
+    def _run(self):
+        while True:
+            with self._lock:
+                self._wake.wait_for(lambda: self._pending)
+                path = next(iter(self._pending))
+                text = self._pending.pop(path)
+                known = self._known.get(path)
+                self._busy = True
+            try:
+                self._write(path, text, known)
+            except Exception as e:
+                # the thread must survive, it is the only writer
+                self.failed += 1
+                self.last_error = e
+                logging.error(f"Unexpected error writing {path}: {e}", exc_info=True)
+            finally:
+                with self._lock:
+                    self._busy = False
+                    self._wake.notify_all()
+
+    def _write(self, path, text, known):
+        digest = content_hash(text)
+        state = _file_state(path)
+        if known is not None and known[1] != state:
+            known = None  # changed by another program since
+        if known is None and state is not None:
+            try:
+                known = (content_hash(path.read_text(encoding='utf-8')), state)
+            except (OSError, UnicodeError):
+                known = None
+        if known is not None and known[0] == digest:
+            self.avoided += 1
+            with self._lock:
+                self._known[path] = known
+            logging.debug("Unchanged, not written: %s", path)
+            return
+
+        try:
+            atomic_write_text(path, text)
+        except Exception as e:
+            self.failed += 1
+            self.last_error = e
+            logging.error(f"Failed to write {path}: {e}")
+            from notifications import notify
+            notify(f"Could not save {path.name}: {e}", "error")
+            return
+        self.writes += 1
+        self.last_error = None
+        with self._lock:
+            self._known[path] = (digest, _file_state(path))
+        logging.debug("Written: %s", path)
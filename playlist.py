@@ -9,6 +9,22 @@ from tkinter import filedialog, StringVar, BooleanVar
 from pathlib import Path
 
 import logging
+import threading
+import time
+
+from notifications import notify
+from persistence import get_file_writer
+from playlist_model import PlaylistModel
+from playlist_search import PlaylistSearch
+from rundown import RundownReader, format_duration
+from stallwatch import stalls_paused
+from virtuallist import VirtualList
+
+# Playlists with more items are opened in the list view
+LARGE_PLAYLIST = 5000
+# Interval for checking the project playlist file for changes by other programs
+WATCH_MS = 500
+
 
 class Playlist():
     def __init__(self, project=None, **kwargs):
@@ -19,47 +35,79 @@ class Playlist():
             project: Project instance for new project-based workflow
             **kwargs: Additional parameters for backward compatibility
 
+        The items and the playhead are held by a PlaylistModel, this class is
+        the Tk side of it: the variables below are only set when their value changed.
+
         Objects:
-            playhead: ttk.IntVar
-                Used by Widget as index to point at list
+            model: PlaylistModel
+                Items and playhead index
             
             playhead_text: ttk.StrVar
                 Usef by Widget as text from list
             
-            data_len: ttk.IntVar
-                Used by spinbox widget as dynamic list lenght.
-            
             inc_able / dec_able: BooleanVar
                 Are True, when playhead increasable and decreasable.
+
+            rundown: Rundown or None
+                Typed columns (IDs, titles, durations) of the last imported CSV/TSV rundown
         
         Functions:
             playlist_edit_window(): Shows the playlist editor
             change_playhead(new_value): change playhead position
             playlist_entry(): returns current playlist text as String and increments playhead after that.
+            watch_project_file(root): applies changes of the project playlist file made by other programs
         """
-        self.data = ["No Items"]
-        self.data_len = ttk.IntVar(value=len(self.data))
-        self.data_len.trace_add("write", self.update_decinc_able)
+        self.model = PlaylistModel()
 
         # Store project reference for new workflow
         self.project = project
 
-        self.playhead = ttk.IntVar(value=0)
-        self.playhead.trace_add("write", self.on_playhead_update)
-        self.playhead.trace_add("write", self.update_decinc_able)
-        
-        self.playhead_text = StringVar(value=self.data[self.playhead.get()])
-
-        self.inc_able = BooleanVar(value=self.playhead.get() < (self.data_len.get()-1))
-        self.dec_able = BooleanVar(value=self.playhead.get() > 0)
+        # view state, the variables are only set if the value differs
+        self.playhead_text = StringVar(value=self.model.current)
+        self.inc_able = BooleanVar(value=self.model.can_inc)
+        self.dec_able = BooleanVar(value=self.model.can_dec)
+        self._shown = (self.model.current, self.model.can_inc, self.model.can_dec)
+        self.model.subscribe(self.on_model_change)
+
+        # search index for the jump box, synced when the items change
+        self.search = PlaylistSearch()
+        self.search.update(self.model.items)
+        self._search_revision = self.model.revision
+        self.jump_box = None
+        self.rundown = None
+        self.rundown_dialog = None
+
+        # state of the project playlist file as last loaded or saved: (path, (mtime, size))
+        self._file_state = None
+        self._pending_state = None
+        self._warned_state = None
+        self._watch_root = None
 
         self.edit_window = None
+        self.text_area = None
+        self.item_list = None
+        self.list_mode = False
+        self._lines = []  # text lines of the editor as synced, None for edited lines
         self.directory = kwargs.get('directory', Path.home())
         
                 # Load from project if available
         if self.project and hasattr(self.project, 'project_playlist_file'):
             self.load_from_project()
 
+    @property
+    def data(self):
+        """Items of the playlist."""
+        return self.model.items
+
+    @data.setter
+    def data(self, items):
+        self.model.set_items(items)
+
+    @property
+    def playhead(self):
+        """Index of the current item."""
+        return self.model.playhead
+
     def get_default_directory(self):
         """
         Gets the default directory for file dialogs.
@@ -71,9 +119,7 @@ class Playlist():
         if (self.project and 
             hasattr(self.project, 'settings_manager') and 
             self.project.settings_manager):
-            default_dir = self.project.settings_manager.get_setting('default_dir')
-            if default_dir and Path(default_dir).exists() and Path(default_dir).is_dir():
-                return default_dir
+            return self.project.settings_manager.get_default_directory()
         
         return None
 
@@ -105,15 +151,45 @@ class Playlist():
         self.edit_window.rowconfigure(3, weight=0)
 
         # text field
-        self.text_area = ttk.Text(self.edit_window, wrap="none", height=15)
-        self.text_area.grid(column=1, columnspan=4, row=1, sticky="NSEW")
+        self.text_frame = ttk.Frame(self.edit_window)
+        self.text_frame.grid(column=1, columnspan=5, row=1, sticky="NSEW")
+        self.text_frame.columnconfigure(0, weight=1)
+        self.text_frame.rowconfigure(0, weight=1)
+
+        self.text_area = ttk.Text(self.text_frame, wrap="none", height=15)
+        self.text_area.grid(column=0, row=0, sticky="NSEW")
+        self.track_text_edits()
         
         self.text_area.bind("<Button-3>", self.show_text_context_menu)
 
-        scroll_bar = ttk.Scrollbar(self.edit_window, command=self.text_area.yview)
-        scroll_bar.grid(column=5, row=1, sticky="NS")
+        scroll_bar = ttk.Scrollbar(self.text_frame, command=self.text_area.yview)
+        scroll_bar.grid(column=1, row=0, sticky="NS")
         self.text_area.configure(yscrollcommand=scroll_bar.set)
 
+        # list view for large playlists, only the visible items are rendered
+        self.list_frame = ttk.Frame(self.edit_window)
+        self.list_frame.columnconfigure(0, weight=1)
+        self.list_frame.rowconfigure(0, weight=1)
+        self.item_list = VirtualList(
+            self.list_frame, self.get_item_rows,
+            columns=("playhead", "index", "item"), headings=("", "#", "Item"), widths=(20, 60, None)
+        )
+        self.item_list.grid(column=0, columnspan=2, row=0, sticky="NSEW")
+        self.item_list.on_select = self.on_item_select
+        self.item_list.on_activate = self.change_playhead
+        self.item_var = StringVar()
+        self.item_entry = ttk.Entry(self.list_frame, textvariable=self.item_var)
+        self.item_entry.grid(column=0, row=1, sticky="EW", pady=(5, 0))
+        self.item_entry.bind("<Return>", self.apply_item_edit)
+        ttk.Button(self.list_frame, text="Apply", command=self.apply_item_edit, bootstyle="secondary-outline").grid(column=1, row=1, padx=(5, 0), pady=(5, 0))
+
+        self.list_mode_var = BooleanVar(value=len(self.model) > LARGE_PLAYLIST)
+        ttk.Checkbutton(
+            self.edit_window, text="List view", variable=self.list_mode_var,
+            command=lambda: self.set_list_mode(self.list_mode_var.get()),
+            bootstyle="round-toggle"
+        ).grid(column=1, columnspan=4, row=3, padx=5, pady=(0, 5), sticky="W")
+
         # context menu
         self.text_ctx_menu = ttk.Menu(self.edit_window, tearoff=0)
         self.text_ctx_menu.add_command(label="Cut", command=lambda: self.text_area.event_generate("<<Cut>>"))
@@ -132,8 +208,8 @@ class Playlist():
             ttk.Button(self.edit_window, text="Load", command=self.load_playlist, bootstyle="primary-outline").grid(column=2, row=2, padx=5, pady=5)
             ttk.Button(self.edit_window, text="Save", command=self.safe_playlist, bootstyle="primary-outline").grid(column=3, row=2, padx=5, pady=5)
 
-        self.populate_text_area()
-        self.text_area.focus_set()
+        self.list_mode = None
+        self.set_list_mode(self.list_mode_var.get())
 
         self.edit_window.bind("<FocusIn>", self.on_edit_window_focus_in)
         self.edit_window.bind("<FocusOut>", self.on_edit_window_focus_out)
@@ -155,20 +231,150 @@ class Playlist():
             self.edit_window.focus_set()
 
     def close_window(self):
+        proxy = self.text_area._w if self.text_area is not None else None
         self.edit_window.destroy()
+        if proxy:
+            self.text_area.tk.deletecommand(proxy)
         self.edit_window = None
+        self.text_area = None
+        self.item_list = None
+
+    def set_list_mode(self, list_mode):
+        """
+        Switches the editor between the text field and the list view.
+        Edits of the text field are synced to the model before.
+        """
+        if list_mode == self.list_mode:
+            return
+        if self.list_mode is False:
+            self.update_list()
+        self.list_mode = list_mode
+        if list_mode:
+            self.text_frame.grid_remove()
+            self.list_frame.grid(column=1, columnspan=5, row=1, sticky="NSEW")
+            self.item_list.select(self.model.playhead)
+            self.item_list.tree.focus_set()
+        else:
+            self.list_frame.grid_remove()
+            self.text_frame.grid()
+            self.text_area.focus_set()
+        self.populate_editor()
+
+    def populate_editor(self):
+        """Shows the items in the editor, if it is open."""
+        if self.edit_window is None or not self.edit_window.winfo_exists():
+            return
+        if self.list_mode is False and len(self.model) > LARGE_PLAYLIST:
+            # the loaded items replace the text, it must not be synced back
+            self.text_area.edit_modified(False)
+            self.list_mode_var.set(True)
+            self.set_list_mode(True)
+            return
+        if self.list_mode:
+            self.item_list.set_row_count(len(self.model))
+        else:
+            self.populate_text_area()
 
     def populate_text_area(self):
+        """Fills the text field with one insert."""
         self.text_area.delete("1.0", "end")
-        for line in self.data:
-            self.text_area.insert("end", line + "\n")
+        self.text_area.insert("1.0", "\n".join(self.model.items) + "\n")
+        self.text_area.mark_set("insert", "1.0")
+        self._lines = list(self.model.items) + [""]
+        self.text_area.edit_modified(False)
+
+    def track_text_edits(self):
+        """
+        Routes the inserts and deletes of the text field through _on_text_command,
+        so the edited lines are known without reading the whole text.
+        """
+        widget = self.text_area._w
+        self._text_command = widget + "_orig"
+        self.text_area.tk.call("rename", widget, self._text_command)
+        self.text_area.tk.createcommand(widget, self._on_text_command)
+
+    def _on_text_command(self, command, *args):
+        """
+        Keeps self._lines aligned with the lines of the text field:
+        removed lines are dropped, inserted and changed lines set to None.
+        """
+        call = self.text_area.tk.call
+        if command in ("insert", "delete", "replace") and args:
+            try:
+                self._track_text_edit(call, command, args)
+            except Exception as e:
+                logging.debug("Playlist editor: edit not tracked (%s), resync on update", e)
+                self._lines = []
+        return call((self._text_command, command) + args)
+
+    def _track_text_edit(self, call, command, args):
+        def line_of(index):
+            return int(str(call(self._text_command, "index", index)).split(".")[0])
+
+        line = line_of(args[0])
+        if command == "insert":
+            chars = args[1::2]  # insert index chars ?tags chars tags ...?
+        else:
+            if command == "delete" and len(args) > 2:
+                raise ValueError("multiple ranges")
+            end = args[1] if len(args) > 1 else f"{args[0]}+1c"
+            del self._lines[line:line_of(end)]
+            chars = args[2::2] if command == "replace" else ()
+        new_lines = sum(str(text).count("\n") for text in chars)
+        if new_lines:
+            self._lines[line:line] = [None] * new_lines
+        if 0 < line <= len(self._lines):
+            self._lines[line - 1] = None
 
     def update_list(self):
-        lines = self.text_area.get("1.0", "end").splitlines()
-        self.data = [line for line in lines if line.strip()]
-        self.update_data_len()
-        self.on_playhead_update()
-        self.repos_playhead()
+        """
+        Syncs the edited lines of the text field to the model.
+        Only the lines changed since the last sync are read from the widget.
+        """
+        if self.text_area is None or not self.text_area.winfo_exists():
+            return
+        if not self.text_area.edit_modified():
+            return
+
+        line_count = int(self.text_area.index("end-1c").split(".")[0])
+        if len(self._lines) != line_count:
+            logging.warning("Playlist editor out of sync, reading the whole text")
+            self._lines = self.text_area.get("1.0", "end-1c").split("\n")
+        else:
+            # read runs of edited lines with one call each
+            index = 0
+            while index < len(self._lines):
+                if self._lines[index] is not None:
+                    index += 1
+                    continue
+                end = index
+                while end < len(self._lines) and self._lines[end] is None:
+                    end += 1
+                text = self.text_area.get(f"{index + 1}.0", f"{end}.end")
+                self._lines[index:end] = text.split("\n")
+                index = end
+
+        self.model.set_items(self._lines)
+        self.text_area.edit_modified(False)
+
+    # GUI: LIST VIEW
+    def get_item_rows(self, first, count):
+        items = self.model.items[first:first + count]
+        playhead = self.model.playhead
+        return [("▶" if first + i == playhead else "", first + i + 1, item) for i, item in enumerate(items)]
+
+    def on_item_select(self, index):
+        if 0 <= index < len(self.model):
+            self.item_var.set(self.model.items[index])
+
+    def apply_item_edit(self, event=None):
+        """Replaces the selected item by the text of the entry, an empty text removes it."""
+        index = self.item_list.selected_index()
+        if index is None:
+            return
+        self.model.set_item(index, self.item_var.get())
+        self.item_list.set_row_count(len(self.model))
+        self.on_item_select(min(index, len(self.model) - 1))
 
     def show_text_context_menu(self, event):
         """Show context menu for text field with cut/copy/paste-commands."""
@@ -193,18 +399,34 @@ class Playlist():
             self.tree.selection_set(self.tree.get_children()[next_index])
             self.edit_item(None)
     
-    def update_data_len(self):
-        self.data_len.set(len(self.data))
-        logging.debug(f"updated data_len to {self.data_len.get()}")
-
-    def update_decinc_able(self, *args):
+    # VIEW
+    def on_model_change(self, model):
         """
-        Updates the dec_able and inc_able variables based on the current playhead position.
+        Pushes the changed values of the model to the Tk variables.
         """
-        current = self.playhead.get()
-        self.inc_able.set(current < (self.data_len.get() - 1))
-        self.dec_able.set(current > 0)
-        logging.debug(f"Updated inc_able to {self.inc_able.get()} and dec_able to {self.dec_able.get()}")
+        if model.revision != self._search_revision:
+            self.search.update(model.items)
+            self._search_revision = model.revision
+        if self.list_mode and self.item_list is not None:
+            self.item_list.set_row_count(len(model))
+        shown = (model.current, model.can_inc, model.can_dec)
+        if shown == self._shown:
+            return
+        text, inc_able, dec_able = shown
+        if text != self._shown[0]:
+            self.playhead_text.set(text)
+        if inc_able != self._shown[1]:
+            self.inc_able.set(inc_able)
+        if dec_able != self._shown[2]:
+            self.dec_able.set(dec_able)
+        self._shown = shown
+
+
+    def show_jump_box(self):
+        """Opens the type-ahead search to jump to a playlist item."""
+        if self.jump_box is None:
+            self.jump_box = PlaylistJumpBox(self)
+        self.jump_box.show()
 
 
     # PLAYHEAD CONTROL    
@@ -212,37 +434,19 @@ class Playlist():
         """
         Increments the playhead.
         """
-        current = int(self.playhead.get())
-        lenght = len(self.data)
-        if 0 <= current < lenght-1:
-            self.playhead.set(current +1)
-            logging.debug(f"Playlist: Incrementing playhead to {self.playhead.get()}")
+        self.model.inc()
 
     def dec_playhead(self):
         """
         Decrements the playhead.
         """
-        current = int(self.playhead.get())
-        lenght = len(self.data)
-        if 0 < current <= lenght-1:
-            self.playhead.set(current -1)
-            logging.debug(f"Playlist: Decrementing playhead to {self.playhead.get()}")
-
-    def on_playhead_update(self, *args):
-        index = self.playhead.get()
-        if 0 <= index < len(self.data):
-            self.playhead_text.set(self.data[index])
-            logging.debug(f"Playlist GUI updated: playhead={index}, text='{self.data[index]}'")
-        else:
-            logging.warning(f"Playlist playhead index out of bounds: {index}, data_len={len(self.data)}")
-    
-    def repos_playhead(self):
-        current = int(self.playhead.get())
-        lenght = len(self.data)
-        if current > lenght-1:
-            self.playhead.set(lenght-1)
-            logging.debug(f"Playlist: Repositioning playhead to {self.playhead.get()}")
-        self.on_playhead_update()
+        self.model.dec()
+
+    def change_playhead(self, new_value):
+        """
+        Moves the playhead to an index.
+        """
+        self.model.seek(new_value)
 
     def playlist_entry(self, *args):
         """
@@ -251,44 +455,66 @@ class Playlist():
         Return:
             playlist_entry: str
         """
-        index = self.playhead.get()
-        lenght = len(self.data)
-        if 0 <= index <= lenght-1:
-            string = str(self.data[index])
-            if not index == lenght-1:
-                self.playhead.set(self.playhead.get()+1)
-            return string
-        else:
-            logging.error(f"Playlist.playlist_entry: Index out of range ({index} from {self.playhead.get()})")
+        return self.model.take()
 
 
     # LEGACY FILE HANDLING (Backward Compatibility)
     def safe_playlist(self, save_path=None):
         if not save_path:
-            save_path = filedialog.asksaveasfilename(
-                initialdir=self.get_default_directory(),
-                defaultextension=".txt",
-                initialfile="Playlist.txt",
-                filetypes=[("Text files", "*.txt")]
-            )
+            with stalls_paused():
+                save_path = filedialog.asksaveasfilename(
+                    initialdir=self.get_default_directory(),
+                    defaultextension=".txt",
+                    initialfile="Playlist.txt",
+                    filetypes=[("Text files", "*.txt")]
+                )
         if save_path:
-            save_path = Path(save_path)
-            save_path.write_text("\n".join(self.data))
+            get_file_writer().write(save_path, "\n".join(self.data))
             logging.info("Playlist saved after changing.")
     
     def load_playlist(self, load_path=None):
         if not load_path:
-            load_path = filedialog.askopenfilename(
-                filetypes=[("Text files", "*.txt")],
-                initialdir=self.get_default_directory()
-            )
+            with stalls_paused():
+                load_path = filedialog.askopenfilename(
+                    filetypes=[("Playlists", "*.txt *.csv *.tsv"), ("Text files", "*.txt"), ("Rundowns", "*.csv *.tsv")],
+                    initialdir=self.get_default_directory()
+                )
         if load_path:
             load_path = Path(load_path)
-            self.data = load_path.read_text().splitlines()
-            self.update_data_len()
-            self.populate_text_area()
+            if load_path.suffix.lower() in (".csv", ".tsv"):
+                self.import_rundown(load_path)
+                return
+            self.load_lines(load_path)
+            self.rundown = None
+            self.populate_editor()
             logging.info("Playlist loaded")
 
+    def load_lines(self, path):
+        """Sets the items to the lines of a text file, read line by line."""
+        with open(path, 'r', encoding='utf-8', errors='replace') as file:
+            self.model.set_items(line.rstrip("\r\n") for line in file)
+
+    def import_rundown(self, path):
+        """Opens the import dialog for a CSV/TSV rundown."""
+        try:
+            reader = RundownReader(path)
+        except (OSError, UnicodeError) as e:
+            logging.error(f"Failed to open rundown {path}: {e}")
+            notify(f"Could not open rundown: {e}", "error")
+            return
+        if self.rundown_dialog is not None:
+            self.rundown_dialog.close()
+        self.rundown_dialog = RundownImportDialog(self, reader)
+
+    def set_rundown(self, rundown):
+        """Replaces the items by the marker texts of an imported rundown."""
+        self.rundown = rundown
+        self.model.set_items(rundown.texts)
+        self.populate_editor()
+        total = rundown.total_duration()
+        planned = f", planned {format_duration(total)}" if total else ""
+        notify(f"Rundown imported: {len(rundown)} items{planned}", "success")
+
 
     # PROJECT-BASED FILE HANDLING (New Workflow)
     def update_and_save_to_project(self):
@@ -302,9 +528,10 @@ class Playlist():
         # Save to project playlist file if project is available
         if self.project and self.project.project_playlist_file:
             try:
+                # written in the background, the watcher finds no edits in its own write
                 playlist_file = Path(self.project.project_playlist_file)
-                playlist_file.write_text("\n".join(self.data))
-                logging.info(f"Playlist saved to project file: {playlist_file}")
+                get_file_writer().write(playlist_file, "\n".join(self.data))
+                logging.info("Playlist saved to project file: %s", playlist_file)
             except Exception as e:
                 logging.error(f"Failed to save playlist to project: {e}")
         else:
@@ -318,19 +545,15 @@ class Playlist():
             playlist_file = Path(self.project.project_playlist_file)
             if playlist_file.exists():
                 try:
-                    self.data = playlist_file.read_text().splitlines()
-                    # Filter out empty lines
-                    self.data = [line for line in self.data if line.strip()]
-                    if not self.data:
-                        self.data = ["No Items"]
-                    
-                    self.update_data_len()
-                    if hasattr(self, 'text_area'):
-                        self.populate_text_area()
-                    self.repos_playhead()
-                    # Ensure GUI is updated with the new data
-                    self.on_playhead_update()
-                    logging.info(f"Playlist data successfully loaded from project file: {playlist_file} ({len(self.data)} entries)")
+                    if self._file_state is not None and self._file_state[0] == playlist_file:
+                        # same project reloaded: merge, so the playhead stays on its item
+                        self.reload_project_file(self._project_file_state())
+                        return
+                    # Empty lines are dropped by the model
+                    self.load_lines(playlist_file)
+                    self._file_state = self._project_file_state()
+                    self.populate_editor()
+                    logging.info("Playlist data successfully loaded from project file: %s (%d entries)", playlist_file, len(self.data))
                 except Exception as e:
                     logging.error(f"Failed to load playlist from project: {e}")
             else:
@@ -338,34 +561,285 @@ class Playlist():
         else:
             logging.warning("No project or project playlist file available for loading")
 
+    # WATCHING THE PROJECT FILE
+    def watch_project_file(self, root):
+        """
+        Checks the project playlist file every WATCH_MS for changes made by other
+        programs (e.g. producers editing the rundown during the show) and merges
+        them into the playlist, the playhead stays on its item.
+        """
+        self._watch_root = root
+        root.after(WATCH_MS, self.check_project_file)
+
+    def _project_file_state(self):
+        if not (self.project and self.project.project_playlist_file):
+            return None
+        path = Path(self.project.project_playlist_file)
+        try:
+            stat = path.stat()
+        except OSError:
+            return (path, None)
+        return (path, (stat.st_mtime_ns, stat.st_size))
+
+    def check_project_file(self):
+        try:
+            state = self._project_file_state()
+            if state is None or state[1] is None or state == self._file_state:
+                self._pending_state = None
+            elif state != self._pending_state:
+                # wait one interval, the other program may still be writing
+                self._pending_state = state
+            elif self.text_area is not None and self.text_area.winfo_exists() and self.text_area.edit_modified():
+                # reloaded when the editor is closed, saving the editor overwrites the file
+                if state != self._warned_state:
+                    self._warned_state = state
+                    logging.warning("Playlist file changed, not reloaded because of unsaved edits in the editor")
+                    notify("Playlist file changed on disk. It is reloaded when the editor is closed.", "warning")
+            else:
+                self._pending_state = None
+                self.reload_project_file(state)
+        except Exception as e:
+            logging.error(f"Failed to check playlist file: {e}")
+        self._watch_root.after(WATCH_MS, self.check_project_file)
+
+    def reload_project_file(self, state):
+        """Merges the current content of the project playlist file into the playlist."""
+        path = state[0]
+        start = time.perf_counter()
+        with open(path, 'r', encoding='utf-8', errors='replace') as file:
+            lines = [line.rstrip("\r\n") for line in file]
+        self._file_state = state
+        before = self.model.current
+        edits = self.model.merge(lines)
+        if not edits:
+            return
+        self.apply_edits_to_editor(edits)
+        elapsed = (time.perf_counter() - start) * 1000
+        changed = sum(max(stop - first, len(items)) for first, stop, items in edits)
+        logging.info("Playlist reloaded from %s: %d lines changed in %.1f ms, playhead %r -> %r",
+                     path, changed, elapsed, before, self.model.current)
+        notify(f"Playlist updated from file ({changed} lines changed)", "info")
+
+    def apply_edits_to_editor(self, edits):
+        """
+        Applies the edits of PlaylistModel.merge to the text field line by line,
+        instead of filling it again. The list view is refreshed by the model change.
+        """
+        if self.list_mode is not False or self.text_area is None or not self.text_area.winfo_exists():
+            return
+        if len(self.model) > LARGE_PLAYLIST or self.text_area.edit_modified():
+            # the list view is used, or the text no longer matches the old items
+            self.populate_editor()
+            return
+        for first, stop, items in reversed(edits):
+            self.text_area.delete(f"{first + 1}.0", f"{stop + 1}.0")
+            if items:
+                self.text_area.insert(f"{first + 1}.0", "\n".join(items) + "\n")
+        self._lines = list(self.model.items) + [""]
+        self.text_area.edit_modified(False)
+
     # LEGACY FILE HANDLING (Backward Compatibility)
     def safe_playlist_legacy(self, save_path=None):
         if not save_path:
-            save_path = filedialog.asksaveasfilename(
-                initialdir=self.get_default_directory(),
-                defaultextension=".txt",
-                initialfile="Playlist.txt",
-                filetypes=[("Text files", "*.txt")]
-            )
+            with stalls_paused():
+                save_path = filedialog.asksaveasfilename(
+                    initialdir=self.get_default_directory(),
+                    defaultextension=".txt",
+                    initialfile="Playlist.txt",
+                    filetypes=[("Text files", "*.txt")]
+                )
         if save_path:
-            save_path = Path(save_path)
-            save_path.write_text("\n".join(self.data))
+            get_file_writer().write(save_path, "\n".join(self.data))
             logging.info("Playlist saved (legacy method).")
     
     def load_playlist_legacy(self, load_path=None):
         if not load_path:
-            load_path = filedialog.askopenfilename(
-                filetypes=[("Text files", "*.txt")],
-                initialdir=self.get_default_directory()
-            )
+            with stalls_paused():
+                load_path = filedialog.askopenfilename(
+                    filetypes=[("Text files", "*.txt")],
+                    initialdir=self.get_default_directory()
+                )
         if load_path:
             load_path = Path(load_path)
-            self.data = load_path.read_text().splitlines()
-            self.update_data_len()
-            self.populate_text_area()
+            self.load_lines(load_path)
+            self.populate_editor()
             logging.info("Playlist loaded (legacy method).")
 
 
+class RundownImportDialog:
+    """
+    Window importing a CSV/TSV rundown as playlist.
+    Shows a preview of the first rows and lets the operator pick the column
+    used as marker text. The file is read on a background thread.
+    """
+
+    POLL_MS = 100
+
+    def __init__(self, playlist, reader):
+        self.playlist = playlist
+        self.reader = reader
+        self.columns = reader.columns()
+        self._result = None
+        self._thread = None
+
+        self.window = ttk.Toplevel()
+        self.window.title(f"QuickEDL: Import Rundown {reader.path.name}")
+        self.window.geometry("600x400")
+        self.window.protocol("WM_DELETE_WINDOW", self.close)
+        self.window.bind("<Escape>", lambda e: self.close())
+        self.window.columnconfigure(1, weight=1)
+        self.window.rowconfigure(1, weight=1)
+
+        ttk.Label(self.window, text="Marker text column:").grid(column=0, row=0, sticky="W", padx=10, pady=10)
+        self.column_var = StringVar(value=self.columns[reader.guess_text_column()] if self.columns else "")
+        self.column_box = ttk.Combobox(self.window, textvariable=self.column_var, values=self.columns, state="readonly")
+        self.column_box.grid(column=1, row=0, sticky="EW", padx=(0, 10), pady=10)
+
+        ids = [f"c{i}" for i in range(len(self.columns))]
+        self.preview = ttk.Treeview(self.window, columns=ids, show="headings", selectmode="none")
+        for column_id, name in zip(ids, self.columns):
+            self.preview.heading(column_id, text=name, anchor="w")
+            self.preview.column(column_id, width=120)
+        for row in reader.preview():
+            self.preview.insert("", "end", values=row)
+        self.preview.grid(column=0, columnspan=2, row=1, sticky="NSEW", padx=10)
+
+        header = "with header" if reader.has_header else "without header"
+        self.status = ttk.Label(self.window, text=f"{len(self.columns)} columns, {header}")
+        self.status.grid(column=0, row=2, sticky="W", padx=10, pady=10)
+        self.import_button = ttk.Button(self.window, text="Import", command=self.start_import, bootstyle="success")
+        self.import_button.grid(column=1, row=2, sticky="E", padx=10, pady=10)
+
+    def start_import(self):
+        if not self.columns or self._thread is not None:
+            return
+        text_column = self.columns.index(self.column_var.get())
+        self.import_button.config(state="disabled")
+        self.column_box.config(state="disabled")
+        self.status.config(text="Importing...")
+        self._thread = threading.Thread(target=self._load, args=(text_column,), daemon=True)
+        self._thread.start()
+        self.window.after(self.POLL_MS, self._poll)
+
+    def _load(self, text_column):
+        start = time.perf_counter()
+        try:
+            self._result = (self.reader.load(text_column), time.perf_counter() - start)
+        except Exception as e:
+            logging.error(f"Failed to import rundown {self.reader.path}: {e}")
+            self._result = (e, 0)
+
+    def _poll(self):
+        if not self.window.winfo_exists():
+            return  # closed while importing, the result is dropped
+        if self._thread.is_alive():
+            self.window.after(self.POLL_MS, self._poll)
+            return
+        rundown, elapsed = self._result
+        if isinstance(rundown, Exception):
+            notify(f"Could not import rundown: {rundown}", "error")
+        else:
+            logging.info(f"Rundown parsed in {elapsed:.2f} s")
+            self.playlist.set_rundown(rundown)
+        self.close()
+
+    def close(self):
+        if self.window.winfo_exists():
+            self.window.destroy()
+        if self.playlist.rundown_dialog is self:
+            self.playlist.rundown_dialog = None
+
+
+class PlaylistJumpBox:
+    """
+    Small window searching the playlist items while typing.
+    Return (or a double click) moves the playhead to the selected item.
+    The window is built on first use and hidden afterwards.
+    """
+
+    LIMIT = 50
+
+    def __init__(self, playlist):
+        self.playlist = playlist
+        self.window = None
+        self.results = []
+
+    def build(self):
+        self.window = ttk.Toplevel()
+        self.window.withdraw()
+        self.window.title("QuickEDL: Jump to Playlist Item")
+        self.window.geometry("400x320")
+        self.window.protocol("WM_DELETE_WINDOW", self.hide)
+        self.window.bind("<Escape>", lambda e: self.hide())
+        self.window.columnconfigure(0, weight=1)
+        self.window.rowconfigure(1, weight=1)
+
+        self.query = StringVar()
+        self.query.trace_add("write", self.on_query)
+        self.entry = ttk.Entry(self.window, textvariable=self.query)
+        self.entry.grid(column=0, row=0, sticky="EW", padx=10, pady=(10, 5))
+        self.entry.bind("<Return>", self.jump)
+        self.entry.bind("<Down>", lambda e: self.move_selection(1))
+        self.entry.bind("<Up>", lambda e: self.move_selection(-1))
+
+        self.listbox = ttk.Treeview(self.window, columns=("index", "item"), show="headings", selectmode="browse")
+        self.listbox.heading("index", text="#", anchor="w")
+        self.listbox.heading("item", text="Item", anchor="w")
+        self.listbox.column("index", width=60, stretch=False)
+        self.listbox.grid(column=0, row=1, sticky="NSEW", padx=10)
+        self.listbox.bind("<Double-Button-1>", self.jump)
+        self.listbox.bind("<Return>", self.jump)
+
+        self.status = ttk.Label(self.window, text="")
+        self.status.grid(column=0, row=2, sticky="W", padx=10, pady=(5, 10))
+
+    def show(self):
+        if self.window is None or not self.window.winfo_exists():
+            self.build()
+        self.query.set("")
+        self.window.deiconify()
+        self.window.lift()
+        self.entry.focus_force()
+
+    def hide(self):
+        if self.window is not None and self.window.winfo_exists():
+            self.window.withdraw()
+
+    def on_query(self, *args):
+        query = self.query.get()
+        start = time.perf_counter()
+        self.results = self.playlist.search.search(query, self.LIMIT)
+        elapsed = (time.perf_counter() - start) * 1000
+
+        self.listbox.delete(*self.listbox.get_children())
+        for index, item in self.results:
+            self.listbox.insert("", "end", iid=str(index), values=(index + 1, item))
+        if self.results:
+            self.listbox.selection_set(str(self.results[0][0]))
+        more = "+" if len(self.results) >= self.LIMIT else ""
+        self.status.config(text=f"{len(self.results)}{more} items ({elapsed:.2f} ms)" if query.strip() else "")
+
+    def move_selection(self, step):
+        children = self.listbox.get_children()
+        if not children:
+            return "break"
+        selection = self.listbox.selection()
+        position = children.index(selection[0]) + step if selection else 0
+        item = children[max(0, min(position, len(children) - 1))]
+        self.listbox.selection_set(item)
+        self.listbox.see(item)
+        return "break"
+
+    def jump(self, event=None):
+        selection = self.listbox.selection()
+        if not selection:
+            return "break"
+        self.playlist.change_playhead(int(selection[0]))
+        logging.info("Playlist: jumped to item %d", int(selection[0]) + 1)
+        self.hide()
+        return "break"
+
+
 # TEST
 if __name__ == "__main__":
     root = ttk.Window(themename="darkly")
@@ -0,0 +1,208 @@
+"""
+This file is part of QuickEDL.
+It provides the playlist data and playhead, independent of Tk.
+"""
+
+from difflib import SequenceMatcher
+
+EMPTY_ITEM = "No Items"
+
+
+def changed_range(old, new, chunk=1024):
+    """
+    Returns (start, old_end, new_end): old[start:old_end] was replaced by new[start:new_end].
+    The equal start and end are found by comparing slices, which is fast for
+    lists sharing most of their items.
+    """
+    limit = min(len(old), len(new))
+    start = 0
+    while start + chunk <= limit and old[start:start + chunk] == new[start:start + chunk]:
+        start += chunk
+    while start < limit and old[start] == new[start]:
+        start += 1
+
+    end = 0
+    limit -= start
+    while end + chunk <= limit and old[len(old) - end - chunk:len(old) - end] == new[len(new) - end - chunk:len(new) - end]:
+        end += chunk
+    while end < limit and old[len(old) - end - 1] == new[len(new) - end - 1]:
+        end += 1
+    return start, len(old) - end, len(new) - end
+
+
+class PlaylistModel:
+    """
+    Items of the playlist and the playhead pointing at the current item.
+
+    The model never is empty: without items it holds EMPTY_ITEM.
+    Listeners are called with the model after every change, playhead
+    operations are O(1).
+
+    Objects:
+        items: list of str
+        playhead: int
+            Index of the current item
+        revision: int
+            Incremented when the items change (not on playhead moves)
+
+    Functions:
+        set_items(items): replaces the items, empty lines are dropped
+        replace(start, stop, items): replaces a slice of the items
+        merge(items): takes a new version of the items, the playhead stays on its item
+        inc() / dec(): moves the playhead by one item
+        seek(index): moves the playhead to an index
+        take(): returns the current item and advances the playhead
+        subscribe(listener): calls listener(model) after changes
+    """
+    __slots__ = ("items", "playhead", "revision", "_listeners")
+
+    def __init__(self, items=None):
+        self.items = [EMPTY_ITEM]
+        self.playhead = 0
+        self.revision = 0
+        self._listeners = []
+        if items is not None:
+            self.set_items(items)
+
+    def __len__(self):
+        return len(self.items)
+
+    @property
+    def current(self):
+        return self.items[self.playhead]
+
+    @property
+    def can_inc(self):
+        return self.playhead < len(self.items) - 1
+
+    @property
+    def can_dec(self):
+        return self.playhead > 0
+
+    def subscribe(self, listener):
+        self._listeners.append(listener)
+
+    def unsubscribe(self, listener):
+        if listener in self._listeners:
+            self._listeners.remove(listener)
+
+    def _changed(self):
+        for listener in self._listeners:
+            listener(self)
+
+    def set_items(self, items):
+        """
+        Replaces the items. Empty lines are dropped,
+        the playhead is kept or moved to the last item.
+        """
+        self.items = [item for item in items if item.strip()] or [EMPTY_ITEM]
+        self.revision += 1
+        if self.playhead >= len(self.items):
+            self.playhead = len(self.items) - 1
+        self._changed()
+
+    def replace(self, start, stop, items):
+        """
+        Replaces the items start:stop by new items (empty lines are dropped).
+        The playhead stays on its item, or on the first new item if its item was replaced.
+        """
+        new = [item for item in items if item.strip()]
+        start = max(0, min(start, len(self.items)))
+        stop = max(start, min(stop, len(self.items)))
+        if self.items == [EMPTY_ITEM]:
+            start, stop = 0, 1
+        self.items[start:stop] = new
+        self.revision += 1
+        if self.playhead >= stop:
+            self.playhead += len(new) - (stop - start)
+        elif self.playhead >= start:
+            self.playhead = start
+        if not self.items:
+            self.items = [EMPTY_ITEM]
+        self.playhead = max(0, min(self.playhead, len(self.items) - 1))
+        self._changed()
+
+    def merge(self, items):
+        """
+        Replaces the items by a new version of them, e.g. the playlist file
+        edited in another program. The lines are diffed against the current
+        items, so the playhead stays on the same item even if lines were
+        inserted or removed before it. If its item was changed, the playhead
+        moves to the changed line, if it was removed, to the next item.
+
+        Only the range between the unchanged start and end is diffed.
+        Returns the edits as [(start, stop, new items)] in the old indices,
+        an empty list if nothing changed.
+        """
+        new = [item for item in items if item.strip()] or [EMPTY_ITEM]
+        old = self.items
+        start, old_end, new_end = changed_range(old, new)
+        if start == old_end and start == new_end:
+            return []
+
+        playhead = self.playhead
+        if playhead >= old_end:
+            new_playhead = playhead + new_end - old_end
+        else:
+            new_playhead = playhead
+        edits = []
+        matcher = SequenceMatcher(None, old[start:old_end], new[start:new_end], autojunk=False)
+        for tag, i1, i2, j1, j2 in matcher.get_opcodes():
+            i1, i2, j1, j2 = i1 + start, i2 + start, j1 + start, j2 + start
+            if tag != "equal":
+                edits.append((i1, i2, new[j1:j2]))
+            if not i1 <= playhead < i2:
+                continue
+            if tag == "equal":
+                new_playhead = j1 + playhead - i1
+            elif tag == "replace":
+                new_playhead = j1 + min(playhead - i1, j2 - j1 - 1)
+            else:  # deleted
+                new_playhead = j1
+
+        self.items = new
+        self.revision += 1
+        self.playhead = max(0, min(new_playhead, len(new) - 1))
+        self._changed()
+        return edits
+
+    def set_item(self, index, item):
+        """Replaces one item, an empty item is removed."""
+        self.replace(index, index + 1, [item])
+
+    def seek(self, index):
+        """
+        Moves the playhead to the index (clamped to the items).
+        Returns True if the playhead moved.
+        """
+        index = max(0, min(int(index), len(self.items) - 1))
+        if index == self.playhead:
+            return False
+        self.playhead = index
+        self._changed()
+        return True
+
+    def inc(self):
+        """Moves the playhead to the next item, returns True if it moved."""
+        if self.playhead >= len(self.items) - 1:
+            return False
+        self.playhead += 1
+        self._changed()
+        return True
+
+    def dec(self):
+        """Moves the playhead to the previous item, returns True if it moved."""
+        if self.playhead <= 0:
+            return False
+        self.playhead -= 1
+        self._changed()
+        return True
+
+    def take(self):
+        """
+        Returns the current item and advances the playhead,
+        the last item stays current.
+        """
+        item = self.items[self.playhead]
+        self.inc()
+        return item
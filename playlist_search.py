@@ -0,0 +1,194 @@
+"""
+This file is part of QuickEDL.
+It provides a search index over the playlist items, independent of Tk.
+"""
+
+from bisect import bisect_left, insort
+from collections import defaultdict
+
+from playlist_model import changed_range
+
+
+def trigrams(word):
+    return {word[i:i + 3] for i in range(len(word) - 2)}
+
+
+class PlaylistSearch:
+    """
+    Type-ahead search over the playlist items.
+
+    Every word of the query must be found in an item: words with three or more
+    letters anywhere in a word of the item, shorter words at the start of one.
+    The index maps the words of the items to the item texts. Matching words are
+    found with a trigram index (long query words) or a sorted word list (short
+    ones), so the work depends on the vocabulary, not on the number of items.
+    Only texts added or removed since the last update are indexed again.
+    A query of digits also finds the item with that number.
+
+    Functions:
+        update(items): syncs the index with the items of the playlist
+        search(query, limit): returns [(index, item)] in playlist order
+    """
+
+    MAX_UNION = 2000  # texts merged into a candidate set, more are iterated lazily
+
+    def __init__(self):
+        self._texts = defaultdict(set)  # word -> item texts
+        self._trigrams = defaultdict(set)  # trigram -> words
+        self._lower = {}  # item text -> lowercase text
+        self._positions = {}  # item text -> item indices
+        self._items = []
+        self._sorted_words = []
+        self._words_dirty = False
+        self._pending_words = 0  # words inserted into the sorted list
+
+    def update(self, items):
+        """
+        Syncs the index with the items. Only the range between the unchanged
+        start and end of the list is compared, texts which are no longer in the
+        playlist are dropped and new texts are indexed.
+        """
+        old = self._items
+        start, old_end, new_end = changed_range(old, items)
+        removed = old[start:old_end]
+        added = items[start:new_end]
+
+        if len(old) == len(items):
+            for index in range(start, old_end):
+                self._positions[old[index]].remove(index)
+            for index in range(start, new_end):
+                self._positions.setdefault(items[index], []).append(index)
+        else:
+            positions = {}
+            for index, item in enumerate(items):
+                positions.setdefault(item, []).append(index)
+            self._positions = positions
+        for text in set(removed):
+            if not self._positions.get(text):
+                self._positions.pop(text, None)
+                self._remove_text(text)
+        for text in set(added):
+            if text not in self._lower:
+                self._add_text(text)
+        for positions in (self._positions[text] for text in set(added)):
+            positions.sort()
+
+        self._items = list(items)
+        if self._words_dirty:
+            self._sorted_words = sorted(self._texts)
+            self._words_dirty = False
+        self._pending_words = 0
+
+    def _add_text(self, text):
+        lower = self._lower[text] = text.lower()
+        for word in set(lower.split()):
+            if word not in self._texts:
+                for gram in trigrams(word):
+                    self._trigrams[gram].add(word)
+                self._add_word(word)
+            self._texts[word].add(text)
+
+    def _remove_text(self, text):
+        for word in set(self._lower.pop(text).split()):
+            texts = self._texts[word]
+            texts.discard(text)
+            if not texts:
+                del self._texts[word]
+                for gram in trigrams(word):
+                    self._trigrams[gram].discard(word)
+                self._remove_word(word)
+
+    def _add_word(self, word):
+        # a few words are inserted, for many words the list is sorted once
+        if not self._words_dirty and self._pending_words < 1000:
+            insort(self._sorted_words, word)
+            self._pending_words += 1
+        else:
+            self._words_dirty = True
+
+    def _remove_word(self, word):
+        if not self._words_dirty:
+            index = bisect_left(self._sorted_words, word)
+            if index < len(self._sorted_words) and self._sorted_words[index] == word:
+                del self._sorted_words[index]
+                return
+        self._words_dirty = True
+
+    def _matching_words(self, query_word):
+        """Words of the index containing (long query word) or starting with (short one) the query word."""
+        if len(query_word) < 3:
+            words = self._sorted_words
+            start = bisect_left(words, query_word)
+            end = bisect_left(words, query_word + "￿", start)
+            return words[start:end]
+
+        smallest = None
+        for gram in trigrams(query_word):
+            words = self._trigrams.get(gram)
+            if not words:
+                return []
+            if smallest is None or len(words) < len(smallest):
+                smallest = words
+        return [word for word in smallest if query_word in word]
+
+    def search(self, query, limit=20):
+        """
+        Returns up to `limit` matches as (index, item), sorted by index.
+        If there are more matches, an arbitrary subset is returned.
+        """
+        query_words = query.lower().split()
+        if not query_words:
+            return []
+
+        results = set()
+        if query.strip().isdigit():
+            index = int(query) - 1
+            if 0 <= index < len(self._items):
+                results.add(index)
+
+        # The query word with the fewest texts gives the candidates, query words
+        # matching a single word of the index are intersected, all are checked.
+        counted = []
+        for query_word in query_words:
+            words = self._matching_words(query_word)
+            if not words:
+                return self._result(results, limit)
+            total = 0
+            if len(words) > self.MAX_UNION:
+                total = len(words)
+            else:
+                for word in words:
+                    total += len(self._texts[word])
+                    if total > self.MAX_UNION:
+                        break
+            # a set of texts can be used as is or intersected in C, prefer it
+            as_set = len(words) == 1 or total <= self.MAX_UNION
+            counted.append((not as_set, total, words))
+        counted.sort(key=lambda entry: entry[:2])
+
+        _, total, words = counted[0]
+        if len(words) == 1:
+            candidates = self._texts[words[0]]
+        elif total <= self.MAX_UNION:
+            candidates = set().union(*(self._texts[word] for word in words))
+        else:
+            candidates = (text for word in words for text in self._texts[word])
+        for _, _, words in counted[1:]:
+            if len(words) == 1 and isinstance(candidates, set):
+                candidates = candidates & self._texts[words[0]]
+
+        found = 0
+        for text in candidates:
+            lower = self._lower[text]
+            padded = " " + lower
+            if all((word in lower) if len(word) >= 3 else (" " + word in padded) for word in query_words):
+                positions = self._positions[text]
+                if not positions[0] in results:
+                    results.update(positions)
+                    found += len(positions)
+                    if found >= limit:
+                        break
+        return self._result(results, limit)
+
+    def _result(self, indices, limit):
+        return [(index, self._items[index]) for index in sorted(indices)[:limit]]
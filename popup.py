@@ -0,0 +1,206 @@
+"""
+This file is part of QuickEDL.
+It provides the popup for markers with a custom text.
+"""
+
+import logging
+import time
+from collections import deque
+
+import ttkbootstrap as ttk
+from ttkbootstrap.constants import LEFT, RIGHT
+
+from hotkeys import MODIFIER_MASK, SHIFT
+
+
+class MarkerPopup:
+    """
+    Popup asking for the text of a marker.
+
+    The window is built once and hidden with withdraw(), so showing it only
+    maps an existing window and no keystrokes get lost while widgets are created.
+    It is not modal: the main window keeps working while the text is typed.
+    Keys which neither type nor edit the text (function keys, keys with
+    Control/Alt, other keys without a character) are passed to the hotkeys.
+    Plain characters like the default marker keys 1-9 are typed into the entry.
+    While typing, texts used before are suggested below the entry: Up/Down
+    select one, Tab takes it into the entry and Return saves it.
+
+    Functions:
+        build(): creates the hidden window, called once at startup
+        show(title, on_submit): shows the popup, on_submit(text) is called with the entered text
+        hide(): hides the popup without submitting
+        show_stats(): time from show() to the window being mapped
+    """
+
+    SAMPLES = 100
+    SUGGESTIONS = 5
+    # keys without a character which are used by the entry or the popup itself
+    EDIT_KEYS = frozenset((
+        "BackSpace", "Delete", "Insert", "Left", "Right", "Up", "Down", "Home", "End",
+        "Tab", "ISO_Left_Tab", "Return", "KP_Enter", "Escape",
+    ))
+
+    def __init__(self, root, on_hotkey=None, on_key_release=None, complete=None):
+        """
+        Args:
+            root: main window
+            on_hotkey: callable(event) for hotkeys typed in the popup
+            on_key_release: callable(event) for key releases typed in the popup
+            complete: callable(prefix, limit) returning suggested texts
+        """
+        self.root = root
+        self.on_hotkey = on_hotkey
+        self.on_key_release = on_key_release
+        self.complete = complete
+        self.suggestions = []
+        self.window = None
+        self._on_submit = None
+        self._show_start = None
+        self.show_times = deque(maxlen=self.SAMPLES)  # ms from show() to mapped
+
+    @property
+    def visible(self):
+        return self.window is not None and self.window.winfo_ismapped()
+
+    def build(self):
+        """Creates the popup window hidden."""
+        if self.window is not None and self.window.winfo_exists():
+            return
+        start = time.perf_counter()
+
+        self.window = ttk.Toplevel(self.root)
+        self.window.withdraw()
+        self.window.geometry("400x260")
+        self.window.resizable(False, False)
+        self.window.transient(self.root)
+        self.window.protocol("WM_DELETE_WINDOW", self.hide)
+        self.window.bind("<Escape>", lambda e: self.hide())
+        self.window.bind("<Return>", self.submit)
+        self.window.bind("<Map>", self._on_map)
+        self.window.bind("<KeyPress>", self._on_key_press)
+        self.window.bind("<KeyRelease>", self._on_key_release)
+
+        self.input_var = ttk.StringVar()
+        self.input_entry = ttk.Entry(self.window, textvariable=self.input_var, width=50)
+        self.input_entry.pack(pady=5)
+        self.input_entry.bind("<Down>", lambda e: self.move_suggestion(1))
+        self.input_entry.bind("<Up>", lambda e: self.move_suggestion(-1))
+        self.input_entry.bind("<Tab>", self.take_suggestion)
+
+        self.suggestion_list = ttk.Treeview(self.window, show="tree", selectmode="browse", height=self.SUGGESTIONS)
+        self.suggestion_list.pack(fill="x", padx=10)
+        self.suggestion_list.bind("<Double-Button-1>", self.submit)
+        self.input_var.trace_add("write", self.update_suggestions)
+
+        buttonframe = ttk.Frame(self.window)
+        buttonframe.pack(pady=10)
+        cancel_button = ttk.Button(buttonframe, bootstyle="danger", text="Cancel", command=self.hide)
+        cancel_button.pack(side=LEFT, padx=10, pady=10)
+        submit_button = ttk.Button(buttonframe, bootstyle="success", text="Save", command=self.submit)
+        submit_button.pack(side=RIGHT, padx=10, pady=10)
+
+        logging.debug("Marker popup built in %.1f ms", (time.perf_counter() - start) * 1000)
+
+    def show(self, title, on_submit):
+        """
+        Shows the popup with an empty entry.
+        If the popup is already open, it is only raised and keeps its text and callback.
+        """
+        self.build()
+        if self.visible:
+            self.window.lift()
+            self.input_entry.focus_force()
+            return
+
+        self._show_start = time.perf_counter()
+        self._on_submit = on_submit
+        self.window.title(title)
+        self.input_var.set("")
+        # open over the main window
+        x = self.root.winfo_rootx() + max(0, (self.root.winfo_width() - 400) // 2)
+        y = self.root.winfo_rooty() + 100
+        self.window.geometry(f"+{x}+{y}")
+        self.window.deiconify()
+        self.window.lift()
+        self.input_entry.focus_force()
+
+    def hide(self):
+        """Hides the popup, the entered text is discarded."""
+        self._on_submit = None
+        if self.window is not None and self.window.winfo_exists():
+            self.window.withdraw()
+            # not focus_force(), the app may be in the background by now
+            self.root.focus_set()
+
+    def submit(self, event=None):
+        selection = self.suggestion_list.selection() if self.window is not None else ()
+        text = self.suggestions[int(selection[0])] if selection else self.input_var.get()
+        on_submit = self._on_submit
+        self.hide()
+        if text and on_submit:
+            on_submit(text)
+
+    def update_suggestions(self, *args):
+        """Shows the texts starting with the entered text, no text is selected."""
+        if self.complete is None:
+            return
+        suggestions = self.complete(self.input_var.get(), self.SUGGESTIONS)
+        if suggestions == self.suggestions:
+            self.suggestion_list.selection_set(())
+            return
+        self.suggestions = suggestions
+        self.suggestion_list.delete(*self.suggestion_list.get_children())
+        for index, text in enumerate(suggestions):
+            self.suggestion_list.insert("", "end", iid=str(index), text=text)
+
+    def move_suggestion(self, step):
+        if not self.suggestions:
+            return "break"
+        selection = self.suggestion_list.selection()
+        if selection:
+            index = int(selection[0]) + step
+        else:
+            index = 0 if step > 0 else len(self.suggestions) - 1
+        if 0 <= index < len(self.suggestions):
+            self.suggestion_list.selection_set(str(index))
+        else:
+            self.suggestion_list.selection_set(())  # back to the typed text
+        return "break"
+
+    def take_suggestion(self, event=None):
+        """Puts the selected (or the first) suggestion into the entry."""
+        if self.suggestions:
+            selection = self.suggestion_list.selection()
+            text = self.suggestions[int(selection[0])] if selection else self.suggestions[0]
+            self.input_var.set(text)
+            self.input_entry.icursor("end")
+        return "break"
+
+    def show_stats(self):
+        """Returns {count, p50, max} of the show latency in milliseconds."""
+        samples = sorted(self.show_times)
+        if not samples:
+            return {'count': 0, 'p50': 0.0, 'max': 0.0}
+        return {'count': len(samples), 'p50': samples[len(samples) // 2], 'max': samples[-1]}
+
+    def _on_map(self, event):
+        if event.widget is self.window and self._show_start is not None:
+            self.show_times.append((time.perf_counter() - self._show_start) * 1000)
+            self._show_start = None
+
+    def _on_key_press(self, event):
+        if self.on_hotkey and self.is_hotkey(event):
+            self.on_hotkey(event)
+
+    def is_hotkey(self, event):
+        """Returns True if the key neither types nor edits the text, it is passed to the hotkeys then."""
+        if event.state & MODIFIER_MASK & ~SHIFT:
+            return True
+        if event.keysym[:1] == "F" and event.keysym[1:].isdigit():
+            return True
+        return not (event.char and event.char.isprintable()) and event.keysym not in self.EDIT_KEYS
+
+    def _on_key_release(self, event):
+        if self.on_key_release:
+            self.on_key_release(event)
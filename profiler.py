@@ -0,0 +1,149 @@
+"""
+This file is part of QuickEDL.
+It provides a sampling profiler of the Tk thread, which can run during a show.
+"""
+
+import logging
+import os
+import sys
+import threading
+import time
+from datetime import datetime
+from pathlib import Path
+
+from utils import atomic_write_text
+
+
+class SamplingProfiler:
+    """
+    Samples the stack of one thread (the Tk thread) from a background thread.
+
+    Each sample reads the thread's frame with sys._current_frames() and counts
+    the stack as a tuple of code objects, names are only formatted on stop.
+    On stop, the counts are written as collapsed stacks, one line per stack:
+    "outer (file.py:12);inner (other.py:34) 17", which flamegraph.pl,
+    speedscope and inferno read.
+
+    A thread is seen where it lets other threads run: blocking I/O and waits
+    exactly, longer computations every switch interval (5 ms). Short
+    computations between waits are counted in the function waiting.
+
+    Overhead: the time spent sampling is measured; while a sample is taken,
+    the sampled thread waits for the GIL, so this share of the wall time is
+    the cost to the app.
+
+    Objects:
+        rate_hz: int
+            Samples per second
+        samples: int
+        overhead: float
+            Share of the wall time spent sampling, e.g. 0.002 for 0.2 %
+    """
+
+    MAX_DEPTH = 200
+
+    def __init__(self, rate_hz=100, thread_ident=None):
+        self.rate_hz = rate_hz
+        self.thread_ident = thread_ident or threading.get_ident()
+        self.samples = 0
+        self.overhead = 0.0
+
+        self._stacks = {}  # tuple of code objects, outermost first -> count
+        self._sample_seconds = 0.0
+        self._started = None
+        self._elapsed = 0.0
+        self._thread = None
+        self._stop = threading.Event()
+
+    @property
+    def running(self):
+        return self._thread is not None
+
+    def start(self):
+        """Starts sampling, the counts of a previous run are discarded."""
+        if self.running:
+            return
+        self._stacks = {}
+        self.samples = 0
+        self._sample_seconds = 0.0
+        self._stop.clear()
+        self._started = time.perf_counter()
+        self._thread = threading.Thread(target=self._run, name="SamplingProfiler", daemon=True)
+        self._thread.start()
+        logging.info("Sampling profiler started at %d Hz", self.rate_hz)
+
+    def stop(self):
+        """Stops sampling and returns the statistics text."""
+        if not self.running:
+            return self.stats_text()
+        self._stop.set()
+        self._thread.join()
+        self._thread = None
+        self._elapsed = time.perf_counter() - self._started
+        self.overhead = self._sample_seconds / self._elapsed if self._elapsed else 0.0
+        text = self.stats_text()
+        logging.info("Sampling profiler stopped: %s", text)
+        return text
+
+    def _run(self):
+        interval = 1 / max(1, self.rate_hz)
+        stacks = self._stacks
+        ident = self.thread_ident
+        max_depth = self.MAX_DEPTH
+        next_sample = time.perf_counter()
+        while True:
+            next_sample += interval
+            delay = next_sample - time.perf_counter()
+            if delay < 0:  # behind, e.g. the thread wasn't scheduled: skip, don't catch up
+                next_sample -= delay
+                delay = 0
+            if self._stop.wait(delay):
+                break
+
+            start = time.perf_counter()
+            frame = sys._current_frames().get(ident)
+            codes = []
+            while frame is not None and len(codes) < max_depth:
+                codes.append(frame.f_code)
+                frame = frame.f_back
+            if codes:
+                key = tuple(reversed(codes))
+                stacks[key] = stacks.get(key, 0) + 1
+                self.samples += 1
+            del frame
+            self._sample_seconds += time.perf_counter() - start
+
+    @staticmethod
+    def _frame_name(code):
+        return f"{code.co_name} ({os.path.basename(code.co_filename)}:{code.co_firstlineno})"
+
+    def collapsed(self):
+        """Returns the collapsed stacks, most sampled first."""
+        names = {}
+        lines = []
+        for codes, count in sorted(self._stacks.items(), key=lambda item: item[1], reverse=True):
+            parts = []
+            for code in codes:
+                name = names.get(code)
+                if name is None:
+                    name = names[code] = self._frame_name(code).replace(";", ":")
+                parts.append(name)
+            lines.append(f"{';'.join(parts)} {count}")
+        return "\n".join(lines) + "\n" if lines else ""
+
+    def write(self, folder):
+        """Writes the collapsed stacks to profile_<date>.folded in folder, returns the path."""
+        path = Path(folder) / f"profile_{datetime.now().strftime('%Y-%m-%d_%H-%M-%S')}.folded"
+        atomic_write_text(path, self.collapsed())
+        logging.info("Profile with %d samples written to %s", self.samples, path)
+        return path
+
+    def stats_text(self):
+        if self.running:
+            elapsed = time.perf_counter() - self._started
+            overhead = self._sample_seconds / elapsed if elapsed else 0.0
+        else:
+            elapsed, overhead = self._elapsed, self.overhead
+        rate = self.samples / elapsed if elapsed else 0.0
+        return (f"{self.samples} samples in {elapsed:.0f} s ({rate:.0f}/s of {self.rate_hz}), "
+                f"{len(self._stacks)} stacks, overhead {overhead * 100:.2f} %")
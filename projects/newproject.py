@@ -3,12 +3,14 @@ This file is part of QuickEDL.
 It provides a dialog to create a new project.
 """
 import ttkbootstrap as ttk
-from ttkbootstrap.dialogs import Messagebox
 
 from tkinter import filedialog
 from pathlib import Path
 import logging
 
+from notifications import notify
+from stallwatch import stalls_paused
+
 def show_new_project_window(root, project, app_instance=None):
     """
     Opens a window to create a new project.
@@ -29,12 +31,12 @@ def show_new_project_window(root, project, app_instance=None):
             # Validate that the path exists and is a directory
             if not project_path.exists():
                 logging.error(f"Selected path does not exist: {project_path}")
-                Messagebox.show_error("Error", f"The selected path does not exist:\n{project_path}")
+                notify(f"The selected path does not exist: {project_path}", "error")
                 return
             
             if not project_path.is_dir():
                 logging.error(f"Selected path is not a directory: {project_path}")
-                Messagebox.show_error("Error", f"The selected path is not a directory:\n{project_path}")
+                notify(f"The selected path is not a directory: {project_path}", "error")
                 return
             
             # Check if project folder would already exist and handle conflicts
@@ -99,7 +101,7 @@ def show_new_project_window(root, project, app_instance=None):
                 # Check if we hit the iteration limit
                 if increment >= max_iterations:
                     logging.error(f"Could not find available project name after {max_iterations} attempts")
-                    Messagebox.show_error("Error", "Could not create project: too many existing projects with similar names.\nPlease choose a different project name or location.")
+                    notify("Could not create project: too many existing projects with similar names. Please choose a different project name or location.", "error")
                     return
                 
                 logging.info(f"Using incremented project name: {project_name}")
@@ -110,21 +112,21 @@ def show_new_project_window(root, project, app_instance=None):
             new_project_window.destroy()
         except Exception as e:
             logging.error(f"Failed to create project: {e}")
-            Messagebox.show_error("Error", f"Failed to create project:\n{str(e)}")
+            notify(f"Failed to create project: {e}", "error")
 
     def select_location():
         # Get default directory from settings if available
         initial_dir = None
         if app_instance and hasattr(app_instance, 'settings_manager'):
-            default_dir = app_instance.settings_manager.get_setting('default_dir')
-            if default_dir and Path(default_dir).exists() and Path(default_dir).is_dir():
-                initial_dir = default_dir
+            initial_dir = app_instance.settings_manager.get_default_directory()
+            if initial_dir:
                 logging.debug(f"Using default directory for create project dialog: {initial_dir}")
         
-        folder = filedialog.askdirectory(
-            title="Select Project Location",
-            initialdir=initial_dir
-        )
+        with stalls_paused():
+            folder = filedialog.askdirectory(
+                title="Select Project Location",
+                initialdir=initial_dir
+            )
         if folder:
             # Convert to Path object for platform-independent handling
             folder_path = Path(folder)
@@ -6,6 +6,8 @@ import logging
 from tkinter import filedialog
 from pathlib import Path
 
+from stallwatch import stalls_paused
+
 class Project:
     """
     Creates and handles a QuickEDL project containing EDL file, markerlabel contents, and playlist content.
@@ -23,6 +25,7 @@ class Project:
         self.project_edl_file = None
         self.project_markerlabel_file = None
         self.project_playlist_file = None
+        self.project_markerbanks_file = None
     
     def load_project(self, project_path):
         """
@@ -38,15 +41,15 @@ class Project:
         # Get default directory from settings if available
         initial_dir = None
         if self.settings_manager:
-            default_dir = self.settings_manager.get_setting('default_dir')
-            if default_dir and Path(default_dir).exists() and Path(default_dir).is_dir():
-                initial_dir = default_dir
+            initial_dir = self.settings_manager.get_default_directory()
+            if initial_dir:
                 logging.debug(f"Using default directory for project dialog: {initial_dir}")
         
-        project_path = filedialog.askdirectory(
-            title="Select Project Folder",
-            initialdir=initial_dir
-        )
+        with stalls_paused():
+            project_path = filedialog.askdirectory(
+                title="Select Project Folder",
+                initialdir=initial_dir
+            )
         
         if project_path:
             return self.load_project_files(project_path)
@@ -113,6 +116,8 @@ class Project:
         self.project_edl_file = files_found.get('edl')
         self.project_markerlabel_file = files_found.get('markerlabel')
         self.project_playlist_file = files_found.get('playlist')
+        # optional, created when the banks are saved
+        self.project_markerbanks_file = path / f"{self.project_name}_MARKERBANKS.json"
 
         logging.debug(f"Final files found: {files_found}")
 
@@ -159,6 +164,7 @@ class Project:
         self.project_edl_file = expected_files.get('edl')
         self.project_markerlabel_file = expected_files.get('markerlabel')
         self.project_playlist_file = expected_files.get('playlist')
+        self.project_markerbanks_file = path / f"{project_name}_MARKERBANKS.json"
 
         self.project_isvalid = True
         logging.info(f"New project '{project_name}' created successfully at {project_path}")
@@ -0,0 +1,199 @@
+"""
+This file is part of QuickEDL.
+It imports rundowns (CSV/TSV exports of the newsroom system) as playlist items.
+"""
+
+import csv
+import logging
+import math
+from array import array
+from itertools import islice
+from pathlib import Path
+
+SAMPLE_BYTES = 16 * 1024  # csv.Sniffer is slow on large samples
+PREVIEW_ROWS = 20
+NO_DURATION = -1
+MAX_DURATION = 2**31 - 1  # durations are kept in an array('l'), 32 bit on Windows
+
+# header names (lowercase) recognized for the typed columns
+ID_NAMES = ("id", "item id", "item", "itemid", "slug", "nr", "no", "number")
+TITLE_NAMES = ("title", "titel", "name", "story", "headline", "beitrag")
+DURATION_NAMES = ("duration", "planned duration", "dur", "length", "dauer", "länge", "planned")
+
+
+def parse_duration(text):
+    """
+    Parses "90", "1:30", "00:01:30", "1:30.5" or a timecode "00:01:30:12"
+    (frames are dropped) to whole seconds. Returns NO_DURATION if it can't be parsed
+    or is negative, not finite ("nan", "inf") or too large.
+    """
+    if not text:
+        return NO_DURATION
+    parts = text.strip().split(":")
+    if len(parts) == 4:  # timecode
+        parts = parts[:3]
+    try:
+        seconds = 0.0
+        for part in parts:
+            seconds = seconds * 60 + float(part.replace(",", "."))
+    except ValueError:
+        return NO_DURATION
+    if not math.isfinite(seconds) or not 0 <= seconds <= MAX_DURATION:
+        return NO_DURATION
+    return int(round(seconds))
+
+
+def format_duration(seconds):
+    if seconds < 0:
+        return ""
+    hours, rest = divmod(seconds, 3600)
+    return f"{hours}:{rest // 60:02d}:{rest % 60:02d}" if hours else f"{rest // 60}:{rest % 60:02d}"
+
+
+class Rundown:
+    """
+    Imported rundown with compact typed columns.
+
+    Objects:
+        texts: list of str
+            Marker text of every row (the column picked by the operator)
+        ids / titles: list of str or None
+            Item IDs and titles, if the columns were found
+        durations: array of int or None
+            Planned durations in seconds, NO_DURATION if empty or invalid
+    """
+    __slots__ = ("texts", "ids", "titles", "durations", "skipped")
+
+    def __init__(self, with_ids=False, with_titles=False, with_durations=False):
+        self.texts = []
+        self.ids = [] if with_ids else None
+        self.titles = [] if with_titles else None
+        self.durations = array('l') if with_durations else None
+        self.skipped = 0  # rows without marker text
+
+    def __len__(self):
+        return len(self.texts)
+
+    def total_duration(self):
+        """Sum of the known planned durations in seconds."""
+        if self.durations is None:
+            return 0
+        return sum(d for d in self.durations if d > 0)
+
+
+class RundownReader:
+    """
+    Streams the rows of a CSV/TSV file.
+
+    The delimiter and header are detected from the first 16 KB, the rows are
+    parsed lazily while reading, so only the kept columns stay in memory.
+
+    Functions:
+        columns(): column names (from the header or "Column 1", ...)
+        preview(): the first rows for the import dialog
+        rows(): iterates over all data rows
+        load(text_column): reads the rundown with the picked marker text column
+    """
+
+    def __init__(self, path, encoding='utf-8-sig'):
+        self.path = Path(path)
+        self.encoding = encoding
+        self.dialect, self.has_header = self._sniff()
+        self.header = None
+        if self.has_header:
+            with self._open() as file:
+                self.header = next(csv.reader(file, self.dialect), None)
+
+    def _open(self):
+        return self.path.open('r', encoding=self.encoding, errors='replace', newline='')
+
+    def _sniff(self):
+        with self._open() as file:
+            sample = file.read(SAMPLE_BYTES)
+        # cut at the last complete line
+        if len(sample) == SAMPLE_BYTES and "\n" in sample:
+            sample = sample[:sample.rfind("\n") + 1]
+        sniffer = csv.Sniffer()
+        try:
+            dialect = sniffer.sniff(sample, delimiters=",;\t|")
+        except csv.Error:
+            dialect = csv.excel_tab if self.path.suffix.lower() == ".tsv" else csv.excel
+        # a first row with known column names is a header, even if all columns are text
+        first = next(csv.reader(sample.splitlines()[:1], dialect), [])
+        known = ID_NAMES + TITLE_NAMES + DURATION_NAMES
+        if any(cell.strip().lower() in known for cell in first):
+            return dialect, True
+        try:
+            has_header = sniffer.has_header(sample)
+        except csv.Error:
+            has_header = False
+        return dialect, has_header
+
+    def rows(self):
+        """Iterates over the data rows (lists of str)."""
+        with self._open() as file:
+            reader = csv.reader(file, self.dialect)
+            if self.has_header:
+                next(reader, None)
+            yield from reader
+
+    def preview(self, count=PREVIEW_ROWS):
+        return list(islice(self.rows(), count))
+
+    def columns(self):
+        if self.header:
+            return [name.strip() or f"Column {i + 1}" for i, name in enumerate(self.header)]
+        width = max((len(row) for row in self.preview()), default=0)
+        return [f"Column {i + 1}" for i in range(width)]
+
+    def guess_column(self, names):
+        """Returns the index of the first column whose name is one of names, or None."""
+        lower = [column.strip().lower() for column in self.columns()]
+        for name in names:
+            if name in lower:
+                return lower.index(name)
+        return None
+
+    def guess_text_column(self):
+        """The title column if there is one, otherwise the first column."""
+        column = self.guess_column(TITLE_NAMES)
+        return 0 if column is None else column
+
+    def load(self, text_column, id_column=None, title_column=None, duration_column=None, limit=None):
+        """
+        Reads the rundown. Rows without text in text_column are skipped.
+        Args:
+            text_column: index of the column used as marker text
+            id_column / title_column / duration_column: indices of the typed columns,
+                guessed from the header if None
+            limit: maximum number of rows, all if None
+        """
+        if id_column is None:
+            id_column = self.guess_column(ID_NAMES)
+        if title_column is None:
+            title_column = self.guess_column(TITLE_NAMES)
+        if duration_column is None:
+            duration_column = self.guess_column(DURATION_NAMES)
+
+        rundown = Rundown(id_column is not None, title_column is not None, duration_column is not None)
+        texts, ids, titles, durations = rundown.texts, rundown.ids, rundown.titles, rundown.durations
+        intern = {}  # equal values (e.g. repeated titles) share one string
+
+        for row in islice(self.rows(), limit):
+            text = row[text_column].strip() if text_column < len(row) else ""
+            if not text:
+                rundown.skipped += 1
+                continue
+            texts.append(intern.setdefault(text, text))
+            if ids is not None:
+                ids.append(row[id_column].strip() if id_column < len(row) else "")
+            if titles is not None:
+                title = row[title_column].strip() if title_column < len(row) else ""
+                titles.append(intern.setdefault(title, title))
+            if durations is not None:
+                durations.append(parse_duration(row[duration_column]) if duration_column < len(row) else NO_DURATION)
+            if len(intern) > 100000:
+                intern.clear()  # bounded, only recent repeats are shared
+
+        logging.info(f"Rundown imported from {self.path}: {len(rundown)} items, {rundown.skipped} rows skipped")
+        return rundown
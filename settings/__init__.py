@@ -4,13 +4,13 @@ Provides settings management and UI components.
 """
 
 from .settings_manager import SettingsManager
-from .settings_window import SettingsWindow
+from .store import SettingsStore, get_shared_store
+from .changes import ChangeSet, SettingsAppliers
 
 # Convenience functions for backwards compatibility
 def get_settings_folder():
     """Returns the settings folder path."""
-    manager = SettingsManager()
-    return manager.get_settings_folder_path()
+    return get_shared_store().settings_folder
 
 def load_yaml(app):
     """Legacy function for loading settings into app object."""
@@ -34,8 +34,17 @@ def set_log_level(level):
     logging.getLogger().setLevel(level)
     logging.info(f"Logging level set to {level}")
 
+def __getattr__(name):
+    # The settings window is imported on first use to keep the startup fast
+    if name == 'SettingsWindow':
+        from .settings_window import SettingsWindow
+        return SettingsWindow
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
 def show_settings_window(app):
     """Shows the settings window."""
+    from .settings_window import SettingsWindow
+
     if not hasattr(app, '_settings_manager'):
         app._settings_manager = SettingsManager()
     
@@ -44,4 +53,4 @@ def show_settings_window(app):
     
     app._settings_window.show()
 
-__all__ = ['SettingsManager', 'SettingsWindow', 'get_settings_folder', 'load_yaml', 'set_log_level', 'show_settings_window']
+__all__ = ['SettingsManager', 'SettingsWindow', 'SettingsStore', 'get_shared_store', 'ChangeSet', 'SettingsAppliers', 'get_settings_folder', 'load_yaml', 'set_log_level', 'show_settings_window']
@@ -0,0 +1,99 @@
+"""
+Settings change sets for QuickEDL
+Computes which settings changed and dispatches them to the matching appliers.
+"""
+import logging
+from typing import Any, Callable, Dict, Iterable, List, Tuple
+
+_MISSING = object()
+
+
+class ChangeSet:
+    """
+    Top-level settings keys whose values differ between two settings dicts.
+    """
+
+    def __init__(self, old: Dict[str, Any], new: Dict[str, Any]):
+        """
+        Args:
+            old: Settings before the change
+            new: Settings after the change
+        """
+        self._changes: Dict[str, Tuple[Any, Any]] = {}
+        for key in set(old) | set(new):
+            old_value = old.get(key, _MISSING)
+            new_value = new.get(key, _MISSING)
+            if old_value != new_value:
+                self._changes[key] = (
+                    None if old_value is _MISSING else old_value,
+                    None if new_value is _MISSING else new_value,
+                )
+
+    @classmethod
+    def from_updates(cls, current: Dict[str, Any], updates: Dict[str, Any]) -> 'ChangeSet':
+        """
+        Returns the changes a partial update would cause on the current settings.
+        """
+        return cls({key: current.get(key) for key in updates if key in current}, updates)
+
+    def __bool__(self):
+        return bool(self._changes)
+
+    def __contains__(self, key):
+        return key in self._changes
+
+    def __iter__(self):
+        return iter(self._changes)
+
+    def __len__(self):
+        return len(self._changes)
+
+    def __repr__(self):
+        return f"ChangeSet({sorted(self._changes)})"
+
+    def old(self, key: str) -> Any:
+        """Returns the value of a changed key before the change."""
+        return self._changes[key][0]
+
+    def new(self, key: str) -> Any:
+        """Returns the value of a changed key after the change."""
+        return self._changes[key][1]
+
+    def updates(self) -> Dict[str, Any]:
+        """Returns the changed keys with their new values."""
+        return {key: new for key, (old, new) in self._changes.items()}
+
+
+class SettingsAppliers:
+    """
+    Registry of functions applying settings to the running application.
+    Every applier is only called if one of its keys is in the change set.
+    """
+
+    def __init__(self):
+        self._appliers: List[Tuple[frozenset, Callable[[ChangeSet], None]]] = []
+
+    def register(self, keys: Iterable[str], applier: Callable[[ChangeSet], None]):
+        """
+        Registers an applier.
+        Args:
+            keys: Settings keys the applier depends on
+            applier: Called with the ChangeSet if any of the keys changed
+        """
+        self._appliers.append((frozenset(keys), applier))
+
+    def apply(self, changes: ChangeSet):
+        """Calls the appliers affected by the change set."""
+        if not changes:
+            return
+        logging.debug("Applying settings changes: %s", changes)
+        for keys, applier in self._appliers:
+            if any(key in changes for key in keys):
+                try:
+                    applier(changes)
+                except Exception as e:
+                    logging.error(f"Failed to apply settings {sorted(keys)}: {e}")
+
+    def apply_all(self, settings: Dict[str, Any]):
+        """Calls all appliers as if every setting changed, e.g. at startup."""
+        self.apply(ChangeSet({}, settings))
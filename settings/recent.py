@@ -5,10 +5,18 @@ Handles the list of recently opened projects.
 
 import json
 import logging
+import os
+import queue
+import sys
+import threading
+import time
 from pathlib import Path
-from typing import List, Callable
+from typing import Dict, List, Callable, Optional
 import ttkbootstrap as ttk
-from ttkbootstrap.dialogs import Messagebox
+
+# Add parent directory to path for relative imports
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from notifications import notify
 
 
 class RecentProjectsManager:
@@ -174,11 +182,128 @@ class RecentProjectsManager:
                 self.save_recent_projects(projects)
 
 
+class ProjectAvailabilityProber:
+    """
+    Checks the reachability of recent project folders in the background.
+
+    Every check runs on a small pool of daemon worker threads, so a hanging
+    network share never blocks the Tk thread (or the interpreter exit).
+    A check that doesn't finish within the timeout marks the path as unreachable.
+    """
+
+    UNKNOWN = "unknown"
+    AVAILABLE = "available"
+    MISSING = "missing"
+    UNREACHABLE = "unreachable"
+
+    def __init__(self, interval: float = 30.0, timeout: float = 2.0, workers: int = 4):
+        """
+        Initialize the prober.
+
+        Args:
+            interval: Seconds between two probing rounds
+            timeout: Seconds after which a pending check counts as unreachable
+            workers: Number of worker threads
+        """
+        self.interval = interval
+        self.timeout = timeout
+        self.generation = 0  # incremented whenever a status changes
+
+        self._paths: List[str] = []
+        self._status: Dict[str, str] = {}
+        self._pending: Dict[str, float] = {}  # path -> monotonic submit time
+        self._lock = threading.Lock()
+        self._queue = queue.Queue()
+        self._stop_event = threading.Event()
+        self._wake_event = threading.Event()
+
+        for i in range(workers):
+            threading.Thread(target=self._worker, name=f"recent-probe-{i}", daemon=True).start()
+        self._scheduler = threading.Thread(target=self._schedule_loop, name="recent-probe-scheduler", daemon=True)
+        self._scheduler.start()
+
+    def set_paths(self, paths: List[str]):
+        """
+        Set the paths to probe and trigger a probing round.
+
+        Args:
+            paths: List of project folder paths
+        """
+        with self._lock:
+            self._paths = list(paths)
+            for path in list(self._status):
+                if path not in self._paths:
+                    del self._status[path]
+        self._wake_event.set()
+
+    def get_status(self, path: str) -> str:
+        """
+        Returns the cached status of a path. Never touches the filesystem.
+
+        Args:
+            path: Project folder path
+        """
+        with self._lock:
+            started = self._pending.get(path)
+            if started is not None and time.monotonic() - started > self.timeout:
+                if self._status.get(path) != self.UNREACHABLE:
+                    self._status[path] = self.UNREACHABLE
+                    self.generation += 1
+            return self._status.get(path, self.UNKNOWN)
+
+    def probe(self, path: str):
+        """
+        Queues a single check for a path, unless one is still pending.
+
+        Args:
+            path: Project folder path
+        """
+        with self._lock:
+            if path in self._pending:
+                return
+            self._pending[path] = time.monotonic()
+        self._queue.put(path)
+
+    def stop(self):
+        """Stops the scheduler. Pending checks are abandoned."""
+        self._stop_event.set()
+        self._wake_event.set()
+
+    def _schedule_loop(self):
+        while not self._stop_event.is_set():
+            with self._lock:
+                paths = list(self._paths)
+            for path in paths:
+                self.probe(path)
+            self._wake_event.wait(self.interval)
+            self._wake_event.clear()
+
+    def _worker(self):
+        while True:
+            path = self._queue.get()
+            try:
+                status = self.AVAILABLE if Path(path).is_dir() else self.MISSING
+            except OSError as e:
+                logging.debug(f"Recent project not reachable: {path} ({e})")
+                status = self.UNREACHABLE
+            with self._lock:
+                self._pending.pop(path, None)
+                if self._status.get(path) != status:
+                    self._status[path] = status
+                    self.generation += 1
+
+
 class RecentProjectsMenu:
     """Manages the recent projects submenu in the GUI."""
     
+    # Interval of the Tk-side poll for status changes of the prober
+    REFRESH_MS = 1000
+    # Interval of the Tk-side poll while waiting for a clicked project to be probed
+    CLICK_POLL_MS = 50
+
     def __init__(self, parent_menu, recent_manager: RecentProjectsManager, 
-                 load_project_callback: Callable[[str], None]):
+                 load_project_callback: Callable[[str], None],
+                 prober: Optional[ProjectAvailabilityProber] = None):
         """
         Initialize the recent projects menu.
         
@@ -186,12 +311,16 @@ class RecentProjectsMenu:
             parent_menu: The parent menu to attach the submenu to
             recent_manager: The recent projects manager instance
             load_project_callback: Callback function to load a project
+            prober: Availability prober, a default one is created if None
         """
         self.parent_menu = parent_menu
         self.recent_manager = recent_manager
         self.load_project_callback = load_project_callback
+        self.prober = prober
         self.submenu = None
         self.separator_index = None
+        self._entries = []  # project paths in submenu order
+        self._seen_generation = -1
         
     def create_submenu(self):
         """Create and populate the recent projects submenu."""
@@ -209,8 +338,12 @@ class RecentProjectsMenu:
             # Add submenu to parent
             self.parent_menu.add_cascade(label="Recent Projects", menu=self.submenu)
             
+            if self.prober is None:
+                self.prober = ProjectAvailabilityProber()
+
             # Populate submenu
             self.update_submenu()
+            self._refresh_availability()
             
         except Exception as e:
             logging.error(f"Error creating recent projects submenu: {e}")
@@ -226,6 +359,9 @@ class RecentProjectsMenu:
             
             # Load recent projects
             projects = self.recent_manager.load_recent_projects()
+            self._entries = [project.get('path', '') for project in projects]
+            if self.prober:
+                self.prober.set_paths(self._entries)
             
             if projects:
                 for project in projects:
@@ -239,7 +375,8 @@ class RecentProjectsMenu:
                     
                     self.submenu.add_command(
                         label=display_name,
-                        command=lambda path=project_path: self._load_recent_project(path)
+                        command=lambda path=project_path: self._load_recent_project(path),
+                        state=self._entry_state(project_path)
                     )
             else:
                 # Show "No recent projects" when list is empty
@@ -251,20 +388,63 @@ class RecentProjectsMenu:
         except Exception as e:
             logging.error(f"Error updating recent projects submenu: {e}")
     
-    def _load_recent_project(self, project_path: str):
+    def _entry_state(self, project_path: str) -> str:
+        """Returns the menu entry state for a project path, greyed out if unreachable."""
+        if self.prober and self.prober.get_status(project_path) == ProjectAvailabilityProber.UNREACHABLE:
+            return 'disabled'
+        return 'normal'
+
+    def _refresh_availability(self):
+        """
+        Periodically applies the cached reachability to the submenu entries.
+        Entries are only reconfigured when the prober reported a change.
+        """
+        if not self.submenu or not self.prober:
+            return
+        try:
+            for path in self._entries:
+                self.prober.get_status(path)  # expire pending checks
+            if self.prober.generation != self._seen_generation:
+                self._seen_generation = self.prober.generation
+                for index, path in enumerate(self._entries):
+                    self.submenu.entryconfigure(index, state=self._entry_state(path))
+        except Exception as e:
+            logging.error(f"Error refreshing recent projects availability: {e}")
+        self.submenu.after(self.REFRESH_MS, self._refresh_availability)
+
+    def _load_recent_project(self, project_path: str, deadline: Optional[float] = None):
         """
         Load a recent project and handle errors.
+        If the availability of the folder is not known yet, a check is queued
+        and the result is awaited via Tk's event loop.
         
         Args:
             project_path: Path to the project folder
+            deadline: Monotonic time until the pending check is awaited (internal)
         """
         try:
+            status = self.prober.get_status(project_path) if self.prober else ProjectAvailabilityProber.AVAILABLE
+
+            if status == ProjectAvailabilityProber.UNKNOWN:
+                if deadline is None:
+                    self.prober.probe(project_path)
+                    deadline = time.monotonic() + self.prober.timeout
+                if time.monotonic() < deadline:
+                    self.submenu.after(self.CLICK_POLL_MS, lambda: self._load_recent_project(project_path, deadline))
+                    return
+                status = ProjectAvailabilityProber.UNREACHABLE
+
+            if status == ProjectAvailabilityProber.UNREACHABLE:
+                notify(f"The project folder is currently not reachable: {project_path}", "error")
+                return
+
             # Check if project folder still exists
-            if not Path(project_path).exists():
+            if status == ProjectAvailabilityProber.MISSING:
                 # Show error message
-                Messagebox.show_error(
-                    title="Project not found",
-                    message=f"The project folder could not be found:\n{project_path}\n\nIt will be removed from the recent projects list."
+                notify(
+                    f"The project folder could not be found: {project_path}. "
+                    "It was removed from the recent projects list.",
+                    "error"
                 )
                 
                 # Remove from recent projects
@@ -279,7 +459,4 @@ class RecentProjectsMenu:
             
         except Exception as e:
             logging.error(f"Error loading recent project {project_path}: {e}")
-            Messagebox.show_error(
-                title="Error loading project",
-                message=f"An error occurred while loading the project:\n{str(e)}"
-            )
+            notify(f"An error occurred while loading the project: {e}", "error")
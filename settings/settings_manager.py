@@ -2,44 +2,49 @@
 Settings Manager for QuickEDL
 Provides universal functions for loading, saving, and managing settings.
 """
-import yaml
 import logging
 from pathlib import Path
 from typing import Any, Dict, Optional
 
+from .changes import ChangeSet
+from .store import get_shared_store
+from .writer import get_shared_writer
+
+_MISSING = object()
+
 class SettingsManager:
     """
     Manages application settings with YAML storage and backwards compatibility.
+    All instances share one process-wide SettingsStore.
     """
     
-    def __init__(self, startup_toast=None):
+    def __init__(self, startup_toast=None, store=None):
         self.startup_toast = startup_toast
-        self.settings_folder = self._get_settings_folder()
-        self.settings_file = self.settings_folder / "settings.yaml"
-        self._settings_cache = {}
+        self._store = store or get_shared_store()
+        self._writer = get_shared_writer() if store is None else None
+        self.settings_folder = self._store.settings_folder
+        self.settings_file = self._store.settings_file
         self._default_settings = self._get_default_settings()
-        
-    def _get_settings_folder(self) -> Path:
-        """Returns the path of the settings folder in the user's home directory."""
-        try:
-            home_dir = Path.home()
-            settings_folder = home_dir / "quickedl"
-            return settings_folder
-        except Exception as e:
-            logging.warning(f"Could not determine settings folder path. ({e})")
-            # Fallback to current directory
-            return Path.cwd() / "quickedl_settings"
+
+    @property
+    def _settings_cache(self) -> Dict[str, Any]:
+        return self._store.snapshot()
     
     def _get_default_settings(self) -> Dict[str, Any]:
         """Returns the default settings dictionary."""
-        return {
-            'log_level': 'DEBUG',
-            'default_dir': None,
-            'delete_key': False,
-            'window_geometry': '400x700',
-            'theme': 'darkly',
-            'auto_save_interval': 300  # seconds
-        }
+        return dict(self._store.defaults)
+
+    def subscribe(self, callback):
+        """
+        Registers a callback for settings changes.
+        Args:
+            callback: Called with a ChangeSet of the changed keys
+        """
+        self._store.subscribe(callback)
+
+    def unsubscribe(self, callback):
+        """Removes a registered settings change callback."""
+        self._store.unsubscribe(callback)
     
     def create_settings_folder(self, current_markerlabels=None) -> bool:
         """
@@ -102,48 +107,33 @@ class SettingsManager:
     def load_settings(self) -> Dict[str, Any]:
         """
         Loads settings from YAML file with backwards compatibility.
+        The file is only parsed again if it changed since the last load.
         Returns merged settings (defaults + loaded values).
         """
-        # Start with default settings
-        settings = self._default_settings.copy()
-        
-        if not self.settings_file.exists():
-            logging.info("Settings file doesn't exist, using defaults")
-            if self.startup_toast:
+        self._store.revalidate()
+
+        if self.startup_toast:
+            if not self._store.file_found:
                 self.startup_toast.addline("Settings not found.", True)
-            self._settings_cache = settings
-            return settings
-        
-        try:
-            with self.settings_file.open('r', encoding='utf-8') as file:
-                loaded_settings = yaml.safe_load(file) or {} # {} to Avoid NoneType
-                
-            # Merge loaded settings with defaults (loaded values override defaults)
-            settings.update(loaded_settings)
-            
-            logging.info(f"Settings loaded from {self.settings_file}")
-            logging.debug(f"Loaded settings: {loaded_settings}")
-            
-            if self.startup_toast:
-                self.startup_toast.addline("Settings loaded.")
-            
-        except Exception as e:
-            logging.error(f"Error loading settings file: {e}")
-            logging.info("Using default settings")
-            if self.startup_toast:
+            elif self._store.last_error:
                 self.startup_toast.addline("Settings not loaded.", warning=True)
-        
-        self._settings_cache = settings
-        return settings
+            else:
+                self.startup_toast.addline("Settings loaded.")
+
+        return self._store.snapshot()
     
     def save_settings(self, settings: Optional[Dict[str, Any]] = None, current_markerlabels=None) -> bool:
         """
         Saves settings to YAML file.
+        The settings are applied in memory immediately, the file is written
+        atomically by the settings writer in the background. Changes within
+        its short delay window are coalesced into a single write.
         Args:
             settings: Settings dictionary to save. If None, saves cached settings.
             current_markerlabels: List of current markerlabel strings from GUI, if available
         Returns:
-            True if successful, False otherwise.
+            True if the settings were applied and their write was queued, False otherwise.
+            A failing write is reported with a notification by the settings writer.
         """
         if settings is None:
             settings = self._settings_cache
@@ -153,16 +143,24 @@ class SettingsManager:
             return False
         
         try:
-            with self.settings_file.open('w', encoding='utf-8') as file:
-                yaml.dump(settings, file, default_flow_style=False, allow_unicode=True)
-            
-            self._settings_cache = settings.copy()
-            logging.info(f"Settings saved to {self.settings_file}")
+            self._store.replace(settings)
+            if self._writer:
+                self._writer.schedule()
             return True
             
         except Exception as e:
             logging.error(f"Error saving settings: {e}")
             return False
+
+    def flush_settings(self) -> bool:
+        """
+        Writes pending settings changes to file immediately.
+        Returns:
+            True if successful or nothing was pending, False otherwise
+        """
+        if self._writer:
+            return self._writer.flush()
+        return True
     
     def get_setting(self, key: str, default: Any = None) -> Any:
         """
@@ -173,18 +171,14 @@ class SettingsManager:
         Returns:
             Setting value or default
         """
-        try:
-            # Support dot notation for nested settings
-            value = self._settings_cache
-            for part in key.split('.'):
-                value = value[part]
+        value = self._store.get(key, _MISSING)
+        if value is not _MISSING:
             return value
-        except (KeyError, TypeError):
-            # For dot notation keys, just return the provided default
-            if '.' in key:
-                return default
-            # For simple keys, try default_settings fallback
-            return default if default is not None else self._default_settings.get(key)
+        # For dot notation keys, just return the provided default
+        if '.' in key:
+            return default
+        # For simple keys, try default_settings fallback
+        return default if default is not None else self._default_settings.get(key)
     
     def set_setting(self, key: str, value: Any) -> bool:
         """
@@ -202,8 +196,8 @@ class SettingsManager:
             
             keys = key.split('.')
             for part in keys[:-1]:
-                if part not in current:
-                    current[part] = {}
+                # copy nested dicts, so the cached settings stay untouched
+                current[part] = dict(current.get(part) or {})
                 current = current[part]
             
             current[keys[-1]] = value
@@ -214,17 +208,32 @@ class SettingsManager:
             logging.error(f"Error setting '{key}' to '{value}': {e}")
             return False
     
+    def diff(self, updates: Dict[str, Any]) -> ChangeSet:
+        """
+        Computes which settings an update would actually change.
+        Args:
+            updates: Dictionary of setting keys and values
+        Returns:
+            ChangeSet containing only the keys with different values
+        """
+        return ChangeSet.from_updates(self._store.snapshot(), updates)
+
     def update_settings(self, updates: Dict[str, Any]) -> bool:
         """
         Updates multiple settings at once.
+        Unchanged values are skipped, nothing is written if nothing changed.
         Args:
             updates: Dictionary of setting keys and values
         Returns:
             True if successful, False otherwise
         """
         try:
+            changes = self.diff(updates)
+            if not changes:
+                logging.debug("Settings unchanged, nothing to save")
+                return True
             settings = self._settings_cache.copy()
-            settings.update(updates)
+            settings.update(changes.updates())
             return self.save_settings(settings)
         except Exception as e:
             logging.error(f"Error updating settings: {e}")
@@ -238,6 +247,13 @@ class SettingsManager:
         """
         return self.save_settings(self._default_settings.copy())
     
+    def get_default_directory(self) -> Optional[str]:
+        """
+        Returns the default directory if it is set and an existing directory, otherwise None.
+        The directory is checked once per settings change, not on every call.
+        """
+        return self._store.default_dir()
+
     def get_settings_folder_path(self) -> Path:
         """Returns the settings folder path."""
         return self.settings_folder
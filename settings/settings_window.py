@@ -13,6 +13,8 @@ import os
 # Add parent directory to path for relative imports
 sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 from utils import open_directory
+from notifications import notify
+from stallwatch import stalls_paused
 
 
 class SettingsWindow:
@@ -156,6 +158,29 @@ class SettingsWindow:
         )
         self._theme_combo.pack(side="right")
         
+        # Clock timecode
+        clock_frame = ttk.Frame(general_frame)
+        clock_frame.pack(fill="x", pady=(0, 10))
+
+        self.settings_vars['clock_timecode'] = BooleanVar(value=settings.get('clock_timecode', False))
+        self._timecode_toggle = ttk.Checkbutton(
+            clock_frame,
+            text="Show frames in clock",
+            variable=self.settings_vars['clock_timecode'],
+            bootstyle="success-round-toggle"
+        )
+        self._timecode_toggle.pack(side="left")
+
+        self.settings_vars['timecode_fps'] = StringVar(value=str(settings.get('timecode_fps', 25)))
+        self._fps_combo = ttk.Combobox(
+            clock_frame,
+            textvariable=self.settings_vars['timecode_fps'],
+            values=['24', '25', '30', '50', '60'],
+            width=5
+        )
+        self._fps_combo.pack(side="right")
+        ttk.Label(clock_frame, text="fps:").pack(side="right", padx=(0, 5))
+
         # Default directory
         dir_frame = ttk.Frame(general_frame)
         dir_frame.pack(fill="x", pady=(0, 10))
@@ -192,7 +217,7 @@ class SettingsWindow:
         
         ttk.Label(level_frame, text="Log level:").pack(side="left")
         
-        self.settings_vars['log_level'] = StringVar(value=settings.get('log_level', 'DEBUG'))
+        self.settings_vars['log_level'] = StringVar(value=settings.get('log_level', 'INFO'))
         self._level_combo = ttk.Combobox(
             level_frame,
             textvariable=self.settings_vars['log_level'],
@@ -201,7 +226,76 @@ class SettingsWindow:
             width=15
         )
         self._level_combo.pack(side="right")
+
+        # Metrics export
+        metrics_frame = ttk.Frame(logging_frame)
+        metrics_frame.pack(fill="x", pady=(0, 10))
+
+        ttk.Label(metrics_frame, text="Metrics export:").pack(side="left")
+
+        self.settings_vars['metrics_interval'] = StringVar(value=str(settings.get('metrics_interval', 15)))
+        self._metrics_spin = ttk.Spinbox(
+            metrics_frame,
+            textvariable=self.settings_vars['metrics_interval'],
+            from_=1,
+            to=3600,
+            width=5
+        )
+        self._metrics_spin.pack(side="right")
+        ttk.Label(metrics_frame, text="every (s):").pack(side="right", padx=(5, 5))
+
+        self.settings_vars['metrics_export'] = StringVar(value=settings.get('metrics_export') or 'off')
+        self._metrics_combo = ttk.Combobox(
+            metrics_frame,
+            textvariable=self.settings_vars['metrics_export'],
+            values=['off', 'prometheus', 'jsonl'],
+            state="readonly",
+            width=10
+        )
+        self._metrics_combo.pack(side="right")
         
+        # Stall detector
+        stall_frame = ttk.Frame(logging_frame)
+        stall_frame.pack(fill="x", pady=(0, 10))
+
+        self.settings_vars['stall_detector'] = BooleanVar(value=settings.get('stall_detector', True))
+        self._stall_toggle = ttk.Checkbutton(
+            stall_frame,
+            text="Log UI stalls",
+            variable=self.settings_vars['stall_detector'],
+            bootstyle="success-round-toggle"
+        )
+        self._stall_toggle.pack(side="left")
+
+        self.settings_vars['stall_threshold_ms'] = StringVar(value=str(settings.get('stall_threshold_ms', 150)))
+        self._stall_spin = ttk.Spinbox(
+            stall_frame,
+            textvariable=self.settings_vars['stall_threshold_ms'],
+            from_=50,
+            to=5000,
+            increment=50,
+            width=5
+        )
+        self._stall_spin.pack(side="right")
+        ttk.Label(stall_frame, text="over (ms):").pack(side="right", padx=(0, 5))
+
+        # Profiler rate
+        profiler_frame = ttk.Frame(logging_frame)
+        profiler_frame.pack(fill="x", pady=(0, 10))
+
+        ttk.Label(profiler_frame, text="Profiler samples per second:").pack(side="left")
+
+        self.settings_vars['profiler_rate_hz'] = StringVar(value=str(settings.get('profiler_rate_hz', 100)))
+        self._profiler_spin = ttk.Spinbox(
+            profiler_frame,
+            textvariable=self.settings_vars['profiler_rate_hz'],
+            from_=10,
+            to=1000,
+            increment=10,
+            width=5
+        )
+        self._profiler_spin.pack(side="right")
+
         # Log file button
         self._log_button = ttk.Button(
             logging_frame,
@@ -236,15 +330,31 @@ class SettingsWindow:
         
         ttk.Label(recent_frame, text="Max recent files:").pack(side="left")
         
-        self.settings_vars['max_recent_files'] = StringVar(value=str(settings.get('max_recent_files', 10)))
+        self.settings_vars['max_recent'] = StringVar(value=str(settings.get('max_recent', 5)))
         self._recent_spin = ttk.Spinbox(
             recent_frame,
-            textvariable=self.settings_vars['max_recent_files'],
+            textvariable=self.settings_vars['max_recent'],
             from_=1,
             to=20,
             width=10
         )
         self._recent_spin.pack(side="right")
+
+        # History depth
+        history_frame = ttk.Frame(file_frame)
+        history_frame.pack(fill="x", pady=(0, 10))
+
+        ttk.Label(history_frame, text="Markers in history:").pack(side="left")
+
+        self.settings_vars['history_depth'] = StringVar(value=str(settings.get('history_depth', 5)))
+        self._history_spin = ttk.Spinbox(
+            history_frame,
+            textvariable=self.settings_vars['history_depth'],
+            from_=1,
+            to=50,
+            width=10
+        )
+        self._history_spin.pack(side="right")
         
     def _create_buttons_section(self, parent):
         """Creates the buttons section."""
@@ -288,11 +398,11 @@ class SettingsWindow:
                 current_markerlabels.append("")
         
         if self.settings_manager.create_settings_folder(current_markerlabels):
-            Messagebox.show_info("Settings folder created successfully!")
+            notify("Settings folder created.", "success")
             self._close_window()
             self.show()  # Refresh window
         else:
-            Messagebox.show_error("Failed to create settings folder.")
+            notify("Failed to create settings folder.", "error")
             
     def _open_settings_folder(self):
         """Opens the settings folder in file manager."""
@@ -300,7 +410,7 @@ class SettingsWindow:
         if folder_path.exists():
             open_directory(folder_path)
         else:
-            Messagebox.show_error("Settings folder doesn't exist.")
+            notify("Settings folder doesn't exist.", "error")
             
     def _open_log_file(self):
         """Opens the log file."""
@@ -308,14 +418,15 @@ class SettingsWindow:
         if log_file.exists():
             open_directory(log_file)
         else:
-            Messagebox.show_error("Log file not found.")
+            notify("Log file not found.", "error")
             
     def _browse_default_directory(self):
         """Opens directory browser for default directory."""
-        directory = filedialog.askdirectory(
-            title="Select Default Directory",
-            initialdir=self.settings_vars['default_dir'].get() or Path.home()
-        )
+        with stalls_paused():
+            directory = filedialog.askdirectory(
+                title="Select Default Directory",
+                initialdir=self.settings_vars['default_dir'].get() or Path.home()
+            )
         if directory:
             self.settings_vars['default_dir'].set(directory)
             
@@ -331,49 +442,33 @@ class SettingsWindow:
                 elif isinstance(var, StringVar):
                     value = var.get()
                     # Convert numeric strings to integers
-                    if key in ['max_recent_files']:
+                    if key in ['max_recent', 'timecode_fps', 'history_depth', 'metrics_interval', 'stall_threshold_ms',
+                               'profiler_rate_hz']:
                         try:
                             value = int(value)
                         except ValueError:
-                            value = 10
+                            value = self.settings_manager.get_setting(key)
                     # Handle empty default_dir
                     elif key == 'default_dir' and not value:
                         value = None
                     new_settings[key] = value
             
-            # Save settings
-            if self.settings_manager.update_settings(new_settings):
-                # Apply theme immediately if changed
-                if 'theme' in new_settings and self.app:
-                    new_theme = new_settings['theme']
-                    
-                    try:
-                        # Use the existing root window's style to change theme
-                        self.app.root.style.theme_use(new_theme)
-                        logging.info(f"Theme changed to: {new_theme}")
-                    except Exception as e:
-                        logging.error(f"Failed to apply theme '{new_theme}': {e}")
-                
-                # Apply log level immediately
-                if 'log_level' in new_settings:
-                    self._apply_log_level(new_settings['log_level'])
-                    
-                Messagebox.show_info("Settings saved successfully!")
+            # Only changed settings are saved, the app applies them via its settings subscription
+            changes = self.settings_manager.diff(new_settings)
+            if not changes:
+                self._close_window()
+                return
+
+            if self.settings_manager.update_settings(changes.updates()):
+                logging.info("Settings changed: %s", ", ".join(sorted(changes)))
+                notify("Settings saved.", "success")
                 self._close_window()
             else:
-                Messagebox.show_error("Failed to save settings.")
+                notify("Failed to save settings.", "error")
 
         except Exception as e:
             logging.error(f"Error saving settings: {e}")
-            Messagebox.show_error(f"Error saving settings: {e}")
-            
-    def _apply_log_level(self, level):
-        """Applies the log level immediately."""
-        try:
-            logging.getLogger().setLevel(level)
-            logging.info(f"Log level changed to {level}")
-        except Exception as e:
-            logging.error(f"Failed to set log level: {e}")
+            notify(f"Error saving settings: {e}", "error")
             
     def _reset_settings(self):
         """Resets settings to defaults."""
@@ -386,10 +481,10 @@ class SettingsWindow:
         
         if result == "Yes":
             if self.settings_manager.reset_to_defaults():
-                Messagebox.show_info("Settings reset to defaults!")
+                notify("Settings reset to defaults.", "success")
                 self._close_window()
             else:
-                Messagebox.show_error("Failed to reset settings.")
+                notify("Failed to reset settings.", "error")
                 
     def _close_window(self, event=None):
         """Closes the settings window."""
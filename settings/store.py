@@ -0,0 +1,260 @@
+"""
+Settings Store for QuickEDL
+Holds the process-wide settings, shared by all SettingsManager instances.
+"""
+import logging
+import threading
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional
+
+from .changes import ChangeSet
+
+# Default settings, loaded values override them.
+DEFAULT_SETTINGS = {
+    'log_level': 'INFO',
+    'default_dir': None,
+    'delete_key': False,
+    'window_geometry': '400x700',
+    'theme': 'darkly',
+    'auto_save_interval': 300,  # seconds
+    'max_recent': 5,
+    'history_depth': 5,  # markers shown in the history
+    'fsync_markers': False,
+    'hotkey_burst_mode': 'batch',  # off, collapse, batch
+    'hotkey_burst_window_ms': 300,
+    'clock_timecode': False,
+    'timecode_fps': 25,
+    'recent_probe_interval': 30,  # seconds
+    'recent_probe_timeout': 2,  # seconds
+    'metrics_export': 'off',  # off, prometheus, jsonl
+    'metrics_interval': 15,  # seconds
+    'stall_detector': True,
+    'stall_threshold_ms': 150,
+    'profiler_rate_hz': 100  # samples per second of the sampling profiler
+}
+
+_MISSING = object()
+
+_shared_store = None
+_shared_lock = threading.Lock()
+
+
+def resolve_settings_folder() -> Path:
+    """Returns the path of the settings folder in the user's home directory."""
+    try:
+        home_dir = Path.home()
+        settings_folder = home_dir / "quickedl"
+        return settings_folder
+    except Exception as e:
+        logging.warning(f"Could not determine settings folder path. ({e})")
+        # Fallback to current directory
+        return Path.cwd() / "quickedl_settings"
+
+
+def get_shared_store() -> 'SettingsStore':
+    """Returns the process-wide settings store, creating it on first use."""
+    global _shared_store
+    if _shared_store is None:
+        with _shared_lock:
+            if _shared_store is None:
+                _shared_store = SettingsStore(resolve_settings_folder(), DEFAULT_SETTINGS)
+    return _shared_store
+
+
+class SettingsStore:
+    """
+    Caches the parsed settings file.
+
+    The YAML file is parsed once and only re-parsed when its mtime (or size)
+    changes. Lookups go through a flattened dict keyed by the full dot path,
+    so a get() is a single dict lookup. Subscribers are called with a
+    ChangeSet whenever the settings change.
+    """
+
+    def __init__(self, settings_folder: Path, defaults: Dict[str, Any]):
+        """
+        Args:
+            settings_folder: Folder containing settings.yaml
+            defaults: Default settings dictionary
+        """
+        self.settings_folder = settings_folder
+        self.settings_file = settings_folder / "settings.yaml"
+        self.defaults = dict(defaults)
+
+        self.loaded = False
+        self.file_found = False
+        self.last_error: Optional[Exception] = None
+        self.generation = 0  # incremented on every change of the settings
+
+        self._settings: Dict[str, Any] = dict(defaults)
+        self._flat: Dict[str, Any] = {}
+        self._stat_key = None
+        self._subscribers: List[Callable[[ChangeSet], None]] = []
+        self._lock = threading.RLock()
+        self._default_dir_cache = (None, None)  # (generation, validated path)
+
+        self._rebuild_index()
+
+    # LOADING
+
+    def _file_stat_key(self):
+        try:
+            stat = self.settings_file.stat()
+        except OSError:
+            return None
+        return (stat.st_mtime_ns, stat.st_size)
+
+    def revalidate(self) -> bool:
+        """
+        Loads the settings file if it has never been loaded or its mtime changed.
+        Returns True if the settings were re-read.
+        """
+        stat_key = self._file_stat_key()
+        if self.loaded and stat_key == self._stat_key:
+            return False
+        self._load(stat_key)
+        return True
+
+    def reload(self):
+        """Forces re-reading the settings file."""
+        self._load(self._file_stat_key())
+
+    def _load(self, stat_key):
+        import yaml
+
+        settings = dict(self.defaults)
+        self.file_found = stat_key is not None
+        self.last_error = None
+
+        if self.file_found:
+            try:
+                with self.settings_file.open('r', encoding='utf-8') as file:
+                    loaded_settings = yaml.safe_load(file) or {} # {} to Avoid NoneType
+                settings.update(loaded_settings)
+                # older settings windows saved the limit as 'max_recent_files'
+                if 'max_recent' not in loaded_settings and 'max_recent_files' in loaded_settings:
+                    settings['max_recent'] = loaded_settings['max_recent_files']
+                logging.info("Settings loaded from %s", self.settings_file)
+                logging.debug("Loaded settings: %s", loaded_settings)
+            except Exception as e:
+                logging.error(f"Error loading settings file: {e}")
+                self.last_error = e
+                if self.loaded:
+                    # keep the last good settings instead of falling back to defaults
+                    logging.info("Keeping previously loaded settings")
+                    settings = self._settings
+                else:
+                    logging.info("Using default settings")
+        else:
+            logging.info("Settings file doesn't exist, using defaults")
+
+        with self._lock:
+            self._stat_key = stat_key
+            self.loaded = True
+        self._replace(settings)
+
+    # ACCESS
+
+    def get(self, key: str, default: Any = _MISSING) -> Any:
+        """
+        Returns a setting by its (dot notation) key.
+        Raises KeyError if the key doesn't exist and no default is given.
+        """
+        if not self.loaded:
+            self.revalidate()
+        value = self._flat.get(key, _MISSING)
+        if value is _MISSING:
+            if default is _MISSING:
+                raise KeyError(key)
+            return default
+        return value
+
+    def snapshot(self) -> Dict[str, Any]:
+        """Returns a copy of the current settings."""
+        if not self.loaded:
+            self.revalidate()
+        return self._settings.copy()
+
+    def replace(self, settings: Dict[str, Any]):
+        """
+        Replaces the cached settings, e.g. after they have been saved.
+        Notifies subscribers if anything changed.
+        """
+        self._replace(dict(settings))
+
+    def mark_saved(self):
+        """Remembers the current file stat, so an own write doesn't trigger a re-parse."""
+        with self._lock:
+            self._stat_key = self._file_stat_key()
+            self.file_found = self._stat_key is not None
+
+    def _replace(self, settings: Dict[str, Any]):
+        with self._lock:
+            old_settings = self._settings
+            if settings == old_settings and self._flat:
+                return
+            self._settings = settings
+            self._rebuild_index()
+            self.generation += 1
+            subscribers = list(self._subscribers)
+
+        if not subscribers:
+            return
+        changes = ChangeSet(old_settings, settings)
+        for callback in subscribers:
+            try:
+                callback(changes)
+            except Exception as e:
+                logging.error(f"Settings subscriber {callback} failed: {e}")
+
+    def _rebuild_index(self):
+        """Flattens nested settings to a dict keyed by the full dot path."""
+        flat = {}
+
+        def add(prefix, value):
+            flat[prefix] = value
+            if isinstance(value, dict):
+                for key, sub_value in value.items():
+                    add(f"{prefix}.{key}", sub_value)
+
+        for key, value in self._settings.items():
+            add(str(key), value)
+        self._flat = flat
+
+    # SUBSCRIPTIONS
+
+    def subscribe(self, callback: Callable[[ChangeSet], None]):
+        """
+        Registers a callback, called with a ChangeSet on every change.
+        """
+        with self._lock:
+            if callback not in self._subscribers:
+                self._subscribers.append(callback)
+
+    def unsubscribe(self, callback):
+        """Removes a registered callback."""
+        with self._lock:
+            if callback in self._subscribers:
+                self._subscribers.remove(callback)
+
+    # DERIVED VALUES
+
+    def default_dir(self) -> Optional[str]:
+        """
+        Returns the 'default_dir' setting if it is an existing directory, otherwise None.
+        The directory is only checked once per settings generation.
+        """
+        default_dir = self.get('default_dir', None)
+        generation, value = self._default_dir_cache
+        if generation == self.generation:
+            return value
+
+        value = None
+        if default_dir:
+            try:
+                if Path(default_dir).is_dir():
+                    value = default_dir
+            except OSError as e:
+                logging.debug(f"Default directory not accessible: {e}")
+        self._default_dir_cache = (self.generation, value)
+        return value
@@ -0,0 +1,114 @@
+"""
+Settings Writer for QuickEDL
+Writes the settings file coalesced, atomically and off the Tk thread.
+"""
+import atexit
+import logging
+import sys
+import os
+import threading
+from typing import Optional
+
+# Add parent directory to path for relative imports
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from notifications import notify
+from utils import atomic_write_text
+
+from .store import SettingsStore, get_shared_store
+
+_shared_writer = None
+_shared_lock = threading.Lock()
+
+
+def get_shared_writer() -> 'SettingsWriter':
+    """Returns the process-wide settings writer, creating it on first use."""
+    global _shared_writer
+    if _shared_writer is None:
+        with _shared_lock:
+            if _shared_writer is None:
+                _shared_writer = SettingsWriter(get_shared_store())
+                atexit.register(_shared_writer.flush)
+    return _shared_writer
+
+
+class SettingsWriter:
+    """
+    Persists the settings of a SettingsStore.
+
+    schedule() only marks the settings as dirty. All changes made within
+    the delay window are written together by a background timer thread,
+    flush() writes pending changes immediately (e.g. on exit). As the caller
+    has already returned when the write happens, failures are reported
+    with a notification.
+    """
+
+    def __init__(self, store: SettingsStore, delay: float = 0.5):
+        """
+        Args:
+            store: The settings store to persist
+            delay: Seconds to collect changes before writing them
+        """
+        self.store = store
+        self.delay = delay
+        self.write_count = 0
+        self.last_error: Optional[Exception] = None
+
+        self._dirty = False
+        self._timer = None
+        self._lock = threading.Lock()
+        self._write_lock = threading.Lock()
+
+    def schedule(self):
+        """Marks the settings as changed. The write happens after the delay window."""
+        with self._lock:
+            self._dirty = True
+            if self._timer is None:
+                self._timer = threading.Timer(self.delay, self._on_timer)
+                self._timer.daemon = True
+                self._timer.start()
+
+    def flush(self) -> bool:
+        """
+        Writes pending changes synchronously.
+        Returns False if writing failed.
+        """
+        with self._lock:
+            if self._timer is not None:
+                self._timer.cancel()
+                self._timer = None
+        return self._write()
+
+    def pending(self) -> bool:
+        """Returns True if there are unwritten changes."""
+        return self._dirty
+
+    def _on_timer(self):
+        with self._lock:
+            self._timer = None
+        self._write()
+
+    def _write(self) -> bool:
+        import yaml
+
+        with self._write_lock:
+            with self._lock:
+                if not self._dirty:
+                    return True
+                self._dirty = False
+            settings = self.store.snapshot()
+
+            try:
+                content = yaml.dump(settings, default_flow_style=False, allow_unicode=True)
+                atomic_write_text(self.store.settings_file, content)
+                self.store.mark_saved()
+                self.write_count += 1
+                self.last_error = None
+                logging.info(f"Settings saved to {self.store.settings_file}")
+                return True
+            except Exception as e:
+                logging.error(f"Error saving settings: {e}")
+                self.last_error = e
+                with self._lock:
+                    self._dirty = True
+                notify(f"Settings could not be saved: {e}", "error")
+                return False
@@ -0,0 +1,194 @@
+"""
+This file is part of QuickEDL.
+It detects stalls of the Tk event loop and logs what the main thread was doing.
+"""
+
+import logging
+import sys
+import threading
+import time
+import traceback
+from contextlib import contextmanager
+
+from logsetup import file_logger
+
+
+class StallDetector:
+    """
+    Watches the Tk event loop with a heartbeat.
+
+    A Tk after() tick updates the heartbeat every TICK_MS. A watchdog thread
+    checks it every CHECK_MS: if the tick is more than threshold_ms late, the
+    stack of the Tk thread is captured with sys._current_frames(). When the
+    loop runs again, the stall is written with its duration and the stack to
+    the stall log. Stalls longer than LONG_STALL_MS are also written while
+    they last, so a freeze which ends with killing the app leaves evidence.
+
+    Native file dialogs block the Tk loop on Windows and macOS, the check is
+    paused while they are open (see stalls_paused()).
+
+    The tick is the only probe of the Tk loop: lag listeners (e.g. the
+    metrics exporter) get the delay of every tick, the tick also runs for
+    them while the watchdog is stopped.
+
+    Objects:
+        threshold_ms: int
+            Delay of the tick counted as stall
+        stalls: int
+        max_stall_ms: float
+    """
+
+    TICK_MS = 50
+    CHECK_MS = 20
+    LONG_STALL_MS = 2000
+
+    def __init__(self, root, log_file, threshold_ms=150):
+        self.root = root
+        self.log_file = log_file
+        self.threshold_ms = threshold_ms
+        self.stalls = 0
+        self.max_stall_ms = 0.0
+
+        self._tk_thread = threading.get_ident()  # created on the Tk thread
+        self._heartbeat = None  # monotonic time of the last tick
+        self._late_ms = 0.0  # delay of the last tick
+        self._after_id = None
+        self._paused = 0  # nesting depth of pause()
+        self._lag_listeners = []
+        self._thread = None
+        self._stop = threading.Event()
+        self._logger = None
+
+    @property
+    def running(self):
+        return self._thread is not None
+
+    def start(self):
+        """Starts the tick and the watchdog thread."""
+        if self.running:
+            return
+        if self._logger is None:
+            self._logger = file_logger("quickedl.stalls", self.log_file)
+        self._start_tick()
+        self._stop.clear()
+        self._thread = threading.Thread(target=self._run, name="StallDetector", daemon=True)
+        self._thread.start()
+        logging.info("Stall detector started, threshold %d ms, log: %s", self.threshold_ms, self.log_file)
+
+    def stop(self):
+        """Stops the watchdog thread, and the tick if no lag listener needs it."""
+        if self._thread is not None:
+            self._stop.set()
+            self._thread.join(timeout=1)
+            self._thread = None
+        if not self._lag_listeners:
+            self._stop_tick()
+
+    def pause(self):
+        """Pauses the stall check, e.g. while a blocking dialog is open. Calls can be nested."""
+        self._paused += 1
+
+    def resume(self):
+        """Resumes the stall check, the time the loop was blocked since pause() is not counted."""
+        self._paused = max(0, self._paused - 1)
+        if not self._paused and self._after_id is not None:
+            self._heartbeat = time.monotonic()
+
+    def add_lag_listener(self, callback):
+        """Calls callback(seconds) with the delay of every tick, starts the tick if needed."""
+        if callback not in self._lag_listeners:
+            self._lag_listeners.append(callback)
+        self._start_tick()
+
+    def remove_lag_listener(self, callback):
+        if callback in self._lag_listeners:
+            self._lag_listeners.remove(callback)
+        if not self._lag_listeners and not self.running:
+            self._stop_tick()
+
+    def _start_tick(self):
+        if self._after_id is None:
+            self._heartbeat = time.monotonic()
+            self._after_id = self.root.after(self.TICK_MS, self._tick)
+
+    def _stop_tick(self):
+        if self._after_id is not None:
+            try:
+                self.root.after_cancel(self._after_id)
+            except Exception:
+                pass  # window already destroyed on exit
+            self._after_id = None
+
+    def _tick(self):
+        now = time.monotonic()
+        self._late_ms = (now - self._heartbeat) * 1000 - self.TICK_MS
+        self._heartbeat = now  # set last, the watchdog reads _late_ms after a new heartbeat
+        self._after_id = self.root.after(self.TICK_MS, self._tick)
+        if self._paused:
+            return
+        lag = max(0.0, self._late_ms / 1000)
+        for callback in self._lag_listeners:
+            callback(lag)
+
+    def _run(self):
+        stall = None  # (heartbeat, stack captured at detection, written while stalled)
+        while not self._stop.wait(self.CHECK_MS / 1000):
+            if self._paused:
+                stall = None
+                continue
+            heartbeat = self._heartbeat
+            late_ms = (time.monotonic() - heartbeat) * 1000 - self.TICK_MS
+            if stall is None:
+                if late_ms >= self.threshold_ms:
+                    stall = [heartbeat, self._capture_stack(), False]
+            elif heartbeat != stall[0]:
+                self._report(self._late_ms, stall[1], stall[2])
+                stall = None
+            elif not stall[2] and late_ms >= self.LONG_STALL_MS:
+                self._logger.warning("Tk loop stalled for %.0f ms so far, main thread:\n%s",
+                                     late_ms, self._capture_stack())
+                stall[2] = True
+
+    def _capture_stack(self):
+        frame = sys._current_frames().get(self._tk_thread)
+        if frame is None:
+            return "  (no frame)\n"
+        return "".join(traceback.format_stack(frame))
+
+    def _report(self, stall_ms, stack, written):
+        self.stalls += 1
+        self.max_stall_ms = max(self.max_stall_ms, stall_ms)
+        note = " (ongoing stall logged before)" if written else ""
+        self._logger.warning("Tk loop stalled for %.0f ms%s, main thread at detection:\n%s", stall_ms, note, stack)
+        logging.warning("UI stalled for %.0f ms, stack in %s", stall_ms, self.log_file)
+
+    def stats_text(self):
+        if not self.running:
+            return "detector off"
+        return f"{self.stalls} over {self.threshold_ms} ms, max {self.max_stall_ms:.0f} ms"
+
+
+_default = None
+
+
+def set_default_detector(detector):
+    """Sets the detector paused by stalls_paused()."""
+    global _default
+    _default = detector
+
+
+@contextmanager
+def stalls_paused():
+    """
+    Pauses the stall check of the default detector, used around native
+    file dialogs which block the Tk loop while they are open.
+    """
+    detector = _default
+    if detector is None:
+        yield
+        return
+    detector.pause()
+    try:
+        yield
+    finally:
+        detector.resume()
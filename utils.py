@@ -7,6 +7,8 @@ import subprocess
 from pathlib import Path
 import os
 import logging
+import sys
+import tempfile
 import webbrowser
 
 def open_directory(path):
@@ -41,6 +43,46 @@ def open_directory(path):
     except Exception as e:
         logging.error(f"An error occurred while opening the directory: {e}", exc_info=True)
 
+def resource_path(relative_path):
+    """
+    Returns the absolute path of a bundled resource file.
+    Works from source and in PyInstaller builds.
+    Args:
+        relative_path: path relative to the application folder, e.g. "resources/icon_unix.png"
+    """
+    base_path = getattr(sys, '_MEIPASS', None) or Path(__file__).resolve().parent
+    return Path(base_path) / relative_path
+
 def open_in_browser(url, **kwargs):
     webbrowser.open_new(url)
-    logging.debug(f"Opening in Browser: {url}")
\ No newline at end of file
+    logging.debug(f"Opening in Browser: {url}")
+
+def atomic_write_text(path, text, encoding='utf-8'):
+    """
+    Writes text to a file atomically.
+    The content is written and fsynced to a temporary file in the same folder,
+    which then replaces the target. Readers see either the old or the new file,
+    never a partial one.
+    Args:
+        path: target file path
+        text: content to write
+    """
+    path = Path(path)
+    try:
+        mode = path.stat().st_mode & 0o777
+    except OSError:
+        mode = 0o644
+    fd, tmp_name = tempfile.mkstemp(prefix=f".{path.name}.", suffix=".tmp", dir=path.parent)
+    try:
+        os.chmod(tmp_name, mode)
+        with os.fdopen(fd, 'w', encoding=encoding) as tmp_file:
+            tmp_file.write(text)
+            tmp_file.flush()
+            os.fsync(tmp_file.fileno())
+        os.replace(tmp_name, path)
+    except BaseException:
+        try:
+            os.unlink(tmp_name)
+        except OSError:
+            pass
+        raise
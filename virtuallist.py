@@ -0,0 +1,211 @@
+"""
+This file is part of QuickEDL.
+It provides a virtualized list widget, which only renders the visible rows.
+"""
+
+import ttkbootstrap as ttk
+
+
+class VirtualList:
+    """
+    Treeview showing a window of rows of an arbitrarily long list.
+
+    Only the visible rows exist as Treeview items, their values are replaced
+    when scrolling. The rows are fetched with get_rows(first, count), which
+    returns a list of value tuples (one per column).
+
+    Functions:
+        set_row_count(count): updates the length of the list
+        scroll_to(index): scrolls the row to the top
+        refresh(): re-fetches the visible rows
+        selected_index(): index of the selected row or None
+    """
+
+    DEFAULT_ROW_HEIGHT = 20
+
+    def __init__(self, parent, get_rows, columns, headings=None, widths=None, **kwargs):
+        """
+        Args:
+            parent: parent widget
+            get_rows: callable(first, count) returning a list of value tuples
+            columns: column ids
+            headings: column headings, defaults to the ids
+            widths: column widths, stretch if None
+        """
+        self.get_rows = get_rows
+        self.row_count = 0
+        self.first = 0
+        self.on_select = None  # callable(index)
+        self.on_activate = None  # callable(index), double click / Return
+
+        self.frame = ttk.Frame(parent)
+        self.frame.columnconfigure(0, weight=1)
+        self.frame.rowconfigure(0, weight=1)
+
+        self.tree = ttk.Treeview(self.frame, columns=columns, show="headings", selectmode="browse", **kwargs)
+        self.tree.grid(column=0, row=0, sticky="NSEW")
+        headings = headings or columns
+        widths = widths or [None] * len(columns)
+        for column, heading, width in zip(columns, headings, widths):
+            self.tree.heading(column, text=heading, anchor="w")
+            if width:
+                self.tree.column(column, width=width, stretch=False)
+            else:
+                self.tree.column(column, stretch=True)
+
+        self.scrollbar = ttk.Scrollbar(self.frame, orient="vertical", command=self._on_scrollbar)
+        self.scrollbar.grid(column=1, row=0, sticky="NS")
+
+        self._items = []  # item ids of the rendered rows
+        self._visible = 1
+        self._selected = None
+
+        self.tree.bind("<Configure>", self._on_resize)
+        self.tree.bind("<MouseWheel>", self._on_mousewheel)
+        self.tree.bind("<Button-4>", lambda e: self.scroll_by(-3))
+        self.tree.bind("<Button-5>", lambda e: self.scroll_by(3))
+        self.tree.bind("<Up>", lambda e: self._move_selection(-1))
+        self.tree.bind("<Down>", lambda e: self._move_selection(1))
+        self.tree.bind("<Prior>", lambda e: self.scroll_by(-self._visible) or "break")
+        self.tree.bind("<Next>", lambda e: self.scroll_by(self._visible) or "break")
+        self.tree.bind("<Home>", lambda e: self.scroll_to(0) or "break")
+        self.tree.bind("<End>", lambda e: self.scroll_to(self.row_count) or "break")
+        self.tree.bind("<<TreeviewSelect>>", self._on_tree_select)
+        self.tree.bind("<Double-Button-1>", self._on_activate)
+        self.tree.bind("<Return>", self._on_activate)
+
+    def grid(self, **kwargs):
+        self.frame.grid(**kwargs)
+
+    def pack(self, **kwargs):
+        self.frame.pack(**kwargs)
+
+    # ROWS
+
+    def set_row_count(self, count):
+        """Sets the length of the list and re-renders."""
+        self.row_count = max(0, count)
+        self.first = min(self.first, self.max_first())
+        self.refresh()
+
+    def max_first(self):
+        return max(0, self.row_count - self._visible)
+
+    def at_end(self):
+        """Returns True if the last row is visible."""
+        return self.first >= self.max_first()
+
+    def scroll_to(self, index):
+        """Scrolls the row with the index to the top (as far as possible)."""
+        self.first = max(0, min(int(index), self.max_first()))
+        self.refresh()
+
+    def scroll_by(self, rows):
+        self.scroll_to(self.first + rows)
+
+    def see(self, index):
+        """Scrolls the row into view if it isn't visible."""
+        if index < self.first:
+            self.scroll_to(index)
+        elif index >= self.first + self._visible:
+            self.scroll_to(index - self._visible + 1)
+
+    def refresh(self):
+        """Fetches and renders the visible rows."""
+        count = min(self._visible, self.row_count - self.first)
+        rows = self.get_rows(self.first, count) if count > 0 else []
+
+        # create or remove items, so there is one per visible row
+        while len(self._items) < len(rows):
+            self._items.append(self.tree.insert("", "end"))
+        while len(self._items) > len(rows):
+            self.tree.delete(self._items.pop())
+
+        for item, values in zip(self._items, rows):
+            self.tree.item(item, values=values)
+
+        self._show_selection()
+        self._update_scrollbar()
+
+    def selected_index(self):
+        return self._selected
+
+    def select(self, index):
+        """Selects the row with the index and scrolls it into view."""
+        if not 0 <= index < self.row_count:
+            return
+        self._selected = index
+        self.see(index)
+        self._show_selection()
+
+    # INTERNAL
+
+    def _show_selection(self):
+        position = None if self._selected is None else self._selected - self.first
+        if position is not None and 0 <= position < len(self._items):
+            item = self._items[position]
+            if self.tree.selection() != (item,):
+                self.tree.selection_set(item)
+            self.tree.focus(item)
+        elif self.tree.selection():
+            self.tree.selection_remove(*self.tree.selection())
+
+    def _update_scrollbar(self):
+        if self.row_count <= 0:
+            self.scrollbar.set(0.0, 1.0)
+            return
+        top = self.first / self.row_count
+        bottom = min(1.0, (self.first + self._visible) / self.row_count)
+        self.scrollbar.set(top, bottom)
+
+    def _row_height(self):
+        if self._items:
+            bbox = self.tree.bbox(self._items[0])
+            if bbox:
+                return max(1, bbox[3])
+        return self.DEFAULT_ROW_HEIGHT
+
+    def _on_resize(self, event=None):
+        heading_height = self.DEFAULT_ROW_HEIGHT + 4
+        visible = max(1, (self.tree.winfo_height() - heading_height) // self._row_height())
+        if visible != self._visible:
+            self._visible = visible
+            self.first = min(self.first, self.max_first())
+            self.refresh()
+
+    def _on_scrollbar(self, command, *args):
+        if command == "moveto":
+            self.scroll_to(float(args[0]) * self.row_count)
+        elif command == "scroll":
+            amount, unit = int(args[0]), args[1]
+            self.scroll_by(amount * (self._visible if unit == "pages" else 1))
+
+    def _on_mousewheel(self, event):
+        delta = event.delta
+        if abs(delta) >= 120:  # Windows sends multiples of 120
+            delta //= 120
+        self.scroll_by(-delta * 3)
+        return "break"
+
+    def _move_selection(self, step):
+        if self.row_count:
+            current = self.first if self._selected is None else self._selected + step
+            self.select(max(0, min(current, self.row_count - 1)))
+            if self.on_select:
+                self.on_select(self._selected)
+        return "break"
+
+    def _on_tree_select(self, event=None):
+        selection = self.tree.selection()
+        if not selection or selection[0] not in self._items:
+            return
+        index = self.first + self._items.index(selection[0])
+        if index != self._selected:
+            self._selected = index
+            if self.on_select:
+                self.on_select(index)
+
+    def _on_activate(self, event=None):
+        if self._selected is not None and self.on_activate:
+            self.on_activate(self._selected)
+        return "break"